@@ -39,6 +39,11 @@
 #         - Session factory'leri yönetir
 #         - Connection health monitoring
 #         - Error handling ve recovery
+#         - Read/write splitting (primary + N read replica)
+#
+#    2.3. _CursorWrapper / _ConnectionHandle (Dahili)
+#         - `with db as conn: conn.cursor.execute(...)` eski cursor API'si
+#         - Dict satırlar, %s -> ? çevirisi (SQLite stand-in için)
 #
 # 3. FONKSİYONLAR VE METOTLAR
 #    ============================================================================
@@ -50,6 +55,7 @@
 #            - __init__(): Sınıfı başlatır ve config'i yükler
 #            - _validate_config(): Config değerlerini doğrular
 #            - _initialize_connections(): Database engine'leri oluşturur
+#            - _ensure_connection(): İlk kullanımda doğrular ve engine'leri kurar (lazy)
 #
 #         B. Bağlantı Yönetimi
 #            - _build_connection_url(): Connection string oluşturur
@@ -74,11 +80,21 @@
 #            - close_all_connections(): Tüm bağlantıları kapatır
 #
 #         G. Context Manager Metotları
-#            - __enter__() / __exit__(): Senkron context manager
+#            - __enter__() / __exit__(): Primary üzerinde cursor tutamacı
+#              (çıkışta commit, hata durumunda rollback)
+#            - read_only(): Okuma sorguları için replica tutamacı
 #            - __aenter__() / __aexit__(): Asenkron context manager
 #
+#         H. Read Replica Yönlendirme
+#            - _choose_read_engine(): Sağlıklı ve gecikmesi düşük replica seçer
+#            - get_replica_lag(): Heartbeat tablosundan gecikmeyi ölçer
+#            - write_heartbeat(): Primary üzerinde heartbeat günceller
+#            - get_replica_status(): Replica durum özetini verir
+#
 #    3.3. Yardımcı Fonksiyonlar
 #         - get_database_manager(): Hızlı database manager oluşturur
+#         - warm_up_pools(): Canlı manager'ların pool'larını önceden doldurur
+#         - reset_after_fork(): Fork sonrası devralınan pool'ları bırakır
 #
 # 4. KULLANIM ÖRNEKLERİ
 #    ============================================================================
@@ -106,6 +122,19 @@
 #         config_info = db_manager.get_config_info()
 #         print(f"Database: {config_info['database']}")
 #
+#    4.7. Legacy Cursor API ve Read Replica
+#         with db_manager as conn:                 # primary, çıkışta commit
+#             conn.cursor.execute("UPDATE ... WHERE id = %s", (1,))
+#         with db_manager.read_only() as conn:     # replica (uygunsa)
+#             conn.cursor.execute("SELECT ... WHERE id = %s", (1,))
+#             rows = conn.cursor.fetchall()
+#
+#    4.8. SQLite Stand-in ile Deneme
+#         DB_PRIMARY_URL=sqlite:////tmp/primary.db
+#         DB_REPLICA_URLS=sqlite:////tmp/replica.db
+#         # replica.db içindeki replica_heartbeat satırı elle güncellenerek
+#         # gecikme simüle edilebilir.
+#
 # 5. KONFİGÜRASYON
 #    ============================================================================
 #    5.1. Gerekli Environment Variables
@@ -121,6 +150,16 @@
 #         - DB_POOL_TIMEOUT: Pool timeout süresi
 #         - DB_POOL_RECYCLE: Pool recycle süresi
 #         - DB_POOL_PRE_PING: Pre-ping özelliği
+#         - DB_PRIMARY_URL: Primary için tam SQLAlchemy URL'i (HOST/PORT... yerine)
+#         - DB_REPLICA_URLS: Virgülle ayrılmış read replica URL'leri
+#         - DB_REPLICA_MAX_LAG_SECONDS: Bu gecikmenin üstündeki replica kullanılmaz
+#         - DB_REPLICA_LAG_CHECK_INTERVAL: Gecikme ölçümü cache süresi (saniye)
+#
+#    5.3. Read-Your-Writes
+#         - Bir request içinde primary'ye yazıldıktan sonra aynı request'teki
+#           tüm okumalar primary'ye gider (flask.g).
+#         - Request dışında (CLI, thread) yazmadan sonraki
+#           DB_REPLICA_MAX_LAG_SECONDS boyunca okumalar primary'de kalır.
 #
 # 6. HATA YÖNETİMİ
 #    ============================================================================
@@ -170,15 +209,20 @@
 # ================================================================================
 
 import asyncio
+import itertools
 import logging
+import threading
+import time
+import weakref
 from contextlib import asynccontextmanager, contextmanager
-from typing import Optional, Dict, Any, Union, Generator, AsyncGenerator
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Union, Generator, AsyncGenerator, List, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
 # SQLAlchemy imports with modern syntax
 try:
-    from sqlalchemy import create_engine, text, Engine
+    from sqlalchemy import create_engine, text, Engine, event
+    from sqlalchemy.engine import make_url
     from sqlalchemy.orm import sessionmaker, Session
     from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
     from sqlalchemy.exc import SQLAlchemyError, OperationalError, DisconnectionError
@@ -196,10 +240,30 @@ except ImportError as e:
     AsyncSession = None
     SQLAlchemyError = Exception
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from app.database.schemas.replica_heartbeat_schema import REPLICA_HEARTBEAT_TABLE_SQL
+from app.database.query_instrumentation import record_query
+
 logger = logging.getLogger(__name__)
 
+# Yazma sonrası "read-your-writes" durumu; request dışı kullanım için thread bazlı
+_sticky_state = threading.local()
+
+# Primary URL -> heartbeat thread (process başına tek yazıcı)
+_heartbeat_threads: Dict[str, threading.Thread] = {}
+_heartbeat_lock = threading.Lock()
+
+# Süreçteki canlı manager'lar (warm-up ve fork sonrası pool sıfırlama için)
+_managers: "weakref.WeakSet[DatabaseConnectionManager]" = weakref.WeakSet()
+
+# Okuma olarak kabul edilen SQL komutları (geri kalanı yazma sayılır)
+_READ_VERBS = frozenset({'SELECT', 'SHOW', 'EXPLAIN', 'DESCRIBE', 'DESC', 'WITH'})
+
+
+def _is_write_statement(sql: str) -> bool:
+    """SQL ifadesinin veri değiştirip değiştirmediğini kaba olarak belirler."""
+    head = (sql or '').lstrip().split(None, 1)
+    return bool(head) and head[0].upper() not in _READ_VERBS
+
 
 @dataclass
 class DatabaseConfig:
@@ -223,6 +287,10 @@ class DatabaseConfig:
         pool_recycle: Pool recycle süresi saniye (varsayılan: 3600)
         pool_pre_ping: Pre-ping özelliği (varsayılan: True)
         echo: SQL log'larını göster (varsayılan: False, debug modda True)
+        primary_url: Primary için tam SQLAlchemy URL'i (verilirse host/port/... yerine kullanılır)
+        replica_urls: Read replica SQLAlchemy URL listesi (boşsa tüm sorgular primary'ye gider)
+        replica_max_lag_seconds: Bu değerden fazla gecikmeli replica'lar atlanır
+        replica_lag_check_interval: Replica gecikme ölçümünün cache süresi (saniye)
     """
     host: str
     port: int
@@ -237,6 +305,10 @@ class DatabaseConfig:
     pool_recycle: int
     pool_pre_ping: bool
     echo: bool
+    primary_url: Optional[str] = None
+    replica_urls: List[str] = field(default_factory=list)
+    replica_max_lag_seconds: float = 5
+    replica_lag_check_interval: float = 2
     
     @classmethod
     def from_config_class(cls, config_class) -> "DatabaseConfig":
@@ -270,10 +342,127 @@ class DatabaseConfig:
             pool_timeout=config_class.DATABASE.POOL_TIMEOUT,
             pool_recycle=config_class.DATABASE.POOL_RECYCLE,
             pool_pre_ping=config_class.DATABASE.POOL_PRE_PING,
-            echo=config_class.APP.DEBUG
+            echo=config_class.APP.DEBUG,
+            primary_url=getattr(config_class.DATABASE, 'PRIMARY_URL', None),
+            replica_urls=list(getattr(config_class.DATABASE, 'REPLICA_URLS', None) or []),
+            replica_max_lag_seconds=getattr(config_class.DATABASE, 'REPLICA_MAX_LAG_SECONDS', 5),
+            replica_lag_check_interval=getattr(config_class.DATABASE, 'REPLICA_LAG_CHECK_INTERVAL', 2)
         )
 
 
+class _CursorWrapper:
+    """
+    DBAPI cursor'ı eski repository API'sine uyarlayan ince sarmalayıcı.
+
+    - mysql.connector dışındaki sürücülerde satırları dict'e çevirir
+    - qmark paramstyle kullanan sürücülerde (SQLite) `%s` -> `?` çevirir
+    - Primary üzerindeki yazma ifadelerini yöneticiye bildirir
+      (read-your-writes için)
+    - Her sorguyu süresiyle birlikte query_instrumentation'a kaydeder
+    """
+
+    def __init__(self, cursor, *, as_dict: bool, convert_rows: bool, qmark: bool,
+                 on_write=None, role: str = 'primary'):
+        self._cursor = cursor
+        self._as_dict = as_dict and convert_rows
+        self._qmark = qmark
+        self._on_write = on_write
+        self._role = role
+
+    def _prepare(self, sql: str) -> str:
+        if self._on_write is not None and _is_write_statement(sql):
+            self._on_write(sql)
+        return sql.replace('%s', '?') if self._qmark else sql
+
+    def execute(self, sql: str, params=None):
+        prepared = self._prepare(sql)
+        started = time.perf_counter()
+        try:
+            if params is None:
+                return self._cursor.execute(prepared)
+            return self._cursor.execute(prepared, params)
+        finally:
+            record_query(sql, (time.perf_counter() - started) * 1000, self._role)
+
+    def executemany(self, sql: str, seq_of_params):
+        prepared = self._prepare(sql)
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(prepared, seq_of_params)
+        finally:
+            record_query(sql, (time.perf_counter() - started) * 1000, self._role)
+
+    def _to_dict(self, row):
+        if row is None or not self._as_dict:
+            return row
+        columns = [col[0] for col in (self._cursor.description or ())]
+        return dict(zip(columns, row))
+
+    def fetchone(self):
+        return self._to_dict(self._cursor.fetchone())
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if not self._as_dict:
+            return rows
+        columns = [col[0] for col in (self._cursor.description or ())]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def fetchmany(self, size: int = 1):
+        rows = self._cursor.fetchmany(size)
+        if not self._as_dict:
+            return rows
+        columns = [col[0] for col in (self._cursor.description or ())]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def __getattr__(self, name):
+        # lastrowid, rowcount, description, close ...
+        return getattr(self._cursor, name)
+
+
+class _ConnectionHandle:
+    """
+    `with db as conn:` bloğunda dönen tutamaç.
+
+    Attributes:
+        cursor: Dict satır döndüren cursor (`conn.cursor.execute(...)`)
+        connection: Pool'dan alınmış DBAPI bağlantısı (`conn.connection.commit()`)
+        role: 'primary' veya 'replica'
+    """
+
+    def __init__(self, manager: "DatabaseConnectionManager", engine: "Engine", role: str):
+        self.manager = manager
+        self.engine = engine
+        self.role = role
+        self.depth = 1
+        self.connection = engine.raw_connection()
+        self.cursor = manager._make_cursor(self.connection, engine, role=role)
+
+    def new_cursor(self, dictionary: bool = True):
+        """Aynı bağlantı üzerinde ek bir cursor açar."""
+        return self.manager._make_cursor(self.connection, self.engine, role=self.role, dictionary=dictionary)
+
+    def release(self, success: bool) -> None:
+        """Transaction'ı sonlandırır ve bağlantıyı pool'a iade eder."""
+        try:
+            if success and self.role == 'primary':
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+        finally:
+            try:
+                self.cursor.close()
+            except Exception:
+                pass
+            self.connection.close()
+
+
 class DatabaseConnectionManager:
     """
     Modern veritabanı bağlantı yöneticisi - hem sync hem async destek.
@@ -312,9 +501,11 @@ class DatabaseConnectionManager:
             config: DatabaseConfig nesnesi. Eğer verilmezse, config sisteminden
                    otomatik olarak yüklenir.
                    
+        Engine'ler burada oluşturulmaz; ilk sorguda (`with`, session veya
+        execute_query) config doğrulanır ve bağlantılar kurulur.
+        
         Raises:
             ImportError: SQLAlchemy kullanılamıyorsa
-            ValueError: Config validation başarısız olursa
             
         Example:
             # Otomatik config yükleme
@@ -340,11 +531,20 @@ class DatabaseConnectionManager:
         self._async_session_factory: Optional[async_sessionmaker] = None
         self._connection_healthy = False
         
-        # Konfigürasyonu doğrula
-        self._validate_config()
+        # Read replica durumu
+        self._replica_engines: List[Engine] = []
+        self._replica_lag_cache: Dict[int, Tuple[float, Optional[float]]] = {}
+        self._replica_cycle = itertools.count()
+        self._heartbeat_table_ready = False
+        
+        # `with db as conn` tutamaçları (thread başına, iç içe kullanım için yığın)
+        self._local = threading.local()
         
-        # Bağlantıları başlat
-        self._initialize_connections()
+        # Doğrulama ve engine oluşturma ilk kullanıma (_ensure_connection) ertelenir;
+        # modül seviyesinde oluşturulan manager'lar import'u veritabanına bağlamaz
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        _managers.add(self)
     
     def _validate_config(self) -> None:
         """
@@ -357,19 +557,23 @@ class DatabaseConnectionManager:
             ValueError: Gerekli config değerleri eksik veya geçersizse
             
         Example:
-            # Bu metot __init__ içinde otomatik çağrılır
+            # Bu metot ilk kullanımda _ensure_connection() içinde çağrılır
             # Manuel olarak çağırmaya gerek yoktur
         """
-        # Zorunlu alanları kontrol et
-        required_fields = ['host', 'port', 'username', 'password', 'database']
-        missing_fields = [field for field in required_fields if not getattr(self.config, field)]
-        
-        if missing_fields:
-            raise ValueError(f"Missing required database configuration: {missing_fields}")
+        # Zorunlu alanları kontrol et (tam URL verildiyse host/port/... gerekmez)
+        if not self.config.primary_url:
+            required_fields = ['host', 'port', 'username', 'password', 'database']
+            missing_fields = [field for field in required_fields if not getattr(self.config, field)]
+            
+            if missing_fields:
+                raise ValueError(f"Missing required database configuration: {missing_fields}")
+            
+            # Port numarasının geçerli olduğunu kontrol et
+            if not (1 <= self.config.port <= 65535):
+                raise ValueError(f"Invalid database port: {self.config.port}")
         
-        # Port numarasının geçerli olduğunu kontrol et
-        if not (1 <= self.config.port <= 65535):
-            raise ValueError(f"Invalid database port: {self.config.port}")
+        if self.config.replica_max_lag_seconds < 0:
+            raise ValueError(f"Invalid replica max lag: {self.config.replica_max_lag_seconds}")
         
         # Pool ayarlarının geçerli olduğunu kontrol et
         if self.config.pool_size <= 0:
@@ -391,46 +595,78 @@ class DatabaseConnectionManager:
             Exception: Engine oluşturma başarısız olursa
             
         Example:
-            # Bu metot __init__ içinde otomatik çağrılır
+            # Bu metot ilk kullanımda _ensure_connection() içinde çağrılır
             # Manuel olarak çağırmaya gerek yoktur
         """
         try:
+            # SQL echo, SQLAlchemy'nin kendi stderr handler'ı yerine uygulama log
+            # hattından geçer; LOG_LEVEL'da sqlalchemy.engine için seviye
+            # verilmişse o kullanılır
+            sql_logger = logging.getLogger('sqlalchemy.engine')
+            if self.config.echo and sql_logger.level == logging.NOTSET:
+                sql_logger.setLevel(logging.INFO)
+            
             # Senkron engine oluştur
             sync_url = self._build_connection_url(is_async=False)
-            self._sync_engine = create_engine(
-                sync_url,
-                poolclass=QueuePool,
-                pool_size=self.config.pool_size,
-                max_overflow=self.config.max_overflow,
-                pool_timeout=self.config.pool_timeout,
-                pool_recycle=self.config.pool_recycle,
-                pool_pre_ping=self.config.pool_pre_ping,
-                echo=self.config.echo
-            )
+            self._sync_engine = self._create_sync_engine(sync_url)
             self._sync_session_factory = sessionmaker(bind=self._sync_engine)
             
-            # Asenkron engine oluştur
-            async_url = self._build_connection_url(is_async=True)
-            self._async_engine = create_async_engine(
-                async_url,
-                poolclass=QueuePool,
-                pool_size=self.config.pool_size,
-                max_overflow=self.config.max_overflow,
-                pool_timeout=self.config.pool_timeout,
-                pool_recycle=self.config.pool_recycle,
-                pool_pre_ping=self.config.pool_pre_ping,
-                echo=self.config.echo
-            )
-            self._async_session_factory = async_sessionmaker(bind=self._async_engine)
+            # Primary üzerindeki yazmaları read-your-writes için işaretle
+            event.listen(self._sync_engine, "before_cursor_execute", self._on_primary_cursor_execute)
+            
+            # Asenkron engine oluştur (tam URL override'ında async sürücü bilinmez)
+            if not self.config.primary_url:
+                async_url = self._build_connection_url(is_async=True)
+                self._async_engine = create_async_engine(
+                    async_url,
+                    poolclass=QueuePool,
+                    pool_size=self.config.pool_size,
+                    max_overflow=self.config.max_overflow,
+                    pool_timeout=self.config.pool_timeout,
+                    pool_recycle=self.config.pool_recycle,
+                    pool_pre_ping=self.config.pool_pre_ping,
+                    echo=False
+                )
+                self._async_session_factory = async_sessionmaker(bind=self._async_engine)
+            
+            # Read replica engine'leri (lazy bağlanır, burada sorgu atılmaz)
+            # (query_role execution option'ı sorgu istatistiklerinde rolü ayırır)
+            self._replica_engines = [
+                self._create_sync_engine(url).execution_options(query_role='replica')
+                for url in self.config.replica_urls
+            ]
             
             # Bağlantı sağlığını test et
             self._test_connection_health()
-            logger.info(f"Database connections initialized successfully for {self.config.database}")
+            if self._replica_engines:
+                self._start_heartbeat()
+            logger.info(f"Database connections initialized successfully for {self.config.database} "
+                        f"({len(self._replica_engines)} read replica)")
             
         except Exception as e:
             logger.error(f"Failed to initialize database connections: {e}")
             raise
     
+    def _create_sync_engine(self, url: str) -> "Engine":
+        """
+        Verilen URL için senkron engine oluşturur.
+        
+        SQLite (stand-in) için pool ayarları sürücüye uygun olmadığından
+        SQLAlchemy varsayılanları kullanılır.
+        """
+        if make_url(url).get_backend_name() == 'sqlite':
+            return create_engine(url, echo=False)
+        return create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_timeout=self.config.pool_timeout,
+            pool_recycle=self.config.pool_recycle,
+            pool_pre_ping=self.config.pool_pre_ping,
+            echo=False
+        )
+    
     def _build_connection_url(self, is_async: bool = False) -> str:
         """
         Database connection URL'i oluşturur.
@@ -446,6 +682,9 @@ class DatabaseConnectionManager:
             sync_url = self._build_connection_url(is_async=False)
             async_url = self._build_connection_url(is_async=True)
         """
+        if self.config.primary_url and not is_async:
+            return self.config.primary_url
+        
         protocol = "mysql+aiomysql" if is_async else "mysql+mysqlconnector"
         
         return (
@@ -522,6 +761,10 @@ class DatabaseConnectionManager:
             print(f"Healthy: {health['healthy']}")
             print(f"Active connections: {health['active_connections']}")
         """
+        try:
+            self._ensure_connection()
+        except Exception as e:
+            logger.warning(f"Database health status unavailable: {e}")
         return {
             "healthy": self._connection_healthy,
             "host": self.config.host,
@@ -532,7 +775,8 @@ class DatabaseConnectionManager:
             "pool_size": self.config.pool_size,
             "max_overflow": self.config.max_overflow,
             "active_connections": self._sync_engine.pool.size() if self._sync_engine else 0,
-            "checked_out_connections": self._sync_engine.pool.checkedout() if self._sync_engine else 0
+            "checked_out_connections": self._sync_engine.pool.checkedout() if self._sync_engine else 0,
+            "replicas": self.get_replica_status()
         }
     
     def get_config_info(self) -> Dict[str, Any]:
@@ -575,17 +819,23 @@ class DatabaseConnectionManager:
             "pool_timeout": self.config.pool_timeout,
             "pool_recycle": self.config.pool_recycle,
             "pool_pre_ping": self.config.pool_pre_ping,
-            "echo": self.config.echo
+            "echo": self.config.echo,
+            "replica_count": len(self.config.replica_urls),
+            "replica_max_lag_seconds": self.config.replica_max_lag_seconds
         }
     
     @contextmanager
-    def get_sync_session(self) -> Generator[Session, None, None]:
+    def get_sync_session(self, read_only: bool = False) -> Generator[Session, None, None]:
         """
         Senkron database session verir (otomatik cleanup ile).
         
         Bu metot, context manager olarak kullanılır ve session'ın
         otomatik olarak commit/rollback ve cleanup yapılmasını sağlar.
         
+        Args:
+            read_only: True ise session uygun bir read replica'ya bağlanır
+                       (yoksa veya gecikmeliyse primary kullanılır)
+        
         Yields:
             Session: SQLAlchemy session nesnesi
             
@@ -606,10 +856,14 @@ class DatabaseConnectionManager:
             except Exception:
                 # Session otomatik olarak rollback edilir
         """
+        self._ensure_connection()
         if not self._sync_session_factory:
             raise RuntimeError("Sync session factory not initialized")
         
-        session = self._sync_session_factory()
+        if read_only:
+            session = Session(bind=self._choose_read_engine())
+        else:
+            session = self._sync_session_factory()
         try:
             yield session
             session.commit()
@@ -647,6 +901,7 @@ class DatabaseConnectionManager:
             except Exception:
                 # Session otomatik olarak rollback edilir
         """
+        self._ensure_connection()
         if not self._async_session_factory:
             raise RuntimeError("Async session factory not initialized")
         
@@ -660,7 +915,8 @@ class DatabaseConnectionManager:
         finally:
             await session.close()
     
-    def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                      read_only: bool = False) -> Any:
         """
         Senkron olarak raw SQL sorgusu çalıştırır.
         
@@ -670,6 +926,7 @@ class DatabaseConnectionManager:
         Args:
             query: Çalıştırılacak SQL sorgusu
             params: Sorgu parametreleri (opsiyonel)
+            read_only: True ise sorgu uygun bir read replica'da çalıştırılır
             
         Returns:
             Any: Sorgu sonucu
@@ -692,11 +949,13 @@ class DatabaseConnectionManager:
             for row in result:
                 print(row)
         """
+        self._ensure_connection()
         if not self.is_healthy():
             raise RuntimeError("Database connection is not healthy")
         
+        engine = self._choose_read_engine() if read_only else self._sync_engine
         try:
-            with self._sync_engine.connect() as conn:
+            with engine.connect() as conn:
                 result = conn.execute(text(query), params or {})
                 return result
         except Exception as e:
@@ -735,6 +994,7 @@ class DatabaseConnectionManager:
             for row in result:
                 print(row)
         """
+        self._ensure_connection()
         if not self._async_engine:
             raise RuntimeError("Async engine not initialized")
         
@@ -760,6 +1020,7 @@ class DatabaseConnectionManager:
                 print("Database bağlantısı başarısız")
         """
         try:
+            self._ensure_connection()
             self._test_connection_health()
             return self._connection_healthy
         except Exception as e:
@@ -780,6 +1041,7 @@ class DatabaseConnectionManager:
                 print("Database bağlantısı başarısız")
         """
         try:
+            self._ensure_connection()
             async with self._async_engine.connect() as conn:
                 await conn.execute(text("SELECT 1"))
                 return True
@@ -809,6 +1071,11 @@ class DatabaseConnectionManager:
                 self._sync_engine.dispose()
                 self._sync_engine = None
             
+            for engine in self._replica_engines:
+                engine.dispose()
+            self._replica_engines = []
+            self._replica_lag_cache.clear()
+            
             if self._async_engine:
                 # Async engine için dispose işlemi
                 try:
@@ -825,35 +1092,303 @@ class DatabaseConnectionManager:
                     self._async_engine = None
             
             self._connection_healthy = False
+            self._initialized = False
             logger.info(f"All database connections closed for {self.config.database}")
             
         except Exception as e:
             logger.error(f"Error closing database connections: {e}")
     
-    def __enter__(self):
+    def __enter__(self) -> _ConnectionHandle:
         """
-        Senkron context manager giriş metodu.
+        Senkron context manager giriş metodu (primary).
+        
+        Pool'dan bir primary bağlantısı alır ve eski repository API'si ile
+        uyumlu bir tutamaç döner. Aynı thread'de iç içe kullanımda mevcut
+        primary tutamacı yeniden kullanılır (tek transaction).
         
         Returns:
-            DatabaseConnectionManager: Kendisi
+            _ConnectionHandle: `cursor` ve `connection` attribute'ları olan tutamaç
             
         Example:
-            with db_manager as db:
-                # Database işlemleri
-                pass
+            with db_manager as conn:
+                conn.cursor.execute("SELECT * FROM users WHERE user_id = %s", (1,))
+                row = conn.cursor.fetchone()
         """
-        return self
+        stack = self._handle_stack()
+        if stack and stack[-1].role == 'primary':
+            stack[-1].depth += 1
+            return stack[-1]
+        self._ensure_connection()
+        handle = _ConnectionHandle(self, self._sync_engine, 'primary')
+        stack.append(handle)
+        return handle
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Senkron context manager çıkış metodu.
         
-        Bu metot, context'ten çıkıldığında otomatik olarak
-        çağrılır. Bağlantıları burada kapatmıyoruz çünkü
-        uygulama lifecycle'ını yönetmek istiyoruz.
+        En dıştaki blokta transaction başarıyla biterse commit, hata varsa
+        rollback yapılır ve bağlantı pool'a iade edilir. Engine'ler
+        kapatılmaz; uygulama lifecycle'ı close_all_connections() ile yönetilir.
         """
-        # Bağlantıları burada kapatmıyoruz, uygulama lifecycle'ını yönetmek istiyoruz
-        pass
+        self._release_top(exc_type is None)
+        return False
+    
+    @contextmanager
+    def read_only(self) -> Generator[_ConnectionHandle, None, None]:
+        """
+        Salt okunur sorgular için tutamaç verir.
+        
+        Uygun (sağlıklı ve gecikmesi DB_REPLICA_MAX_LAG_SECONDS altında)
+        bir replica varsa ona, yoksa primary'ye bağlanır. Aynı request'te
+        daha önce yazma yapıldıysa (read-your-writes) veya zaten açık bir
+        tutamaç varsa primary / mevcut tutamaç kullanılır.
+        
+        Example:
+            with db_manager.read_only() as conn:
+                conn.cursor.execute("SELECT * FROM grades")
+                grades = conn.cursor.fetchall()
+        """
+        stack = self._handle_stack()
+        if stack:
+            stack[-1].depth += 1
+        else:
+            self._ensure_connection()
+            engine = self._choose_read_engine()
+            role = 'primary' if engine is self._sync_engine else 'replica'
+            stack.append(_ConnectionHandle(self, engine, role))
+        success = False
+        try:
+            yield stack[-1]
+            success = True
+        finally:
+            self._release_top(success)
+    
+    def _handle_stack(self) -> List[_ConnectionHandle]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def _release_top(self, success: bool) -> None:
+        stack = self._handle_stack()
+        if not stack:
+            return
+        handle = stack[-1]
+        handle.depth -= 1
+        if handle.depth > 0:
+            return
+        stack.pop()
+        handle.release(success)
+    
+    def _make_cursor(self, raw_connection, engine: "Engine", role: str, dictionary: bool = True):
+        """
+        Sürücüye uygun cursor oluşturur.
+        
+        mysql.connector kendi dict/buffered cursor'ını kullanır; diğer
+        sürücülerde satırlar _CursorWrapper ile dict'e çevrilir.
+        """
+        on_write = self._note_write if role == 'primary' else None
+        dialect = engine.dialect
+        if dialect.driver == 'mysqlconnector':
+            cursor = raw_connection.cursor(dictionary=dictionary, buffered=True)
+            return _CursorWrapper(cursor, as_dict=dictionary, convert_rows=False,
+                                  qmark=False, on_write=on_write, role=role)
+        return _CursorWrapper(raw_connection.cursor(), as_dict=dictionary, convert_rows=True,
+                              qmark=dialect.paramstyle == 'qmark', on_write=on_write, role=role)
+    
+    # ------------------------------------------------------------------
+    # Legacy API (eski DatabaseConnection arayüzü)
+    # ------------------------------------------------------------------
+    
+    def _ensure_connection(self) -> None:
+        """
+        Engine'leri ilk kullanımda (veya close() sonrası) oluşturur.
+        
+        Thread-safe'dir; eşzamanlı ilk istekler tek bir başlatmayı bekler.
+        Config eksikse ValueError burada, ilk sorguda yükselir.
+        """
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._validate_config()
+            self._initialize_connections()
+            self._initialized = True
+    
+    def close(self) -> None:
+        """Geriye dönük uyumluluk: close_all_connections() için takma ad."""
+        self.close_all_connections()
+    
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Engine'leri kurar ve primary pool'a `connections` adet bağlantı açar.
+        
+        Bağlantılar aynı anda checkout edilip SELECT 1 ile doğrulanır, sonra
+        pool'a iade edilir; ilk istekler TCP/TLS/auth maliyetini ödemez.
+        
+        Returns:
+            int: Açılan bağlantı sayısı
+        """
+        self._ensure_connection()
+        opened = []
+        try:
+            for _ in range(max(0, connections)):
+                conn = self._sync_engine.connect()
+                opened.append(conn)
+                conn.execute(text("SELECT 1"))
+            self._connection_healthy = True
+        finally:
+            for conn in opened:
+                conn.close()
+        return len(opened)
+    
+    # ------------------------------------------------------------------
+    # Read Replica Yönlendirme
+    # ------------------------------------------------------------------
+    
+    def _on_primary_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """SQLAlchemy event: primary engine üzerindeki yazmaları işaretler."""
+        if _is_write_statement(statement):
+            self._note_write(statement)
+    
+    def _note_write(self, statement: str) -> None:
+        """
+        Primary'ye yazma yapıldığını kaydeder (read-your-writes).
+        
+        Request içindeyse flask.g üzerinde, değilse thread bazında zaman
+        damgası tutulur. Heartbeat yazmaları sayılmaz.
+        """
+        if 'replica_heartbeat' in statement:
+            return
+        _sticky_state.last_write_at = time.monotonic()
+        try:
+            from flask import g, has_request_context
+            if has_request_context():
+                g._db_wrote_primary = True
+        except ImportError:
+            pass
+    
+    def _should_stick_to_primary(self) -> bool:
+        """Bu request/thread'de yakın zamanda yazma yapıldı mı?"""
+        try:
+            from flask import g, has_request_context
+            if has_request_context():
+                return bool(getattr(g, '_db_wrote_primary', False))
+        except ImportError:
+            pass
+        last_write_at = getattr(_sticky_state, 'last_write_at', None)
+        if last_write_at is None:
+            return False
+        return (time.monotonic() - last_write_at) < self.config.replica_max_lag_seconds
+    
+    def _choose_read_engine(self) -> "Engine":
+        """
+        Okuma sorgusu için engine seçer.
+        
+        Replica'lar round-robin sırayla denenir; gecikmesi ölçülemeyen veya
+        eşiği aşan replica atlanır. Uygun replica yoksa primary döner.
+        """
+        if not self._replica_engines or self._should_stick_to_primary():
+            return self._sync_engine
+        count = len(self._replica_engines)
+        start = next(self._replica_cycle) % count
+        for offset in range(count):
+            index = (start + offset) % count
+            lag = self.get_replica_lag(index)
+            if lag is not None and lag <= self.config.replica_max_lag_seconds:
+                return self._replica_engines[index]
+        return self._sync_engine
+    
+    def get_replica_lag(self, index: int) -> Optional[float]:
+        """
+        Replica gecikmesini (saniye) heartbeat tablosundan ölçer.
+        
+        Sonuç replica_lag_check_interval süresince cache'lenir. Replica'ya
+        ulaşılamıyorsa veya heartbeat satırı yoksa None döner.
+        """
+        now = time.monotonic()
+        cached = self._replica_lag_cache.get(index)
+        if cached and (now - cached[0]) < self.config.replica_lag_check_interval:
+            return cached[1]
+        lag: Optional[float] = None
+        try:
+            with self._replica_engines[index].connect() as conn:
+                heartbeat_at = conn.execute(
+                    text("SELECT heartbeat_at FROM replica_heartbeat WHERE id = 1")
+                ).scalar()
+            if heartbeat_at is not None:
+                lag = max(0.0, time.time() - float(heartbeat_at))
+        except Exception as e:
+            logger.warning(f"Replica #{index} lag check failed: {e}")
+        self._replica_lag_cache[index] = (now, lag)
+        return lag
+    
+    def write_heartbeat(self) -> bool:
+        """
+        Primary üzerindeki heartbeat satırını günceller.
+        
+        UPDATE/INSERT ile taşınabilir tutulmuştur (MySQL ve SQLite).
+        
+        Returns:
+            bool: Yazma başarılıysa True
+        """
+        if self._sync_engine is None:
+            return False
+        try:
+            with self._sync_engine.begin() as conn:
+                if not self._heartbeat_table_ready:
+                    conn.execute(text(REPLICA_HEARTBEAT_TABLE_SQL))
+                    self._heartbeat_table_ready = True
+                params = {"ts": time.time()}
+                result = conn.execute(
+                    text("UPDATE replica_heartbeat SET heartbeat_at = :ts WHERE id = 1"), params
+                )
+                if result.rowcount == 0:
+                    conn.execute(
+                        text("INSERT INTO replica_heartbeat (id, heartbeat_at) VALUES (1, :ts)"), params
+                    )
+            return True
+        except Exception as e:
+            logger.warning(f"Replica heartbeat write failed: {e}")
+            return False
+    
+    def _start_heartbeat(self) -> None:
+        """Primary URL başına tek bir daemon heartbeat thread'i başlatır."""
+        key = str(self._sync_engine.url)
+        with _heartbeat_lock:
+            thread = _heartbeat_threads.get(key)
+            if thread is not None and thread.is_alive():
+                return
+            period = max(0.5, min(self.config.replica_lag_check_interval,
+                                  self.config.replica_max_lag_seconds / 2 or 0.5))
+            
+            def _run() -> None:
+                while self._sync_engine is not None:
+                    self.write_heartbeat()
+                    time.sleep(period)
+            
+            thread = threading.Thread(target=_run, name="db-replica-heartbeat", daemon=True)
+            _heartbeat_threads[key] = thread
+            thread.start()
+    
+    def get_replica_status(self) -> List[Dict[str, Any]]:
+        """
+        Replica'ların durum özetini verir (şifreler gizlenir).
+        
+        Returns:
+            List[Dict[str, Any]]: url, lag_seconds ve usable alanları
+        """
+        status = []
+        for index, engine in enumerate(self._replica_engines):
+            lag = self.get_replica_lag(index)
+            status.append({
+                "url": engine.url.render_as_string(hide_password=True),
+                "lag_seconds": lag,
+                "usable": lag is not None and lag <= self.config.replica_max_lag_seconds
+            })
+        return status
     
     async def __aenter__(self):
         """
@@ -920,6 +1455,77 @@ def get_database_manager(config_class=None) -> DatabaseConnectionManager:
     return DatabaseConnectionManager(db_config)
 
 
+def warm_up_pools(connections: int = 1) -> Dict[str, Any]:
+    """
+    Süreçteki canlı tüm manager'ların pool'larını önceden doldurur.
+    
+    Modül seviyesinde tutulan (repository/servis) manager'lar hedeflenir;
+    istek başına oluşturulanlar zaten toplanmış olur.
+    
+    Returns:
+        Dict[str, Any]: {'managers', 'connections', 'errors'}
+    """
+    result = {'managers': 0, 'connections': 0, 'errors': 0}
+    for manager in list(_managers):
+        try:
+            result['connections'] += manager.warm_up(connections)
+            result['managers'] += 1
+        except Exception as e:
+            result['errors'] += 1
+            logger.warning(f"Database pool warm-up failed for {manager.config.database}: {e}")
+    return result
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """
+    Süreçteki canlı manager'ların pool kullanımını verir (metrik örnekleyici için).
+    
+    Engine'i henüz oluşturulmamış manager'lar atlanır; bu fonksiyon bağlantı açmaz.
+    
+    Returns:
+        List[Dict[str, Any]]: [{'database', 'size', 'checked_out', 'overflow', 'capacity'}]
+    """
+    result = []
+    for manager in list(_managers):
+        engine = manager._sync_engine
+        if engine is None:
+            continue
+        pool = engine.pool
+        try:
+            result.append({
+                'database': manager.config.database,
+                'size': pool.size(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow(),
+                'capacity': manager.config.pool_size + manager.config.max_overflow,
+            })
+        except Exception:
+            # StaticPool/NullPool gibi pool'larda sayaçlar yoktur
+            continue
+    return result
+
+
+def reset_after_fork() -> None:
+    """
+    Fork edilen worker'da ebeveynden devralınan pool bağlantılarını bırakır.
+    
+    Soketler ebeveyn süreçle paylaşıldığından kapatılmaz (close=False);
+    yalnızca bu süreçteki pool'lar yenilenir. Heartbeat thread'leri fork'tan
+    sağ çıkmadığı için yeniden başlatılır.
+    """
+    with _heartbeat_lock:
+        _heartbeat_threads.clear()
+    for manager in list(_managers):
+        engines = [manager._sync_engine, *manager._replica_engines]
+        if manager._async_engine is not None:
+            engines.append(manager._async_engine.sync_engine)
+        for engine in engines:
+            if engine is not None:
+                engine.dispose(close=False)
+        if manager._sync_engine is not None and manager._replica_engines:
+            manager._start_heartbeat()
+
+
 # ================================================================================
 # LEGACY COMPATIBILITY (GERİYE DÖNÜK UYUMLULUK)
 # ================================================================================
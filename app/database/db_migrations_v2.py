@@ -24,8 +24,13 @@
 #    3.3. seed_default_users(self)
 #    3.4. seed_questions_from_dir(self)
 #    3.4.b. seed_questions_file(self)
+#    3.4.c. sync_questions_from_dir(self, directory)
 #    3.5. seed_questions_if_empty(self)
 #    3.6. get_table_info(self)
+#    3.7. repair_answerable_flags(self, dry_run)
+#    3.8. purge_expired_data(self, policies, dry_run)
+#    3.9. partition_tables(self, tables, dry_run)
+#    3.10. maintain_partitions(self, dry_run, drop_expired)
 #
 # 4. Dahili Yardımcılar: Veritabanı İşlemleri (Internal Helpers: Database Operations)
 #    4.1. _exec(self, conn, sql, params)
@@ -37,12 +42,13 @@
 #    5.2. _seed_curriculum_from_json(self, conn)
 # =============================================================================
 
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple, Any
 from mysql.connector import Error as MySQLError
 
 from app.database.db_connection import DatabaseConnection
-from app.database.migrations import SchemaManager, IndexManager
+from app.database.migrations import SchemaManager, IndexManager, RetentionManager, PartitionManager
 from app.database.seeders import SeedManager
+from app.database.repositories.question_repository import QuestionRepository
 
 
 class DatabaseMigrations:
@@ -73,6 +79,7 @@ class DatabaseMigrations:
         self.schema_manager = SchemaManager(self.db)
         self.index_manager = IndexManager(self.db)
         self.seed_manager = SeedManager(self.db)
+        self.partition_manager = PartitionManager(self.db)
 
         # Raporlama ve yardımcı fonksiyonlar için tablo sırası
         self.table_order = self.schema_manager.table_order
@@ -98,11 +105,16 @@ class DatabaseMigrations:
         2.1. Ana geçiş fonksiyonu. Veritabanındaki tüm tabloların tanımlanmış
              şemalara göre var olmasını sağlar. Sadece eksik tabloları oluşturur.
         
+        Partition'lı tablolar varsa ileri tarihli aylık partition'ları da açar.
+        
         Returns:
             Tüm tablolar başarıyla oluşturulduysa veya zaten varsa True,
             aksi takdirde False.
         """
-        return self.schema_manager.ensure_tables()
+        ok = self.schema_manager.ensure_tables()
+        if ok:
+            self.maintain_partitions()
+        return ok
 
     def create_tables(self) -> bool:
         """
@@ -202,6 +214,21 @@ class DatabaseMigrations:
         except Exception:
             return (0, 0)
 
+    def sync_questions_from_dir(self, directory: str) -> Dict[str, Dict[str, Any]]:
+        """
+        3.4.c. Soru bankası dizinini artımlı senkronize eder: yalnızca içeriği
+             değişen dosyalara soru bazında insert/update/deactivate uygular.
+
+        Returns:
+            Kaynak dosya -> {'status', 'inserted', 'updated', 'deactivated'} sözlüğü.
+        """
+        try:
+            if not self.schema_manager.ensure_tables():
+                return {}
+            return self.seed_manager.sync_questions_from_dir(directory)
+        except Exception:
+            return {}
+
     def seed_questions_if_empty(self, directory: str) -> Optional[Dict[str, Tuple[int, int]]]:
         """
         3.5. Veritabanında hiç soru yoksa, verilen dizinden soruları seed eder.
@@ -240,6 +267,54 @@ class DatabaseMigrations:
             pass
         return info
 
+    def repair_answerable_flags(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        3.7. questions.option_count / is_answerable alanlarını gerçek seçenek
+             sayılarıyla karşılaştırır ve sapmaları düzeltir.
+
+        Returns:
+            {'checked': ..., 'drifted': ..., 'fixed': ...} sözlüğü.
+        """
+        return QuestionRepository(self.db).repair_answerable(dry_run=dry_run)
+
+    def purge_expired_data(self, policies: Optional[List[str]] = None,
+                           dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        3.8. Saklama süresi dolmuş verileri (chat, aktivite, terk edilmiş quiz
+             oturumları) PK sırasıyla parça parça siler.
+
+        Returns:
+            Politika adı -> RetentionManager.purge() raporu.
+        """
+        return RetentionManager(self.db).purge_all(policies, dry_run=dry_run)
+
+    def partition_tables(self, tables: Optional[List[str]] = None,
+                         dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        3.9. chat_messages / user_activities tablolarını aylık RANGE
+             partition'lı yapıya dönüştürür (yalnızca MySQL). Tablo yeniden
+             yazıldığından bakım penceresinde çalıştırılmalıdır.
+
+        Returns:
+            Tablo adı -> PartitionManager.partition_table() raporu.
+        """
+        from app.database.schemas.partitioning import PARTITIONED_TABLES
+        return {
+            table: self.partition_manager.partition_table(table, dry_run=dry_run)
+            for table in (tables or list(PARTITIONED_TABLES))
+        }
+
+    def maintain_partitions(self, dry_run: bool = False,
+                            drop_expired: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        3.10. Partition'lı tablolar için ileri tarihli partition'ları açar;
+              drop_expired=True ise saklama süresi dolmuş ayları düşürür.
+
+        Returns:
+            Tablo adı -> {'supported', 'partitioned', 'created', 'dropped'}.
+        """
+        return self.partition_manager.maintain(dry_run=dry_run, drop_expired=drop_expired)
+
     # =========================================================================
     # 4. Dahili Yardımcılar: Veritabanı İşlemleri (Internal Helpers: Database Operations)
     # =========================================================================
@@ -1,7 +1,14 @@
 from .schema_manager import SchemaManager
 from .index_manager import IndexManager
+from .index_advisor import IndexAdvisor
+from .retention_manager import RetentionManager, RETENTION_POLICIES
+from .partition_manager import PartitionManager
 
 __all__ = [
     "SchemaManager",
     "IndexManager",
+    "IndexAdvisor",
+    "RetentionManager",
+    "RETENTION_POLICIES",
+    "PartitionManager",
 ]
@@ -0,0 +1,757 @@
+# =============================================================================
+# INDEX ADVISOR
+# =============================================================================
+# Uygulamanın sorgu günlüğünden (query_instrumentation fingerprint'leri ve
+# slow-query log'u) ifadeleri toplar, her biri için hangi kolonlarla
+# filtrelendiğini/sıralandığını çıkarır, mevcut index'lerle karşılaştırır ve
+# bir migration planı üretir:
+#
+#   - eksik composite index'ler (eşitlik kolonları + aralık/ORDER BY kolonu)
+#   - başka bir index'in sol öneki olan (redundant) index'ler
+#   - hiç kullanılmayan index'ler (performance_schema veya fingerprint'lere göre)
+#
+# Veritabanına erişilebiliyorsa index listesi INFORMATION_SCHEMA'dan okunur ve
+# ifadeler EXPLAIN ile doğrulanır; erişilemiyorsa app/database/schemas
+# altındaki CREATE TABLE tanımları kullanılır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. SQL AYRIŞTIRMA YARDIMCILARI
+#   4.1. parse_schema_sql(sql)
+#   4.2. analyze_statement(fp, columns_by_table)
+# 5.0. INDEX ADVISOR SINIFI
+#   5.1. Constructor ve Başlatma
+#   5.2. Girdi Toplama
+#     5.2.1. add_statement(self, sql, count, total_ms, sample)
+#     5.2.2. load_fingerprints(self, path)
+#     5.2.3. load_slow_log(self, path)
+#     5.2.4. load_runtime_stats(self)
+#     5.2.5. scan_source(self, root)
+#   5.3. Mevcut Index'ler
+#   5.4. Analiz
+#     5.4.1. analyze(self, explain, include_drops)
+#     5.4.2. migration_plan(self, report, include_drops)
+#   5.5. format_report(report)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import ast
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.database.query_instrumentation import fingerprint, get_query_stats
+from app.database.migrations.schema_manager import TABLE_SCHEMAS
+
+# Index önerisi üretilmeyecek tablolar (altyapı tabloları)
+IGNORED_TABLES = {'replica_heartbeat'}
+
+# MySQL index adı sınırı
+MAX_INDEX_NAME_LENGTH = 64
+
+_SQL_KEYWORDS = {
+    'where', 'join', 'inner', 'left', 'right', 'outer', 'cross', 'on', 'set',
+    'order', 'group', 'limit', 'having', 'union', 'values', 'using', 'as',
+    'select', 'from', 'and', 'or', 'natural', 'straight_join', 'for', 'lock',
+}
+_RANGE_OPS = {'<', '>', '<=', '>=', 'between', 'like'}
+_EQ_OPS = {'=', '<=>', 'in', 'is'}
+
+# =============================================================================
+# 4.0. SQL AYRIŞTIRMA YARDIMCILARI
+# =============================================================================
+
+_RE_LINE_COMMENT = re.compile(r'--[^\n]*')
+_RE_CREATE_TABLE = re.compile(r'create\s+table\s+(?:if\s+not\s+exists\s+)?`?(\w+)`?\s*\((.*)\)', re.I | re.S)
+_RE_INDEX_DEF = re.compile(r'^(unique\s+key|unique\s+index|unique|index|key)\s+`?(\w+)`?\s*\(([^)]*)\)', re.I)
+_RE_PK_DEF = re.compile(r'^primary\s+key\s*\(([^)]*)\)', re.I)
+_RE_FK_DEF = re.compile(r'^(?:constraint\s+\w+\s+)?foreign\s+key\s*\(([^)]*)\)', re.I)
+_RE_COLUMN_DEF = re.compile(r'^`?(\w+)`?\s+\w+', re.I)
+
+_RE_TABLE_REF = re.compile(r'\b(from|join|update|into)\s+`?(\w+)`?(?:\s+(?:as\s+)?(\w+))?', re.I)
+_RE_PREDICATE = re.compile(
+    r'(?:\b(\w+)\.)?\b(\w+)\s*(<=>|>=|<=|<>|!=|=|<|>|\bin\b|\blike\b|\bbetween\b|\bis\b)\s*'
+    r'(\(\?\+\)|\(\s*select\b|\w+\.\w+|\?|\bnull\b|\bnot\s+null\b|\btrue\b|\bfalse\b|\w+)',
+    re.I
+)
+# Cümlecik sınırları; yalnızca WHERE ve JOIN ... ON bölümlerinden koşul okunur
+# (SELECT listesindeki CASE ifadeleri, UPDATE SET atamaları ve VALUES
+# listeleri index kolonu değildir)
+_RE_CLAUSE = re.compile(
+    r'\b(on\s+duplicate\s+key\s+update|where|on|select|from|join|group\s+by|order\s+by|having|'
+    r'limit|offset|set|update|union|values|using|into|for\s+update)\b',
+    re.I
+)
+_FILTER_CLAUSES = {'where', 'on'}
+_RE_ORDER_BY = re.compile(r'\border\s+by\s+(.+?)(?=\blimit\b|\boffset\b|\)|\bfor\s+update\b|$)', re.I | re.S)
+
+
+def _split_columns(cols_sql: str) -> List[str]:
+    """'(a, b(10) DESC)' -> ['a', 'b']"""
+    result = []
+    for part in cols_sql.split(','):
+        name = part.strip().strip('`').split('(')[0].split()[0] if part.strip() else ''
+        if name:
+            result.append(name.lower())
+    return result
+
+
+def _split_definitions(body: str) -> List[str]:
+    """CREATE TABLE gövdesini en üst seviyedeki virgüllerden böler."""
+    parts, depth, current = [], 0, []
+    for char in body:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def _filter_text(text: str) -> str:
+    """Sorgunun yalnızca WHERE ve JOIN ... ON bölümlerini (alt sorgular dahil) birleştirir."""
+    matches = list(_RE_CLAUSE.finditer(text))
+    parts = []
+    for i, match in enumerate(matches):
+        if match.group(1).lower() not in _FILTER_CLAUSES:
+            continue
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        parts.append(text[match.end():end])
+    return ' and '.join(parts)
+
+
+def parse_schema_sql(sql: str) -> Optional[Dict[str, Any]]:
+    """
+    4.1. CREATE TABLE ifadesinden kolonları, PK'yı, FK kolonlarını ve
+    index'leri çıkarır.
+
+    Returns:
+        {'table', 'columns', 'primary_key', 'foreign_keys',
+         'indexes': {name: {'columns': [...], 'unique': bool}}} veya None
+    """
+    match = _RE_CREATE_TABLE.search(_RE_LINE_COMMENT.sub('', sql or ''))
+    if not match:
+        return None
+    table = match.group(1).lower()
+    info: Dict[str, Any] = {
+        'table': table, 'columns': [], 'primary_key': [],
+        'foreign_keys': [], 'indexes': {},
+    }
+    for definition in _split_definitions(match.group(2)):
+        if not definition:
+            continue
+        pk = _RE_PK_DEF.match(definition)
+        if pk:
+            info['primary_key'] = _split_columns(pk.group(1))
+            continue
+        fk = _RE_FK_DEF.match(definition)
+        if fk:
+            info['foreign_keys'].extend(_split_columns(fk.group(1)))
+            continue
+        index = _RE_INDEX_DEF.match(definition)
+        if index:
+            info['indexes'][index.group(2)] = {
+                'columns': _split_columns(index.group(3)),
+                'unique': index.group(1).lower().startswith('unique'),
+            }
+            continue
+        column = _RE_COLUMN_DEF.match(definition)
+        if column and column.group(1).lower() not in ('constraint', 'check', 'fulltext', 'spatial'):
+            name = column.group(1).lower()
+            info['columns'].append(name)
+            if re.search(r'\bprimary\s+key\b', definition, re.I):
+                info['primary_key'] = [name]
+            elif re.search(r'\bunique\b', definition, re.I):
+                info['indexes'][name] = {'columns': [name], 'unique': True}
+    return info
+
+
+def analyze_statement(fp: str, columns_by_table: Dict[str, List[str]]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    4.2. Normalize edilmiş bir ifadeden tablo başına erişim kolonlarını çıkarır.
+
+    Sezgiseldir: alias'lar FROM/JOIN/UPDATE'ten çözülür, nitelenmemiş kolonlar
+    şemadaki kolon listesine göre tabloya atanır. Koşullar yalnızca WHERE ve
+    JOIN ... ON bölümlerinden, sıralama ORDER BY'dan okunur. Join kolonları
+    sürücü (ilk FROM) tablo dışındaki tablolar için eşitlik kolonu sayılır.
+
+    Returns:
+        {table: {'eq': [...], 'range': [...], 'order': [...], 'join': [...]}}
+    """
+    text = fp.lower()
+    verb = text.split(' ', 1)[0] if text else ''
+    if verb not in ('select', 'update', 'delete'):
+        return {}
+
+    aliases: Dict[str, str] = {}
+    tables: List[str] = []
+    for _, table, alias in _RE_TABLE_REF.findall(text):
+        if table in _SQL_KEYWORDS or table == 'dual':
+            continue
+        if table not in tables:
+            tables.append(table)
+        aliases[table] = table
+        if alias and alias not in _SQL_KEYWORDS:
+            aliases[alias] = table
+    if not tables:
+        return {}
+    driving = tables[0]
+    access = {table: {'eq': [], 'range': [], 'order': [], 'join': []} for table in tables}
+
+    def resolve(qualifier: Optional[str], column: str) -> Optional[str]:
+        if qualifier:
+            return aliases.get(qualifier)
+        owners = [t for t in tables if column in columns_by_table.get(t, [])]
+        if len(owners) == 1:
+            return owners[0]
+        if len(tables) == 1 and not columns_by_table.get(tables[0]):
+            return tables[0]
+        return None
+
+    def add(table: Optional[str], kind: str, column: str) -> None:
+        if not table or table not in access:
+            return
+        known = columns_by_table.get(table)
+        if known and column not in known:
+            return
+        if column not in access[table][kind]:
+            access[table][kind].append(column)
+
+    for qualifier, column, op, rhs in _RE_PREDICATE.findall(_filter_text(text)):
+        if column in _SQL_KEYWORDS or column == '?':
+            continue
+        op = op.strip()
+        table = resolve(qualifier or None, column)
+        join_match = re.match(r'(\w+)\.(\w+)$', rhs)
+        if join_match and op == '=':
+            other = aliases.get(join_match.group(1))
+            if other and other != table:
+                add(table, 'join', column)
+                add(other, 'join', join_match.group(2))
+                if table != driving:
+                    add(table, 'eq', column)
+                if other != driving:
+                    add(other, 'eq', join_match.group(2))
+            continue
+        if rhs.startswith('(') and 'select' in rhs:
+            continue
+        if op in _EQ_OPS:
+            add(table, 'eq', column)
+        elif op in _RANGE_OPS:
+            add(table, 'range', column)
+
+    order = _RE_ORDER_BY.search(text)
+    if order and 'rand(' not in order.group(1):
+        for item in order.group(1).split(','):
+            token = item.strip().split(' ')[0]
+            if not token or '(' in token:
+                continue
+            qualifier, _, column = token.rpartition('.')
+            table = resolve(qualifier or None, column)
+            if table != driving:
+                # Birden fazla tablo üzerinden sıralama tek index'le çözülemez
+                access[driving]['order'] = []
+                break
+            add(table, 'order', column)
+
+    return {table: cols for table, cols in access.items() if any(cols.values())}
+
+
+def _covers(index_cols: List[str], eq: List[str], tail: List[str], primary_key: List[str]) -> bool:
+    """Index (+ InnoDB'nin gizli PK soneki) eq kolonlarını önek olarak, tail'i ardından içeriyor mu?"""
+    n = len(eq)
+    if len(index_cols) < n or set(index_cols[:n]) != set(eq):
+        return False
+    if not tail:
+        return True
+    rest = index_cols[n:] + [c for c in primary_key if c not in index_cols]
+    return rest[:len(tail)] == tail
+
+
+def _index_name(table: str, columns: List[str]) -> str:
+    name = f"idx_{table}_{'_'.join(columns)}"
+    return name[:MAX_INDEX_NAME_LENGTH]
+
+
+_PLACEHOLDER = r"(?:%s|%\(\w+\)s|\?|(?<![:\w]):(?!\d)\w+)"
+
+
+def _explain_sql(sample: str) -> str:
+    """Parametreli örnek sorguyu EXPLAIN edilebilir hale getirir (değerler '1', LIMIT 1)."""
+    text = re.sub(
+        rf"\b(limit|offset)\s+{_PLACEHOLDER}(\s*,\s*{_PLACEHOLDER})?",
+        lambda m: f"{m.group(1)} 1" + (", 1" if m.group(2) else ""),
+        sample, flags=re.I
+    )
+    text = re.sub(_PLACEHOLDER, "'1'", text)
+    return f"EXPLAIN {text}"
+
+# =============================================================================
+# 5.0. INDEX ADVISOR SINIFI
+# =============================================================================
+
+class IndexAdvisor:
+    """
+    Sorgu günlüğünden index önerileri ve migration planı üretir.
+
+    Example:
+        advisor = IndexAdvisor()
+        advisor.load_fingerprints()
+        report = advisor.analyze()
+        print(format_report(report))
+    """
+
+    # -------------------------------------------------------------------------
+    # 5.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection=None, use_database: bool = True):
+        """
+        Args:
+            db_connection: Kullanılacak DatabaseConnection; verilmezse ve
+                           use_database True ise yeni bir tane oluşturulur.
+            use_database: False ise yalnızca şema dosyaları kullanılır
+                          (INFORMATION_SCHEMA, performance_schema ve EXPLAIN yok).
+        """
+        self.db = db_connection
+        if self.db is None and use_database:
+            try:
+                from app.database.db_connection import DatabaseConnection
+                self.db = DatabaseConnection()
+            except Exception:
+                self.db = None
+        self.statements: Dict[str, Dict[str, Any]] = {}
+        self.sources: List[str] = []
+
+    # -------------------------------------------------------------------------
+    # 5.2. Girdi Toplama
+    # -------------------------------------------------------------------------
+
+    def add_statement(self, sql: str, count: int = 1, total_ms: float = 0.0,
+                      sample: Optional[str] = None) -> Optional[str]:
+        """5.2.1. Bir ifadeyi (ham SQL veya fingerprint) girdilere ekler."""
+        if not sql:
+            return None
+        fp = fingerprint(sql)
+        entry = self.statements.setdefault(fp, {'count': 0, 'total_ms': 0.0, 'sample': None})
+        entry['count'] += int(count or 0)
+        entry['total_ms'] = round(entry['total_ms'] + float(total_ms or 0.0), 3)
+        if entry['sample'] is None and (sample or sql) != fp:
+            entry['sample'] = sample or sql
+        return fp
+
+    def _default_log_path(self, name: str) -> Optional[Path]:
+        try:
+            from config import AppConfig
+            return Path(AppConfig.LOG_DIR) / name
+        except Exception:
+            return None
+
+    def load_fingerprints(self, path: Optional[str] = None) -> int:
+        """5.2.2. dump_fingerprints() çıktısını (query_fingerprints.json) okur."""
+        target = Path(path) if path else self._default_log_path('query_fingerprints.json')
+        if not target or not target.exists():
+            return 0
+        try:
+            statements = json.loads(target.read_text(encoding='utf-8')).get('statements', {})
+        except Exception:
+            return 0
+        for fp, entry in statements.items():
+            self.add_statement(entry.get('sample') or fp, entry.get('count', 1),
+                               entry.get('total_ms', 0.0), entry.get('sample'))
+        self.sources.append(str(target))
+        return len(statements)
+
+    def load_slow_log(self, path: Optional[str] = None) -> int:
+        """5.2.3. slow_queries.log (JSON satırları) dosyasını okur."""
+        target = Path(path) if path else self._default_log_path('slow_queries.log')
+        if not target or not target.exists():
+            return 0
+        loaded = 0
+        try:
+            with target.open(encoding='utf-8') as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    sql = record.get('sql') or record.get('fingerprint')
+                    if self.add_statement(sql, 1, record.get('elapsed_ms', 0.0), record.get('sql')):
+                        loaded += 1
+        except Exception:
+            return loaded
+        self.sources.append(str(target))
+        return loaded
+
+    def load_runtime_stats(self) -> int:
+        """5.2.4. Bu process'te toplanan query_instrumentation istatistiklerini ekler."""
+        statements = get_query_stats(limit=10 ** 6).get('top_statements', [])
+        for entry in statements:
+            self.add_statement(entry.get('sample') or entry['fingerprint'], entry.get('count', 1),
+                               entry.get('total_ms', 0.0), entry.get('sample'))
+        if statements:
+            self.sources.append('runtime')
+        return len(statements)
+
+    def scan_source(self, root: Optional[str] = None) -> int:
+        """
+        5.2.5. Henüz trafik görmemiş ortamlar için kaynak koddaki SQL
+        literal'lerini (f-string parçaları dahil) ağırlık 1 ile ekler.
+        """
+        base = Path(root) if root else Path(__file__).resolve().parents[2]
+        found = 0
+        for path in base.rglob('*.py'):
+            try:
+                tree = ast.parse(path.read_text(encoding='utf-8'))
+            except Exception:
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    text = node.value
+                elif isinstance(node, ast.JoinedStr):
+                    text = ''.join(
+                        part.value if isinstance(part, ast.Constant) else ' ? '
+                        for part in node.values
+                    )
+                else:
+                    continue
+                if re.match(r'\s*(select|update|delete)\b', text, re.I) and re.search(r'\b(from|set)\b', text, re.I):
+                    self.add_statement(text, 1, 0.0)
+                    found += 1
+        if found:
+            self.sources.append(f"source:{base}")
+        return found
+
+    # -------------------------------------------------------------------------
+    # 5.3. Mevcut Index'ler
+    # -------------------------------------------------------------------------
+
+    def _database_name(self) -> Optional[str]:
+        if self.db is None:
+            return None
+        try:
+            with self.db as conn:
+                conn.cursor.execute("SELECT DATABASE() AS db")
+                return (conn.cursor.fetchone() or {}).get('db')
+        except Exception:
+            return None
+
+    def _schema_from_files(self) -> Dict[str, Dict[str, Any]]:
+        schema = {}
+        for sql in TABLE_SCHEMAS.values():
+            info = parse_schema_sql(sql)
+            if info:
+                schema[info['table']] = info
+        return schema
+
+    def _schema_from_database(self, db_name: str) -> Dict[str, Dict[str, Any]]:
+        schema: Dict[str, Dict[str, Any]] = {}
+        with self.db as conn:
+            conn.cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS "
+                "WHERE TABLE_SCHEMA=%s ORDER BY TABLE_NAME, ORDINAL_POSITION", (db_name,)
+            )
+            for row in conn.cursor.fetchall():
+                table = row['TABLE_NAME'].lower()
+                schema.setdefault(table, {'table': table, 'columns': [], 'primary_key': [],
+                                          'foreign_keys': [], 'indexes': {}})
+                schema[table]['columns'].append(row['COLUMN_NAME'].lower())
+            conn.cursor.execute(
+                "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, NON_UNIQUE FROM INFORMATION_SCHEMA.STATISTICS "
+                "WHERE TABLE_SCHEMA=%s ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX", (db_name,)
+            )
+            for row in conn.cursor.fetchall():
+                info = schema.get(row['TABLE_NAME'].lower())
+                if info is None:
+                    continue
+                if row['INDEX_NAME'] == 'PRIMARY':
+                    info['primary_key'].append(row['COLUMN_NAME'].lower())
+                    continue
+                index = info['indexes'].setdefault(
+                    row['INDEX_NAME'], {'columns': [], 'unique': not int(row['NON_UNIQUE'])}
+                )
+                index['columns'].append(row['COLUMN_NAME'].lower())
+            conn.cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE "
+                "WHERE TABLE_SCHEMA=%s AND REFERENCED_TABLE_NAME IS NOT NULL", (db_name,)
+            )
+            for row in conn.cursor.fetchall():
+                info = schema.get(row['TABLE_NAME'].lower())
+                if info is not None:
+                    info['foreign_keys'].append(row['COLUMN_NAME'].lower())
+        return schema
+
+    def _unused_from_performance_schema(self, db_name: str) -> Optional[Set[Tuple[str, str]]]:
+        """Sunucu açıldığından beri hiç okunmamış index'ler; erişim yoksa None."""
+        try:
+            with self.db as conn:
+                conn.cursor.execute(
+                    "SELECT OBJECT_NAME, INDEX_NAME FROM performance_schema.table_io_waits_summary_by_index_usage "
+                    "WHERE OBJECT_SCHEMA=%s AND INDEX_NAME IS NOT NULL AND INDEX_NAME <> 'PRIMARY' "
+                    "AND COUNT_STAR = 0", (db_name,)
+                )
+                return {(row['OBJECT_NAME'].lower(), row['INDEX_NAME']) for row in conn.cursor.fetchall()}
+        except Exception:
+            return None
+
+    def _explain(self, sample: str) -> List[Dict[str, Any]]:
+        try:
+            with self.db.read_only() as conn:
+                conn.cursor.execute(_explain_sql(sample))
+                return conn.cursor.fetchall() or []
+        except Exception:
+            return []
+
+    # -------------------------------------------------------------------------
+    # 5.4. Analiz
+    # -------------------------------------------------------------------------
+
+    def analyze(self, explain: bool = True, include_drops: bool = False) -> Dict[str, Any]:
+        """
+        5.4.1. Toplanan ifadeleri mevcut index'lerle karşılaştırır.
+
+        Args:
+            explain: Veritabanı modunda örnek ifadeleri EXPLAIN ile doğrula.
+            include_drops: Plana redundant index'ler için çalıştırılabilir
+                DROP INDEX yaz (varsayılan: yorum satırı olarak öneri).
+
+        Returns:
+            {'generated_at', 'mode', 'sources', 'statements_analyzed',
+             'missing_indexes', 'redundant_indexes', 'unused_indexes',
+             'explain_findings', 'plan'}
+        """
+        db_name = self._database_name()
+        schema = None
+        if db_name:
+            try:
+                schema = self._schema_from_database(db_name)
+            except Exception:
+                schema = None
+        mode = 'database' if schema else 'schema-files'
+        if not schema:
+            schema = self._schema_from_files()
+        columns_by_table = {table: info['columns'] for table, info in schema.items()}
+
+        candidates: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+        referenced: Dict[str, Set[str]] = {}
+        explain_findings: List[Dict[str, Any]] = []
+        analyzed = 0
+
+        for fp, entry in sorted(self.statements.items(), key=lambda item: -item[1]['total_ms']):
+            access = analyze_statement(fp, columns_by_table)
+            if not access:
+                continue
+            analyzed += 1
+            for table, cols in access.items():
+                info = schema.get(table)
+                if not info or table in IGNORED_TABLES:
+                    continue
+                referenced.setdefault(table, set()).update(
+                    cols['eq'] + cols['range'] + cols['order'] + cols['join']
+                )
+                eq = cols['eq']
+                primary_key = info['primary_key']
+                if primary_key and set(primary_key) <= set(eq):
+                    continue  # PK ile nokta erişimi
+                tail = cols['range'][:1] or [c for c in cols['order'] if c not in eq]
+                wanted = eq + [c for c in tail if c not in eq]
+                if not wanted or wanted == primary_key[:len(wanted)]:
+                    continue
+                existing = [index['columns'] for index in info['indexes'].values()]
+                if any(_covers(index_cols, eq, tail, primary_key) for index_cols in existing):
+                    continue
+                if not eq and not cols['range'] and 'limit' not in fp:
+                    continue  # LIMIT'siz tam sıralama için index değmez
+                candidate = candidates.setdefault((table, tuple(wanted)), {
+                    'table': table, 'columns': wanted, 'name': _index_name(table, wanted),
+                    'count': 0, 'total_ms': 0.0, 'statements': [], 'explain_confirmed': False,
+                })
+                candidate['count'] += entry['count']
+                candidate['total_ms'] = round(candidate['total_ms'] + entry['total_ms'], 3)
+                candidate['statements'].append(fp)
+
+            if explain and mode == 'database' and entry.get('sample'):
+                for row in self._explain(entry['sample']):
+                    extra = row.get('Extra') or ''
+                    if row.get('type') == 'ALL' or 'filesort' in extra or 'temporary' in extra:
+                        finding = {
+                            'fingerprint': fp, 'table': row.get('table'), 'type': row.get('type'),
+                            'key': row.get('key'), 'rows': row.get('rows'), 'extra': extra,
+                        }
+                        explain_findings.append(finding)
+                        for candidate in candidates.values():
+                            if fp in candidate['statements']:
+                                candidate['explain_confirmed'] = True
+
+        missing = self._merge_prefix_candidates(list(candidates.values()))
+        redundant = self._find_redundant(schema, missing)
+        unused = self._find_unused(schema, referenced, db_name if mode == 'database' else None,
+                                   {item['index'] for item in redundant})
+
+        report = {
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'mode': mode,
+            'sources': list(self.sources),
+            'statements_analyzed': analyzed,
+            'missing_indexes': missing,
+            'redundant_indexes': redundant,
+            'unused_indexes': unused,
+            'explain_findings': explain_findings,
+        }
+        report['plan'] = self.migration_plan(report, include_drops=include_drops)
+        return report
+
+    @staticmethod
+    def _merge_prefix_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Başka bir önerinin sol öneki olan önerileri uzun olana katar."""
+        candidates.sort(key=lambda item: -len(item['columns']))
+        merged: List[Dict[str, Any]] = []
+        for candidate in candidates:
+            target = next(
+                (m for m in merged if m['table'] == candidate['table']
+                 and m['columns'][:len(candidate['columns'])] == candidate['columns']),
+                None
+            )
+            if target is None:
+                merged.append(candidate)
+                continue
+            target['count'] += candidate['count']
+            target['total_ms'] = round(target['total_ms'] + candidate['total_ms'], 3)
+            target['statements'].extend(candidate['statements'])
+            target['explain_confirmed'] = target['explain_confirmed'] or candidate['explain_confirmed']
+        merged.sort(key=lambda item: (-item['total_ms'], -item['count']))
+        return merged
+
+    @staticmethod
+    def _find_redundant(schema: Dict[str, Dict[str, Any]],
+                        missing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Mevcut veya önerilen başka bir index'in sol öneki olan unique olmayan index'ler."""
+        redundant = []
+        for table, info in schema.items():
+            if table in IGNORED_TABLES:
+                continue
+            others = [(name, index['columns']) for name, index in info['indexes'].items()]
+            others += [(item['name'], item['columns']) for item in missing if item['table'] == table]
+            for name, index in info['indexes'].items():
+                if index['unique']:
+                    continue
+                cols = index['columns']
+                for other_name, other_cols in others:
+                    if other_name == name or other_cols[:len(cols)] != cols:
+                        continue
+                    # Birebir aynı iki index'ten yalnızca ikincisi işaretlenir
+                    if other_cols == cols and other_name in info['indexes'] \
+                            and not info['indexes'][other_name]['unique'] and other_name > name:
+                        continue
+                    redundant.append({
+                        'table': table, 'index': name, 'columns': cols,
+                        'covered_by': other_name,
+                        'planned': other_name not in info['indexes'],
+                    })
+                    break
+        return redundant
+
+    def _find_unused(self, schema: Dict[str, Dict[str, Any]], referenced: Dict[str, Set[str]],
+                     db_name: Optional[str], redundant_names: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Hiç kullanılmayan index'ler. performance_schema okunabiliyorsa sayaçlar,
+        okunamıyorsa trafik görmüş tablolarda öncü kolonu hiç referans
+        edilmeyen index'ler esas alınır. Tek FK dayanağı olan index'ler atlanır.
+        """
+        ps_unused = self._unused_from_performance_schema(db_name) if db_name else None
+        unused = []
+        for table, info in schema.items():
+            if table in IGNORED_TABLES:
+                continue
+            for name, index in info['indexes'].items():
+                if index['unique'] or name in redundant_names:
+                    continue
+                if ps_unused is not None:
+                    if (table, name) not in ps_unused:
+                        continue
+                    evidence = 'performance_schema'
+                else:
+                    if table not in referenced or index['columns'][0] in referenced[table]:
+                        continue
+                    evidence = 'fingerprints'
+                lead = index['columns'][0]
+                if lead in info['foreign_keys']:
+                    backers = [n for n, other in info['indexes'].items()
+                               if other['columns'][0] == lead and n != name]
+                    if not backers and info['primary_key'][:1] != [lead]:
+                        continue
+                unused.append({'table': table, 'index': name, 'columns': index['columns'],
+                               'evidence': evidence})
+        return unused
+
+    def migration_plan(self, report: Dict[str, Any], include_drops: bool = False) -> List[str]:
+        """
+        5.4.2. Rapordan ALTER TABLE ifadeleri üretir.
+
+        Eklemeler önce gelir (FK'yı taşıyan index düşmeden yenisi hazır olur).
+        Silmeler sezgisel analize dayandığından varsayılan olarak yorum satırı
+        olarak yazılır; redundant index'ler yalnızca `include_drops=True` ile
+        çalıştırılabilir DROP INDEX olur. Henüz eklenmemiş bir öneriye
+        dayanan ve kullanılmayan index'ler her zaman yorum satırıdır.
+        """
+        lines = [f"-- Index advisor migration plan ({report['generated_at']}, mode={report['mode']})"]
+        for item in report['missing_indexes']:
+            lines.append(
+                f"-- {item['count']} calls, {item['total_ms']} ms total"
+                f"{', confirmed by EXPLAIN' if item['explain_confirmed'] else ''}: {item['statements'][0][:160]}"
+            )
+            lines.append(f"ALTER TABLE {item['table']} ADD INDEX {item['name']} ({', '.join(item['columns'])});")
+        for item in report['redundant_indexes']:
+            planned = ' (proposed above)' if item['planned'] else ''
+            lines.append(f"-- {item['index']} ({', '.join(item['columns'])}) is a prefix of {item['covered_by']}{planned}")
+            prefix = '' if include_drops and not item['planned'] else '-- '
+            lines.append(f"{prefix}ALTER TABLE {item['table']} DROP INDEX {item['index']};")
+        for item in report['unused_indexes']:
+            lines.append(f"-- unused ({item['evidence']}), review before applying:")
+            lines.append(f"-- ALTER TABLE {item['table']} DROP INDEX {item['index']};")
+        return lines
+
+
+# -----------------------------------------------------------------------------
+# 5.5. format_report(report)
+# -----------------------------------------------------------------------------
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Raporu terminal için okunabilir metne çevirir."""
+    out = [
+        f"Index advisor ({report['mode']}) - {report['statements_analyzed']} statements analyzed",
+        f"Sources: {', '.join(report['sources']) or '-'}",
+        "",
+        f"Missing composite indexes ({len(report['missing_indexes'])}):",
+    ]
+    for item in report['missing_indexes']:
+        out.append(f"  {item['table']}({', '.join(item['columns'])})  "
+                   f"calls={item['count']} total_ms={item['total_ms']} statements={len(item['statements'])}")
+    out.append(f"Redundant indexes ({len(report['redundant_indexes'])}):")
+    for item in report['redundant_indexes']:
+        out.append(f"  {item['table']}.{item['index']}({', '.join(item['columns'])}) -> {item['covered_by']}")
+    out.append(f"Unused indexes ({len(report['unused_indexes'])}):")
+    for item in report['unused_indexes']:
+        out.append(f"  {item['table']}.{item['index']}({', '.join(item['columns'])}) [{item['evidence']}]")
+    if report['explain_findings']:
+        out.append(f"EXPLAIN findings ({len(report['explain_findings'])}):")
+        for item in report['explain_findings']:
+            out.append(f"  {item['table']}: type={item['type']} key={item['key']} rows={item['rows']} "
+                       f"{item['extra']} :: {item['fingerprint'][:100]}")
+    out.append("")
+    out.append("Migration plan:")
+    out.extend(report['plan'])
+    return '\n'.join(out)
@@ -30,10 +30,24 @@ class IndexManager:
                         conn.cursor.execute(f"ALTER TABLE {table} ADD INDEX {index_name} {cols_sql}")
                         conn.connection.commit()
 
-                # Ensure required indexes
-                ensure_index('questions', 'idx_q_topic_active_diff_qid', '(topic_id, is_active, difficulty_level, question_id)')
-                ensure_index('questions', 'idx_q_active_diff_qid', '(is_active, difficulty_level, question_id)')
+                def drop_index(table: str, index_name: str) -> None:
+                    conn.cursor.execute(
+                        "SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS "
+                        "WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND INDEX_NAME=%s LIMIT 1",
+                        (db_name, table, index_name)
+                    )
+                    if conn.cursor.fetchone():
+                        conn.cursor.execute(f"ALTER TABLE {table} DROP INDEX {index_name}")
+                        conn.connection.commit()
+
+                # Ensure required indexes (sampling filters on is_answerable as well)
+                ensure_index('questions', 'idx_q_topic_active_ans_diff_qid', '(topic_id, is_active, is_answerable, difficulty_level, question_id)')
+                ensure_index('questions', 'idx_q_active_ans_diff_qid', '(is_active, is_answerable, difficulty_level, question_id)')
                 ensure_index('question_options', 'idx_options_qid_correct', '(question_id, is_correct)')
+
+                # Superseded by the *_ans_* variants above
+                drop_index('questions', 'idx_q_topic_active_diff_qid')
+                drop_index('questions', 'idx_q_active_diff_qid')
                 return True
         except Exception:
             return False
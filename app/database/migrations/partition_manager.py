@@ -0,0 +1,276 @@
+# =============================================================================
+# PARTITION MANAGER
+# =============================================================================
+# chat_messages ve user_activities tablolarının aylık RANGE partition
+# bakımını yapar (yalnızca MySQL):
+#   - Var olan (partition'sız) tabloyu partition'lı yapıya dönüştürür.
+#   - İleriye dönük ayların partition'larını pmax'tan ayırarak önceden açar.
+#   - Saklama süresi tamamen dolmuş ayları DROP PARTITION ile siler
+#     (satır satır DELETE yerine anlık, undo log üretmeyen silme).
+# Tanımlar ve ad/sınır yardımcıları app/database/schemas/partitioning.py'dedir.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. PARTITION MANAGER SINIFI
+#   4.1. Constructor ve Başlatma
+#   4.2. Durum Sorguları
+#     4.2.1. is_supported(self)
+#     4.2.2. get_partitions(self, table)
+#     4.2.3. is_partitioned(self, table)
+#   4.3. Dönüştürme
+#     4.3.1. partition_table(self, table, dry_run)
+#   4.4. Bakım
+#     4.4.1. ensure_future_partitions(self, table, months_ahead, dry_run)
+#     4.4.2. drop_expired_partitions(self, table, days, cutoff, dry_run)
+#     4.4.3. maintain(self, tables, dry_run)
+#   4.5. Dahili Yardımcılar
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.database.db_connection import DatabaseConnection
+from app.database.schemas.partitioning import (
+    MAXVALUE_PARTITION,
+    PARTITIONED_TABLES,
+    add_months,
+    month_start,
+    monthly_partitions,
+    partition_by_clause,
+    partition_month,
+)
+
+# =============================================================================
+# 4.0. PARTITION MANAGER SINIFI
+# =============================================================================
+
+class PartitionManager:
+    """
+    Aylık RANGE partition'ların oluşturulması, ileri tarihli partition'ların
+    açılması ve süresi dolanların DROP PARTITION ile silinmesi.
+
+    MySQL dışındaki veritabanlarında (ör. SQLite stand-in) tüm işlemler
+    hiçbir şey yapmadan `supported: False` raporu döner.
+    """
+
+    # -------------------------------------------------------------------------
+    # 4.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None,
+                 months_ahead: Optional[int] = None, config_class=None) -> None:
+        self.db = db_connection or DatabaseConnection()
+        if config_class is None:
+            from config import get_config
+            config_class = get_config()
+        self.settings = getattr(config_class, 'DATABASE', None)
+        self.months_ahead = max(1, int(months_ahead if months_ahead is not None
+                                       else getattr(self.settings, 'PARTITION_MONTHS_AHEAD', 3)))
+
+    # -------------------------------------------------------------------------
+    # 4.2. Durum Sorguları
+    # -------------------------------------------------------------------------
+
+    def is_supported(self) -> bool:
+        """4.2.1. Bağlı veritabanı partition destekliyor mu (MySQL)."""
+        try:
+            with self.db as conn:
+                return conn.engine.dialect.name == 'mysql'
+        except Exception:
+            return False
+
+    def get_partitions(self, table: str) -> List[Dict[str, Any]]:
+        """
+        4.2.2. Tablonun partition'larını sırasıyla döner.
+
+        Returns:
+            [{'name', 'month' (aylık partition ise ay başı), 'rows' (tahmini)}];
+            tablo partition'sız ise boş liste.
+        """
+        with self.db as conn:
+            conn.cursor.execute(
+                "SELECT PARTITION_NAME AS name, TABLE_ROWS AS row_count "
+                "FROM INFORMATION_SCHEMA.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION",
+                (table,)
+            )
+            rows = conn.cursor.fetchall()
+        return [
+            {'name': row['name'], 'month': partition_month(row['name']), 'rows': int(row['row_count'] or 0)}
+            for row in rows
+        ]
+
+    def is_partitioned(self, table: str) -> bool:
+        """4.2.3. Tablo partition'lı mı."""
+        try:
+            return self.is_supported() and bool(self.get_partitions(table))
+        except Exception:
+            return False
+
+    # -------------------------------------------------------------------------
+    # 4.3. Dönüştürme
+    # -------------------------------------------------------------------------
+
+    def partition_table(self, table: str, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        4.3.1. Partition'sız bir tabloyu aylık partition'lı yapıya dönüştürür.
+
+        Sırasıyla: FOREIGN KEY'ler kaldırılır, NULL created_at doldurulur,
+        PRIMARY KEY (id, created_at) yapılır ve en eski satırın ayından
+        bugün + months_ahead aya kadar partition'lar ile pmax oluşturulur.
+        ALTER TABLE ... PARTITION BY tabloyu yeniden yazar; büyük tablolarda
+        bakım penceresinde çalıştırılmalıdır.
+
+        Returns:
+            {'table', 'supported', 'partitioned', 'statements': [...]}; hata
+            olursa 'error' eklenir.
+        """
+        report: Dict[str, Any] = {'table': table, 'supported': False, 'partitioned': False,
+                                  'statements': []}
+        try:
+            column = PARTITIONED_TABLES[table]['column']
+            if not self.is_supported():
+                return report
+            report['supported'] = True
+            if self.get_partitions(table):
+                report['partitioned'] = True
+                return report
+
+            with self.db as conn:
+                statements = [
+                    f"ALTER TABLE {table} DROP FOREIGN KEY {name}"
+                    for name in self._foreign_keys(conn, table)
+                ]
+                statements.append(f"UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE {column} IS NULL")
+                statements.append(
+                    f"ALTER TABLE {table} "
+                    f"MODIFY {column} TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+                    f"DROP PRIMARY KEY, ADD PRIMARY KEY (id, {column})"
+                )
+                conn.cursor.execute(f"SELECT MIN({column}) AS first_at FROM {table}")
+                first_at = (conn.cursor.fetchone() or {}).get('first_at') or datetime.now()
+                current = month_start(datetime.now())
+                statements.append(
+                    f"ALTER TABLE {table} "
+                    f"{partition_by_clause(column, month_start(first_at), add_months(current, self.months_ahead))}"
+                )
+                report['statements'] = statements
+                if dry_run:
+                    return report
+                for sql in statements:
+                    conn.cursor.execute(sql)
+            report['partitioned'] = True
+        except Exception as e:
+            report['error'] = str(e)
+        return report
+
+    # -------------------------------------------------------------------------
+    # 4.4. Bakım
+    # -------------------------------------------------------------------------
+
+    def ensure_future_partitions(self, table: str, months_ahead: Optional[int] = None,
+                                 dry_run: bool = False) -> List[str]:
+        """
+        4.4.1. Bugünden itibaren months_ahead ay ilerisine kadar eksik aylık
+        partition'ları açar. pmax varsa boş olduğu sürece REORGANIZE anlıktır;
+        bakım gecikir de satırlar pmax'a düşerse, sonraki çalışmada o satırlar
+        yeni aylara taşınır.
+
+        Returns:
+            Oluşturulan (dry_run'da oluşturulacak) partition adları.
+        """
+        partitions = self.get_partitions(table)
+        if not partitions:
+            return []
+        months = [p['month'] for p in partitions if p['month'] is not None]
+        target = add_months(month_start(datetime.now()), months_ahead or self.months_ahead)
+        first = add_months(max(months), 1) if months else month_start(datetime.now())
+        if first > target:
+            return []
+        has_maxvalue = any(p['name'] == MAXVALUE_PARTITION for p in partitions)
+        definitions = monthly_partitions(first, target, include_maxvalue=has_maxvalue)
+        created = [definition.split()[1] for definition in definitions
+                   if definition.split()[1] != MAXVALUE_PARTITION]
+        if dry_run:
+            return created
+        body = ', '.join(definitions)
+        if has_maxvalue:
+            sql = f"ALTER TABLE {table} REORGANIZE PARTITION {MAXVALUE_PARTITION} INTO ({body})"
+        else:
+            sql = f"ALTER TABLE {table} ADD PARTITION ({body})"
+        with self.db as conn:
+            conn.cursor.execute(sql)
+        return created
+
+    def drop_expired_partitions(self, table: str, days: Optional[float] = None,
+                                cutoff: Optional[datetime] = None,
+                                dry_run: bool = False) -> Dict[str, Any]:
+        """
+        4.4.2. Tüm satırları cutoff'tan eski olan aylık partition'ları siler.
+
+        Bir partition ancak bir sonraki ayın başı cutoff'a eşit/önce ise
+        düşürülür; kısmen süresi dolmuş ay satır satır silmeye kalır.
+        pmax hiçbir zaman düşürülmez.
+
+        Returns:
+            {'partitions': [ad...], 'rows': tahmini satır sayısı}
+        """
+        if cutoff is None:
+            if days is None:
+                days = getattr(self.settings, PARTITIONED_TABLES[table]['retention_setting'], 90)
+            cutoff = datetime.now() - timedelta(days=float(days))
+        expired = [p for p in self.get_partitions(table)
+                   if p['month'] is not None and add_months(p['month'], 1) <= cutoff]
+        result = {'partitions': [p['name'] for p in expired], 'rows': sum(p['rows'] for p in expired)}
+        if expired and not dry_run:
+            with self.db as conn:
+                conn.cursor.execute(f"ALTER TABLE {table} DROP PARTITION {', '.join(result['partitions'])}")
+        return result
+
+    def maintain(self, tables: Optional[Iterable[str]] = None,
+                 dry_run: bool = False, drop_expired: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        4.4.3. Partition'lı tabloların ileri tarihli partition'larını açar;
+        drop_expired=True ise süresi dolanları da düşürür.
+
+        Returns:
+            Tablo -> {'supported', 'partitioned', 'created', 'dropped'[, 'error']}
+        """
+        supported = self.is_supported()
+        reports: Dict[str, Dict[str, Any]] = {}
+        for table in (list(tables) if tables else list(PARTITIONED_TABLES)):
+            report: Dict[str, Any] = {'supported': supported, 'partitioned': False,
+                                      'created': [], 'dropped': []}
+            reports[table] = report
+            if not supported:
+                continue
+            try:
+                report['partitioned'] = bool(self.get_partitions(table))
+                if not report['partitioned']:
+                    continue
+                report['created'] = self.ensure_future_partitions(table, dry_run=dry_run)
+                if drop_expired:
+                    report['dropped'] = self.drop_expired_partitions(table, dry_run=dry_run)['partitions']
+            except Exception as e:
+                report['error'] = str(e)
+        return reports
+
+    # -------------------------------------------------------------------------
+    # 4.5. Dahili Yardımcılar
+    # -------------------------------------------------------------------------
+
+    def _foreign_keys(self, conn, table: str) -> List[str]:
+        """Tablonun FOREIGN KEY kısıt adları (partition'lı tablolarda desteklenmez)."""
+        conn.cursor.execute(
+            "SELECT CONSTRAINT_NAME AS name FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND CONSTRAINT_TYPE = 'FOREIGN KEY'",
+            (table,)
+        )
+        return [row['name'] for row in conn.cursor.fetchall()]
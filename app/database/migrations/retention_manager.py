@@ -0,0 +1,345 @@
+# =============================================================================
+# RETENTION MANAGER
+# =============================================================================
+# Süresi dolmuş verileri (eski chat mesajları, kapanmış chat session'ları,
+# kullanıcı aktiviteleri, terk edilmiş quiz oturumları) birincil anahtar
+# sırasıyla küçük parçalar (chunk) halinde siler. Tek bir sınırsız DELETE
+# yerine kısa transaction'lar kullanıldığından satır kilitleri ve undo log
+# büyümesi chunk boyutuyla sınırlı kalır; FK CASCADE ile silinecek alt
+# tablolar da önce aynı şekilde parça parça temizlenir. Aylık partition'lı
+# tablolarda (bkz. PartitionManager) tamamen süresi dolmuş aylar önce
+# DROP PARTITION ile düşürülür; satır silme yalnızca kısmi ayda kalır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. TABLO VE POLİTİKA TANIMLARI
+# 5.0. RETENTION MANAGER SINIFI
+#   5.1. Constructor ve Başlatma
+#   5.2. Genel API
+#     5.2.1. purge(self, policy, days, cutoff, dry_run, max_seconds, should_stop, progress, where)
+#     5.2.2. purge_all(self, policies, dry_run, **kwargs)
+#   5.3. Sayım (dry-run)
+#     5.3.1. _count(self, table, where, params)
+#   5.4. Parça Parça Silme
+#     5.4.1. _scan(self, table, where, params, after)
+#     5.4.2. _delete_rows(self, table, rows, report)
+#     5.4.3. _delete_children(self, table, keys, report)
+#     5.4.4. _throttle(self, deleted, started)
+#   5.5. Partition Entegrasyonu
+#     5.5.1. _drop_partitions(self, table, cutoff, dry_run)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.database.db_connection import DatabaseConnection
+
+# =============================================================================
+# 4.0. TABLO VE POLİTİKA TANIMLARI
+# =============================================================================
+
+# Tablo -> birincil anahtar, alt tablolara verilen anahtar ve FK CASCADE ile
+# bağlı alt tablolar [(alt tablo, alt tablodaki FK kolonu)]
+RETENTION_TABLES: Dict[str, Dict[str, Any]] = {
+    'chat_messages': {'pk': 'id'},
+    'chat_sessions': {'pk': 'id', 'key': 'session_id',
+                      'children': [('chat_messages', 'chat_session_id')]},
+    'user_activities': {'pk': 'id'},
+    'quiz_session_questions': {'pk': 'id'},
+    'quiz_sessions': {'pk': 'session_id', 'key': 'session_id',
+                      'children': [('quiz_session_questions', 'session_id'),
+                                   ('chat_sessions', 'quiz_session_id')]},
+}
+
+# Politika -> tablo, silme koşulu (tek %s: cutoff) ve varsayılan gün ayarı
+RETENTION_POLICIES: Dict[str, Dict[str, Any]] = {
+    'chat_messages': {
+        'table': 'chat_messages',
+        'where': 'created_at < %s',
+        'days_setting': 'RETENTION_CHAT_MESSAGE_DAYS',
+        'drop_partitions': True,
+        'description': 'Eski chat mesajları',
+    },
+    'chat_sessions': {
+        'table': 'chat_sessions',
+        'where': "status IN ('completed', 'archived', 'closed') AND last_activity < %s",
+        'days_setting': 'RETENTION_CHAT_SESSION_DAYS',
+        'description': 'Kapanmış chat session\'ları ve mesajları',
+    },
+    'user_activities': {
+        'table': 'user_activities',
+        'where': 'created_at < %s',
+        'days_setting': 'RETENTION_ACTIVITY_DAYS',
+        'drop_partitions': True,
+        'description': 'Kullanıcı aktivite kayıtları',
+    },
+    'quiz_sessions': {
+        'table': 'quiz_sessions',
+        # Uzun süredir güncellenmeyen 'active' oturumlar da terk edilmiş sayılır
+        'where': "status IN ('abandoned', 'active') AND updated_at < %s",
+        'days_setting': 'RETENTION_QUIZ_SESSION_DAYS',
+        'description': 'Terk edilmiş quiz oturumları, soruları ve chat\'leri',
+    },
+}
+
+# =============================================================================
+# 5.0. RETENTION MANAGER SINIFI
+# =============================================================================
+
+class RetentionManager:
+    """
+    Politika tabanlı, parça parça çalışan veri temizleme motoru.
+
+    Her politika için koşula uyan satırlar birincil anahtar sırasıyla
+    (keyset: `pk > son_pk`) `chunk_size`'lık parçalar halinde okunur; her
+    parçanın alt tablo satırları ve kendisi ayrı, kısa transaction'larda
+    silinir. Parçalar arasında `sleep_ms` beklenir; `max_rows_per_sec`
+    verilirse silme hızı bu değere sabitlenir.
+    """
+
+    # -------------------------------------------------------------------------
+    # 5.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None,
+                 chunk_size: Optional[int] = None, sleep_ms: Optional[int] = None,
+                 max_rows_per_sec: Optional[int] = None, config_class=None) -> None:
+        """
+        Args:
+            db_connection: Mevcut bağlantı yöneticisi (verilmezse yenisi).
+            chunk_size: Bir DELETE'in en fazla sileceği satır sayısı.
+            sleep_ms: Her DELETE sonrası bekleme (ms).
+            max_rows_per_sec: Saniyedeki en fazla silinen satır (0 = sınırsız).
+            config_class: Varsayılanların okunacağı config (verilmezse get_config()).
+        """
+        self.db = db_connection or DatabaseConnection()
+        if config_class is None:
+            from config import get_config
+            config_class = get_config()
+        self.settings = getattr(config_class, 'DATABASE', None)
+        self.chunk_size = max(1, int(chunk_size if chunk_size is not None
+                                     else self._setting('RETENTION_CHUNK_SIZE', 1000)))
+        self.sleep_ms = max(0, int(sleep_ms if sleep_ms is not None
+                                   else self._setting('RETENTION_SLEEP_MS', 50)))
+        self.max_rows_per_sec = max(0, int(max_rows_per_sec if max_rows_per_sec is not None
+                                           else self._setting('RETENTION_MAX_ROWS_PER_SEC', 0)))
+        self.config_class = config_class
+        self._partitions = None
+
+    def _setting(self, name: str, default: Any) -> Any:
+        return getattr(self.settings, name, default)
+
+    # -------------------------------------------------------------------------
+    # 5.2. Genel API
+    # -------------------------------------------------------------------------
+
+    def purge(self, policy: str, days: Optional[float] = None, cutoff: Optional[datetime] = None,
+              dry_run: bool = False, max_seconds: Optional[float] = None,
+              should_stop: Optional[Callable[[], bool]] = None,
+              progress: Optional[Callable[[int], None]] = None,
+              where: Optional[str] = None) -> Dict[str, Any]:
+        """
+        5.2.1. Bir politikayı uygular.
+
+        Args:
+            policy: RETENTION_POLICIES anahtarı.
+            days: Saklama süresi (gün); verilmezse politikanın config ayarı.
+            cutoff: Doğrudan kesim zamanı (days yerine).
+            dry_run: True ise hiçbir şey silinmez; tablo başına silinecek
+                     satır sayıları döner.
+            max_seconds: Süre bütçesi; dolunca kalan satırlar sonraki çalışmaya bırakılır.
+            should_stop: True dönerse (ör. iş iptali) parça sınırında durulur.
+            progress: Her parçadan sonra toplam silinen satır sayısıyla çağrılır.
+            where: Politikanın koşulu yerine kullanılacak koşul (tek %s: cutoff);
+                   tablo, alt tablolar ve chunk'lama politikadan gelir.
+
+        Returns:
+            {'policy', 'table', 'cutoff', 'dry_run', 'deleted' | 'would_delete': {tablo: n},
+             'chunks', 'complete', 'elapsed_ms'}; hata olursa 'error' eklenir.
+        """
+        spec = RETENTION_POLICIES.get(policy)
+        if spec is None:
+            raise ValueError(f"Unknown retention policy: {policy}")
+        where = where or spec['where']
+        if cutoff is None:
+            if days is None:
+                days = self._setting(spec['days_setting'], 90)
+            cutoff = datetime.now() - timedelta(days=float(days))
+        params = (cutoff.strftime('%Y-%m-%d %H:%M:%S'),)
+
+        started = time.perf_counter()
+        report: Dict[str, Any] = {
+            'policy': policy,
+            'table': spec['table'],
+            'cutoff': params[0],
+            'dry_run': dry_run,
+            'chunks': 0,
+            'complete': False,
+        }
+        try:
+            if spec.get('drop_partitions'):
+                report['partitions'] = self._drop_partitions(spec['table'], cutoff, dry_run)
+            if dry_run:
+                report['would_delete'] = self._count(spec['table'], where, params)
+                report['complete'] = True
+                return report
+
+            report['deleted'] = {}
+            pk = RETENTION_TABLES[spec['table']]['pk']
+            after = None
+            while True:
+                if should_stop is not None and should_stop():
+                    break
+                if max_seconds is not None and time.perf_counter() - started >= max_seconds:
+                    break
+                rows = self._scan(spec['table'], where, params, after)
+                if not rows:
+                    report['complete'] = True
+                    break
+                after = rows[-1][pk]
+                self._delete_rows(spec['table'], rows, report)
+                report['chunks'] += 1
+                if progress is not None:
+                    progress(sum(report['deleted'].values()))
+        except Exception as e:
+            report['error'] = str(e)
+        finally:
+            report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return report
+
+    def purge_all(self, policies: Optional[Iterable[str]] = None, dry_run: bool = False,
+                  **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+        """5.2.2. Birden fazla politikayı sırayla uygular (varsayılan: hepsi)."""
+        names = list(policies) if policies else list(RETENTION_POLICIES)
+        return {name: self.purge(name, dry_run=dry_run, **kwargs) for name in names}
+
+    # -------------------------------------------------------------------------
+    # 5.3. Sayım (dry-run)
+    # -------------------------------------------------------------------------
+
+    def _count(self, table: str, where: str, params: tuple) -> Dict[str, int]:
+        """
+        5.3.1. Koşula uyan satırları ve CASCADE ile gidecek alt tablo
+        satırlarını sayar (alt tablolar IN (SELECT ...) alt sorgusuyla).
+        """
+        counts: Dict[str, int] = {}
+        with self.db.read_only() as conn:
+            self._count_into(conn, table, where, params, counts)
+        return counts
+
+    def _count_into(self, conn, table: str, where: str, params: tuple, counts: Dict[str, int]) -> None:
+        conn.cursor.execute(f"SELECT COUNT(*) AS cnt FROM {table} WHERE {where}", params)
+        row = conn.cursor.fetchone() or {}
+        counts[table] = counts.get(table, 0) + int(row.get('cnt') or 0)
+        info = RETENTION_TABLES[table]
+        for child, fk in info.get('children', []):
+            child_where = f"{fk} IN (SELECT {info['key']} FROM {table} WHERE {where})"
+            self._count_into(conn, child, child_where, params, counts)
+
+    # -------------------------------------------------------------------------
+    # 5.4. Parça Parça Silme
+    # -------------------------------------------------------------------------
+
+    def _scan(self, table: str, where: str, params: tuple, after: Any = None) -> List[Dict[str, Any]]:
+        """5.4.1. Koşula uyan sonraki parçanın anahtarlarını PK sırasıyla okur."""
+        info = RETENTION_TABLES[table]
+        columns = info['pk'] if 'key' not in info or info['key'] == info['pk'] \
+            else f"{info['pk']}, {info['key']}"
+        query = f"SELECT {columns} FROM {table} WHERE ({where})"
+        if after is not None:
+            query += f" AND {info['pk']} > %s"
+            params = params + (after,)
+        query += f" ORDER BY {info['pk']} LIMIT %s"
+        with self.db as conn:
+            conn.cursor.execute(query, params + (self.chunk_size,))
+            return conn.cursor.fetchall()
+
+    def _delete_rows(self, table: str, rows: List[Dict[str, Any]], report: Dict[str, Any]) -> None:
+        """5.4.2. Bir parçanın önce alt tablo satırlarını, sonra kendisini siler."""
+        info = RETENTION_TABLES[table]
+        if info.get('children'):
+            self._delete_children(table, [row[info['key']] for row in rows], report)
+        self._delete_by_pk(table, [row[info['pk']] for row in rows], report)
+
+    def _delete_children(self, table: str, keys: List[Any], report: Dict[str, Any]) -> None:
+        """
+        5.4.3. Verilen üst anahtarlara bağlı alt tablo satırlarını (ve onların
+        alt satırlarını) chunk_size'lık parçalarla siler; böylece üst satırın
+        DELETE'i CASCADE ile sınırsız sayıda satır silmez.
+        """
+        placeholders = ', '.join(['%s'] * len(keys))
+        for child, fk in RETENTION_TABLES[table].get('children', []):
+            child_info = RETENTION_TABLES[child]
+            where = f"{fk} IN ({placeholders})"
+            after = None
+            while True:
+                rows = self._scan(child, where, tuple(keys), after)
+                if not rows:
+                    break
+                after = rows[-1][child_info['pk']]
+                self._delete_rows(child, rows, report)
+
+    def _delete_by_pk(self, table: str, pks: List[Any], report: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        pk = RETENTION_TABLES[table]['pk']
+        with self.db as conn:
+            conn.cursor.execute(
+                f"DELETE FROM {table} WHERE {pk} IN ({', '.join(['%s'] * len(pks))})", tuple(pks)
+            )
+            deleted = max(0, conn.cursor.rowcount or 0)
+        report['deleted'][table] = report['deleted'].get(table, 0) + deleted
+        self._throttle(deleted, started)
+
+    def _throttle(self, deleted: int, started: float) -> None:
+        """5.4.4. Silme hızını max_rows_per_sec'e sabitler, ardından sleep_ms bekler."""
+        delay = self.sleep_ms / 1000.0
+        if self.max_rows_per_sec and deleted:
+            delay += max(0.0, deleted / self.max_rows_per_sec - (time.perf_counter() - started))
+        if delay > 0:
+            time.sleep(delay)
+
+    # -------------------------------------------------------------------------
+    # 5.5. Partition Entegrasyonu
+    # -------------------------------------------------------------------------
+
+    def _drop_partitions(self, table: str, cutoff: datetime, dry_run: bool) -> Dict[str, Any]:
+        """
+        5.5.1. Tablo aylık partition'lı ise ileri tarihli partition'ları açar
+        ve tamamen süresi dolmuş ayları DROP PARTITION ile düşürür.
+
+        Returns:
+            {'created': [...], 'dropped': [...], 'rows': n}; partition'sız
+            tablolarda (veya MySQL dışında) boş rapor.
+        """
+        from app.database.migrations.partition_manager import PartitionManager
+        if self._partitions is None:
+            self._partitions = PartitionManager(self.db, config_class=self.config_class)
+        if not self._partitions.is_partitioned(table):
+            return {'created': [], 'dropped': [], 'rows': 0}
+        created = self._partitions.ensure_future_partitions(table, dry_run=dry_run)
+        dropped = self._partitions.drop_expired_partitions(table, cutoff=cutoff, dry_run=dry_run)
+        return {'created': created, 'dropped': dropped['partitions'], 'rows': dropped['rows']}
+
+
+def format_report(reports: Dict[str, Dict[str, Any]]) -> str:
+    """purge_all() çıktısını okunabilir metne çevirir."""
+    lines: List[str] = []
+    for name, report in reports.items():
+        counts: Dict[str, int] = report.get('would_delete') or report.get('deleted') or {}
+        verb = 'would delete' if report.get('dry_run') else 'deleted'
+        detail = ', '.join(f"{table}={count}" for table, count in counts.items()) or 'nothing'
+        dropped = (report.get('partitions') or {}).get('dropped')
+        if dropped:
+            detail += f"; partitions: {', '.join(dropped)}"
+        status = 'error: ' + report['error'] if 'error' in report else \
+            ('complete' if report.get('complete') else 'partial')
+        lines.append(f"{name:<16} cutoff={report.get('cutoff')}  {verb}: {detail}  "
+                     f"[{status}, {report.get('chunks', 0)} chunks, {report.get('elapsed_ms', 0)} ms]")
+    return '\n'.join(lines)
@@ -10,9 +10,46 @@ from app.database.schemas import (
     USERS_TABLE_SQL,
     QUIZ_SESSIONS_TABLE_SQL,
     QUIZ_SESSION_QUESTIONS_TABLE_SQL,
+    REPLICA_HEARTBEAT_TABLE_SQL,
+    QUESTION_BANK_FILES_TABLE_SQL,
+    BACKGROUND_JOBS_TABLE_SQL,
+    USER_ACTIVITIES_TABLE_SQL,
 )
 from app.database.schemas.chat_sessions_schema import get_chat_sessions_schema
-from app.database.schemas.chat_messages_schema import get_chat_messages_schema
+from app.database.schemas.chat_messages_schema import (
+    get_chat_messages_schema,
+    get_chat_messages_partitioned_schema,
+)
+from app.database.schemas.user_activities_schema import get_user_activities_partitioned_schema
+from app.database.repositories.question_repository import QuestionRepository
+
+
+# Tablo adı -> CREATE TABLE SQL (index advisor da bildirilen index'leri buradan okur)
+TABLE_SCHEMAS = {
+    'grades': GRADES_TABLE_SQL,
+    'subjects': SUBJECTS_TABLE_SQL,
+    'units': UNITS_TABLE_SQL,
+    'topics': TOPICS_TABLE_SQL,
+    'questions': QUESTIONS_TABLE_SQL,
+    'question_options': QUESTION_OPTIONS_TABLE_SQL,
+    'users': USERS_TABLE_SQL,
+    'quiz_sessions': QUIZ_SESSIONS_TABLE_SQL,
+    'quiz_session_questions': QUIZ_SESSION_QUESTIONS_TABLE_SQL,
+    'chat_sessions': get_chat_sessions_schema(),
+    'chat_messages': get_chat_messages_schema(),
+    'replica_heartbeat': REPLICA_HEARTBEAT_TABLE_SQL,
+    'question_bank_files': QUESTION_BANK_FILES_TABLE_SQL,
+    'background_jobs': BACKGROUND_JOBS_TABLE_SQL,
+    'user_activities': USER_ACTIVITIES_TABLE_SQL,
+}
+TABLE_ORDER = [
+    'grades', 'subjects', 'units', 'topics',
+    'questions', 'question_options', 'users',
+    'quiz_sessions', 'quiz_session_questions',
+    'chat_sessions', 'chat_messages',
+    'replica_heartbeat', 'question_bank_files', 'background_jobs',
+    'user_activities'
+]
 
 
 class SchemaManager:
@@ -22,25 +59,34 @@ class SchemaManager:
         self.db = db_connection or DatabaseConnection()
         self.own_connection = db_connection is None
 
-        self.table_schemas = {
-            'grades': GRADES_TABLE_SQL,
-            'subjects': SUBJECTS_TABLE_SQL,
-            'units': UNITS_TABLE_SQL,
-            'topics': TOPICS_TABLE_SQL,
-            'questions': QUESTIONS_TABLE_SQL,
-            'question_options': QUESTION_OPTIONS_TABLE_SQL,
-            'users': USERS_TABLE_SQL,
-            'quiz_sessions': QUIZ_SESSIONS_TABLE_SQL,
-            'quiz_session_questions': QUIZ_SESSION_QUESTIONS_TABLE_SQL,
-            'chat_sessions': get_chat_sessions_schema(),
-            'chat_messages': get_chat_messages_schema(),
+        self.table_schemas = dict(TABLE_SCHEMAS)
+        # Yeni kurulumlarda büyüyen tablolar aylık partition'lı oluşturulur
+        from config import get_config
+        settings = get_config().DATABASE
+        if getattr(settings, 'PARTITIONING_ENABLED', False):
+            months_ahead = getattr(settings, 'PARTITION_MONTHS_AHEAD', 3)
+            self.table_schemas['chat_messages'] = get_chat_messages_partitioned_schema(months_ahead)
+            self.table_schemas['user_activities'] = get_user_activities_partitioned_schema(months_ahead)
+        # Mevcut veritabanlarına sonradan eklenen kolonlar: tablo -> [(kolon, DDL)]
+        self.added_columns = {
+            'questions': [
+                ('option_count', 'SMALLINT NOT NULL DEFAULT 0'),
+                ('is_answerable', 'BOOLEAN NOT NULL DEFAULT false'),
+                ('source_file', 'VARCHAR(255) NULL'),
+                ('source_key', 'VARCHAR(191) NULL'),
+                ('content_hash', 'CHAR(40) NULL'),
+            ],
         }
-        self.table_order = [
-            'grades', 'subjects', 'units', 'topics',
-            'questions', 'question_options', 'users',
-            'quiz_sessions', 'quiz_session_questions',
-            'chat_sessions', 'chat_messages'
-        ]
+        # Sonradan eklenen kolonlar üzerindeki index'ler: tablo -> [(ad, DDL)]
+        self.added_indexes = {
+            'questions': [
+                ('uq_questions_source', 'UNIQUE KEY uq_questions_source (source_file, source_key)'),
+            ],
+            'background_jobs': [
+                ('idx_background_jobs_status', 'INDEX idx_background_jobs_status (status, created_at)'),
+            ],
+        }
+        self.table_order = list(TABLE_ORDER)
 
     def ensure_tables(self) -> bool:
         try:
@@ -49,6 +95,41 @@ class SchemaManager:
                     sql = self.table_schemas[table]
                     conn.cursor.execute(sql)
                     conn.connection.commit()
+            return self.ensure_columns()
+        except Exception:
+            return False
+
+    def ensure_columns(self) -> bool:
+        """Eski şemayla oluşturulmuş tablolara eksik kolonları ekler (idempotent)."""
+        try:
+            added = []
+            with self.db as conn:
+                conn.cursor.execute("SELECT DATABASE() AS db")
+                db_name = (conn.cursor.fetchone() or {}).get('db')
+                if not db_name:
+                    return False
+                for table, columns in self.added_columns.items():
+                    for column, ddl in columns:
+                        conn.cursor.execute(
+                            "SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS "
+                            "WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND COLUMN_NAME=%s LIMIT 1",
+                            (db_name, table, column)
+                        )
+                        if not conn.cursor.fetchone():
+                            conn.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+                            added.append((table, column))
+                for table, indexes in self.added_indexes.items():
+                    for index_name, ddl in indexes:
+                        conn.cursor.execute(
+                            "SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS "
+                            "WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND INDEX_NAME=%s LIMIT 1",
+                            (db_name, table, index_name)
+                        )
+                        if not conn.cursor.fetchone():
+                            conn.cursor.execute(f"ALTER TABLE {table} ADD {ddl}")
+            # Yeni eklenen answerable alanlarını mevcut seçeneklerden doldur
+            if any(column in ('option_count', 'is_answerable') for _, column in added):
+                QuestionRepository(self.db).repair_answerable()
             return True
         except Exception:
             return False
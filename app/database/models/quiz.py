@@ -4,7 +4,7 @@
 # SQLAlchemy QuizSession and QuizSessionQuestion models for quiz sessions
 # =============================================================================
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, JSON, Enum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import db
@@ -0,0 +1,463 @@
+# =============================================================================
+# Sorgu Enstrümantasyonu (Query Instrumentation)
+# =============================================================================
+# Amaç: Uygulamadaki tüm SQL sorgularını tek bir noktada ölçmek.
+#   - Request başına sorgu sayısı ve toplam veritabanı süresi
+#   - Sorgu parmak izi (fingerprint) bazında en maliyetli ifadeler
+#   - N+1 tespiti (aynı fingerprint bir request içinde K kereden fazla)
+#   - Eşik üstü sorgular için slow-query log'u
+#   - Admin endpoint'i için endpoint bazlı toplu istatistikler
+#
+# Kancalar (hooks):
+#   - Eski cursor yolu: db_connection._CursorWrapper her execute'u
+#     record_query() ile bildirir.
+#   - SQLAlchemy: tüm Engine'ler için before/after_cursor_execute event'leri
+#     (DatabaseConnectionManager ve Flask-SQLAlchemy engine'leri dahil).
+#
+# İçindekiler:
+#
+# 1. Ayarlar ve Durum
+#    1.1. configure(config_class)
+#    1.2. _settings()
+#
+# 2. Fingerprint
+#    2.1. fingerprint(sql)
+#
+# 3. Kayıt (Recording)
+#    3.1. record_query(sql, elapsed_ms, role)
+#    3.2. query_scope(name)
+#    3.3. SQLAlchemy engine event'leri
+#
+# 4. Flask Entegrasyonu
+#    4.1. init_app(app)
+#    4.2. _attach_slow_query_file(log_dir)
+#    4.3. _before_request() / _after_request(response)
+#
+# 5. Raporlama
+#    5.1. get_query_stats(limit)
+#    5.2. reset_query_stats()
+#    5.3. dump_fingerprints(path)
+# =============================================================================
+
+import atexit
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, Optional
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger('app.slow_query')
+
+# Global fingerprint tablosunda tutulacak en fazla farklı ifade sayısı
+_MAX_FINGERPRINTS = 500
+
+# =========================================================================
+# 1. Ayarlar ve Durum
+# =========================================================================
+
+_config_lock = threading.Lock()
+_config: Optional[Dict[str, Any]] = None
+
+_stats_lock = threading.Lock()
+_fingerprints: Dict[str, Dict[str, Any]] = {}
+_endpoints: Dict[str, Dict[str, Any]] = {}
+_slow_queries: deque = deque(maxlen=200)
+_n_plus_one: deque = deque(maxlen=100)
+
+# Request dışı (CLI, thread) ölçüm kapsamı
+_local = threading.local()
+
+# Route'a eşleşmeyen istekler (404 taramaları) tek bir endpoint kaydında toplanır
+UNMATCHED_ENDPOINT = '<unmatched>'
+
+# Çıkışta fingerprint dökümü süreç başına bir kez kaydedilir
+_exit_hook_registered = False
+
+
+def configure(config_class=None) -> Dict[str, Any]:
+    """
+    1.1. Ayarları config sınıfından yükler.
+
+    Args:
+        config_class: Uygulama config sınıfı (verilmezse get_config()).
+
+    Returns:
+        Yüklenen ayarlar sözlüğü.
+    """
+    global _config, _slow_queries
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    database = getattr(config_class, 'DATABASE', None)
+    app = getattr(config_class, 'APP', None)
+    settings = {
+        'enabled': bool(getattr(database, 'QUERY_STATS_ENABLED', True)),
+        'slow_query_ms': float(getattr(database, 'SLOW_QUERY_MS', 200)),
+        'n_plus_one_threshold': int(getattr(database, 'N_PLUS_ONE_THRESHOLD', 10)),
+        'slow_log_size': int(getattr(database, 'SLOW_QUERY_LOG_SIZE', 200)),
+        'log_dir': getattr(app, 'LOG_DIR', None),
+    }
+    with _config_lock:
+        _config = settings
+        if _slow_queries.maxlen != settings['slow_log_size']:
+            _slow_queries = deque(_slow_queries, maxlen=max(1, settings['slow_log_size']))
+    return settings
+
+
+def _settings() -> Dict[str, Any]:
+    """1.2. Yüklü ayarları döner; ilk kullanımda config'ten yükler."""
+    if _config is None:
+        try:
+            return configure()
+        except Exception:
+            return configure(object())
+    return _config
+
+# =========================================================================
+# 2. Fingerprint
+# =========================================================================
+
+_RE_COMMENT = re.compile(r'/\*.*?\*/|--[^\n]*', re.S)
+_RE_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_RE_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_RE_PARAM = re.compile(r'%s|%\(\w+\)s|:\w+|\?')
+_RE_IN_LIST = re.compile(r'\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.I)
+_RE_VALUES = re.compile(r'\bvalues\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*', re.I)
+_RE_SPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql: str) -> str:
+    """
+    2.1. SQL ifadesini parametrelerden bağımsız bir parmak izine çevirir.
+
+    Literal'ler ve bind parametreleri '?' olur, IN (...) listeleri ve
+    çok satırlı VALUES tek forma indirgenir, boşluklar sadeleştirilir.
+
+    Example:
+        fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3)")
+        -> "select * from t where id in (?+)"
+    """
+    text = _RE_COMMENT.sub(' ', sql or '')
+    text = _RE_STRING.sub('?', text)
+    text = _RE_PARAM.sub('?', text)
+    text = _RE_NUMBER.sub('?', text)
+    text = _RE_IN_LIST.sub('in (?+)', text)
+    text = _RE_VALUES.sub(r'values \1+', text)
+    return _RE_SPACE.sub(' ', text).strip().lower()
+
+# =========================================================================
+# 3. Kayıt (Recording)
+# =========================================================================
+
+
+def _new_scope(name: str) -> Dict[str, Any]:
+    return {'name': name, 'count': 0, 'total_ms': 0.0, 'statements': {}}
+
+
+def _current_scope() -> Optional[Dict[str, Any]]:
+    """Aktif ölçüm kapsamını döner: önce Flask request'i, sonra thread kapsamı."""
+    try:
+        from flask import g, has_request_context
+        if has_request_context():
+            return g.get('_query_scope')
+    except ImportError:
+        pass
+    return getattr(_local, 'scope', None)
+
+
+def record_query(sql: str, elapsed_ms: float, role: str = 'primary') -> None:
+    """
+    3.1. Çalıştırılmış bir sorguyu kaydeder.
+
+    Args:
+        sql: Çalıştırılan SQL ifadesi.
+        elapsed_ms: Süre (milisaniye).
+        role: 'primary' veya 'replica'.
+    """
+    settings = _settings()
+    if not settings['enabled'] or 'replica_heartbeat' in (sql or ''):
+        return
+    fp = fingerprint(sql)
+    scope = _current_scope()
+    if scope is not None:
+        scope['count'] += 1
+        scope['total_ms'] += elapsed_ms
+        entry = scope['statements'].get(fp)
+        if entry is None:
+            entry = scope['statements'][fp] = {'count': 0, 'total_ms': 0.0}
+        entry['count'] += 1
+        entry['total_ms'] += elapsed_ms
+
+    with _stats_lock:
+        entry = _fingerprints.get(fp)
+        if entry is None:
+            if len(_fingerprints) >= _MAX_FINGERPRINTS:
+                # En az çalışan ifadeyi çıkar, tablo sınırlı kalsın
+                victim = min(_fingerprints, key=lambda key: _fingerprints[key]['count'])
+                del _fingerprints[victim]
+            entry = _fingerprints[fp] = {
+                'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'sample': (sql or '').strip()[:2000], 'roles': {}
+            }
+        entry['count'] += 1
+        entry['total_ms'] += elapsed_ms
+        entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+        entry['roles'][role] = entry['roles'].get(role, 0) + 1
+
+        if elapsed_ms >= settings['slow_query_ms']:
+            record = {
+                'at': time.time(),
+                'elapsed_ms': round(elapsed_ms, 2),
+                'role': role,
+                'scope': scope['name'] if scope else None,
+                'fingerprint': fp,
+                'sql': (sql or '').strip()[:2000],
+            }
+            _slow_queries.append(record)
+            slow_query_logger.warning(json.dumps(record, ensure_ascii=False))
+
+
+@contextmanager
+def query_scope(name: str) -> Generator[Dict[str, Any], None, None]:
+    """
+    3.2. Request dışı kod (CLI, seed, arka plan işleri) için ölçüm kapsamı.
+
+    Example:
+        with query_scope('seed:questions') as scope:
+            seeder.seed_all()
+        print(scope['count'], scope['total_ms'])
+    """
+    previous = getattr(_local, 'scope', None)
+    scope = _new_scope(name)
+    _local.scope = scope
+    try:
+        yield scope
+    finally:
+        _local.scope = previous
+        _finish_scope(scope)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault('_query_started_at', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get('_query_started_at')
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    record_query(statement, elapsed_ms, conn.get_execution_options().get('query_role', 'primary'))
+
+
+def _install_engine_hooks() -> None:
+    """3.3. Tüm SQLAlchemy Engine'leri için cursor event'lerini bir kez bağlar."""
+    try:
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+    except ImportError:
+        return
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+_install_engine_hooks()
+
+# =========================================================================
+# 4. Flask Entegrasyonu
+# =========================================================================
+
+
+def init_app(app) -> None:
+    """
+    4.1. Flask uygulamasına request kancalarını ekler.
+
+    Her response'a `Server-Timing: db;dur=<ms>;desc="<n> queries"` başlığı
+    eklenir; request sonunda N+1 şüpheleri log'lanır.
+    """
+    class _ConfigView:
+        DATABASE = app.config.get('DATABASE')
+        APP = app.config.get('APP')
+
+    settings = configure(_ConfigView)
+    _attach_slow_query_file(settings.get('log_dir'))
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    # Birden fazla app örneği (ör. test app factory) aynı süreç genelindeki
+    # tabloyu paylaşır; döküm yine yalnızca bir kez yapılır
+    global _exit_hook_registered
+    with _config_lock:
+        if not _exit_hook_registered:
+            atexit.register(_dump_on_exit)
+            _exit_hook_registered = True
+
+
+def _attach_slow_query_file(log_dir) -> None:
+    """Slow-query kayıtlarını LOG_DIR/slow_queries.log dosyasına JSON satırları olarak yazar."""
+    if not log_dir or slow_query_logger.handlers:
+        return
+    try:
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(Path(log_dir) / 'slow_queries.log', encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        slow_query_logger.addHandler(handler)
+    except Exception as e:
+        logger.warning(f"Slow query log file could not be opened: {e}")
+
+
+def _before_request() -> None:
+    from flask import g, request
+    g._query_scope = _new_scope(request.endpoint or UNMATCHED_ENDPOINT)
+
+
+def _after_request(response):
+    from flask import g
+    scope = g.pop('_query_scope', None)
+    if scope is not None:
+        _finish_scope(scope)
+        if scope['count']:
+            response.headers.add(
+                'Server-Timing', f'db;dur={scope["total_ms"]:.1f};desc="{scope["count"]} queries"'
+            )
+    return response
+
+
+def _finish_scope(scope: Dict[str, Any]) -> None:
+    """Kapsamı endpoint istatistiklerine ekler ve N+1 şüphelerini kaydeder."""
+    settings = _settings()
+    if not settings['enabled']:
+        return
+    threshold = settings['n_plus_one_threshold']
+    suspects = [
+        {'fingerprint': fp, 'count': entry['count'], 'total_ms': round(entry['total_ms'], 2)}
+        for fp, entry in scope['statements'].items()
+        if entry['count'] > threshold
+    ]
+    with _stats_lock:
+        endpoint = _endpoints.get(scope['name'])
+        if endpoint is None:
+            endpoint = _endpoints[scope['name']] = {
+                'requests': 0, 'queries': 0, 'db_ms': 0.0, 'max_queries': 0, 'max_db_ms': 0.0, 'n_plus_one': 0
+            }
+        endpoint['requests'] += 1
+        endpoint['queries'] += scope['count']
+        endpoint['db_ms'] += scope['total_ms']
+        endpoint['max_queries'] = max(endpoint['max_queries'], scope['count'])
+        endpoint['max_db_ms'] = max(endpoint['max_db_ms'], scope['total_ms'])
+        if suspects:
+            endpoint['n_plus_one'] += 1
+            _n_plus_one.append({'at': time.time(), 'scope': scope['name'], 'statements': suspects})
+    for suspect in suspects:
+        logger.warning(
+            f"N+1 suspect in {scope['name']}: {suspect['count']}x {suspect['fingerprint'][:200]}"
+        )
+
+# =========================================================================
+# 5. Raporlama
+# =========================================================================
+
+
+def get_query_stats(limit: int = 20) -> Dict[str, Any]:
+    """
+    5.1. Admin endpoint'i için toplu istatistikleri döner.
+
+    Returns:
+        settings, endpoints (sorgu/süre ortalamaları), top_statements
+        (toplam süreye göre), slow_queries ve n_plus_one kayıtları.
+    """
+    with _stats_lock:
+        endpoints = []
+        for name, entry in _endpoints.items():
+            requests = entry['requests'] or 1
+            endpoints.append({
+                'endpoint': name,
+                'requests': entry['requests'],
+                'avg_queries': round(entry['queries'] / requests, 2),
+                'avg_db_ms': round(entry['db_ms'] / requests, 2),
+                'max_queries': entry['max_queries'],
+                'max_db_ms': round(entry['max_db_ms'], 2),
+                'n_plus_one_requests': entry['n_plus_one'],
+            })
+        statements = [
+            {
+                'fingerprint': fp,
+                'count': entry['count'],
+                'total_ms': round(entry['total_ms'], 2),
+                'avg_ms': round(entry['total_ms'] / entry['count'], 3) if entry['count'] else 0,
+                'max_ms': round(entry['max_ms'], 2),
+                'roles': dict(entry['roles']),
+                'sample': entry['sample'],
+            }
+            for fp, entry in _fingerprints.items()
+        ]
+        slow = list(_slow_queries)[-limit:]
+        n_plus_one = list(_n_plus_one)[-limit:]
+    endpoints.sort(key=lambda item: item['avg_db_ms'] * item['requests'], reverse=True)
+    statements.sort(key=lambda item: item['total_ms'], reverse=True)
+    settings = dict(_settings())
+    settings.pop('log_dir', None)
+    return {
+        'settings': settings,
+        'endpoints': endpoints[:limit],
+        'top_statements': statements[:limit],
+        'slow_queries': slow,
+        'n_plus_one': n_plus_one,
+    }
+
+
+def reset_query_stats() -> None:
+    """5.2. Toplanan tüm istatistikleri sıfırlar."""
+    with _stats_lock:
+        _fingerprints.clear()
+        _endpoints.clear()
+        _slow_queries.clear()
+        _n_plus_one.clear()
+
+
+def dump_fingerprints(path: Optional[str] = None) -> Optional[str]:
+    """
+    5.3. Fingerprint tablosunu JSON olarak diske yazar.
+
+    Mevcut dosya varsa sayaçlar birleştirilir; böylece process'ler arası
+    birikim (ör. index advisor girdisi) korunur.
+
+    Returns:
+        Yazılan dosya yolu veya başarısızsa None.
+    """
+    try:
+        if path is None:
+            log_dir = _settings().get('log_dir')
+            if not log_dir:
+                return None
+            path = str(Path(log_dir) / 'query_fingerprints.json')
+        target = Path(path)
+        merged: Dict[str, Dict[str, Any]] = {}
+        if target.exists():
+            try:
+                merged = json.loads(target.read_text(encoding='utf-8')).get('statements', {})
+            except Exception:
+                merged = {}
+        with _stats_lock:
+            for fp, entry in _fingerprints.items():
+                current = merged.setdefault(fp, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'sample': entry['sample']})
+                current['count'] += entry['count']
+                current['total_ms'] = round(current['total_ms'] + entry['total_ms'], 3)
+                current['max_ms'] = round(max(current['max_ms'], entry['max_ms']), 3)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            json.dumps({'updated_at': time.time(), 'statements': merged}, ensure_ascii=False, indent=1),
+            encoding='utf-8'
+        )
+        return str(target)
+    except Exception as e:
+        logger.warning(f"Query fingerprint dump failed: {e}")
+        return None
+
+
+def _dump_on_exit() -> None:
+    if _fingerprints:
+        dump_fingerprints()
@@ -3,6 +3,7 @@ Activity Repository - User Activity Logging
 Handles logging and retrieval of user activities for audit purposes
 """
 
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from app.database.repositories.base_repository import BaseRepository
 from app.database.db_connection import DatabaseConnection
@@ -91,18 +92,22 @@ class ActivityRepository(BaseRepository):
             return []
     
     def get_by_date_range(self, start_date: str, end_date: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Tarih aralığına göre aktiviteleri getirir"""
+        """Tarih aralığına göre aktiviteleri getirir (uç günler dahil)"""
         try:
+            # DATE(created_at) yerine sabit aralık: index ve aylık partition budaması kullanılabilir
+            start = datetime.strptime(str(start_date)[:10], '%Y-%m-%d')
+            end = datetime.strptime(str(end_date)[:10], '%Y-%m-%d') + timedelta(days=1)
             query = """
                 SELECT a.*, u.username
                 FROM user_activities a
                 LEFT JOIN users u ON a.user_id = u.id
-                WHERE DATE(a.created_at) BETWEEN %s AND %s
+                WHERE a.created_at >= %s AND a.created_at < %s
                 ORDER BY a.created_at DESC
                 LIMIT %s
             """
             
-            return self.fetch_all(query, (start_date, end_date, limit))
+            return self.fetch_all(query, (start.strftime('%Y-%m-%d %H:%M:%S'),
+                                          end.strftime('%Y-%m-%d %H:%M:%S'), limit))
             
         except Exception as e:
             print(f"Error getting activities by date range: {e}")
@@ -131,10 +136,13 @@ class ActivityRepository(BaseRepository):
             return 0
     
     def cleanup_old_activities(self, days: int = 90) -> int:
-        """Eski aktivite kayıtlarını temizler"""
+        """Eski aktivite kayıtlarını PK sırasıyla, parça parça temizler"""
         try:
-            query = "DELETE FROM user_activities WHERE created_at < DATE_SUB(NOW(), INTERVAL %s DAY)"
-            return self.execute_query(query, (days,))
+            from app.database.migrations.retention_manager import RetentionManager
+            report = RetentionManager(self.db_connection).purge('user_activities', days=days)
+            if 'error' in report:
+                print(f"Error cleaning up old activities: {report['error']}")
+            return report.get('deleted', {}).get('user_activities', 0)
             
         except Exception as e:
             print(f"Error cleaning up old activities: {e}")
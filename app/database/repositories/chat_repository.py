@@ -6,10 +6,14 @@
 
 import uuid
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from ..db_connection import DatabaseConnection
 
+# chat_messages'ın partition durumunun yeniden kontrol aralığı (saniye)
+PARTITION_CHECK_INTERVAL = 600
+
 class ChatRepository:
     """
     Chat session ve mesaj veritabanı işlemlerini yönetir.
@@ -18,6 +22,8 @@ class ChatRepository:
     def __init__(self, db_connection=None):
         """Chat repository'yi başlatır."""
         self.db_connection = db_connection or DatabaseConnection()
+        self._partitioned: Optional[bool] = None
+        self._partition_checked_at = 0.0
     
     def create_chat_session(self, quiz_session_id: str, question_id: int, user_id: Optional[int] = None, context: Dict[str, Any] = None) -> str:
         """
@@ -103,14 +109,15 @@ class ChatRepository:
         """
         try:
             with self.db_connection as conn:
-                query = """
+                since_sql, since_params = self._messages_since(conn, chat_session_id)
+                query = f"""
                     SELECT id, chat_session_id, message_type as role, content, action_type as label, created_at
                     FROM chat_messages
-                    WHERE chat_session_id = %s
+                    WHERE chat_session_id = %s{since_sql}
                     ORDER BY created_at ASC
                 """
                 
-                conn.cursor.execute(query, (chat_session_id,))
+                conn.cursor.execute(query, (chat_session_id,) + since_params)
                 results = conn.cursor.fetchall()
                 
                 # Since cursor is created with dictionary=True, results are already dictionaries
@@ -255,15 +262,16 @@ class ChatRepository:
         """
         try:
             with self.db_connection as conn:
-                query = """
+                since_sql, since_params = self._messages_since(conn, chat_session_id)
+                query = f"""
                 SELECT id, message_type as role, content, action_type, created_at
                 FROM chat_messages
-                WHERE chat_session_id = %s
+                WHERE chat_session_id = %s{since_sql}
                 ORDER BY created_at ASC
                 LIMIT %s
                 """
                 
-                conn.cursor.execute(query, (chat_session_id, limit))
+                conn.cursor.execute(query, (chat_session_id,) + since_params + (limit,))
                 results = conn.cursor.fetchall()
                 
                 # Return in chronological order directly
@@ -310,17 +318,30 @@ class ChatRepository:
         except Exception as e:
             pass
     
-    def cleanup_old_sessions(self, hours: int = 24):
-        """Eski chat session'larını temizler."""
+    def cleanup_old_sessions(self, hours: int = 24) -> int:
+        """
+        `hours` saatten önce oluşturulmuş ve kapatılmış ('closed') chat
+        session'larını parça parça siler.
+        
+        Kapsam eski tek DELETE ile aynıdır (status = 'closed' AND
+        created_at < cutoff); 'completed'/'archived' session'lar yalnızca
+        RetentionManager'ın 'chat_sessions' politikasıyla temizlenir. Silinen
+        session'ların mesajları, FK CASCADE'in yapacağı gibi önce aynı
+        chunk'larla silinir (partition'lı chat_messages'ta CASCADE yoktur).
+        
+        Returns:
+            Silinen session sayısı
+        """
         try:
-            with self.db_connection as conn:
-                cutoff_time = datetime.now() - timedelta(hours=hours)
-                query = "DELETE FROM chat_sessions WHERE created_at < %s AND status = 'closed'"
-                conn.cursor.execute(query, (cutoff_time,))
-                deleted_count = conn.cursor.rowcount
+            from ..migrations.retention_manager import RetentionManager
+            report = RetentionManager(self.db_connection).purge(
+                'chat_sessions', cutoff=datetime.now() - timedelta(hours=hours),
+                where="status = 'closed' AND created_at < %s"
+            )
+            return report.get('deleted', {}).get('chat_sessions', 0)
                 
         except Exception as e:
-            pass
+            return 0
     
     def get_session_statistics(self, chat_session_id: str) -> Dict[str, Any]:
         """
@@ -334,7 +355,8 @@ class ChatRepository:
         """
         try:
             with self.db_connection as conn:
-                query = """
+                since_sql, since_params = self._messages_since(conn, chat_session_id)
+                query = f"""
                 SELECT 
                     COUNT(*) as total_messages,
                     COUNT(CASE WHEN message_type = 'user' THEN 1 END) as user_messages,
@@ -344,10 +366,10 @@ class ChatRepository:
                     MIN(created_at) as first_message,
                     MAX(created_at) as last_message
                 FROM chat_messages
-                WHERE chat_session_id = %s
+                WHERE chat_session_id = %s{since_sql}
                 """
                 
-                conn.cursor.execute(query, (chat_session_id,))
+                conn.cursor.execute(query, (chat_session_id,) + since_params)
                 result = conn.cursor.fetchone()
                 
                 if result:
@@ -356,3 +378,51 @@ class ChatRepository:
                 
         except Exception as e:
             return {}
+    
+    def _messages_since(self, conn, chat_session_id: str) -> Tuple[str, tuple]:
+        """
+        Mesaj sorgularına session'ın oluşturulma zamanını alt sınır olarak ekler.
+        
+        Mesajlar session'dan önce oluşamaz; `created_at >= sabit` koşulu aylık
+        partition'lı chat_messages tablosunda yalnızca ilgili ayların
+        taranmasını (partition pruning) sağlar. Pruning sabit değer istediğinden
+        sınır ayrı bir sorguyla okunur; bu sorgu yalnızca tablo partition'lıysa
+        yapılır. Session bulunamazsa koşul eklenmez.
+        
+        Returns:
+            (SQL parçası, parametreler)
+        """
+        if not self._messages_partitioned(conn):
+            return '', ()
+        conn.cursor.execute(
+            "SELECT created_at FROM chat_sessions WHERE session_id = %s", (chat_session_id,)
+        )
+        row = conn.cursor.fetchone()
+        if not row or not row.get('created_at'):
+            return '', ()
+        return ' AND created_at >= %s', (row['created_at'],)
+    
+    def _messages_partitioned(self, conn) -> bool:
+        """
+        chat_messages partition'lı mı (MySQL INFORMATION_SCHEMA).
+        
+        Sonuç PARTITION_CHECK_INTERVAL saniye önbellekte tutulur; tablo çalışma
+        sırasında partition'lanırsa sınır en geç bu süre sonunda devreye girer.
+        """
+        now = time.monotonic()
+        if self._partitioned is not None and now - self._partition_checked_at < PARTITION_CHECK_INTERVAL:
+            return self._partitioned
+        partitioned = False
+        try:
+            if conn.engine.dialect.name == 'mysql':
+                conn.cursor.execute(
+                    "SELECT COUNT(*) AS cnt FROM INFORMATION_SCHEMA.PARTITIONS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'chat_messages' "
+                    "AND PARTITION_NAME IS NOT NULL"
+                )
+                row = conn.cursor.fetchone() or {}
+                partitioned = int(row.get('cnt') or 0) > 0
+        except Exception:
+            partitioned = False
+        self._partitioned, self._partition_checked_at = partitioned, now
+        return partitioned
@@ -0,0 +1,510 @@
+# =============================================================================
+# CURRICULUM IMPORT REPOSITORY
+# =============================================================================
+# Müfredat (grades -> subjects -> units -> topics) verisini küme tabanlı
+# içe aktarır. Mevcut anahtarlar seviye başına tek sorguyla belleğe alınır,
+# eksik kayıtlar seviye seviye çok satırlı INSERT ile yazılır; satır başına
+# SELECT + INSERT gidiş-dönüşü yapılmaz.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. YARDIMCI FONKSİYONLAR
+#   4.1. name_key(name)
+#   4.2. empty_report()
+# 5.0. CURRICULUM IMPORT REPOSITORY SINIFI
+#   5.1. Constructor ve Başlatma
+#   5.2. Ana İşlem
+#     5.2.1. import_data(self, data)
+#     5.2.2. apply_plan(self, plan, conn, state)
+#   5.3. Girdi Normalizasyonu
+#     5.3.1. build_plan(self, data)
+#     5.3.2. _plan_flat(self, data, plan)
+#     5.3.3. _plan_hierarchical(self, items, plan)
+#   5.4. Seviye İşlemleri
+#     5.4.1. _load_level(self, conn, level, parent_ids)
+#     5.4.2. _apply_level(self, conn, level, resolved, state, counts, seen)
+#     5.4.3. _resolve_parent(self, level, ref, state)
+#   5.5. SQL Yardımcıları
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from app.database.db_connection import DatabaseConnection
+
+# Tek bir çok satırlı INSERT / IN (...) ifadesindeki en fazla parametre sayısı
+MAX_PARAMS_PER_STATEMENT = 4000
+# Rapordaki hata listesinin üst sınırı
+MAX_REPORTED_ERRORS = 50
+
+# seviye -> (tablo, id kolonu, üst seviye FK kolonu, ad kolonu, üst seviye)
+LEVELS: Dict[str, Tuple[str, str, Optional[str], str, Optional[str]]] = {
+    'grades': ('grades', 'grade_id', None, 'grade_name', None),
+    'subjects': ('subjects', 'subject_id', 'grade_id', 'subject_name', 'grades'),
+    'units': ('units', 'unit_id', 'subject_id', 'unit_name', 'subjects'),
+    'topics': ('topics', 'topic_id', 'unit_id', 'topic_name', 'units'),
+}
+LEVEL_ORDER = ('grades', 'subjects', 'units', 'topics')
+# Satır sayısı en yüksek seviye; tamamı değil yalnızca ilgili üniteler okunur
+LEAF_LEVEL = 'topics'
+
+# =============================================================================
+# 4.0. YARDIMCI FONKSİYONLAR
+# =============================================================================
+
+def name_key(name: Any) -> str:
+    """
+    4.1. Ad eşleştirme anahtarı.
+
+    Tablolar utf8mb4_unicode_ci collation kullandığından MySQL 'Matematik' ile
+    'matematik'i aynı UNIQUE anahtar sayar; bellekteki haritalar da büyük/küçük
+    harf ve baş/son boşluk farkını yok sayar.
+    """
+    return str(name).strip().casefold()
+
+
+def empty_report() -> Dict[str, Any]:
+    """4.2. Boş içe aktarma raporu."""
+    return {
+        'success': False,
+        **{level: {'created': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0} for level in LEVEL_ORDER},
+        'errors': [],
+        'statements': 0,
+        'elapsed_ms': 0.0,
+    }
+
+
+def _first(entry: Any, *keys: str) -> Any:
+    """
+    Alternatif anahtar adlarından ilk dolu olanın değeri (boşluklar kırpılır).
+
+    Bazı müfredat dosyalarında konular yalnızca ad olarak ("Ölçek") yazılır;
+    düz metin girdinin kendisi ad kabul edilir.
+    """
+    if isinstance(entry, str):
+        return entry.strip() or None
+    if not isinstance(entry, dict):
+        return None
+    for key in keys:
+        value = entry.get(key)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _attrs(entry: Any) -> Dict[str, Any]:
+    """Girdide açıkça verilmiş description / is_active alanları."""
+    attrs = {}
+    if not isinstance(entry, dict):
+        return attrs
+    if 'description' in entry:
+        attrs['description'] = entry.get('description')
+    for key in ('is_active', 'isActive'):
+        if key in entry and entry[key] is not None:
+            attrs['is_active'] = bool(entry[key])
+            break
+    return attrs
+
+# =============================================================================
+# 5.0. CURRICULUM IMPORT REPOSITORY SINIFI
+# =============================================================================
+
+class CurriculumImportRepository:
+    """
+    Müfredat içe aktarma motoru.
+
+    Girdi önce seviye başına bir "plan"a (ad + üst seviye referansı + alanlar)
+    dönüştürülür, ardından tek transaction içinde:
+
+      1. Seviyenin mevcut kayıtları tek SELECT ile haritaya alınır,
+      2. Plan satırlarının üst seviye ID'leri bellekten çözülür,
+      3. Eksik kayıtlar çok satırlı INSERT ile eklenir, ID'leri üst seviye
+         ID'leri üzerinden toplu olarak geri okunur,
+      4. description / is_active alanı farklı olan kayıtlar güncellenir.
+
+    Böylece sorgu sayısı satır sayısıyla değil seviye ve parça sayısıyla artar.
+    """
+
+    # -------------------------------------------------------------------------
+    # 5.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """Repository'yi başlatır."""
+        self.db = db_connection or DatabaseConnection()
+        self._statements = 0
+
+    # -------------------------------------------------------------------------
+    # 5.2. Ana İşlem
+    # -------------------------------------------------------------------------
+
+    def import_data(self, data: Any) -> Dict[str, Any]:
+        """
+        5.2.1. Müfredat verisini içe aktarır.
+
+        Args:
+            data: Düz format ({'grades': [...], 'subjects': [...], ...}) ya da
+                  hiyerarşik format ([{'gradeName', 'subjects': [{'units': ...}]}]).
+
+        Returns:
+            Seviye başına {'created', 'updated', 'unchanged', 'skipped'} sayıları,
+            'errors' (ilk MAX_REPORTED_ERRORS atlama nedeni), 'statements'
+            (çalıştırılan SQL ifadesi sayısı) ve 'elapsed_ms' içeren rapor.
+            Hata olursa transaction geri alınır ve 'success' False döner.
+        """
+        started = time.perf_counter()
+        report = empty_report()
+        try:
+            plan = self.build_plan(data)
+            with self.db as conn:
+                report = self.apply_plan(plan, conn)
+            report['success'] = True
+        except Exception as e:
+            report['success'] = False
+            report['errors'].append(str(e))
+        report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return report
+
+    def apply_plan(self, plan: Dict[str, List[Dict[str, Any]]], conn,
+                   state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        5.2.2. Hazır bir planı açık bir `with db as conn` tutamacında uygular.
+
+        Çağıran kendi transaction'ını yönetir (ör. batch'ler halinde içe aktarım).
+
+        Args:
+            plan: build_plan() çıktısı.
+            conn: Açık veritabanı tutamacı.
+            state: Batch'ler arasında taşınan önbellek. Verilirse grades /
+                   subjects / units haritaları bir kez yüklenip sonraki
+                   batch'lerde yeniden kullanılır; topics her batch'te yalnızca
+                   o batch'in ünitelerine göre okunur. Aynı kayıt sonraki
+                   batch'lerde tekrar 'unchanged' sayılmaz. Batch'in
+                   transaction'ı geri alınırsa state atılmalıdır.
+        """
+        self._statements = 0
+        report = empty_report()
+        state = state if state is not None else {}
+        seen = state.setdefault('_seen', {})
+        for entry in plan.get('skipped', []):
+            self._skip(report, entry['level'], entry['reason'])
+
+        for level in LEVEL_ORDER:
+            resolved = []
+            for spec in plan.get(level, []):
+                parent_id = self._resolve_parent(level, spec.get('parent'), state)
+                if LEVELS[level][4] and parent_id is None:
+                    self._skip(report, level, f"{spec['name']}: üst kayıt bulunamadı ({spec.get('parent')})")
+                    continue
+                resolved.append((parent_id, spec))
+            if level == LEAF_LEVEL:
+                state[level] = self._load_level(conn, level, parent_ids={pid for pid, _ in resolved})
+            elif level not in state:
+                state[level] = self._load_level(conn, level)
+            self._apply_level(conn, level, resolved, state[level], report[level],
+                              seen=None if level == LEAF_LEVEL else seen.setdefault(level, set()))
+
+        report['statements'] = self._statements
+        report['success'] = True
+        return report
+
+    # -------------------------------------------------------------------------
+    # 5.3. Girdi Normalizasyonu
+    # -------------------------------------------------------------------------
+
+    def build_plan(self, data: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        5.3.1. Girdiyi seviye başına plan listelerine çevirir.
+
+        Plan satırı: {'name', 'attrs', 'parent'}. 'parent' üst seviyeyi şu
+        biçimlerden biriyle gösterir:
+            {'path': (grade_name, ...)}  - ad yolu (hiyerarşik / düz format)
+            {'id': int}                  - doğrudan üst seviye ID'si
+            {'name': str}                - yalnız ad; ilk eşleşen kayıt
+        'path' çözülemezse ve 'name' de verilmişse ada göre geri düşülür
+        (eski resolve_subject_id / resolve_unit_id davranışı).
+        """
+        plan: Dict[str, List[Dict[str, Any]]] = {level: [] for level in LEVEL_ORDER}
+        plan['skipped'] = []
+        if isinstance(data, dict) and any(k in data for k in LEVEL_ORDER):
+            self._plan_flat(data, plan)
+        elif data:
+            self._plan_hierarchical(data if isinstance(data, list) else [data], plan)
+        return plan
+
+    def _plan_flat(self, data: Dict[str, Any], plan: Dict[str, List[Dict[str, Any]]]) -> None:
+        """5.3.2. Düz export formatı: her seviye kendi listesinde, üst seviye ad veya ID ile."""
+        for g in data.get('grades') or []:
+            gname = _first(g, 'grade_name', 'gradeName', 'name')
+            if not gname:
+                plan['skipped'].append({'level': 'grades', 'reason': 'sınıf adı eksik'})
+                continue
+            plan['grades'].append({'name': gname, 'attrs': _attrs(g), 'parent': None})
+
+        for s in data.get('subjects') or []:
+            sname = _first(s, 'subject_name', 'subjectName')
+            if not sname:
+                plan['skipped'].append({'level': 'subjects', 'reason': 'ders adı eksik'})
+                continue
+            gname = _first(s, 'grade_name', 'gradeName')
+            if gname:
+                # Referans verilen sınıf yoksa oluşturulur
+                plan['grades'].append({'name': gname, 'attrs': {}, 'parent': None})
+                parent = {'path': (gname,)}
+            else:
+                parent = {'id': s.get('grade_id')}
+            plan['subjects'].append({'name': sname, 'attrs': _attrs(s), 'parent': parent})
+
+        for u in data.get('units') or []:
+            uname = _first(u, 'unit_name', 'unitName')
+            if not uname:
+                plan['skipped'].append({'level': 'units', 'reason': 'ünite adı eksik'})
+                continue
+            sname = _first(u, 'subject_name', 'subjectName')
+            gname = _first(u, 'grade_name', 'gradeName')
+            if sname:
+                parent = {'path': (gname, sname) if gname else None, 'name': sname}
+            else:
+                parent = {'id': u.get('subject_id')}
+            plan['units'].append({'name': uname, 'attrs': _attrs(u), 'parent': parent})
+
+        for t in data.get('topics') or []:
+            tname = _first(t, 'topic_name', 'topicName')
+            if not tname:
+                plan['skipped'].append({'level': 'topics', 'reason': 'konu adı eksik'})
+                continue
+            uname = _first(t, 'unit_name', 'unitName')
+            sname = _first(t, 'subject_name', 'subjectName')
+            gname = _first(t, 'grade_name', 'gradeName')
+            if uname:
+                parent = {'path': (gname, sname, uname) if sname and gname else None, 'name': uname}
+            else:
+                parent = {'id': t.get('unit_id')}
+            plan['topics'].append({'name': tname, 'attrs': _attrs(t), 'parent': parent})
+
+    def _plan_hierarchical(self, items: List[Dict[str, Any]], plan: Dict[str, List[Dict[str, Any]]]) -> None:
+        """5.3.3. Hiyerarşik format: sınıf -> subjects -> units -> topics iç içe."""
+        for item in items:
+            if not isinstance(item, dict):
+                plan['skipped'].append({'level': 'grades', 'reason': 'geçersiz sınıf kaydı'})
+                continue
+            gname = (_first(item, 'gradeName', 'grade_name', 'grade')
+                     or f"Grade {item.get('gradeLevel', 'Unknown')}")
+            plan['grades'].append({'name': gname, 'attrs': _attrs(item), 'parent': None})
+
+            for subject in item.get('subjects') or []:
+                sname = _first(subject, 'subjectName', 'subject_name')
+                if not sname:
+                    plan['skipped'].append({'level': 'subjects', 'reason': f'{gname}: ders adı eksik'})
+                    continue
+                plan['subjects'].append({'name': sname, 'attrs': _attrs(subject),
+                                         'parent': {'path': (gname,)}})
+
+                for unit in (subject.get('units') if isinstance(subject, dict) else None) or []:
+                    uname = _first(unit, 'unitName', 'unit_name')
+                    if not uname:
+                        plan['skipped'].append({'level': 'units', 'reason': f'{gname}/{sname}: ünite adı eksik'})
+                        continue
+                    plan['units'].append({'name': uname, 'attrs': _attrs(unit),
+                                          'parent': {'path': (gname, sname)}})
+
+                    for topic in (unit.get('topics') if isinstance(unit, dict) else None) or []:
+                        tname = _first(topic, 'topicName', 'topic_name')
+                        if not tname:
+                            plan['skipped'].append({'level': 'topics',
+                                                    'reason': f'{gname}/{sname}/{uname}: konu adı eksik'})
+                            continue
+                        plan['topics'].append({'name': tname, 'attrs': _attrs(topic),
+                                               'parent': {'path': (gname, sname, uname)}})
+
+    # -------------------------------------------------------------------------
+    # 5.4. Seviye İşlemleri
+    # -------------------------------------------------------------------------
+
+    def _load_level(self, conn, level: str, parent_ids: Optional[set] = None) -> Dict[str, Any]:
+        """
+        5.4.1. Seviyenin mevcut kayıtlarını haritalara alır.
+
+        Args:
+            parent_ids: Verilirse yalnızca bu üst kayıtlara bağlı satırlar
+                        IN (...) parçalarıyla okunur; verilmezse tablo tek
+                        sorguyla okunur.
+
+        Returns:
+            {'by_key': {(parent_id, name_key): row}, 'ids': set, 'by_name': {name_key: min id}}
+        """
+        table, id_col, parent_col, name_col, _ = LEVELS[level]
+        parent_expr = parent_col or 'NULL'
+        query = f"""
+            SELECT {id_col} AS id, {parent_expr} AS parent_id, {name_col} AS name,
+                   description, is_active
+            FROM {table}
+        """
+        state = {'by_key': {}, 'ids': set(), 'by_name': {}}
+        if parent_ids is None:
+            batches = [(query, ())]
+        else:
+            values = sorted(pid for pid in parent_ids if pid is not None)
+            batches = []
+            for start in range(0, len(values), MAX_PARAMS_PER_STATEMENT):
+                chunk = tuple(values[start:start + MAX_PARAMS_PER_STATEMENT])
+                batches.append((query + f" WHERE {parent_col} IN ({', '.join(['%s'] * len(chunk))})", chunk))
+        for sql, params in batches:
+            for row in self._fetch(conn, sql, params):
+                self._remember(state, row)
+        return state
+
+    def _remember(self, state: Dict[str, Any], row: Dict[str, Any]) -> None:
+        key = (row['parent_id'], name_key(row['name']))
+        state['by_key'].setdefault(key, row)
+        state['ids'].add(row['id'])
+        by_name = state['by_name']
+        if key[1] not in by_name or row['id'] < by_name[key[1]]:
+            by_name[key[1]] = row['id']
+
+    def _resolve_parent(self, level: str, ref: Optional[Dict[str, Any]],
+                        state: Dict[str, Dict[str, Any]]) -> Optional[int]:
+        """
+        5.4.3. Plan satırının üst seviye ID'sini bellekteki haritalardan çözer.
+
+        'path' çözümü yukarıdan aşağı yürür: (grade,) -> grade_id,
+        (grade, subject) -> subject_id, (grade, subject, unit) -> unit_id.
+        """
+        parent_level = LEVELS[level][4]
+        if parent_level is None or not ref:
+            return None
+        if ref.get('id') is not None:
+            try:
+                parent_id = int(ref['id'])
+            except (TypeError, ValueError):
+                return None
+            return parent_id if parent_id in state[parent_level]['ids'] else None
+
+        path = ref.get('path')
+        if path:
+            current_id = None
+            for depth, part in enumerate(path):
+                row = state[LEVEL_ORDER[depth]]['by_key'].get((current_id, name_key(part)))
+                if row is None:
+                    current_id = None
+                    break
+                current_id = row['id']
+            if current_id is not None:
+                return current_id
+        if ref.get('name'):
+            return state[parent_level]['by_name'].get(name_key(ref['name']))
+        return None
+
+    def _apply_level(self, conn, level: str, resolved: List[Tuple[Optional[int], Dict[str, Any]]],
+                     state: Dict[str, Any], counts: Dict[str, int], seen: Optional[set] = None) -> None:
+        """
+        5.4.2. Çözülmüş plan satırlarını mevcut kayıtlarla karşılaştırıp
+        eksikleri toplu ekler, alanı değişenleri günceller.
+
+        Aynı anahtar girdide birden fazla geçerse tek kayıt sayılır; sonradan
+        gelen açık alanlar öncekilerin üzerine yazılır.
+        """
+        table, id_col, parent_col, name_col, _ = LEVELS[level]
+
+        # Girdi içindeki tekrarları birleştir (sıra korunur)
+        wanted: Dict[Tuple[Optional[int], str], Dict[str, Any]] = {}
+        for parent_id, spec in resolved:
+            key = (parent_id, name_key(spec['name']))
+            if key in wanted:
+                wanted[key]['attrs'].update(spec['attrs'])
+            else:
+                wanted[key] = {'name': spec['name'], 'attrs': dict(spec['attrs'])}
+
+        inserts: List[tuple] = []
+        updates: List[tuple] = []
+        for key, spec in wanted.items():
+            attrs = spec['attrs']
+            existing = state['by_key'].get(key)
+            if seen is not None:
+                # Önceki batch'lerde sayılmış kayıt yalnızca değişirse tekrar sayılır
+                first_time = key not in seen
+                seen.add(key)
+            if existing is None:
+                description = attrs.get('description')
+                is_active = attrs.get('is_active', True)
+                row = (key[0], spec['name'], description, is_active) if parent_col else \
+                    (spec['name'], description, is_active)
+                inserts.append(row)
+                continue
+            description = attrs.get('description', existing['description'])
+            is_active = attrs.get('is_active', bool(existing['is_active']))
+            if description != existing['description'] or is_active != bool(existing['is_active']):
+                updates.append((description, is_active, existing['id']))
+                # Önbellekteki satır da güncellenir; sonraki batch aynı değeri yeniden yazmaz
+                existing['description'], existing['is_active'] = description, is_active
+            elif seen is None or first_time:
+                counts['unchanged'] += 1
+
+        if inserts:
+            columns = ((parent_col,) if parent_col else ()) + (name_col, 'description', 'is_active')
+            self._insert_rows(conn, table, columns, inserts)
+            counts['created'] += len(inserts)
+            self._reload_created(conn, level, inserts, state)
+
+        if updates:
+            self._statements += 1
+            conn.cursor.executemany(
+                f"UPDATE {table} SET description = %s, is_active = %s WHERE {id_col} = %s",
+                updates
+            )
+            counts['updated'] += len(updates)
+
+    def _reload_created(self, conn, level: str, inserts: List[tuple], state: Dict[str, Any]) -> None:
+        """Yeni eklenen kayıtların ID'lerini üst seviye ID'leri (veya adları) üzerinden toplu okur."""
+        table, id_col, parent_col, name_col, _ = LEVELS[level]
+        if parent_col:
+            lookup_col = parent_col
+            values = sorted({row[0] for row in inserts})
+        else:
+            lookup_col = name_col
+            values = [row[0] for row in inserts]
+        parent_expr = parent_col or 'NULL'
+        for start in range(0, len(values), MAX_PARAMS_PER_STATEMENT):
+            chunk = values[start:start + MAX_PARAMS_PER_STATEMENT]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            rows = self._fetch(conn, f"""
+                SELECT {id_col} AS id, {parent_expr} AS parent_id, {name_col} AS name,
+                       description, is_active
+                FROM {table}
+                WHERE {lookup_col} IN ({placeholders})
+            """, tuple(chunk))
+            for row in rows:
+                self._remember(state, row)
+
+    def _skip(self, report: Dict[str, Any], level: str, reason: str) -> None:
+        report[level]['skipped'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append(f"{level}: {reason}")
+
+    # -------------------------------------------------------------------------
+    # 5.5. SQL Yardımcıları
+    # -------------------------------------------------------------------------
+
+    def _fetch(self, conn, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        self._statements += 1
+        conn.cursor.execute(query, params)
+        return conn.cursor.fetchall() or []
+
+    def _insert_rows(self, conn, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+        """Satırları çok satırlı INSERT ... VALUES (...), (...) ifadeleriyle yazar."""
+        per_statement = max(1, MAX_PARAMS_PER_STATEMENT // len(columns))
+        row_sql = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start:start + per_statement]
+            self._statements += 1
+            conn.cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ', '.join([row_sql] * len(chunk)),
+                tuple(value for row in chunk for value in row)
+            )
@@ -0,0 +1,179 @@
+# =============================================================================
+# QUESTION REPOSITORY
+# =============================================================================
+# Soru ve soru seçeneği yazma işlemleri ile `questions.option_count` /
+# `questions.is_answerable` alanlarının bakımı.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. QUESTION REPOSITORY SINIFI
+#   4.1. Constructor ve Başlatma
+#   4.2. Seçenek Yazma İşlemleri
+#     4.2.1. add_option(self, question_id, option_text, is_correct, description)
+#     4.2.2. delete_option(self, option_id)
+#   4.3. Answerable Bakımı
+#     4.3.1. refresh_answerable(self, question_ids, conn)
+#     4.3.2. repair_answerable(self, batch_size, dry_run)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+from typing import Any, Dict, Iterable, List, Optional
+from app.database.db_connection import DatabaseConnection
+
+# Bir sorunun quiz'de sorulabilmesi için gereken en az seçenek sayısı
+ANSWERABLE_MIN_OPTIONS = 2
+
+# =============================================================================
+# 4.0. QUESTION REPOSITORY SINIFI
+# =============================================================================
+
+class QuestionRepository:
+    """
+    Soru/seçenek yazmalarını yöneten repository.
+
+    `questions.option_count` ve `questions.is_answerable` alanları seçenek
+    eklendiğinde/silindiğinde aynı transaction içinde güncellenir; rastgele
+    soru seçimi bu bayrağı index üzerinden okur.
+    """
+
+    # -------------------------------------------------------------------------
+    # 4.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """Repository'yi başlatır."""
+        self.db = db_connection or DatabaseConnection()
+
+    # -------------------------------------------------------------------------
+    # 4.2. Seçenek Yazma İşlemleri
+    # -------------------------------------------------------------------------
+
+    def add_option(self, question_id: int, option_text: str, is_correct: bool = False,
+                   description: str = '') -> Optional[int]:
+        """4.2.1. Soruya seçenek ekler ve answerable alanlarını günceller."""
+        try:
+            with self.db as conn:
+                conn.cursor.execute("""
+                    INSERT INTO question_options (question_id, option_text, is_correct, description)
+                    VALUES (%s, %s, %s, %s)
+                """, (question_id, option_text, is_correct, description))
+                option_id = conn.cursor.lastrowid
+                self.refresh_answerable([question_id], conn=conn)
+            from app.services.response_cache import invalidate_question
+            invalidate_question(question_id)
+            return option_id
+        except Exception:
+            return None
+
+    def delete_option(self, option_id: int) -> bool:
+        """4.2.2. Seçeneği siler ve ait olduğu sorunun answerable alanlarını günceller."""
+        try:
+            with self.db as conn:
+                conn.cursor.execute(
+                    "SELECT question_id FROM question_options WHERE option_id = %s", (option_id,)
+                )
+                row = conn.cursor.fetchone()
+                if not row:
+                    return False
+                conn.cursor.execute("DELETE FROM question_options WHERE option_id = %s", (option_id,))
+                self.refresh_answerable([row['question_id']], conn=conn)
+            from app.services.response_cache import invalidate_question
+            invalidate_question(row['question_id'])
+            return True
+        except Exception:
+            return False
+
+    # -------------------------------------------------------------------------
+    # 4.3. Answerable Bakımı
+    # -------------------------------------------------------------------------
+
+    def refresh_answerable(self, question_ids: Iterable[int], conn=None) -> bool:
+        """
+        4.3.1. Verilen soruların option_count / is_answerable alanlarını
+        question_options'a göre yeniden hesaplar.
+
+        Args:
+            question_ids: Güncellenecek soru ID'leri.
+            conn: Açık bir `with db as conn` tutamacı; verilirse güncelleme
+                  çağıranın transaction'ı içinde yapılır.
+        """
+        ids: List[int] = sorted({int(qid) for qid in question_ids})
+        if not ids:
+            return True
+        if conn is None:
+            try:
+                with self.db as own_conn:
+                    return self.refresh_answerable(ids, conn=own_conn)
+            except Exception:
+                return False
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            conn.cursor.execute(f"""
+                UPDATE questions
+                SET option_count = (
+                    SELECT COUNT(*) FROM question_options qo
+                    WHERE qo.question_id = questions.question_id
+                )
+                WHERE question_id IN ({placeholders})
+            """, tuple(chunk))
+            conn.cursor.execute(f"""
+                UPDATE questions
+                SET is_answerable = (option_count >= %s)
+                WHERE question_id IN ({placeholders})
+            """, (ANSWERABLE_MIN_OPTIONS,) + tuple(chunk))
+        return True
+
+    def repair_answerable(self, batch_size: int = 1000, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        4.3.2. Tüm soruları PK aralıkları halinde tarar, option_count /
+        is_answerable alanı gerçek seçenek sayısından sapmış olanları düzeltir.
+
+        Args:
+            batch_size: Her adımda taranacak question_id aralığı genişliği.
+            dry_run: True ise sadece sapan satırlar sayılır, yazma yapılmaz.
+
+        Returns:
+            {'checked': int, 'drifted': int, 'fixed': int}
+        """
+        result = {'checked': 0, 'drifted': 0, 'fixed': 0}
+        try:
+            with self.db as conn:
+                conn.cursor.execute("SELECT MIN(question_id) AS min_id, MAX(question_id) AS max_id FROM questions")
+                bounds = conn.cursor.fetchone() or {}
+            min_id, max_id = bounds.get('min_id'), bounds.get('max_id')
+            if min_id is None or max_id is None:
+                return result
+
+            step = max(1, int(batch_size))
+            for low in range(int(min_id), int(max_id) + 1, step):
+                high = low + step - 1
+                # Her aralık kendi kısa transaction'ında işlenir
+                with self.db as conn:
+                    conn.cursor.execute("""
+                        SELECT q.question_id, q.option_count, q.is_answerable,
+                               (SELECT COUNT(*) FROM question_options qo
+                                WHERE qo.question_id = q.question_id) AS actual_count
+                        FROM questions q
+                        WHERE q.question_id BETWEEN %s AND %s
+                    """, (low, high))
+                    rows = conn.cursor.fetchall()
+                    result['checked'] += len(rows)
+                    drifted = [
+                        row['question_id'] for row in rows
+                        if int(row['option_count'] or 0) != int(row['actual_count'] or 0)
+                        or bool(row['is_answerable']) != (int(row['actual_count'] or 0) >= ANSWERABLE_MIN_OPTIONS)
+                    ]
+                    result['drifted'] += len(drifted)
+                    if drifted and not dry_run:
+                        self.refresh_answerable(drifted, conn=conn)
+                        result['fixed'] += len(drifted)
+            return result
+        except Exception as e:
+            result['error'] = str(e)
+            return result
@@ -33,8 +33,6 @@
 # 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
 # =============================================================================
 from typing import Dict, List, Optional, Tuple, Any
-import os
-import time
 import random
 from app.database.db_connection import DatabaseConnection
 
@@ -50,11 +48,6 @@ class QuizSessionRepository:
     def __init__(self):
         """Repository'yi başlatır."""
         self.db = DatabaseConnection()
-        # PERF logging toggle (env PERF_LOG = 1/true)
-        try:
-            self._perf = str(os.getenv('PERF_LOG', '0')).lower() in ('1', 'true', 't', 'yes', 'y')
-        except Exception:
-            self._perf = False
 
     # -------------------------------------------------------------------------
     # 4.2. Quiz Session İşlemleri
@@ -306,12 +299,11 @@ class QuizSessionRepository:
         - 1) Filtreli MIN/MAX question_id aralığını bulur
         - 2) Bu aralıkta rastgele id'lerden >= id ile ilk kaydı LIMIT 1 çekerek toplar
         - 3) Eksik kalırsa sıralı doldurma yapar
+        Soru bankası içeriği olduğundan sorgular read replica'ya yönlendirilebilir.
         """
         try:
-            with self.db as conn:
+            with self.db.read_only() as conn:
                 # 1) Sınırları al
-                if self._perf:
-                    t_bounds = time.perf_counter()
                 conn.cursor.execute(f"""
                     SELECT MIN(q.question_id) AS min_id, MAX(q.question_id) AS max_id
                     FROM questions q
@@ -323,8 +315,6 @@ class QuizSessionRepository:
                     return []
                 min_id = int(row.get('min_id'))
                 max_id = int(row.get('max_id'))
-                if self._perf:
-                    print(f"[PERF][Repo] _random_sample bounds: {(time.perf_counter()-t_bounds)*1000:.1f} ms (min={min_id}, max={max_id})")
                 if min_id > max_id:
                     return []
 
@@ -332,8 +322,6 @@ class QuizSessionRepository:
                 sample_budget = min(5 * max(1, count), 1000)
                 seen_ids = set()
                 out: List[Dict[str, Any]] = []
-                if self._perf:
-                    t_sample = time.perf_counter()
                 for _ in range(sample_budget):
                     if len(out) >= count:
                         break
@@ -350,14 +338,10 @@ class QuizSessionRepository:
                     if one and one.get('question_id') not in seen_ids:
                         seen_ids.add(one['question_id'])
                         out.append(one)
-                if self._perf:
-                    print(f"[PERF][Repo] _random_sample loop: {(time.perf_counter()-t_sample)*1000:.1f} ms, collected={len(out)}")
 
                 # 3) Eksik kalırsa sıralı doldur
                 if len(out) < count:
                     need = count - len(out)
-                    if self._perf:
-                        t_fill = time.perf_counter()
                     conn.cursor.execute(f"""
                         SELECT q.*
                         FROM questions q
@@ -374,8 +358,6 @@ class QuizSessionRepository:
                             out.append(rrow)
                             if len(out) >= count:
                                 break
-                    if self._perf:
-                        print(f"[PERF][Repo] _random_sample fill: {(time.perf_counter()-t_fill)*1000:.1f} ms, after_fill={len(out)}")
                 try:
                     random.shuffle(out)
                 except Exception:
@@ -388,17 +370,14 @@ class QuizSessionRepository:
         """4.4.1. Belirli kriterlere göre ID tabanlı rastgele sorular getirir."""
         try:
             # Filtreleri hazırla
+            # (is_answerable = en az 2 seçenek; seeder/QuestionRepository tarafından tutulur
+            #  ve idx_q_topic_active_ans_diff_qid sayesinde saf index range scan olur)
             diff_sql = "" if difficulty == 'random' else " AND q.difficulty_level = %s"
             where_sql = (
-                "q.topic_id = %s AND q.is_active = 1" + diff_sql +
-                " AND (SELECT COUNT(1) FROM question_options qo WHERE qo.question_id = q.question_id) >= 2"
+                "q.topic_id = %s AND q.is_active = 1 AND q.is_answerable = 1" + diff_sql
             )
             params = (topic_id,) if difficulty == 'random' else (topic_id, difficulty)
-            if self._perf:
-                t0 = time.perf_counter()
             questions = self._random_sample_questions("", where_sql, params, count)
-            if self._perf:
-                print(f"[PERF][Repo] get_random_questions sample: {(time.perf_counter()-t0)*1000:.1f} ms, n={len(questions)}")
             return questions
         except Exception:
             return []
@@ -409,15 +388,10 @@ class QuizSessionRepository:
             joins_sql = "JOIN topics t ON q.topic_id = t.topic_id JOIN units u ON t.unit_id = u.unit_id"
             diff_sql = "" if difficulty == 'random' else " AND q.difficulty_level = %s"
             where_sql = (
-                "u.subject_id = %s AND q.is_active = 1" + diff_sql +
-                " AND (SELECT COUNT(1) FROM question_options qo WHERE qo.question_id = q.question_id) >= 2"
+                "u.subject_id = %s AND q.is_active = 1 AND q.is_answerable = 1" + diff_sql
             )
             params = (subject_id,) if difficulty == 'random' else (subject_id, difficulty)
-            if self._perf:
-                t0 = time.perf_counter()
             questions = self._random_sample_questions(joins_sql, where_sql, params, count)
-            if self._perf:
-                print(f"[PERF][Repo] get_random_questions_by_subject sample: {(time.perf_counter()-t0)*1000:.1f} ms, n={len(questions)}")
             return questions
         except Exception:
             return []
@@ -428,15 +402,10 @@ class QuizSessionRepository:
             joins_sql = "JOIN topics t ON q.topic_id = t.topic_id"
             diff_sql = "" if difficulty == 'random' else " AND q.difficulty_level = %s"
             where_sql = (
-                "t.unit_id = %s AND q.is_active = 1" + diff_sql +
-                " AND (SELECT COUNT(1) FROM question_options qo WHERE qo.question_id = q.question_id) >= 2"
+                "t.unit_id = %s AND q.is_active = 1 AND q.is_answerable = 1" + diff_sql
             )
             params = (unit_id,) if difficulty == 'random' else (unit_id, difficulty)
-            if self._perf:
-                t0 = time.perf_counter()
             questions = self._random_sample_questions(joins_sql, where_sql, params, count)
-            if self._perf:
-                print(f"[PERF][Repo] get_random_questions_by_unit sample: {(time.perf_counter()-t0)*1000:.1f} ms, n={len(questions)}")
             return questions
         except Exception:
             return []
@@ -451,15 +420,10 @@ class QuizSessionRepository:
             )
             diff_sql = "" if difficulty == 'random' else " AND q.difficulty_level = %s"
             where_sql = (
-                "s.grade_id = %s AND q.is_active = 1" + diff_sql +
-                " AND (SELECT COUNT(1) FROM question_options qo WHERE qo.question_id = q.question_id) >= 2"
+                "s.grade_id = %s AND q.is_active = 1 AND q.is_answerable = 1" + diff_sql
             )
             params = (grade_id,) if difficulty == 'random' else (grade_id, difficulty)
-            if self._perf:
-                t0 = time.perf_counter()
             questions = self._random_sample_questions(joins_sql, where_sql, params, count)
-            if self._perf:
-                print(f"[PERF][Repo] get_random_questions_by_grade sample: {(time.perf_counter()-t0)*1000:.1f} ms, n={len(questions)}")
             return questions
         except Exception:
             return []
@@ -469,15 +433,10 @@ class QuizSessionRepository:
         try:
             diff_sql = "" if difficulty == 'random' else " AND q.difficulty_level = %s"
             where_sql = (
-                "q.is_active = 1" + diff_sql +
-                " AND (SELECT COUNT(1) FROM question_options qo WHERE qo.question_id = q.question_id) >= 2"
+                "q.is_active = 1 AND q.is_answerable = 1" + diff_sql
             )
             params = tuple() if difficulty == 'random' else (difficulty,)
-            if self._perf:
-                t0 = time.perf_counter()
             questions = self._random_sample_questions("", where_sql, params, count)
-            if self._perf:
-                print(f"[PERF][Repo] get_random_questions_global sample: {(time.perf_counter()-t0)*1000:.1f} ms, n={len(questions)}")
             return questions
         except Exception:
             return []
@@ -489,7 +448,7 @@ class QuizSessionRepository:
     def get_correct_answer(self, question_id: int) -> Optional[Dict[str, Any]]:
         """4.5.1. Sorunun doğru cevabını getirir."""
         try:
-            with self.db as conn:
+            with self.db.read_only() as conn:
                 conn.cursor.execute("""
                     SELECT option_id AS id, option_text AS name
                     FROM question_options 
@@ -506,9 +465,7 @@ class QuizSessionRepository:
     def get_question_options(self, question_id: int) -> List[Dict[str, Any]]:
         """4.5.2. Soru seçeneklerini getirir."""
         try:
-            with self.db as conn:
-                if self._perf:
-                    t0 = time.perf_counter()
+            with self.db.read_only() as conn:
                 conn.cursor.execute("""
                     SELECT 
                         option_id AS id,
@@ -523,8 +480,6 @@ class QuizSessionRepository:
                 """, (question_id,))
                 
                 options = conn.cursor.fetchall()
-                if self._perf:
-                    print(f"[PERF][Repo] get_question_options query: {(time.perf_counter()-t0)*1000:.1f} ms")
                 # Python tarafında rastgele sırala (SQL'de RAND() yerine)
                 try:
                     random.shuffle(options)
@@ -538,7 +493,7 @@ class QuizSessionRepository:
     def get_question_details(self, question_id: int) -> Optional[Dict[str, Any]]:
         """4.5.3. Soru detaylarını getirir."""
         try:
-            with self.db as conn:
+            with self.db.read_only() as conn:
                 conn.cursor.execute("""
                     SELECT 
                         q.question_id,
@@ -568,7 +523,7 @@ class QuizSessionRepository:
     def get_answer_option_text(self, answer_option_id: int) -> Optional[str]:
         """4.5.4. Cevap seçeneği metnini getirir."""
         try:
-            with self.db as conn:
+            with self.db.read_only() as conn:
                 conn.cursor.execute("""
                     SELECT option_text FROM question_options 
                     WHERE option_id = %s
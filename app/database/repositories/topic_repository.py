@@ -3,7 +3,7 @@ Topic Repository - Topic Management
 Handles all database operations for topics
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from app.database.repositories.base_repository import BaseRepository
 
 class TopicRepository(BaseRepository):
@@ -158,3 +158,34 @@ class TopicRepository(BaseRepository):
         except Exception as e:
             print(f"Error counting active topics: {e}")
             return 0
+    
+    def iter_curriculum_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Müfredatı sınıf > ders > ünite > konu sırasıyla düz satırlar halinde üretir.
+        
+        Her sınıf için tek bir sıralı JOIN sorgusu çalışır; bağlantı yalnızca
+        sorgu süresince tutulur, satırlar bağlantı iade edildikten sonra üretilir.
+        Böylece bellekte en fazla bir sınıfın satırları bulunur ve tüketici
+        (ör. streaming response) yavaş olsa da bağlantı pool'u meşgul edilmez.
+        Hatalar yutulmaz; yarım kalan export çağırana bildirilir.
+        """
+        with self.db_connection.read_only() as conn:
+            conn.cursor.execute("SELECT grade_id, grade_name FROM grades ORDER BY grade_name ASC, grade_id ASC")
+            grades = conn.cursor.fetchall()
+        
+        for grade in grades:
+            with self.db_connection.read_only() as conn:
+                conn.cursor.execute("""
+                    SELECT s.subject_name, s.description AS subject_description,
+                           u.unit_name, u.description AS unit_description,
+                           t.topic_name, t.description AS topic_description
+                    FROM subjects s
+                    JOIN units u ON u.subject_id = s.subject_id
+                    JOIN topics t ON t.unit_id = u.unit_id
+                    WHERE s.grade_id = %s
+                    ORDER BY s.subject_name ASC, s.subject_id ASC, u.unit_id ASC, t.topic_id ASC
+                """, (grade['grade_id'],))
+                rows = conn.cursor.fetchall()
+            for row in rows:
+                row['grade_name'] = grade['grade_name']
+                yield row
@@ -3,9 +3,12 @@ User Repository - User Management
 Handles all database operations for users
 """
 
+import logging
 from typing import List, Dict, Any, Optional
 from app.database.repositories.base_repository import BaseRepository
 
+logger = logging.getLogger(__name__)
+
 class UserRepository(BaseRepository):
     """Kullanıcıları yöneten repository"""
     
@@ -25,7 +28,7 @@ class UserRepository(BaseRepository):
             """
             return self.fetch_all(query)
         except Exception as e:
-            print(f"Error getting all users: {e}")
+            logger.error("Error getting all users: %s", e)
             return []
     
     def get_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -38,7 +41,7 @@ class UserRepository(BaseRepository):
             """
             return self.fetch_one(query, (user_id,))
         except Exception as e:
-            print(f"Error getting user by ID: {e}")
+            logger.error("Error getting user by ID: %s", e)
             return None
     
     def get_by_username(self, username: str) -> Optional[Dict[str, Any]]:
@@ -51,40 +54,20 @@ class UserRepository(BaseRepository):
             """
             return self.fetch_one(query, (username,))
         except Exception as e:
-            print(f"Error getting user by username: {e}")
+            logger.error("Error getting user by username: %s", e)
             return None
     
     def get_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Email'e göre kullanıcı getirir"""
-        print('=== LOGIN DEBUG (USER REPOSITORY) ===')
-        print(f'Looking up user by email: {email}')
-        
         try:
             query = """
                 SELECT user_id, username, email, password_hash, first_name, last_name, is_admin, is_active, 
                        created_at, updated_at
                 FROM users WHERE email = %s
             """
-            print(f'Executing query: {query}')
-            print(f'Query parameters: {(email,)}')
-            
-            result = self.fetch_one(query, (email,))
-            
-            if result:
-                # Don't print password_hash for security, but show that it exists
-                safe_result = dict(result)
-                if 'password_hash' in safe_result:
-                    safe_result['password_hash'] = f'[HASH_EXISTS: {bool(safe_result["password_hash"])}]'
-                print(f'User found: {safe_result}')
-            else:
-                print('User not found')
-            
-            return result
-            
+            return self.fetch_one(query, (email,))
         except Exception as e:
-            print(f"ERROR: Exception in get_by_email: {e}")
-            import traceback
-            print(f'Traceback: {traceback.format_exc()}')
+            logger.exception("Error getting user by email: %s", e)
             return None
     
     def create_user(self, username: str, email: str, hashed_password: str, **kwargs) -> Optional[int]:
@@ -109,14 +92,14 @@ class UserRepository(BaseRepository):
             return self.execute_query(query, params)
             
         except Exception as e:
-            print(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             return None
     
     def update(self, user_id: int, data: Dict[str, Any]) -> bool:
         """Kullanıcı bilgilerini günceller"""
         try:
             # Sadece güncellenebilir alanları al
-            updateable_fields = ['first_name', 'last_name', 'is_active']
+            updateable_fields = ['first_name', 'last_name', 'is_active', 'is_admin']
             update_data = {}
             
             for field in updateable_fields:
@@ -131,14 +114,24 @@ class UserRepository(BaseRepository):
             query = f"""
                 UPDATE users 
                 SET {set_clause}, updated_at = NOW()
-                WHERE id = %s
+                WHERE user_id = %s
             """
             
             params = list(update_data.values()) + [user_id]
             return self.execute_query(query, tuple(params)) > 0
             
         except Exception as e:
-            print(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
+            return False
+    
+    def update_password_hash(self, user_id: int, password_hash: str) -> bool:
+        """Kullanıcının şifre hash'ini günceller (girişte yeniden hash'leme)"""
+        try:
+            query = "UPDATE users SET password_hash = %s WHERE user_id = %s"
+            return self.execute_query(query, (password_hash, user_id)) > 0
+            
+        except Exception as e:
+            logger.error("Error updating password hash: %s", e)
             return False
     
     def count_all(self) -> int:
@@ -148,7 +141,7 @@ class UserRepository(BaseRepository):
             result = self.fetch_one(query)
             return result['count'] if result else 0
         except Exception as e:
-            print(f"Error counting users: {e}")
+            logger.error("Error counting users: %s", e)
             return 0
     
     def count_active(self) -> int:
@@ -158,7 +151,7 @@ class UserRepository(BaseRepository):
             result = self.fetch_one(query)
             return result['count'] if result else 0
         except Exception as e:
-            print(f"Error counting active users: {e}")
+            logger.error("Error counting active users: %s", e)
             return 0
     
     def count_recent_logins(self, days: int = 7) -> int:
@@ -172,7 +165,7 @@ class UserRepository(BaseRepository):
             result = self.fetch_one(query, (days,))
             return result['count'] if result else 0
         except Exception as e:
-            print(f"Error counting recent logins: {e}")
+            logger.error("Error counting recent logins: %s", e)
             return 0
     
     def search(self, search_term: str) -> List[Dict[str, Any]]:
@@ -188,7 +181,7 @@ class UserRepository(BaseRepository):
             search_pattern = f"%{search_term}%"
             return self.fetch_all(query, (search_pattern, search_pattern, search_pattern, search_pattern))
         except Exception as e:
-            print(f"Error searching users: {e}")
+            logger.error("Error searching users: %s", e)
             return []
     
     def get_active_users(self) -> List[Dict[str, Any]]:
@@ -203,7 +196,7 @@ class UserRepository(BaseRepository):
             """
             return self.fetch_all(query)
         except Exception as e:
-            print(f"Error getting active users: {e}")
+            logger.error("Error getting active users: %s", e)
             return []
     
     def get_admin_users(self) -> List[Dict[str, Any]]:
@@ -218,7 +211,7 @@ class UserRepository(BaseRepository):
             """
             return self.fetch_all(query)
         except Exception as e:
-            print(f"Error getting admin users: {e}")
+            logger.error("Error getting admin users: %s", e)
             return []
     
     def bulk_update_status(self, user_ids: List[int], is_active: bool) -> bool:
@@ -238,5 +231,5 @@ class UserRepository(BaseRepository):
             return self.execute_query(query, tuple(params)) > 0
             
         except Exception as e:
-            print(f"Error bulk updating user status: {e}")
+            logger.error("Error bulk updating user status: %s", e)
             return False
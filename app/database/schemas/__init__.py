@@ -31,6 +31,18 @@ from .quiz_sessions_schema import QUIZ_SESSIONS_TABLE_SQL
 # Quiz Session Questions (Quiz Oturumu Soruları) şeması
 from .quiz_session_questions_schema import QUIZ_SESSION_QUESTIONS_TABLE_SQL
 
+# Replica Heartbeat (Replikasyon gecikme ölçümü) şeması
+from .replica_heartbeat_schema import REPLICA_HEARTBEAT_TABLE_SQL
+
+# Question Bank Files (Soru bankası senkronizasyon kayıtları) şeması
+from .question_bank_files_schema import QUESTION_BANK_FILES_TABLE_SQL
+
+# Background Jobs (Arka plan iş kayıtları) şeması
+from .background_jobs_schema import BACKGROUND_JOBS_TABLE_SQL
+
+# User Activities (Kullanıcı aktivite kayıtları) şeması
+from .user_activities_schema import USER_ACTIVITIES_TABLE_SQL
+
 # Tüm şemaları export et
 __all__ = [
     'GRADES_TABLE_SQL',
@@ -41,5 +53,9 @@ __all__ = [
     'QUESTION_OPTIONS_TABLE_SQL',
     'USERS_TABLE_SQL',
     'QUIZ_SESSIONS_TABLE_SQL',
-    'QUIZ_SESSION_QUESTIONS_TABLE_SQL'
+    'QUIZ_SESSION_QUESTIONS_TABLE_SQL',
+    'REPLICA_HEARTBEAT_TABLE_SQL',
+    'QUESTION_BANK_FILES_TABLE_SQL',
+    'BACKGROUND_JOBS_TABLE_SQL',
+    'USER_ACTIVITIES_TABLE_SQL'
 ]
\ No newline at end of file
@@ -0,0 +1,33 @@
+# =============================================================================
+# BACKGROUND JOBS TABLE SCHEMA
+# =============================================================================
+# Uzun süren admin işlemlerinin (import/export, temizlik, index oluşturma)
+# kalıcı iş kayıtları. JobRunner işleri bu tabloya yazar; ilerleme, iptal
+# isteği ve sonuç (JSON) burada tutulur, /api/admin/jobs/<id> buradan okur.
+# Not: SQLite stand-in ile de çalışabilmesi için tanım taşınabilir tutulmuştur
+# (ENGINE/CHARSET ifadesi yok, zamanlar epoch saniye); JobRunner tabloyu ilk
+# kullanımda kendisi de oluşturur.
+# =============================================================================
+
+BACKGROUND_JOBS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS background_jobs (
+    job_id CHAR(32) PRIMARY KEY,
+    job_type VARCHAR(64) NOT NULL,
+    status VARCHAR(16) NOT NULL,
+    params TEXT,
+    result TEXT,
+    error TEXT,
+    message VARCHAR(255),
+    progress_current BIGINT NOT NULL DEFAULT 0,
+    progress_total BIGINT NULL,
+    cancel_requested SMALLINT NOT NULL DEFAULT 0,
+    created_by INT NULL,
+    owner VARCHAR(128) NULL,
+    created_at DOUBLE NOT NULL,
+    started_at DOUBLE NULL,
+    finished_at DOUBLE NULL,
+    updated_at DOUBLE NOT NULL
+)
+"""
+
+BACKGROUND_JOBS_INDEX_SQL = "CREATE INDEX idx_background_jobs_status ON background_jobs (status, created_at)"
@@ -5,6 +5,10 @@
 # Tüm user-AI etkileşimleri kaydedilir.
 # =============================================================================
 
+from datetime import datetime
+
+from .partitioning import add_months, month_start, partition_by_clause
+
 def get_chat_messages_schema():
     """Chat messages tablosu için SQL şeması döndürür."""
     return """
@@ -41,3 +45,48 @@ def get_chat_messages_schema():
         INDEX idx_created_at (created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """
+
+
+def get_chat_messages_partitioned_schema(months_ahead: int = 3, now: datetime = None):
+    """
+    Aylık partition'lı chat messages şeması (bu ay + months_ahead ay + pmax).
+
+    Partition'lı tablolarda FOREIGN KEY desteklenmediğinden chat_sessions
+    CASCADE'i yoktur; session silinirken mesajlar RetentionManager tarafından
+    açıkça silinir. PRIMARY KEY partition kolonunu (created_at) içerir.
+    """
+    current = month_start(now or datetime.now())
+    return f"""
+    CREATE TABLE IF NOT EXISTS chat_messages (
+        id INT AUTO_INCREMENT,
+        chat_session_id VARCHAR(255) NOT NULL COMMENT 'Chat session reference',
+        
+        -- Mesaj bilgileri
+        message_type ENUM('user', 'ai', 'system') NOT NULL,
+        content TEXT NOT NULL COMMENT 'Message content',
+        
+        -- AI specific bilgileri
+        action_type VARCHAR(50) COMMENT 'Type of action: general, explain, hint',
+        ai_model VARCHAR(50) COMMENT 'AI model used for response',
+        prompt_used TEXT COMMENT 'Full prompt sent to AI',
+        
+        -- Performance metrics
+        response_time_ms INT COMMENT 'AI response time in milliseconds',
+        token_count INT COMMENT 'Token count for AI requests',
+        
+        -- Metadata
+        metadata JSON COMMENT 'Additional message metadata',
+        
+        -- Zaman damgaları (partition kolonu)
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        
+        PRIMARY KEY (id, created_at),
+        
+        -- Indexes for performance
+        INDEX idx_chat_session (chat_session_id, created_at),
+        INDEX idx_message_type (message_type),
+        INDEX idx_action_type (action_type),
+        INDEX idx_created_at (created_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    {partition_by_clause('created_at', current, add_months(current, months_ahead))};
+    """
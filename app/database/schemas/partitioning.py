@@ -0,0 +1,80 @@
+# =============================================================================
+# MONTHLY RANGE PARTITIONING
+# =============================================================================
+# Sürekli büyüyen, yalnızca ekleme yapılan tablolar (chat_messages,
+# user_activities) created_at üzerinden aylık RANGE partition'lara bölünür.
+# Her ay bir partition'dır (pYYYYMM, o ayın satırları); en sonda MAXVALUE
+# sınırlı `pmax` yedek partition'ı bulunur. Yeni aylar pmax'tan
+# REORGANIZE ile ayrılır, süresi dolan aylar DROP PARTITION ile silinir.
+#
+# MySQL kısıtları:
+#   - Partition'lı tablolarda FOREIGN KEY tanımlanamaz.
+#   - Tüm PRIMARY/UNIQUE anahtarlar partition kolonunu içermelidir
+#     (PRIMARY KEY (id, created_at)).
+#   - TIMESTAMP kolonu için partition ifadesi UNIX_TIMESTAMP(created_at)
+#     olmalıdır; sorgularda `created_at` üzerinde sabitlerle yapılan
+#     aralık karşılaştırmaları partition budamasına (pruning) izin verir,
+#     DATE(created_at) gibi ifadeler vermez.
+# =============================================================================
+
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Tablo -> partition kolonu ve saklama süresinin okunacağı config ayarı
+PARTITIONED_TABLES: Dict[str, Dict[str, str]] = {
+    'chat_messages': {'column': 'created_at', 'retention_setting': 'RETENTION_CHAT_MESSAGE_DAYS'},
+    'user_activities': {'column': 'created_at', 'retention_setting': 'RETENTION_ACTIVITY_DAYS'},
+}
+
+MAXVALUE_PARTITION = 'pmax'
+PARTITION_NAME_RE = re.compile(r'^p(\d{4})(\d{2})$')
+
+
+def month_start(value: datetime) -> datetime:
+    """Verilen zamanın ayının ilk anını döner."""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Ay başına `months` ay ekler (negatif olabilir)."""
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Ayın partition adı: p202610"""
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """pYYYYMM adından ay başını döner; aylık partition değilse None."""
+    match = PARTITION_NAME_RE.match(name or '')
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def partition_definition(month: datetime) -> str:
+    """Tek bir aylık partition tanımı (üst sınır: bir sonraki ayın başı)."""
+    upper = add_months(month, 1).strftime('%Y-%m-%d %H:%M:%S')
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN (UNIX_TIMESTAMP('{upper}'))"
+
+
+def monthly_partitions(first_month: datetime, last_month: datetime,
+                       include_maxvalue: bool = True) -> List[str]:
+    """first_month..last_month (dahil) aylık partition tanımları, ardından pmax."""
+    definitions = []
+    month = month_start(first_month)
+    while month <= last_month:
+        definitions.append(partition_definition(month))
+        month = add_months(month, 1)
+    if include_maxvalue:
+        definitions.append(f"PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return definitions
+
+
+def partition_by_clause(column: str, first_month: datetime, last_month: datetime) -> str:
+    """`PARTITION BY RANGE (...)` ifadesinin tamamı."""
+    body = ',\n        '.join(monthly_partitions(first_month, last_month))
+    return f"PARTITION BY RANGE (UNIX_TIMESTAMP({column})) (\n        {body}\n    )"
@@ -0,0 +1,20 @@
+# =============================================================================
+# QUESTION BANK FILES TABLE SCHEMA
+# =============================================================================
+# Artımlı (incremental) soru bankası senkronizasyonu için kaynak dosya kayıtları.
+# Her JSON dosyası için son senkronize edilen içerik hash'i, boyut ve mtime
+# tutulur; mtime+boyut değişmemişse dosya okunmaz, değişmişse önce hash
+# karşılaştırılır, yalnızca içerik farklıysa soru bazında diff uygulanır.
+# =============================================================================
+
+QUESTION_BANK_FILES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS question_bank_files (
+    file_path VARCHAR(255) PRIMARY KEY,
+    topic_id INT NULL,
+    content_hash CHAR(64) NOT NULL,
+    file_size BIGINT NOT NULL DEFAULT 0,
+    mtime_ns BIGINT NOT NULL DEFAULT 0,
+    question_count INT NOT NULL DEFAULT 0,
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
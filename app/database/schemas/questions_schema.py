@@ -2,6 +2,14 @@
 # QUESTIONS TABLE SCHEMA
 # =============================================================================
 # Sorular tablosu için Python şeması
+#
+# option_count / is_answerable: question_options'tan türetilen, yazma anında
+# tutulan alanlar (is_answerable = option_count >= 2). Rastgele soru seçimi
+# korelasyonlu COUNT alt sorgusu yerine bu bayrağı kullanır.
+#
+# source_file / source_key / content_hash: sorunun geldiği soru bankası dosyası
+# (bank dizinine göre göreli yol), dosyadaki soru kimliği ve içerik hash'i.
+# Artımlı senkronizasyon değişen soruları bu alanlarla bulur.
 # =============================================================================
 
 QUESTIONS_TABLE_SQL = """
@@ -14,6 +22,11 @@ CREATE TABLE IF NOT EXISTS questions (
     points INT DEFAULT 1,
     description TEXT,
     is_active BOOLEAN DEFAULT true,
+    option_count SMALLINT NOT NULL DEFAULT 0,
+    is_answerable BOOLEAN NOT NULL DEFAULT false,
+    source_file VARCHAR(255) NULL,
+    source_key VARCHAR(191) NULL,
+    content_hash CHAR(40) NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (topic_id) REFERENCES topics(topic_id) ON DELETE CASCADE,
@@ -21,7 +34,8 @@ CREATE TABLE IF NOT EXISTS questions (
     INDEX idx_questions_difficulty (difficulty_level),
     INDEX idx_questions_type (question_type),
     INDEX idx_questions_active (is_active),
-    INDEX idx_q_topic_active_diff_qid (topic_id, is_active, difficulty_level, question_id),
-    INDEX idx_q_active_diff_qid (is_active, difficulty_level, question_id)
+    INDEX idx_q_topic_active_ans_diff_qid (topic_id, is_active, is_answerable, difficulty_level, question_id),
+    INDEX idx_q_active_ans_diff_qid (is_active, is_answerable, difficulty_level, question_id),
+    UNIQUE KEY uq_questions_source (source_file, source_key)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
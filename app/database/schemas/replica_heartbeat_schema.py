@@ -0,0 +1,18 @@
+# =============================================================================
+# REPLICA HEARTBEAT TABLE SCHEMA
+# =============================================================================
+# Read replica gecikme (lag) ölçümü için heartbeat tablosu.
+# Primary üzerinde periyodik olarak `heartbeat_at` (epoch saniye) güncellenir;
+# replica'da okunan değer ile şimdiki zaman arasındaki fark replikasyon
+# gecikmesini verir.
+# Not: SQLite stand-in ile de çalışabilmesi için tanım taşınabilir tutulmuştur
+# (ENGINE/CHARSET ifadesi yok); DatabaseConnectionManager tabloyu ilk
+# heartbeat yazımında kendisi de oluşturur.
+# =============================================================================
+
+REPLICA_HEARTBEAT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS replica_heartbeat (
+    id INT PRIMARY KEY,
+    heartbeat_at DOUBLE NOT NULL
+)
+"""
@@ -0,0 +1,47 @@
+# =============================================================================
+# USER ACTIVITIES TABLE SCHEMA
+# =============================================================================
+# Kullanıcı ve admin işlemlerinin denetim (audit) kayıtları. Sadece ekleme
+# yapılan, zamanla büyüyen bir tablodur; eski kayıtlar RetentionManager ile
+# silinir. DB_PARTITIONING_ENABLED açıksa aylık partition'lı tanım kullanılır.
+# =============================================================================
+
+from datetime import datetime
+
+from .partitioning import add_months, month_start, partition_by_clause
+
+USER_ACTIVITIES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS user_activities (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NULL,
+    action VARCHAR(100) NOT NULL,
+    details TEXT,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_user_activities_user (user_id, created_at),
+    INDEX idx_user_activities_action (action, created_at),
+    INDEX idx_user_activities_created (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+
+def get_user_activities_partitioned_schema(months_ahead: int = 3, now: datetime = None) -> str:
+    """Aylık partition'lı user_activities şeması (bu ay + months_ahead ay + pmax)."""
+    current = month_start(now or datetime.now())
+    return f"""
+CREATE TABLE IF NOT EXISTS user_activities (
+    id INT AUTO_INCREMENT,
+    user_id INT NULL,
+    action VARCHAR(100) NOT NULL,
+    details TEXT,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(255),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at),
+    INDEX idx_user_activities_user (user_id, created_at),
+    INDEX idx_user_activities_action (action, created_at),
+    INDEX idx_user_activities_created (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+{partition_by_clause('created_at', current, add_months(current, months_ahead))};
+"""
@@ -1,115 +1,708 @@
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, Callable, Iterable, Iterator, List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import hashlib
+import itertools
 import json
+import os
+import time
 from app.database.db_connection import DatabaseConnection
+from app.utils.json_stream import iter_array_items, DEFAULT_CHUNK_SIZE
+from app.database.repositories.question_repository import ANSWERABLE_MIN_OPTIONS
+
+# Tek transaction'da yazılan soru sayısı
+DEFAULT_BATCH_SIZE = 1000
+# Çok satırlı INSERT başına en fazla bind parametresi
+MAX_PARAMS_PER_STATEMENT = 4000
+# IN (...) listeleri için parça boyu
+ID_CHUNK_SIZE = 500
+# Bu boyuttan büyük dosyalar belleğe alınmadan soru soru okunur
+STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+# Paralel ayrıştırmada worker başına aynı anda bekleyen en fazla dosya
+PARSE_WINDOW_PER_WORKER = 2
+# source_file değerleri bu köke göre göreli tutulur (çalışma dizininden bağımsız)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+QUESTION_COLUMNS = (
+    'question_id', 'question_text', 'topic_id', 'difficulty_level', 'question_type',
+    'points', 'description', 'option_count', 'is_answerable',
+    'source_file', 'source_key', 'content_hash',
+)
+OPTION_COLUMNS = ('question_id', 'option_text', 'is_correct', 'description')
+
+
+def grade_name(grade: Any) -> str:
+    """JSON'daki sınıf numarasını grades.grade_name biçimine çevirir."""
+    return f"{grade}. Sınıf"
+
+
+def source_name(path: Path) -> str:
+    """Dosyanın questions.source_file / question_bank_files.file_path değeri."""
+    resolved = Path(path).resolve()
+    try:
+        return resolved.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+def question_hash(topic_key: Tuple[str, str, str, str], question: tuple) -> str:
+    """Sorunun (konu dahil) içerik hash'i; değişiklik tespiti için."""
+    payload = json.dumps([list(topic_key), question], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def iter_bank_files(base: Path) -> Iterator[Path]:
+    """Dizindeki *.json dosyalarını (dizin sırasıyla, sıralı) listeyi önceden toplamadan üretir."""
+    for root, dirs, files in os.walk(base):
+        dirs.sort()
+        for file_name in sorted(files):
+            if file_name.endswith('.json'):
+                yield Path(root) / file_name
+
+
+def file_sha256(file_path: str) -> str:
+    """Dosyanın SHA-256'sını sabit bellekle hesaplar."""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _topic_key(metadata: Dict[str, Any]) -> Optional[Tuple[str, str, str, str]]:
+    grade, subject = metadata.get('grade'), metadata.get('subject')
+    unit, topic = metadata.get('unit'), metadata.get('topic')
+    if not all([grade, subject, unit, topic]):
+        return None
+    return (grade_name(grade), subject, unit, topic)
+
+
+def _question_entry(q: Dict[str, Any], index: int, topic_key: Tuple[str, str, str, str],
+                    seen_keys: set) -> Optional[Tuple[tuple, str, str]]:
+    """JSON sorusunu (question, source_key, content_hash) üçlüsüne çevirir; eksik alanlıysa None."""
+    try:
+        options = [
+            (option['text'], bool(option['isCorrect']), option.get('explanation', ''))
+            for option in q['options']
+        ]
+        question = (
+            q['questionText'], q['difficulty'], q['questionType'], 1,
+            q.get('explanation', ''), options,
+        )
+    except (KeyError, TypeError):
+        return None
+    source_key = str(q.get('id') or f"#{index}")
+    if source_key in seen_keys:
+        source_key = f"{source_key}#{index}"
+    seen_keys.add(source_key)
+    return question, source_key, question_hash(topic_key, question)
+
+
+class _HashingReader:
+    """Okunan baytları aynı anda hash'leyen dosya sarmalayıcı."""
+
+    def __init__(self, handle, hasher):
+        self.handle = handle
+        self.hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.handle.read(size)
+        self.hasher.update(data)
+        return data
+
+
+def parse_question_file(file_path: str) -> Dict[str, Any]:
+    """
+    Soru dosyasını okuyup yazmaya hazır satırlara çevirir.
+
+    Modül seviyesinde tutulur; ProcessPoolExecutor ile ayrı process'lerde
+    çalıştırılabilir (DB erişimi yoktur).
+
+    Returns:
+        {'file', 'name', 'key': (grade_name, subject, unit, topic) | None,
+         'questions': [(text, difficulty, type, points, description,
+                        [(option_text, is_correct, description), ...])],
+         'keys': [dosyadaki soru kimliği], 'hashes': [içerik hash'i],
+         'file_hash', 'total', 'error'}
+    """
+    result: Dict[str, Any] = {
+        'file': str(file_path), 'name': Path(file_path).name,
+        'key': None, 'questions': [], 'keys': [], 'hashes': [],
+        'file_hash': None, 'total': 0, 'error': None,
+    }
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        result['file_hash'] = hashlib.sha256(raw).hexdigest()
+        data = json.loads(raw.decode('utf-8'))
+    except Exception as e:
+        result['error'] = f"unreadable: {e}"
+        return result
+
+    metadata = data.get('metadata', {}) if isinstance(data, dict) else {}
+    questions = data.get('questions', []) if isinstance(data, dict) else []
+    result['total'] = len(questions)
+    result['key'] = _topic_key(metadata or {})
+    if not result['key']:
+        result['error'] = 'metadata must contain grade, subject, unit and topic'
+        return result
+
+    seen_keys: set = set()
+    for index, q in enumerate(questions):
+        entry = _question_entry(q, index, result['key'], seen_keys)
+        if entry is None:
+            continue
+        question, source_key, content_hash = entry
+        result['questions'].append(question)
+        result['keys'].append(source_key)
+        result['hashes'].append(content_hash)
+    return result
+
+
+def stream_question_file(file_path: str) -> Dict[str, Any]:
+    """
+    parse_question_file'ın büyük dosyalar için akış (streaming) karşılığı.
+
+    `questions` dizisi eleman eleman okunur; bellek kullanımı dosya boyutuyla
+    değil tek soru + okuma tamponuyla sınırlıdır. Sorular listeler yerine
+    `entries` üretecinden (question, source_key, content_hash) olarak alınır;
+    `total` ve `file_hash` üreteç tükendiğinde doldurulur. Üreteç
+    tüketilmeyecekse `close()` çağrılmalıdır.
+
+    metadata, questions dizisinden sonra geliyorsa dosya parse_question_file
+    ile bütün olarak okunur.
+    """
+    result: Dict[str, Any] = {
+        'file': str(file_path), 'name': Path(file_path).name, 'key': None,
+        'entries': iter(()), 'streaming': True, 'close': lambda: None,
+        'file_hash': None, 'total': 0, 'error': None,
+    }
+    try:
+        handle = open(file_path, 'rb')
+    except Exception as e:
+        result['error'] = f"unreadable: {e}"
+        return result
+    hasher = hashlib.sha256()
+    reader = _HashingReader(handle, hasher)
+    header: Dict[str, Any] = {}
+    items = iter_array_items(reader, 'questions', header)
+    end = object()
+    try:
+        first = next(items, end)
+    except Exception as e:
+        handle.close()
+        result['error'] = f"unreadable: {e}"
+        return result
+    if 'metadata' not in header and first is not end:
+        handle.close()
+        return parse_question_file(file_path)
+
+    result['close'] = handle.close
+    result['key'] = _topic_key(header.get('metadata') or {})
+    if not result['key']:
+        handle.close()
+        result['error'] = 'metadata must contain grade, subject, unit and topic'
+        return result
+
+    def entries() -> Iterator[Tuple[tuple, str, str]]:
+        seen_keys: set = set()
+        try:
+            head = [] if first is end else [first]
+            for index, q in enumerate(itertools.chain(head, items)):
+                result['total'] += 1
+                entry = _question_entry(q, index, result['key'], seen_keys)
+                if entry is not None:
+                    yield entry
+            # Kapanıştan sonraki baytlar da hash'e girsin
+            while reader.read(DEFAULT_CHUNK_SIZE):
+                pass
+            result['file_hash'] = hasher.hexdigest()
+        finally:
+            handle.close()
+
+    result['entries'] = entries()
+    return result
 
 
 class QuestionsSeeder:
-    """Seed questions and options from JSON files (idempotent behavior at file level)."""
+    """
+    Seed questions and options from JSON files (idempotent behavior at file level).
+
+    Dosyalar (isteğe bağlı olarak bir process pool'da) ayrıştırılır, topic_id
+    tek sorguyla yüklenen haritadan çözülür ve sorular/seçenekler çok satırlı
+    INSERT'lerle, batch başına tek transaction'da yazılır.
+    """
 
-    def __init__(self, data_dir: str = "app/data/quiz_banks", db_connection: Optional[DatabaseConnection] = None) -> None:
+    def __init__(self, data_dir: str = "app/data/quiz_banks", db_connection: Optional[DatabaseConnection] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, workers: Optional[int] = None,
+                 stream_threshold: int = STREAMING_THRESHOLD_BYTES,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
         self.db = db_connection or DatabaseConnection()
         self.own_connection = db_connection is None
         self.data_dir = Path(data_dir)
+        self.batch_size = max(1, int(batch_size))
+        self.workers = workers
+        self.stream_threshold = stream_threshold
+        self._topic_map: Optional[Dict[Tuple[str, str, str, str], int]] = None
+        self.progress = progress
+        self.stats: Dict[str, Any] = {}
+        self.file_reports: List[Dict[str, Any]] = []
 
-    # Internal helpers (inlined from former QuestionLoader)
-    def _load_question_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+    # Topic çözümleme
+    def _load_topic_map(self, refresh: bool = False) -> Dict[Tuple[str, str, str, str], int]:
+        """(grade_name, subject, unit, topic) -> topic_id haritasını tek sorguda yükler."""
+        if self._topic_map is not None and not refresh:
+            return self._topic_map
+        topic_map: Dict[Tuple[str, str, str, str], int] = {}
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with self.db.read_only() as conn:
+                conn.cursor.execute(
+                    """
+                    SELECT g.grade_name, s.subject_name, u.unit_name, t.topic_name, t.topic_id
+                    FROM topics t
+                    JOIN units u ON t.unit_id = u.unit_id
+                    JOIN subjects s ON u.subject_id = s.subject_id
+                    JOIN grades g ON s.grade_id = g.grade_id
+                    """
+                )
+                for row in conn.cursor.fetchall():
+                    key = (row['grade_name'], row['subject_name'], row['unit_name'], row['topic_name'])
+                    topic_map[key] = row['topic_id']
         except Exception:
-            return None
+            return {}
+        self._topic_map = topic_map
+        return topic_map
 
     def _get_topic_id(self, grade: int, subject: str, unit: str, topic: str) -> Optional[int]:
+        return self._load_topic_map().get((grade_name(grade), subject, unit, topic))
+
+    # Ayrıştırma
+    def _is_large(self, path: str) -> bool:
         try:
-            query = (
-                """
-                SELECT t.topic_id 
-                FROM topics t
-                JOIN units u ON t.unit_id = u.unit_id
-                JOIN subjects s ON u.subject_id = s.subject_id
-                JOIN grades g ON s.grade_id = g.grade_id
-                WHERE g.grade_name = %s 
-                  AND s.subject_name = %s 
-                  AND u.unit_name = %s 
-                  AND t.topic_name = %s
-                """
+            return os.path.getsize(path) >= self.stream_threshold
+        except OSError:
+            return False
+
+    def _iter_parsed(self, paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Dosyaları sırayla ayrıştırır (sıra korunur).
+
+        Büyük dosyalar stream_question_file ile bu process'te akış olarak
+        okunur; diğerleri workers > 1 ise process pool'da ayrıştırılır.
+        Yol listesi tembel tüketilir ve pool'a en fazla
+        workers * PARSE_WINDOW_PER_WORKER dosya verilir; bellekte bekleyen
+        ayrıştırılmış sonuç sayısı bu pencereyle sınırlıdır.
+        """
+        if self.workers and self.workers > 1:
+            window = self.workers * PARSE_WINDOW_PER_WORKER
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # (path, future) çiftleri; büyük dosyalarda future None'dır
+                pending = deque()
+                for path in paths:
+                    future = None if self._is_large(path) else pool.submit(parse_question_file, path)
+                    pending.append((path, future))
+                    while len(pending) > window:
+                        yield self._resolve_parsed(*pending.popleft())
+                while pending:
+                    yield self._resolve_parsed(*pending.popleft())
+        else:
+            for path in paths:
+                yield stream_question_file(path) if self._is_large(path) else parse_question_file(path)
+
+    @staticmethod
+    def _resolve_parsed(path: str, future) -> Dict[str, Any]:
+        """Pool sonucunu bekler; future yoksa dosyayı akış olarak açar."""
+        return stream_question_file(path) if future is None else future.result()
+
+    @staticmethod
+    def _entries(parsed: Dict[str, Any]) -> Iterator[Tuple[tuple, str, str]]:
+        """Ayrıştırma sonucundan (question, source_key, content_hash) üçlülerini verir."""
+        if parsed.get('streaming'):
+            return parsed['entries']
+        return zip(parsed['questions'], parsed['keys'], parsed['hashes'])
+
+    # Yazma
+    def _insert_rows(self, conn, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+        """Satırları çok satırlı INSERT ... VALUES (...), (...) ifadeleriyle yazar."""
+        per_statement = max(1, MAX_PARAMS_PER_STATEMENT // len(columns))
+        row_sql = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start:start + per_statement]
+            params = [value for row in chunk for value in row]
+            conn.cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ', '.join([row_sql] * len(chunk)),
+                tuple(params)
             )
-            grade_name = f"{grade}. Sınıf"
-            with self.db as conn:
-                conn.cursor.execute(query, (grade_name, subject, unit, topic))
-                result = conn.cursor.fetchone()
-                return result['topic_id'] if result else None
-        except Exception:
-            return None
 
-    def _insert_question(self, question_data: Dict[str, Any], topic_id: int) -> Optional[int]:
-        try:
-            with self.db as conn:
-                q_sql = (
-                    """
-                    INSERT INTO questions (question_text, topic_id, difficulty_level, question_type, points, description)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    """
-                )
-                q_text = question_data['questionText']
-                q_desc = question_data.get('explanation', '')
-                q_vals = (q_text, topic_id, question_data['difficulty'], question_data['questionType'], 1, q_desc)
-                conn.cursor.execute(q_sql, q_vals)
-                question_id = conn.cursor.lastrowid
-
-                for option in question_data['options']:
-                    o_sql = (
-                        """
-                        INSERT INTO question_options (question_id, option_text, is_correct, description)
-                        VALUES (%s, %s, %s, %s)
-                        """
-                    )
-                    o_vals = (
-                        question_id,
-                        option['text'],
-                        option['isCorrect'],
-                        option.get('explanation', ''),
-                    )
-                    conn.cursor.execute(o_sql, o_vals)
-
-                return question_id
-        except Exception:
-            return None
+    def _insert_batch(self, batch: List[Tuple[int, tuple, str, str, str]], conn=None) -> Tuple[int, int]:
+        """
+        Bir batch soruyu ve seçeneklerini tek transaction'da yazar.
 
-    def _process_question_file(self, file_path: str) -> Tuple[int, int]:
-        data = self._load_question_file(file_path)
-        if not data:
+        question_id'ler MAX(question_id)+1'den başlayan bitişik bir aralıktan
+        verilir (MySQL'de FOR UPDATE ile tablonun sonu kilitlenir); böylece
+        seçeneklerin FK'ları lastrowid'e tek tek bakmadan hesaplanır.
+
+        Args:
+            batch: [(topic_id, question, source_file, source_key, content_hash)]
+            conn: Açık `with db as conn` tutamacı; verilirse çağıranın
+                  transaction'ı kullanılır.
+
+        Returns:
+            (yazılan soru sayısı, yazılan seçenek sayısı)
+        """
+        if not batch:
             return 0, 0
+        if conn is None:
+            with self.db as own_conn:
+                return self._insert_batch(batch, conn=own_conn)
+
+        lock = ' FOR UPDATE' if conn.engine.dialect.name == 'mysql' else ''
+        conn.cursor.execute(f"SELECT COALESCE(MAX(question_id), 0) AS max_id FROM questions{lock}")
+        first_id = int((conn.cursor.fetchone() or {}).get('max_id') or 0) + 1
+
+        question_rows, option_rows = [], []
+        for offset, (topic_id, question, source_file, source_key, content_hash) in enumerate(batch):
+            question_id = first_id + offset
+            text, difficulty, question_type, points, description, options = question
+            question_rows.append((
+                question_id, text, topic_id, difficulty, question_type, points, description,
+                len(options), len(options) >= ANSWERABLE_MIN_OPTIONS,
+                source_file, source_key, content_hash,
+            ))
+            option_rows.extend((question_id,) + tuple(option) for option in options)
+
+        self._insert_rows(conn, 'questions', QUESTION_COLUMNS, question_rows)
+        self._insert_rows(conn, 'question_options', OPTION_COLUMNS, option_rows)
+        return len(question_rows), len(option_rows)
+
+    def _report_progress(self, stats: Dict[str, Any], started: float, current: Optional[str]) -> None:
+        """progress callback'ine anlık durum gönderir (files, questions, rows, rows_per_sec, current)."""
+        if not self.progress:
+            return
+        elapsed = time.perf_counter() - started
+        rows = stats.get('questions', 0) + stats.get('options', 0)
+        self.progress({
+            'files': stats.get('files', 0),
+            'questions': stats.get('questions', 0),
+            'rows': rows,
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+            'current': current,
+        })
+
+    def _seed_paths(self, paths: Iterable[Path]) -> Dict[str, Tuple[int, int]]:
+        """
+        Dosyaları ayrıştırıp tek yazıcı (bu process) ile batch'ler halinde yazar.
 
-        metadata = data.get('metadata', {})
-        questions = data.get('questions', [])
-        grade = metadata.get('grade')
-        subject = metadata.get('subject')
-        unit = metadata.get('unit')
-        topic = metadata.get('topic')
-        if not all([grade, subject, unit, topic]):
-            return 0, len(questions)
-
-        topic_id = self._get_topic_id(grade, subject, unit, topic)
-        if not topic_id:
-            return 0, len(questions)
-
-        success = 0
-        for q in questions:
-            if self._insert_question(q, topic_id):
-                success += 1
-        return success, len(questions)
+        Ayrıştırma workers > 1 ise process pool'da yapılır; yazma sırası dosya
+        sırasıdır, bu yüzden hatalar ve self.file_reports da dosya sırasındadır.
+        """
+        started = time.perf_counter()
+        topic_map = self._load_topic_map(refresh=True)
+        stats = {'files': 0, 'questions': 0, 'options': 0, 'failed': 0, 'errors': {}}
+        reports: Dict[str, Dict[str, Any]] = {}
+        pending: List[Tuple[int, tuple, str, str, str]] = []
+        pending_files: Dict[str, int] = {}
+
+        def flush(current: Optional[str]) -> None:
+            try:
+                questions, options = self._insert_batch(pending)
+                for source_file, count in pending_files.items():
+                    reports[source_file]['inserted'] += count
+                stats['questions'] += questions
+                stats['options'] += options
+            except Exception as e:
+                stats['failed'] += len(pending)
+                for source_file in pending_files:
+                    reports[source_file]['error'] = reports[source_file]['error'] or f"batch insert failed: {e}"
+            pending.clear()
+            pending_files.clear()
+            self._report_progress(stats, started, current)
+
+        for parsed in self._iter_parsed(str(path) for path in paths):
+            source_file = source_name(Path(parsed['file']))
+            report = reports[source_file] = {
+                'file': source_file, 'name': parsed['name'], 'inserted': 0,
+                'total': parsed['total'], 'skipped': 0, 'error': None,
+            }
+            stats['files'] += 1
+            topic_id = topic_map.get(parsed['key']) if parsed['key'] else None
+            if not topic_id:
+                report['error'] = parsed['error'] or f"topic not found: {parsed['key']}"
+                parsed.get('close', lambda: None)()
+                self._report_progress(stats, started, source_file)
+                continue
+            valid = 0
+            try:
+                for question, source_key, content_hash in self._entries(parsed):
+                    valid += 1
+                    pending.append((topic_id, question, source_file, source_key, content_hash))
+                    pending_files[source_file] = pending_files.get(source_file, 0) + 1
+                    if len(pending) >= self.batch_size:
+                        flush(source_file)
+            except Exception as e:
+                report['error'] = f"parse failed: {e}"
+            report['total'] = parsed['total']
+            # Zorunlu alanı eksik olduğu için atlanan sorular
+            report['skipped'] = max(0, parsed['total'] - valid) if not report['error'] else 0
+            self._report_progress(stats, started, source_file)
+        flush(None)
+
+        elapsed = time.perf_counter() - started
+        rows = stats['questions'] + stats['options']
+        stats['errors'] = {item['file']: item['error'] for item in reports.values() if item['error']}
+        stats.update({
+            'rows': rows,
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+        })
+        self.stats = stats
+        self.file_reports = list(reports.values())
+        results: Dict[str, Tuple[int, int]] = {}
+        for item in self.file_reports:
+            success, total = results.get(item['name'], (0, 0))
+            results[item['name']] = (success + item['inserted'], total + item['total'])
+        return results
+
+    def _process_question_file(self, file_path: str) -> Tuple[int, int]:
+        return self._seed_paths([Path(file_path)]).get(Path(file_path).name, (0, 0))
 
     def _process_dir(self, dir_path: Path) -> Dict[str, Tuple[int, int]]:
         if not dir_path.exists():
             return {}
-        results: Dict[str, Tuple[int, int]] = {}
-        json_files = list(dir_path.rglob("*.json"))
-        if not json_files:
-            return {}
-        for fp in json_files:
-            results[fp.name] = self._process_question_file(str(fp))
+        return self._seed_paths(iter_bank_files(dir_path))
+
+    # Artımlı senkronizasyon
+    def _load_file_records(self) -> Dict[str, Dict[str, Any]]:
+        with self.db as conn:
+            conn.cursor.execute(
+                "SELECT file_path, content_hash, file_size, mtime_ns, question_count FROM question_bank_files"
+            )
+            return {row['file_path']: row for row in conn.cursor.fetchall()}
+
+    def _save_file_record(self, conn, source_file: str, topic_id: Optional[int], content_hash: str,
+                          stat, question_count: int) -> None:
+        conn.cursor.execute("DELETE FROM question_bank_files WHERE file_path = %s", (source_file,))
+        conn.cursor.execute(
+            """
+            INSERT INTO question_bank_files (file_path, topic_id, content_hash, file_size, mtime_ns, question_count)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            (source_file, topic_id, content_hash, stat.st_size, stat.st_mtime_ns, question_count)
+        )
+
+    def _update_questions(self, conn, changed: List[Tuple[int, int, tuple, str, str, str]]) -> None:
+        """
+        Değişen soruları yerinde günceller. Seçenekler option_id sırasıyla
+        eşleştirilip güncellenir (geçmiş cevapların option_id'leri korunur),
+        fazlası eklenir, eksik kalanlar silinir.
+        """
+        question_ids = [item[0] for item in changed]
+        existing_options: Dict[int, List[int]] = {qid: [] for qid in question_ids}
+        for start in range(0, len(question_ids), ID_CHUNK_SIZE):
+            chunk = question_ids[start:start + ID_CHUNK_SIZE]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            conn.cursor.execute(
+                f"SELECT option_id, question_id FROM question_options "
+                f"WHERE question_id IN ({placeholders}) ORDER BY question_id, option_id",
+                tuple(chunk)
+            )
+            for row in conn.cursor.fetchall():
+                existing_options[row['question_id']].append(row['option_id'])
+
+        question_updates, option_updates, option_inserts, option_deletes = [], [], [], []
+        for question_id, topic_id, question, source_file, source_key, content_hash in changed:
+            text, difficulty, question_type, points, description, options = question
+            question_updates.append((
+                text, topic_id, difficulty, question_type, points, description,
+                len(options), len(options) >= ANSWERABLE_MIN_OPTIONS,
+                source_file, source_key, content_hash, question_id,
+            ))
+            old_ids = existing_options.get(question_id, [])
+            for option_id, option in zip(old_ids, options):
+                option_updates.append(tuple(option) + (option_id,))
+            option_inserts.extend((question_id,) + tuple(option) for option in options[len(old_ids):])
+            option_deletes.extend(old_ids[len(options):])
+
+        conn.cursor.executemany(
+            """
+            UPDATE questions
+            SET question_text = %s, topic_id = %s, difficulty_level = %s, question_type = %s,
+                points = %s, description = %s, option_count = %s, is_answerable = %s,
+                source_file = %s, source_key = %s, content_hash = %s, is_active = 1
+            WHERE question_id = %s
+            """,
+            question_updates
+        )
+        if option_updates:
+            conn.cursor.executemany(
+                "UPDATE question_options SET option_text = %s, is_correct = %s, description = %s "
+                "WHERE option_id = %s",
+                option_updates
+            )
+        self._insert_rows(conn, 'question_options', OPTION_COLUMNS, option_inserts)
+        self._execute_in_chunks(conn, "DELETE FROM question_options WHERE option_id IN ({ids})", option_deletes)
+
+    def _execute_in_chunks(self, conn, sql_template: str, ids: List[int]) -> None:
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[start:start + ID_CHUNK_SIZE]
+            conn.cursor.execute(sql_template.format(ids=', '.join(['%s'] * len(chunk))), tuple(chunk))
+
+    def _apply_file_diff(self, parsed: Dict[str, Any], source_file: str, topic_id: int, stat,
+                         file_hash: str) -> Dict[str, int]:
+        """
+        Tek dosyanın sorularını veritabanıyla karşılaştırıp tek transaction'da
+        insert/update/deactivate uygular.
+
+        Daha önce source_file'sız (eski seed ile) eklenmiş sorular, aynı
+        konu ve soru metni eşleşirse sahiplenilir; böylece ilk senkronizasyon
+        mevcut bankayı çoğaltmaz.
+        """
+        summary = {'inserted': 0, 'updated': 0, 'deactivated': 0, 'unchanged': 0}
+        with self.db as conn:
+            conn.cursor.execute(
+                "SELECT question_id, source_key, content_hash, is_active FROM questions WHERE source_file = %s",
+                (source_file,)
+            )
+            existing = {row['source_key']: row for row in conn.cursor.fetchall()}
+
+            legacy: Dict[str, int] = {}
+            if not existing:
+                conn.cursor.execute(
+                    "SELECT question_id, question_text FROM questions WHERE topic_id = %s AND source_file IS NULL",
+                    (topic_id,)
+                )
+                for row in conn.cursor.fetchall():
+                    legacy.setdefault(row['question_text'], row['question_id'])
+
+            new_rows, changed, count = [], [], 0
+            for question, source_key, content_hash in self._entries(parsed):
+                count += 1
+                row = existing.pop(source_key, None)
+                if row is None and question[0] in legacy:
+                    row = {'question_id': legacy.pop(question[0]), 'content_hash': None, 'is_active': 1}
+                if row is None:
+                    new_rows.append((topic_id, question, source_file, source_key, content_hash))
+                elif row['content_hash'] != content_hash or not row['is_active']:
+                    changed.append((row['question_id'], topic_id, question, source_file, source_key, content_hash))
+                else:
+                    summary['unchanged'] += 1
+                if len(new_rows) >= self.batch_size:
+                    summary['inserted'] += self._insert_batch(new_rows, conn=conn)[0]
+                    new_rows = []
+                if len(changed) >= self.batch_size:
+                    self._update_questions(conn, changed)
+                    summary['updated'] += len(changed)
+                    changed = []
+
+            # Dosyadan çıkarılan sorular silinmez; quiz geçmişi için pasifleştirilir
+            removed = [row['question_id'] for row in existing.values() if row['is_active']]
+            if changed:
+                self._update_questions(conn, changed)
+                summary['updated'] += len(changed)
+            self._execute_in_chunks(conn, "UPDATE questions SET is_active = 0 WHERE question_id IN ({ids})", removed)
+            summary['inserted'] += self._insert_batch(new_rows, conn=conn)[0]
+            summary['deactivated'] = len(removed)
+            self._save_file_record(conn, source_file, topic_id, file_hash, stat, count)
+        return summary
+
+    def _deactivate_missing_file(self, source_file: str) -> int:
+        """Diskten silinmiş bir banka dosyasının sorularını pasifleştirir."""
+        with self.db as conn:
+            conn.cursor.execute(
+                "SELECT question_id FROM questions WHERE source_file = %s AND is_active = 1", (source_file,)
+            )
+            ids = [row['question_id'] for row in conn.cursor.fetchall()]
+            self._execute_in_chunks(conn, "UPDATE questions SET is_active = 0 WHERE question_id IN ({ids})", ids)
+            conn.cursor.execute("DELETE FROM question_bank_files WHERE file_path = %s", (source_file,))
+        return len(ids)
+
+    def sync_dir(self, directory: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Soru bankası dizinini artımlı olarak senkronize eder.
+
+        mtime ve boyutu kayıtla aynı olan dosyalar okunmaz; değişenlerin
+        SHA-256'sı aynıysa yalnızca kayıt güncellenir. İçeriği değişen
+        dosyalarda soru bazında (source_key + content_hash) diff uygulanır.
+        Dizinden silinen dosyaların soruları pasifleştirilir.
+
+        Returns:
+            source_file -> {'status': 'unchanged' | 'synced' | 'removed' | 'error',
+                            'inserted', 'updated', 'deactivated', 'error'}
+        """
+        started = time.perf_counter()
+        base = Path(directory) if directory else self.data_dir
+        results: Dict[str, Dict[str, Any]] = {}
+        stats = {'files': 0, 'unchanged': 0, 'synced': 0, 'removed': 0,
+                 'inserted': 0, 'updated': 0, 'deactivated': 0, 'errors': {}}
+        if not base.exists():
+            self.stats = stats
+            return results
+
+        topic_map = self._load_topic_map(refresh=True)
+        records = self._load_file_records()
+        base_prefix = source_name(base).rstrip('/') + '/'
+
+        candidates: List[Tuple[Path, str, Any]] = []
+        present = set()
+        for path in iter_bank_files(base):
+            name = source_name(path)
+            present.add(name)
+            stats['files'] += 1
+            stat = path.stat()
+            record = records.get(name)
+            if record and int(record['mtime_ns']) == stat.st_mtime_ns and int(record['file_size']) == stat.st_size:
+                results[name] = {'status': 'unchanged'}
+                continue
+            candidates.append((path, name, stat))
+
+        parsed_iter = self._iter_parsed([str(path) for path, _, _ in candidates])
+        applied = 0
+        for done, ((path, name, stat), parsed) in enumerate(zip(candidates, parsed_iter)):
+            self._report_progress({'files': stats['files'] - len(candidates) + done, 'questions': applied},
+                                  started, name)
+            record = records.get(name)
+            topic_id = topic_map.get(parsed['key']) if parsed['key'] else None
+            # Akış modunda hash, soruları okumadan önce ayrı bir geçişle alınır
+            current_hash = parsed['file_hash'] or (file_sha256(str(path)) if parsed.get('streaming') else None)
+            if current_hash and record and record['content_hash'] == current_hash:
+                # Sadece mtime değişmiş (touch, checkout): kaydı tazele
+                parsed.get('close', lambda: None)()
+                with self.db as conn:
+                    self._save_file_record(conn, name, topic_id, current_hash, stat, record.get('question_count') or 0)
+                results[name] = {'status': 'unchanged'}
+                continue
+            if not topic_id:
+                parsed.get('close', lambda: None)()
+                error = parsed['error'] or f"topic not found: {parsed['key']}"
+                results[name] = {'status': 'error', 'error': error}
+                stats['errors'][name] = error
+                continue
+            try:
+                summary = self._apply_file_diff(parsed, name, topic_id, stat, current_hash)
+                results[name] = dict(summary, status='synced')
+                applied += summary['inserted'] + summary['updated']
+            except Exception as e:
+                results[name] = {'status': 'error', 'error': str(e)}
+                stats['errors'][name] = str(e)
+
+        for name in records:
+            if name.startswith(base_prefix) and name not in present:
+                try:
+                    results[name] = {'status': 'removed', 'deactivated': self._deactivate_missing_file(name)}
+                except Exception as e:
+                    results[name] = {'status': 'error', 'error': str(e)}
+                    stats['errors'][name] = str(e)
+
+        for result in results.values():
+            status = result['status']
+            if status in stats:
+                stats[status] += 1
+            for key in ('inserted', 'updated', 'deactivated'):
+                stats[key] += result.get(key, 0)
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        self.stats = stats
         return results
 
     # Public API
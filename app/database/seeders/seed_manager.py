@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Any
 from app.database.db_connection import DatabaseConnection
 from .curriculum_seeder import CurriculumSeeder
 from .questions_seeder import QuestionsSeeder
@@ -32,6 +32,9 @@ class SeedManager:
     def seed_questions_file(self, file_path: str) -> Tuple[int, int]:
         return self.questions.seed_file(file_path)
 
+    def sync_questions_from_dir(self, directory: str) -> Dict[str, Dict[str, Any]]:
+        return self.questions.sync_dir(directory)
+
     # Users (dev only)
     def seed_default_users(self) -> bool:
         return self.users.seed_default_users()
@@ -21,7 +21,10 @@ class UsersSeeder:
             # Generate a Werkzeug-compatible password hash for dev users
             # IMPORTANT: This is only for local development/testing.
             default_password = 'admin123'
-            password_hash = generate_password_hash(default_password)
+            from config import get_config
+            from app.services.password_hasher import hash_method
+            rounds = getattr(get_config().SECURITY, 'PASSWORD_SALT_ROUNDS', 15)
+            password_hash = generate_password_hash(default_password, method=hash_method(rounds))
 
             sql = (
                 "INSERT INTO users "
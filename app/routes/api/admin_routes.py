@@ -3,7 +3,7 @@ Admin API Routes - Modern & Clean Implementation
 Handles all admin panel API endpoints with proper authentication and error handling
 """
 
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, Response, jsonify, request, send_file, session, stream_with_context
 from functools import wraps
 import logging
 from typing import Dict, List, Any, Optional
@@ -11,8 +11,12 @@ from typing import Dict, List, Any, Optional
 # Import services
 from app.services.admin_service import AdminService
 from app.services.auth_service import AuthenticationService
+from app.services.job_runner import get_job_runner
+from app.services.system_service import SystemService
 from app.utils.response_utils import success_response, error_response
 from app.utils.validation_utils import validate_required_fields
+from app.utils.exceptions import NotFoundError, ValidationError
+from app.database import query_instrumentation
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -23,6 +27,8 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 # Initialize services
 admin_service = AdminService()
 auth_service = AuthenticationService()
+system_service = SystemService()
+admin_service.register_jobs(get_job_runner())
 
 # =============================================================================
 # DECORATORS
@@ -36,8 +42,9 @@ def admin_required(f):
         if not session.get('logged_in'):
             return error_response('Oturum bulunamadı', 401)
         
-        # Then check if user is admin
-        if not session.get('is_admin'):
+        # Then check if user is admin (güncel kayıt, süreç içi önbellekten)
+        current_user = auth_service.get_current_user()
+        if not current_user or not current_user.get('is_admin'):
             return error_response('Admin yetkisi gerekli', 403)
         
         return f(*args, **kwargs)
@@ -414,11 +421,35 @@ def toggle_admin_status(user_id: int):
 @admin_bp.route('/export/curriculum', methods=['GET'])
 @admin_required
 def export_curriculum():
-    """Müfredat verilerini CSV olarak export eder"""
+    """
+    Müfredat verilerini indirilebilir dosya olarak stream eder.
+    
+    Query params:
+        format: 'csv' (varsayılan) veya 'jsonl'
+        gzip: '1' ise çıktı gzip ile sıkıştırılır
+        async: '1' ise export arka plan işi olarak dosyaya yazılır; 202 ile
+               dönen işin sonucu /jobs/<job_id>/download ile indirilir
+    """
     try:
         format_type = request.args.get('format', 'csv')
-        data = admin_service.export_curriculum(format_type)
-        return success_response('Müfredat başarıyla export edildi', data)
+        compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            if format_type.lower() not in ('csv', 'jsonl'):
+                return error_response('Desteklenmeyen export formatı', 400)
+            job = admin_service.submit_job('curriculum_export', {'format_type': format_type, 'compress': compress})
+            return success_response('Export işi başlatıldı', job, 202)
+        export = admin_service.export_curriculum(format_type, compress=compress)
+        return Response(
+            stream_with_context(export['stream']),
+            mimetype=export['mimetype'],
+            headers={
+                'Content-Disposition': f'attachment; filename="{export["filename"]}"',
+                # Reverse proxy'nin yanıtı tamponlamadan iletmesi için
+                'X-Accel-Buffering': 'no'
+            }
+        )
+    except ValidationError as e:
+        return error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Export curriculum error: {str(e)}")
         return error_response('Export işlemi sırasında hata oluştu', 500)
@@ -426,7 +457,13 @@ def export_curriculum():
 @admin_bp.route('/import/curriculum', methods=['POST'])
 @admin_required
 def import_curriculum():
-    """CSV dosyasından müfredat verilerini import eder"""
+    """
+    CSV dosyasından müfredat verilerini import eder.
+    
+    `async=1` (query veya form) verilirse import arka planda çalışır ve
+    202 ile import_id döner; ilerleme /import/curriculum/<import_id>
+    üzerinden sorgulanır.
+    """
     try:
         if 'file' not in request.files:
             return error_response('Dosya bulunamadı', 400)
@@ -435,16 +472,150 @@ def import_curriculum():
         if file.filename == '':
             return error_response('Dosya seçilmedi', 400)
         
-        result = admin_service.import_curriculum(file)
+        background = (request.args.get('async') or request.form.get('async') or '').lower() in ('1', 'true', 'yes')
+        result = admin_service.import_curriculum(file, background=background)
+        if background:
+            return success_response('Müfredat import işlemi başlatıldı', result, 202)
         return success_response('Müfredat başarıyla import edildi', result)
+    except ValidationError as e:
+        return error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Import curriculum error: {str(e)}")
         return error_response('Import işlemi sırasında hata oluştu', 500)
 
+@admin_bp.route('/import/curriculum/<import_id>', methods=['GET'])
+@admin_required
+def get_import_status(import_id):
+    """Müfredat import işleminin ilerlemesini getirir"""
+    try:
+        status = admin_service.get_import_status(import_id)
+        return success_response('Import durumu alındı', status)
+    except NotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        logger.error(f"Import status error: {str(e)}")
+        return error_response('Import durumu alınırken hata oluştu', 500)
+
+@admin_bp.route('/import/curriculum/<import_id>/errors', methods=['GET'])
+@admin_required
+def download_import_errors(import_id):
+    """Import sırasında reddedilen satırların raporunu CSV olarak indirir"""
+    try:
+        path = admin_service.get_import_error_report(import_id)
+        return send_file(path, mimetype='text/csv', as_attachment=True,
+                         download_name=f'curriculum_import_{import_id[:8]}_errors.csv')
+    except NotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        logger.error(f"Import error report error: {str(e)}")
+        return error_response('Hata raporu alınırken hata oluştu', 500)
+
+# =============================================================================
+# BACKGROUND JOBS
+# =============================================================================
+
+@admin_bp.route('/jobs', methods=['GET'])
+@admin_required
+def list_jobs():
+    """Son arka plan işlerini listeler (?status=running&limit=50)"""
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        jobs = get_job_runner().list_jobs(limit=limit, status=request.args.get('status'))
+        return success_response('İşler alındı', jobs)
+    except Exception as e:
+        logger.error(f"List jobs error: {str(e)}")
+        return error_response('İşler alınırken hata oluştu', 500)
+
+@admin_bp.route('/jobs/<job_id>', methods=['GET'])
+@admin_required
+def get_job(job_id):
+    """Arka plan işinin durumunu ve ilerlemesini getirir"""
+    try:
+        return success_response('İş durumu alındı', get_job_runner().get(job_id))
+    except NotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        logger.error(f"Get job error: {str(e)}")
+        return error_response('İş durumu alınırken hata oluştu', 500)
+
+@admin_bp.route('/jobs/<job_id>/cancel', methods=['POST'])
+@admin_required
+def cancel_job(job_id):
+    """Arka plan işini iptal eder"""
+    try:
+        return success_response('İptal isteği alındı', get_job_runner().cancel(job_id))
+    except NotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        logger.error(f"Cancel job error: {str(e)}")
+        return error_response('İş iptal edilirken hata oluştu', 500)
+
+@admin_bp.route('/jobs/<job_id>/download', methods=['GET'])
+@admin_required
+def download_job_result(job_id):
+    """Tamamlanmış export işinin dosyasını indirir"""
+    try:
+        export = admin_service.get_export_file(get_job_runner().get(job_id))
+        return send_file(export['path'], mimetype=export['mimetype'], as_attachment=True,
+                         download_name=export['filename'])
+    except NotFoundError as e:
+        return error_response(str(e), 404)
+    except Exception as e:
+        logger.error(f"Download job result error: {str(e)}")
+        return error_response('Dosya indirilirken hata oluştu', 500)
+
 # =============================================================================
 # SYSTEM & UTILITIES
 # =============================================================================
 
+@admin_bp.route('/system/cleanup-activities', methods=['POST'])
+@admin_required
+def cleanup_activities():
+    """Eski aktivite kayıtlarını arka planda temizler"""
+    try:
+        data = request.get_json(silent=True) or {}
+        days = int(data.get('days', 90))
+        if days < 1:
+            return error_response('Gün sayısı en az 1 olmalı', 400)
+        job = admin_service.submit_job('activity_cleanup', {'days': days})
+        return success_response('Aktivite temizliği başlatıldı', job, 202)
+    except (TypeError, ValueError):
+        return error_response('Geçersiz gün sayısı', 400)
+    except Exception as e:
+        logger.error(f"Cleanup activities error: {str(e)}")
+        return error_response('Temizlik başlatılırken hata oluştu', 500)
+
+@admin_bp.route('/system/retention', methods=['POST'])
+@admin_required
+def purge_expired_data():
+    """Saklama süresi dolmuş verileri arka planda parça parça temizler"""
+    try:
+        from app.database.migrations.retention_manager import RETENTION_POLICIES
+        data = request.get_json(silent=True) or {}
+        policies = data.get('policies') or list(RETENTION_POLICIES)
+        unknown = [name for name in policies if name not in RETENTION_POLICIES]
+        if unknown:
+            return error_response(f"Bilinmeyen politika: {', '.join(map(str, unknown))}", 400)
+        job = admin_service.submit_job('retention_purge', {
+            'policies': policies,
+            'dry_run': bool(data.get('dry_run', False))
+        })
+        return success_response('Veri temizliği başlatıldı', job, 202)
+    except Exception as e:
+        logger.error(f"Retention purge error: {str(e)}")
+        return error_response('Veri temizliği başlatılırken hata oluştu', 500)
+
+@admin_bp.route('/system/ensure-indexes', methods=['POST'])
+@admin_required
+def ensure_indexes():
+    """Kritik performans index'lerini arka planda oluşturur"""
+    try:
+        job = admin_service.submit_job('ensure_indexes')
+        return success_response("Index oluşturma başlatıldı", job, 202)
+    except Exception as e:
+        logger.error(f"Ensure indexes error: {str(e)}")
+        return error_response("Index oluşturma başlatılırken hata oluştu", 500)
+
 @admin_bp.route('/system/status', methods=['GET'])
 @admin_required
 def get_system_status():
@@ -456,6 +627,44 @@ def get_system_status():
         logger.error(f"System status error: {str(e)}")
         return error_response('Sistem durumu alınırken hata oluştu', 500)
 
+@admin_bp.route('/system/metrics', methods=['GET'])
+@admin_required
+def get_system_metrics():
+    """Arka planda örneklenen sistem metriklerini getirir (son örnek ve kısa geçmiş)"""
+    try:
+        limit = request.args.get('history', 60, type=int)
+        data = system_service.get_metrics_history(limit=max(0, min(limit, 1000)))
+        if 'error' in data:
+            return error_response('Sistem metrikleri alınırken hata oluştu', 500)
+        data['latest'] = system_service.get_system_metrics()
+        return success_response('Sistem metrikleri alındı', data)
+    except Exception as e:
+        logger.error(f"System metrics error: {str(e)}")
+        return error_response('Sistem metrikleri alınırken hata oluştu', 500)
+
+@admin_bp.route('/system/queries', methods=['GET'])
+@admin_required
+def get_query_stats():
+    """SQL sorgu istatistiklerini getirir (endpoint özetleri, en maliyetli ifadeler, slow/N+1 kayıtları)"""
+    try:
+        limit = request.args.get('limit', 20, type=int)
+        stats = query_instrumentation.get_query_stats(limit=max(1, min(limit, 200)))
+        return success_response('Sorgu istatistikleri alındı', stats)
+    except Exception as e:
+        logger.error(f"Query stats error: {str(e)}")
+        return error_response('Sorgu istatistikleri alınırken hata oluştu', 500)
+
+@admin_bp.route('/system/queries/reset', methods=['POST'])
+@admin_required
+def reset_query_stats():
+    """SQL sorgu istatistiklerini sıfırlar"""
+    try:
+        query_instrumentation.reset_query_stats()
+        return success_response('Sorgu istatistikleri sıfırlandı')
+    except Exception as e:
+        logger.error(f"Query stats reset error: {str(e)}")
+        return error_response('Sorgu istatistikleri sıfırlanırken hata oluştu', 500)
+
 @admin_bp.route('/refresh-session', methods=['POST'])
 @admin_required
 def refresh_admin_session():
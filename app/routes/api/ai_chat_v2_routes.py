@@ -7,8 +7,14 @@
 
 from flask import Blueprint, request, jsonify, session
 from typing import Dict, Any
+import logging
 import traceback
 
+from app.services.rate_limiter import rate_limit
+from app.utils.lazy import LazyService
+
+logger = logging.getLogger(__name__)
+
 # Create the AI chat v2 blueprint
 ai_chat_v2_bp = Blueprint('ai_chat_v2', __name__)
 
@@ -19,18 +25,24 @@ try:
     from app.services.chat_message_service import ChatMessageService
     from app.services.quiz_session_service import QuizSessionService
     from app.database.db_connection import DatabaseConnection
+    from app.services.job_runner import get_job_runner
 except ImportError as e:
     GeminiAPIService = None
     ChatSessionService = None
     ChatMessageService = None
     QuizSessionService = None
     DatabaseConnection = None
+    get_job_runner = None
 
-# Global service instances
+# Global service instances (servisler ilk istekte oluşturulur; DB engine'i de ilk sorguda kurulur)
 db_connection = DatabaseConnection() if DatabaseConnection else None
-gemini_service = GeminiAPIService() if GeminiAPIService else None
-chat_session_service = ChatSessionService(db_connection) if ChatSessionService else None
-chat_message_service = ChatMessageService(db_connection) if ChatMessageService else None
+gemini_service = LazyService(GeminiAPIService, 'GeminiAPIService')
+chat_session_service = LazyService(
+    (lambda: ChatSessionService(db_connection)) if ChatSessionService else None, 'ChatSessionService'
+)
+chat_message_service = LazyService(
+    (lambda: ChatMessageService(db_connection)) if ChatMessageService else None, 'ChatMessageService'
+)
 
 # ===========================================================================
 # SYSTEM ROUTES
@@ -253,6 +265,7 @@ def get_session_info(chat_session_id):
 # ===========================================================================
 
 @ai_chat_v2_bp.route('/ai/chat/message', methods=['POST'])
+@rate_limit('ai')
 def send_chat_message():
     """Chat mesajı gönderir ve AI yanıtı alır"""
     try:
@@ -402,9 +415,7 @@ def send_chat_message():
         return jsonify(response_payload), 200
         
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Quick action failed: {str(e)}")
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception("Quick action failed: %s", e)
         error_msg = chat_message_service.get_error_message('general_error') if chat_message_service else 'System error'
         return jsonify({
             'status': 'error',
@@ -414,11 +425,10 @@ def send_chat_message():
         }), 500
 
 @ai_chat_v2_bp.route('/ai/chat/quick-action', methods=['POST'])
+@rate_limit('ai')
 def quick_action():
     """Hızlı aksiyon işleme endpoint'i"""
     try:
-        print(f"[DEBUG] Quick action endpoint called")
-        print(f"[DEBUG] Request data: {request.get_json()}", flush=True)
         if not all([gemini_service, chat_session_service, chat_message_service]):
             return jsonify({
                 'status': 'error',
@@ -474,7 +484,7 @@ def quick_action():
         # Chat session kontrol - eğer session yoksa oluştur
         session_info = chat_session_service.get_session(chat_session_id)
         if not session_info:
-            print(f"[DEBUG] Chat session not found, using fallback session info")
+            logger.debug("Chat session %s not found, using fallback session info", chat_session_id)
             # Fallback: Basic session info for quick actions
             from datetime import datetime
             session_info = {
@@ -557,41 +567,34 @@ def quick_action():
         }
         
         # AI'dan yanıt al (structured contents)
-        print(f"[DEBUG] Calling Gemini API with contents length: {len(contents)}")
         ai_response = gemini_service.generate_content(contents=contents)
-        print(f"[DEBUG] AI response received: {bool(ai_response)}")
         
         if not ai_response:
             error_msg = chat_message_service.get_error_message('api_error')
-            print(f"[DEBUG] AI response is None, returning error: {error_msg}")
+            logger.warning("Quick action %s: empty AI response", action)
             return jsonify({
                 'status': 'error',
                 'message': error_msg
             }), 500
         
         # AI yanıtını format et
-        print(f"[DEBUG] Formatting AI response...")
         try:
             formatted_response = chat_message_service.format_ai_response(ai_response)
-            print(f"[DEBUG] Formatted response length: {len(formatted_response) if formatted_response else 0}")
         except Exception as format_error:
-            print(f"[DEBUG] Error formatting AI response: {format_error}")
+            logger.error("Error formatting AI response: %s", format_error)
             return jsonify({
                 'status': 'error',
                 'message': f'Response formatting failed: {str(format_error)}'
             }), 500
         
         # AI mesajını session'a ekle
-        print(f"[DEBUG] Creating AI metadata...")
         try:
             ai_metadata = chat_message_service.create_message_metadata('ai', action=action, question_id=question_id)
             ai_metadata['prompt_contents'] = contents
-            print(f"[DEBUG] AI metadata created successfully")
         except Exception as metadata_error:
-            print(f"[DEBUG] Error creating AI metadata: {metadata_error}")
+            logger.warning("Error creating AI metadata: %s", metadata_error)
             ai_metadata = {}
         
-        print(f"[DEBUG] Adding AI message to session...")
         try:
             chat_message_service.add_message(
                 chat_session_id, 'ai', formatted_response,
@@ -600,9 +603,8 @@ def quick_action():
                 prompt_used=final_user_text,
                 metadata=ai_metadata
             )
-            print(f"[DEBUG] AI message added successfully")
         except Exception as add_error:
-            print(f"[DEBUG] Error adding AI message: {add_error}")
+            logger.error("Error adding AI message: %s", add_error)
             return jsonify({
                 'status': 'error',
                 'message': f'Failed to save AI response: {str(add_error)}'
@@ -626,9 +628,7 @@ def quick_action():
         return jsonify(quick_response), 200
         
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Quick action failed: {str(e)}")
-        print(f"[ERROR] Traceback: {traceback.format_exc()}")
+        logger.exception("Quick action failed: %s", e)
         error_msg = chat_message_service.get_error_message('general_error') if chat_message_service else 'System error'
         return jsonify({
             'status': 'error',
@@ -641,26 +641,60 @@ def quick_action():
 # UTILITY ROUTES
 # ===========================================================================
 
+def _min_cleanup_age_hours() -> int:
+    """Session temizliğinde izin verilen en küçük yaş (DATABASE.RETENTION_CHAT_SESSION_DAYS)"""
+    from config import get_config
+    days = getattr(get_config().DATABASE, 'RETENTION_CHAT_SESSION_DAYS', 30)
+    return max(1, int(days)) * 24
+
+
 @ai_chat_v2_bp.route('/ai/session/cleanup', methods=['POST'])
 def cleanup_sessions():
-    """Eski session'ları temizler"""
+    """Eski kapanmış session'ları arka plan işi olarak temizler (yalnızca admin; ilerleme: /api/admin/jobs/<job_id>)"""
     try:
+        if not session.get('logged_in'):
+            return jsonify({
+                'status': 'error',
+                'message': 'Oturum bulunamadı'
+            }), 401
+        from app.services.auth_service import get_current_user
+        current_user = get_current_user()
+        if not current_user or not current_user.get('is_admin'):
+            return jsonify({
+                'status': 'error',
+                'message': 'Admin yetkisi gerekli'
+            }), 403
+        
         if not chat_session_service:
             return jsonify({
                 'status': 'error',
                 'message': 'Chat session service not available'
             }), 503
         
-        data = request.get_json() or {}
-        max_age_hours = data.get('max_age_hours', 24)
+        data = request.get_json(silent=True) or {}
+        min_age_hours = _min_cleanup_age_hours()
+        try:
+            max_age_hours = int(data.get('max_age_hours', min_age_hours))
+        except (TypeError, ValueError):
+            max_age_hours = -1
+        if max_age_hours < min_age_hours:
+            return jsonify({
+                'status': 'error',
+                'message': f'max_age_hours must be at least {min_age_hours}'
+            }), 400
         
-        deleted = chat_session_service.cleanup_old_sessions(max_age_hours)
+        job = get_job_runner().submit(
+            'chat_session_cleanup',
+            {'max_age_hours': max_age_hours},
+            user_id=session.get('user_id')
+        )
         
         return jsonify({
-            'status': 'success',
-            'message': 'Old sessions cleaned up',
-            'deleted': deleted
-        }), 200
+            'status': 'accepted',
+            'message': 'Session cleanup queued',
+            'job_id': job['job_id'],
+            'status_url': f"/api/admin/jobs/{job['job_id']}"
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -669,6 +703,18 @@ def cleanup_sessions():
             'error': str(e)
         }), 500
 
+
+def _chat_session_cleanup_job(job, max_age_hours: int = 24) -> Dict[str, Any]:
+    """'chat_session_cleanup' işi: `max_age_hours` saatten eski kapanmış session'ları siler"""
+    # Kuyruğa başka yoldan eklenen işler de en küçük yaşın altına inemez
+    max_age_hours = max(int(max_age_hours), _min_cleanup_age_hours())
+    return {'deleted': chat_session_service.cleanup_old_sessions(max_age_hours),
+            'max_age_hours': max_age_hours}
+
+
+if ChatSessionService and get_job_runner:
+    get_job_runner().register('chat_session_cleanup', _chat_session_cleanup_job)
+
 # ===========================================================================
 # CONFIG ROUTES
 # ===========================================================================
@@ -27,6 +27,10 @@
 # =============================================================================
 from flask import Blueprint, jsonify, request, session
 from datetime import datetime
+import random
+
+from app.services.rate_limiter import rate_limit
+from app.services.response_cache import get_question_content
 
 # Create the quiz blueprint
 quiz_bp = Blueprint('quiz', __name__)
@@ -377,6 +381,7 @@ def get_quiz_session(session_id):
         }), 500
 
 @quiz_bp.route('/quiz/session/<session_id>/status', methods=['GET'])
+@rate_limit('poll')
 # @login_required  # Temporarily disabled for testing
 def get_session_status(session_id):
     """5.2.2b. Quiz session durumunu getirir."""
@@ -474,6 +479,7 @@ def get_session_status(session_id):
         }), 500
 
 @quiz_bp.route('/quiz/session/<session_id>/timer', methods=['PUT'])
+@rate_limit('poll')
 # @login_required  # Temporarily disabled for testing
 def update_session_timer(session_id):
     """5.2.2c. Quiz session timer'ını günceller."""
@@ -552,11 +558,9 @@ def get_all_questions(session_id):
         all_questions = []
         
         for i, question in enumerate(questions):
-            # Her soru için seçenekleri yükle
-            question_options = session_service.get_question_options(question['question_id'])
-            
-            # Her soru için detayları (açıklama dahil) yükle
-            question_details = session_service.get_question_details(question['question_id'])
+            # Soru detayları ve serileştirilmiş seçenekler (oturumlar arası önbellekten)
+            question_details, question_options = get_question_content(session_service, question['question_id'])
+            random.shuffle(question_options)
             
             # Educational features için veri hazırla
             hint = None
@@ -24,6 +24,9 @@ from datetime import datetime
 import platform
 import sys
 
+from app.services.rate_limiter import rate_limit
+from app.utils.lazy import LazyService
+
 # Import services here to avoid circular imports
 try:
     from app.services.system_service import SystemService
@@ -36,8 +39,8 @@ system_bp = Blueprint('system', __name__)
 # =============================================================================
 # 4.0. SERVİS BAŞLATMA
 # =============================================================================
-# Rotaların kullanacağı servis sınıfından bir örnek oluşturulur.
-system_service = SystemService() if SystemService else None
+# Rotaların kullanacağı servis örneği ilk istekte oluşturulur.
+system_service = LazyService(SystemService, 'SystemService')
 
 # =============================================================================
 # 4.0. SİSTEM API ROTALARI (SYSTEM API ROUTES)
@@ -48,6 +51,7 @@ system_service = SystemService() if SystemService else None
 # -------------------------------------------------------------------------
 
 @system_bp.route('/health', methods=['GET'])
+@rate_limit(None)
 def health_check():
     """4.1.1. Sistem durumunu kontrol eder."""
     if system_service:
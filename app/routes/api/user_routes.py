@@ -27,16 +27,22 @@
 # =============================================================================
 # 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
 # =============================================================================
+import logging
 from flask import Blueprint, jsonify, request, session
 from datetime import datetime
 
+from app.services.rate_limiter import rate_limit
+from app.utils.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
 # Create the user blueprint
 user_bp = Blueprint('user', __name__)
 
 # Import services here to avoid circular imports
 try:
     from app.services import get_user_service
-    from app.services.auth_service import logout_user
+    from app.services.auth_service import logout_user, regenerate_session
 except ImportError as e:
     get_user_service = None
 
@@ -45,6 +51,19 @@ except ImportError as e:
 # =============================================================================
 # Servisler endpoint'lerde dinamik olarak alınacak
 
+@user_bp.errorhandler(ServiceUnavailableError)
+def handle_service_unavailable(error):
+    """Şifre hash kuyruğu doluyken isteği bekletmeden 503 ile reddeder."""
+    response = jsonify({
+        'status': 'error',
+        'message': error.message,
+        'details': error.details
+    })
+    response.status_code = 503
+    if error.retry_after:
+        response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
 # =============================================================================
 # 5.0. KULLANICI API ROTALARI (USER API ROUTES)
 # =============================================================================
@@ -113,6 +132,7 @@ def create_user():
 # -------------------------------------------------------------------------
 
 @user_bp.route('/register', methods=['POST'])
+@rate_limit('auth')
 def register():
     """5.2.1. Kullanıcı kayıt işlemini gerçekleştirir."""
     user_service = get_user_service()
@@ -144,61 +164,51 @@ def register():
         }), 400  # 400 Bad Request
 
 @user_bp.route('/login', methods=['POST'])
+@rate_limit('auth')
 def login():
     """5.2.2. Kullanıcı giriş işlemini gerçekleştirir."""
-    print('=== LOGIN DEBUG (API ROUTE) ===')
-    print(f'Request method: {request.method}')
-    print(f'Request path: {request.path}')
-    print(f'Request headers: {dict(request.headers)}')
-    
     user_service = get_user_service()
     if not user_service:
-        print('ERROR: User service not available')
+        logger.error("Login rejected: user service not available")
         return jsonify({
             'status': 'error',
             'message': 'User service not available'
         }), 500
     
     data = request.get_json()
-    print(f'Received JSON data: {data}')
     
     if not data:
-        print('ERROR: Invalid JSON received')
+        logger.debug("Login rejected: invalid JSON body")
         return jsonify({'status': 'error', 'message': 'Invalid JSON'}), 400
 
-    print('Calling user_service.login_user...')
     # Login iş mantığı servis katmanına devredildi.
     success, result = user_service.login_user(data)
-    
-    print(f'Login service result - Success: {success}, Result: {result}')
 
     if success:
-        print('Login successful, setting session...')
         # Session'a kullanıcı bilgilerini kaydet
         session['logged_in'] = True
         session['user_id'] = result['id']
         session['username'] = result['username']
         session['email'] = result['email']
         session['is_admin'] = result.get('is_admin', False)
-        
-        print(f'Session set: {dict(session)}')
+        # Girişten önceki oturum kimliği kullanılmaya devam etmez (session fixation)
+        regenerate_session()
+        logger.info("Login succeeded", extra={'user_id': result['id']})
         
         response_data = {
             'status': 'success',
             'message': 'Giriş başarılı',
             'data': result
         }
-        print(f'Returning success response: {response_data}')
         return jsonify(response_data), 200  # 200 OK
     else:
-        print(f'Login failed: {result}')
+        logger.info("Login failed: %s", result.get('message'))
         # Hata mesajı servisten geldiği için doğrudan kullanılır.
         error_response = {
             'status': 'error',
             'message': result.get('message', 'Giriş işlemi başarısız'),
             'details': result
         }
-        print(f'Returning error response (401): {error_response}')
         return jsonify(error_response), 401  # 401 Unauthorized
 
 @user_bp.route('/logout', methods=['POST'])
@@ -4,10 +4,16 @@ Handles all admin panel business logic and data operations
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
 from datetime import datetime, timedelta
 import csv
 import io
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
 
 from app.database.repositories.grade_repository import GradeRepository
 from app.database.repositories.subject_repository import SubjectRepository
@@ -15,11 +21,42 @@ from app.database.repositories.unit_repository import UnitRepository
 from app.database.repositories.topic_repository import TopicRepository
 from app.database.repositories.user_repository import UserRepository
 from app.database.repositories.activity_repository import ActivityRepository
+from app.database.repositories.curriculum_import_repository import (
+    CurriculumImportRepository, LEVEL_ORDER, name_key
+)
 from app.utils.exceptions import ValidationError, NotFoundError, DatabaseError
+from app.utils.validation_utils import validate_curriculum_data
+from app.services.job_runner import JobCancelled, JobContext, JobRunner, get_job_runner
+from app.services.user_cache import get_user_cache, invalidate_user
+from config import get_config
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Müfredat export ayarları
+EXPORT_COLUMNS = ['Grade', 'Subject', 'Unit', 'Topic', 'Description']
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl')
+}
+# Response'a yazılan her parçanın yaklaşık boyutu (karakter)
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Müfredat CSV import ayarları (kolon sırası export ile aynı)
+IMPORT_COLUMNS = EXPORT_COLUMNS
+IMPORT_FIELDS = ['grade_name', 'subject_name', 'unit_name', 'topic_name']
+IMPORT_HEADER_ALIASES = {
+    'grade': 'Grade', 'grade_name': 'Grade',
+    'subject': 'Subject', 'subject_name': 'Subject',
+    'unit': 'Unit', 'unit_name': 'Unit',
+    'topic': 'Topic', 'topic_name': 'Topic',
+    'description': 'Description'
+}
+# Yanıtta gösterilen hata satırı sayısı; tamamı hata raporundadır
+IMPORT_ERROR_PREVIEW = 10
+# Durum dosyası yazımlarını (istek thread'i + iş thread'i) sıralar
+_import_status_lock = threading.Lock()
+
 class AdminService:
     """Admin panel için tüm iş mantığını yöneten servis"""
     
@@ -31,6 +68,7 @@ class AdminService:
         self.topic_repo = TopicRepository()
         self.user_repo = UserRepository()
         self.activity_repo = ActivityRepository()
+        self.import_repo = CurriculumImportRepository()
     
     # =============================================================================
     # DASHBOARD & OVERVIEW
@@ -869,6 +907,7 @@ class AdminService:
             
             # Update user
             success = self.user_repo.update(user_id, update_data)
+            invalidate_user(user_id)
             if not success:
                 raise DatabaseError('Kullanıcı güncellenemedi')
             
@@ -906,6 +945,7 @@ class AdminService:
             new_admin_status = not existing_user.get('is_admin', False)
             
             success = self.user_repo.update(user_id, {'is_admin': new_admin_status})
+            invalidate_user(user_id)
             if not success:
                 raise DatabaseError('Admin durumu güncellenemedi')
             
@@ -923,116 +963,474 @@ class AdminService:
     # IMPORT/EXPORT
     # =============================================================================
     
-    def export_curriculum(self, format_type: str = 'csv') -> Dict[str, Any]:
-        """Müfredat verilerini export eder"""
+    def export_curriculum(self, format_type: str = 'csv', compress: bool = False,
+                          user_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Müfredat verilerini akış (stream) olarak export eder.
+        
+        Args:
+            format_type: 'csv' veya 'jsonl' (JSON Lines)
+            compress: True ise çıktı gzip ile sıkıştırılır (.gz)
+        
+        Returns:
+            {'format', 'filename', 'mimetype', 'stream'}; 'stream' bayt parçaları
+            üreten bir iterator'dır ve doğrudan Flask Response'a verilebilir.
+        """
+        format_type = (format_type or 'csv').lower()
+        if format_type not in EXPORT_FORMATS:
+            raise ValidationError('Desteklenmeyen export formatı')
+        
         try:
-            if format_type.lower() == 'csv':
-                return self._export_curriculum_csv()
-            else:
-                raise ValidationError('Desteklenmeyen export formatı')
-                
-        except Exception as e:
-            logger.error(f"Error exporting curriculum: {str(e)}")
-            raise DatabaseError(f"Export işlemi başarısız: {str(e)}")
-    
-    def _export_curriculum_csv(self) -> Dict[str, Any]:
-        """Müfredat verilerini CSV formatında export eder"""
-        try:
-            # Get all curriculum data
-            grades = self.grade_repo.get_all()
-            subjects = self.subject_repo.get_all_with_grade()
-            units = self.unit_repo.get_all_with_subject()
-            topics = self.topic_repo.get_all_with_unit()
-            
-            # Create CSV content
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write headers
-            writer.writerow(['Grade', 'Subject', 'Unit', 'Topic', 'Description'])
-            
-            # Write data
-            for grade in grades:
-                grade_name = grade['grade_name']
-                
-                for subject in subjects:
-                    if subject['grade_id'] == grade['id']:
-                        subject_name = subject['subject_name']
-                        subject_desc = subject.get('description', '')
-                        
-                        for unit in units:
-                            if unit['subject_id'] == subject['id']:
-                                unit_name = unit['unit_name']
-                                unit_desc = unit.get('description', '')
-                                
-                                for topic in topics:
-                                    if topic['unit_id'] == unit['id']:
-                                        topic_name = topic['topic_name']
-                                        topic_desc = topic.get('description', '')
-                                        
-                                        writer.writerow([
-                                            grade_name,
-                                            subject_name,
-                                            unit_name,
-                                            topic_name,
-                                            topic_desc or unit_desc or subject_desc
-                                        ])
-            
-            csv_content = output.getvalue()
-            output.close()
+            mimetype, extension = EXPORT_FORMATS[format_type]
+            encoder = self._encode_csv if format_type == 'csv' else self._encode_jsonl
+            stream = self._export_stream(encoder(self.topic_repo.iter_curriculum_rows()))
+            filename = f'curriculum_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+            if compress:
+                stream = self._gzip_stream(stream)
+                filename += '.gz'
+                mimetype = 'application/gzip'
             
             # Log activity
-            self._log_activity('curriculum_exported', 'Müfredat export edildi')
+            self._log_activity('curriculum_exported', f'Müfredat export edildi ({format_type})', user_id=user_id)
             
             return {
-                'format': 'csv',
-                'content': csv_content,
-                'filename': f'curriculum_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                'record_count': len(topics)
+                'format': format_type,
+                'filename': filename,
+                'mimetype': mimetype,
+                'stream': stream
             }
             
         except Exception as e:
-            logger.error(f"Error creating CSV export: {str(e)}")
-            raise DatabaseError(f"CSV export oluşturulamadı: {str(e)}")
+            logger.error(f"Error exporting curriculum: {str(e)}")
+            raise DatabaseError(f"Export işlemi başarısız: {str(e)}")
+    
+    def _export_rows(self, rows: Iterable[Dict[str, Any]]) -> Iterator[List[str]]:
+        """JOIN satırlarını export kolonlarına (EXPORT_COLUMNS) çevirir"""
+        for row in rows:
+            yield [
+                row['grade_name'],
+                row['subject_name'],
+                row['unit_name'],
+                row['topic_name'],
+                row.get('topic_description') or row.get('unit_description') or row.get('subject_description') or ''
+            ]
+    
+    def _encode_csv(self, rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """Satırları CSV metin parçalarına (~EXPORT_CHUNK_SIZE) çevirir"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for values in self._export_rows(rows):
+            writer.writerow(values)
+            if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
     
-    def import_curriculum(self, file) -> Dict[str, Any]:
-        """CSV dosyasından müfredat verilerini import eder"""
+    def _encode_jsonl(self, rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """Satırları JSON Lines metin parçalarına (~EXPORT_CHUNK_SIZE) çevirir"""
+        keys = [column.lower() for column in EXPORT_COLUMNS]
+        lines: List[str] = []
+        size = 0
+        for values in self._export_rows(rows):
+            line = json.dumps(dict(zip(keys, values)), ensure_ascii=False) + '\n'
+            lines.append(line)
+            size += len(line)
+            if size >= EXPORT_CHUNK_SIZE:
+                yield ''.join(lines)
+                lines, size = [], 0
+        yield ''.join(lines)
+    
+    def _export_stream(self, chunks: Iterable[str]) -> Iterator[bytes]:
+        """Metin parçalarını UTF-8 baytlara çevirir; akış ortasındaki hataları loglar"""
+        count = 0
         try:
-            # Read CSV file
-            csv_content = file.read().decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
-            
-            imported_count = 0
-            errors = []
-            
-            for row_num, row in enumerate(csv_reader, start=2):  # Start from 2 (1 is header)
-                try:
-                    # Validate required fields
-                    if not all([row.get('Grade'), row.get('Subject'), row.get('Unit'), row.get('Topic')]):
-                        errors.append(f"Satır {row_num}: Gerekli alanlar eksik")
-                        continue
-                    
-                    # Import logic here (simplified for now)
-                    # TODO: Implement full import logic
-                    imported_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"Satır {row_num}: {str(e)}")
-            
-            # Log activity
-            self._log_activity('curriculum_imported', f'Müfredat import edildi: {imported_count} kayıt')
-            
-            return {
-                'imported_count': imported_count,
-                'error_count': len(errors),
-                'errors': errors[:10],  # Limit errors to first 10
-                'total_rows': row_num - 1
-            }
+            for chunk in chunks:
+                if chunk:
+                    count += 1
+                    yield chunk.encode('utf-8')
+        except Exception as e:
+            # Başlıklar gönderildiği için durum kodu değiştirilemez; yarım dosya loglanır
+            logger.error(f"Curriculum export stream aborted after {count} chunks: {str(e)}")
+            raise
+    
+    def _gzip_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Bayt parçalarını bellekte biriktirmeden gzip formatında sıkıştırır"""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    
+    def import_curriculum(self, file, background: bool = False) -> Dict[str, Any]:
+        """
+        CSV dosyasından müfredat verilerini import eder.
+        
+        Yüklenen dosya önce diske kaydedilir (belleğe alınmaz), ardından
+        satır satır okunup IMPORT_BATCH_SIZE'lık batch'ler halinde doğrulanır
+        ve her batch kendi transaction'ında toplu upsert edilir. Hatalı satırlar
+        indirilebilir bir hata raporuna (CSV) yazılır.
+        
+        Args:
+            file: Yüklenen dosya (werkzeug FileStorage)
+            background: True ise import 'curriculum_import' arka plan işi olarak
+                        kuyruğa alınır ve hemen {'import_id', 'job_id',
+                        'status': 'queued'} döner; ilerleme /api/admin/jobs/<id>
+                        veya get_import_status() ile sorgulanır.
+        """
+        try:
+            import_id = uuid.uuid4().hex
+            import_dir = self._import_dir()
+            upload_path = os.path.join(import_dir, f'{import_id}.csv')
+            file.save(upload_path)
+            
+            if not background:
+                return self._run_curriculum_import(import_id, upload_path)
+            
+            # 'queued' iş kuyruğa girmeden yazılır; hızlı bir worker'ın
+            # 'running'/'completed' durumunun üzerine yazılamaz
+            self._write_import_status(import_id, {'import_id': import_id, 'status': 'queued'})
+            job = get_job_runner().submit(
+                'curriculum_import',
+                {'import_id': import_id, 'upload_path': upload_path},
+                user_id=self._current_user_id()
+            )
+            return self._patch_import_status(import_id, {'job_id': job['job_id']})
             
         except Exception as e:
             logger.error(f"Error importing curriculum: {str(e)}")
             raise DatabaseError(f"Import işlemi başarısız: {str(e)}")
     
+    def get_import_status(self, import_id: str) -> Dict[str, Any]:
+        """Import işleminin son durumunu döner"""
+        path = self._import_path(import_id, '.status.json')
+        if not os.path.exists(path):
+            raise NotFoundError('Import işlemi bulunamadı')
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def get_import_error_report(self, import_id: str) -> str:
+        """Import hata raporunun (CSV) dosya yolunu döner"""
+        path = self._import_path(import_id, '.errors.csv')
+        if not os.path.exists(path):
+            raise NotFoundError('Hata raporu bulunamadı')
+        return path
+    
+    def _run_curriculum_import(self, import_id: str, upload_path: str,
+                               user_id: Optional[int] = None, job: Optional[JobContext] = None) -> Dict[str, Any]:
+        """
+        Kaydedilmiş CSV'yi batch'ler halinde import eder.
+        
+        Bellekte en fazla bir batch'in satırları, batch içi doğrulama önbelleği
+        ve ilk IMPORT_ERROR_PREVIEW hata tutulur; geri kalan her şey diskteki
+        hata raporuna ve durum dosyasına yazılır. Arka plan işi olarak
+        çalışırken her batch sonunda ilerleme bildirilir ve iptal kontrol
+        edilir; iptalde o ana kadar yazılan batch'ler kalır. Arka plan işinde
+        import başarısız olursa hata yeniden fırlatılır (iş 'failed' kapanır).
+        """
+        started = time.perf_counter()
+        status: Dict[str, Any] = {
+            'import_id': import_id,
+            'status': 'running',
+            'total_rows': 0,
+            'imported_count': 0,
+            'error_count': 0,
+            'errors': [],
+            'counts': {level: {'created': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0} for level in LEVEL_ORDER},
+            'bytes_total': os.path.getsize(upload_path),
+            'bytes_read': 0,
+            'error_report': None
+        }
+        if job is not None:
+            status['job_id'] = job.job_id
+        failure: Optional[Exception] = None
+        error_path = self._import_path(import_id, '.errors.csv')
+        error_file = None
+        error_writer = None
+        state: Dict[str, Any] = {}
+        batch_size = max(1, int(getattr(get_config().APP, 'CURRICULUM_IMPORT_BATCH_SIZE', 2000)))
+        
+        def record_error(row_num: int, message: str, values: List[str]) -> None:
+            nonlocal error_file, error_writer
+            if error_writer is None:
+                error_file = open(error_path, 'w', newline='', encoding='utf-8')
+                error_writer = csv.writer(error_file)
+                error_writer.writerow(['Row', 'Error'] + IMPORT_COLUMNS)
+            error_writer.writerow([row_num, message] + values)
+            status['error_count'] += 1
+            if len(status['errors']) < IMPORT_ERROR_PREVIEW:
+                status['errors'].append(f"Satır {row_num}: {message}")
+        
+        try:
+            self._write_import_status(import_id, status)
+            with open(upload_path, 'r', newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                columns = self._map_import_header(header or [])
+                if columns is None:
+                    raise ValidationError(f"CSV başlığı eksik; gerekli kolonlar: {', '.join(IMPORT_COLUMNS[:4])}")
+                
+                batch: List[tuple] = []
+                for row_num, row in enumerate(reader, start=2):  # 1. satır başlık
+                    if not any(cell.strip() for cell in row):
+                        continue
+                    values = [row[index].strip() if index is not None and index < len(row) else ''
+                              for index in columns]
+                    batch.append((row_num, values))
+                    status['total_rows'] += 1
+                    if len(batch) >= batch_size:
+                        state = self._import_batch(batch, state, status, record_error)
+                        batch = []
+                        status['bytes_read'] = f.buffer.tell()
+                        self._write_import_status(import_id, status)
+                        if job is not None:
+                            job.progress(status['bytes_read'], status['bytes_total'],
+                                         f"{status['total_rows']} satır işlendi")
+                            job.check_cancelled()
+                if batch:
+                    state = self._import_batch(batch, state, status, record_error)
+            
+            status['bytes_read'] = status['bytes_total']
+            status['status'] = 'completed'
+            self._log_activity(
+                'curriculum_imported',
+                f"Müfredat import edildi: {status['imported_count']} kayıt, {status['error_count']} hata",
+                user_id=user_id
+            )
+        except JobCancelled:
+            status['status'] = 'cancelled'
+        except Exception as e:
+            logger.error(f"Curriculum import {import_id} failed: {str(e)}")
+            failure = e
+            status['status'] = 'failed'
+            status['message'] = str(e)
+        finally:
+            if error_file is not None:
+                error_file.close()
+                status['error_report'] = f'/api/admin/import/curriculum/{import_id}/errors'
+            status['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            self._write_import_status(import_id, status)
+            try:
+                os.remove(upload_path)
+            except OSError:
+                pass
+        
+        if failure is not None and job is not None:
+            raise failure
+        if status['status'] == 'failed' and status['total_rows'] == 0:
+            raise ValidationError(status.get('message', 'Import işlemi başarısız'))
+        return status
+    
+    # =============================================================================
+    # BACKGROUND JOBS
+    # =============================================================================
+    
+    def register_jobs(self, runner: JobRunner) -> None:
+        """Admin işlemlerini arka plan iş tipleri olarak kaydeder"""
+        runner.register('curriculum_import', self._curriculum_import_job)
+        runner.register('curriculum_export', self._curriculum_export_job)
+        runner.register('activity_cleanup', self._activity_cleanup_job)
+        runner.register('ensure_indexes', self._ensure_indexes_job)
+        runner.register('retention_purge', self._retention_purge_job)
+    
+    def submit_job(self, job_type: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Bir admin işlemini oturumdaki kullanıcı adına kuyruğa alır"""
+        return get_job_runner().submit(job_type, params or {}, user_id=self._current_user_id())
+    
+    def get_export_file(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Tamamlanmış export işinin dosya bilgisini döner"""
+        result = job.get('result') or {}
+        if job.get('job_type') != 'curriculum_export' or job.get('status') != 'completed':
+            raise NotFoundError('İndirilebilir export bulunamadı')
+        path = os.path.join(self._work_dir('exports'), os.path.basename(result.get('file', '')))
+        if not result.get('file') or not os.path.exists(path):
+            raise NotFoundError('Export dosyası bulunamadı')
+        return {'path': path, 'filename': result['filename'], 'mimetype': result['mimetype']}
+    
+    def _curriculum_import_job(self, job: JobContext, import_id: str, upload_path: str) -> Dict[str, Any]:
+        """'curriculum_import' işi: kaydedilmiş CSV'yi batch'ler halinde import eder"""
+        return self._run_curriculum_import(import_id, upload_path, user_id=job.user_id, job=job)
+    
+    def _curriculum_export_job(self, job: JobContext, format_type: str = 'csv',
+                               compress: bool = False) -> Dict[str, Any]:
+        """'curriculum_export' işi: export akışını UPLOAD_DIR/exports altına dosya olarak yazar"""
+        export = self.export_curriculum(format_type, compress=compress, user_id=job.user_id)
+        path = os.path.join(self._work_dir('exports'), f"{job.job_id}_{export['filename']}")
+        size = 0
+        try:
+            with open(path, 'wb') as f:
+                for chunk in export['stream']:
+                    f.write(chunk)
+                    size += len(chunk)
+                    job.progress(size, message=f'{size} bayt yazıldı')
+                    job.check_cancelled()
+            job.progress(size, size, message=f'{size} bayt yazıldı', force=True)
+        except BaseException:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            raise
+        return {
+            'file': os.path.basename(path),
+            'filename': export['filename'],
+            'mimetype': export['mimetype'],
+            'size': size,
+            'download_url': f'/api/admin/jobs/{job.job_id}/download'
+        }
+    
+    def _activity_cleanup_job(self, job: JobContext, days: int = 90) -> Dict[str, Any]:
+        """'activity_cleanup' işi: `days` günden eski aktivite kayıtlarını siler"""
+        deleted = self.activity_repo.cleanup_old_activities(int(days))
+        self._log_activity('activities_cleaned', f'{deleted} eski aktivite silindi', user_id=job.user_id)
+        return {'deleted': deleted, 'days': int(days)}
+    
+    def _retention_purge_job(self, job: JobContext, policies: Optional[List[str]] = None,
+                             dry_run: bool = False) -> Dict[str, Any]:
+        """'retention_purge' işi: saklama politikalarını parça parça uygular"""
+        from app.database.migrations.retention_manager import RetentionManager
+        reports = RetentionManager(self.activity_repo.db_connection).purge_all(
+            policies, dry_run=bool(dry_run), should_stop=job.is_cancelled,
+            progress=lambda deleted: job.progress(deleted, message=f'{deleted} satır silindi')
+        )
+        job.check_cancelled()
+        if not dry_run:
+            total = sum(sum(r.get('deleted', {}).values()) for r in reports.values())
+            self._log_activity('retention_purged', f'{total} süresi dolmuş kayıt silindi',
+                               user_id=job.user_id)
+        return {'dry_run': bool(dry_run), 'policies': reports}
+    
+    def _ensure_indexes_job(self, job: JobContext) -> Dict[str, Any]:
+        """'ensure_indexes' işi: kritik performans index'lerini oluşturur"""
+        from app.database.migrations.index_manager import IndexManager
+        success = IndexManager().ensure_indexes()
+        if not success:
+            raise DatabaseError("Index'ler oluşturulamadı")
+        return {'success': success}
+    
+    def _import_batch(self, batch: List[tuple], state: Dict[str, Any], status: Dict[str, Any],
+                      record_error) -> Dict[str, Any]:
+        """
+        Bir batch'i doğrular ve tek transaction'da upsert eder.
+        
+        Aynı sınıf/ders/ünite adları binlerce satırda tekrarlandığından
+        validate_curriculum_data her (alan, değer) çifti için batch başına bir
+        kez çağrılır. Batch yazılamazsa satırları hata raporuna düşer ve
+        önbellek (state) sıfırlanır.
+        
+        Returns:
+            Sonraki batch'te kullanılacak state
+        """
+        checked: Dict[tuple, List[str]] = {}
+        plan: Dict[str, List[Dict[str, Any]]] = {level: [] for level in LEVEL_ORDER}
+        planned = set()
+        valid_rows: List[tuple] = []
+        
+        for row_num, values in batch:
+            grade, subject, unit, topic, description = values
+            missing = [IMPORT_COLUMNS[i] for i, value in enumerate(values[:4]) if not value]
+            if missing:
+                record_error(row_num, f"Gerekli alanlar eksik: {', '.join(missing)}", values)
+                continue
+            
+            messages: List[str] = []
+            for field, value in zip(IMPORT_FIELDS, values[:4]):
+                key = (field, value)
+                if key not in checked:
+                    checked[key] = validate_curriculum_data({field: value}).get(field, [])
+                messages.extend(checked[key])
+            if messages:
+                record_error(row_num, '; '.join(messages), values)
+                continue
+            
+            valid_rows.append((row_num, values))
+            path = (grade, subject, unit, topic)
+            keys = tuple(name_key(part) for part in path[:3])
+            for depth, level in enumerate(LEVEL_ORDER):
+                # Üst seviyeler batch içinde bir kez planlanır; konular her satırda
+                if depth < 3:
+                    if keys[:depth + 1] in planned:
+                        continue
+                    planned.add(keys[:depth + 1])
+                plan[level].append({
+                    'name': path[depth],
+                    'attrs': {'description': description} if description and level == LEVEL_ORDER[-1] else {},
+                    'parent': {'path': path[:depth]} if depth else None
+                })
+        
+        if not valid_rows:
+            return state
+        try:
+            with self.import_repo.db as conn:
+                report = self.import_repo.apply_plan(plan, conn, state)
+        except Exception as e:
+            logger.error(f"Curriculum import batch failed: {str(e)}")
+            for row_num, values in valid_rows:
+                record_error(row_num, f"Veritabanı hatası: {str(e)}", values)
+            return {}
+        
+        status['imported_count'] += len(valid_rows)
+        for level in LEVEL_ORDER:
+            for key, value in report[level].items():
+                status['counts'][level][key] += value
+        return state
+    
+    def _map_import_header(self, header: List[str]) -> Optional[List[Optional[int]]]:
+        """CSV başlığını IMPORT_COLUMNS sırasına göre kolon indekslerine çevirir"""
+        positions = {}
+        for index, name in enumerate(header):
+            canonical = IMPORT_HEADER_ALIASES.get(name.strip().lower())
+            if canonical and canonical not in positions:
+                positions[canonical] = index
+        if any(column not in positions for column in IMPORT_COLUMNS[:4]):
+            return None
+        return [positions.get(column) for column in IMPORT_COLUMNS]
+    
+    def _import_dir(self) -> str:
+        """Import dosyalarının (yükleme, durum, hata raporu) tutulduğu dizin"""
+        return self._work_dir('imports')
+    
+    def _work_dir(self, name: str) -> str:
+        """UPLOAD_DIR altında import/export çalışma dizinini döner (yoksa oluşturur)"""
+        path = os.path.join(str(get_config().APP.UPLOAD_DIR), name)
+        os.makedirs(path, exist_ok=True)
+        return path
+    
+    def _import_path(self, import_id: str, suffix: str) -> str:
+        """import_id'yi doğrulayıp dosya yolunu döner (path traversal'a karşı)"""
+        if not isinstance(import_id, str) or len(import_id) != 32 or \
+                any(ch not in '0123456789abcdef' for ch in import_id):
+            raise NotFoundError('Import işlemi bulunamadı')
+        return os.path.join(self._import_dir(), f'{import_id}{suffix}')
+    
+    def _write_import_status(self, import_id: str, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Durum dosyasını atomik olarak yazar (okuyucu yarım JSON görmez)"""
+        status['updated_at'] = datetime.now().isoformat()
+        path = self._import_path(import_id, '.status.json')
+        with _import_status_lock:
+            self._replace_status_file(path, status)
+        return status
+    
+    def _patch_import_status(self, import_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Güncel durum dosyasına alan ekler; durumu (status) değiştirmez"""
+        path = self._import_path(import_id, '.status.json')
+        with _import_status_lock:
+            with open(path, 'r', encoding='utf-8') as f:
+                status = json.load(f)
+            status.update(fields)
+            self._replace_status_file(path, status)
+        return status
+    
+    @staticmethod
+    def _replace_status_file(path: str, status: Dict[str, Any]) -> None:
+        """Yazıcı başına ayrı geçici dosyaya yazıp yerine taşır"""
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
     # =============================================================================
     # SYSTEM STATUS
     # =============================================================================
@@ -1058,6 +1456,39 @@ class AdminService:
             except Exception:
                 status['database'] = 'unhealthy'
             
+            # Şifre hash havuzu: kuyruk derinliği, reddedilen istekler, gecikme
+            from app.services.password_hasher import get_password_hasher
+            status['password_hasher'] = get_password_hasher().stats()
+            # Yetki kontrolü kullanıcı önbelleği: isabet oranı
+            status['user_cache'] = get_user_cache().stats()
+            # Sunucu tarafı oturum deposu (etkinse)
+            from flask import current_app
+            session_interface = getattr(current_app, 'session_interface', None)
+            if hasattr(session_interface, 'stats'):
+                status['sessions'] = session_interface.stats()
+            # API rate limiter: politika bazında reddedilen istekler
+            from app.services.rate_limiter import get_rate_limiter
+            status['rate_limiter'] = get_rate_limiter().stats()
+            # JSON provider ve soru içeriği önbelleği
+            if hasattr(current_app.json, 'info'):
+                status['json'] = current_app.json.info()
+            from app.services.response_cache import get_response_cache
+            status['response_cache'] = get_response_cache().stats()
+            for name in ('compression', 'static_assets', 'asset_manifest'):
+                if name in current_app.extensions:
+                    status[name] = current_app.extensions[name].stats()
+            # Arka planda örneklenen sistem/uygulama metrikleri (son örnek)
+            from app.services.metrics_sampler import ensure_metrics_sampler
+            sampler = ensure_metrics_sampler()
+            if sampler is not None:
+                status['metrics'] = {'sampler': sampler.stats(), 'latest': sampler.latest()}
+            # Açılış aşama süreleri ve worker warm-up raporu
+            profiler = current_app.extensions.get('startup_profile')
+            if profiler is not None:
+                status['startup'] = profiler.report()
+            if 'warmup' in current_app.extensions:
+                status['warmup'] = current_app.extensions['warmup']
+            
             return status
             
         except Exception as e:
@@ -1076,12 +1507,17 @@ class AdminService:
     # UTILITY METHODS
     # =============================================================================
     
-    def _log_activity(self, action: str, details: str) -> None:
-        """Aktivite loglarını kaydeder"""
+    def _current_user_id(self) -> Optional[int]:
+        """Request içindeyse oturumdaki kullanıcı ID'sini döner"""
+        from flask import has_request_context, session
+        return session.get('user_id') if has_request_context() else None
+    
+    def _log_activity(self, action: str, details: str, user_id: Optional[int] = None) -> None:
+        """Aktivite loglarını kaydeder (arka plan işlerinde user_id açıkça verilir)"""
         try:
             # Get current user from session (if available)
-            from flask import session
-            user_id = session.get('user_id')
+            if user_id is None:
+                user_id = self._current_user_id()
             
             activity_data = {
                 'user_id': user_id,
@@ -0,0 +1,674 @@
+# =============================================================================
+# ASSET PIPELINE
+# =============================================================================
+# Sayfa başına JS/CSS bundle'ları (Node araç zinciri gerektirmez):
+#   - 'module': giriş dosyasından başlayarak göreli ES module import grafiği
+#     çözülür. Modüller bağımlılık sırasıyla tek dosyada, her biri kendi
+#     kapsamında (IIFE) birleştirilir; import/export satırları modül
+#     tablosundan okunan yerel sabitlere çevrilir. Döngüsel import, dış
+#     (bare/URL) import, dinamik import() ve `export *` desteklenmez; bu
+#     durumlar derleme hatasıdır.
+#   - 'script': klasik scriptler sırayla birleştirilir.
+#   - 'css': dosyalar ve göreli @import'ları satır içine alınır (her dosya
+#     bir kez), url() yolları bundle klasörüne göre yeniden yazılır.
+# Çıktılar küçültülür (yorum ve gereksiz boşluklar; satır sonları ASI için
+# korunur), içerik hash'li adla app/static/dist/ altına yazılır ve
+# dist/manifest.json'a kaydedilir.
+#
+# Şablonlarda {{ asset_bundle('quiz_educational.js') }} manifest'teki
+# bundle'ı ekler. Manifest yoksa, ASSET_BUNDLES kapalıysa veya debug'da
+# kaynak dosyalar bundle'dan yeniyse kaynak dosyalar tek tek eklenir.
+#
+# Derleme: python scripts/static_assets.py build
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. BUNDLE TANIMLARI
+# 5.0. KÜÇÜLTME
+#   5.1. minify_js(source)
+#   5.2. minify_css(source)
+# 6.0. BUNDLE ÜRETİMİ
+#   6.1. bundle_modules(static_dir, entry)
+#   6.2. bundle_scripts(static_dir, files)
+#   6.3. bundle_css(static_dir, files, output_dir)
+#   6.4. build_bundles(static_dir, names, prune)
+# 7.0. MANIFEST VE ŞABLON YARDIMCISI
+#   7.1. AssetManifest
+#   7.2. init_asset_pipeline(app, config_class)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import json
+import logging
+import os
+import posixpath
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from markupsafe import Markup, escape
+
+from app.services.static_assets import HASH_LENGTH, content_hash
+from app.utils.exceptions import FileOperationError
+
+logger = logging.getLogger(__name__)
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# =============================================================================
+# 4.0. BUNDLE TANIMLARI
+# =============================================================================
+# Ad -> tanım. Ad, şablondaki asset_bundle() argümanı ve çıktı dosyasının
+# köküdür; yollar static klasörüne görelidir.
+
+ASSET_BUNDLES: Dict[str, Dict[str, Any]] = {
+    'base.css': {'type': 'css', 'files': [
+        'css/plugins/bootstrap-grid.css',
+        'css/base.css',
+        'css/components/navbar.css',
+        'css/components/footer.css',
+    ]},
+    'quiz_preloader.js': {'type': 'script', 'files': ['js/components/quiz-preloader.js']},
+    'quiz_normal.css': {'type': 'css', 'files': [
+        'css/components/quiz-preloader.css',
+        'css/quiz/quiz_normal/quiz_normal.css',
+    ]},
+    'quiz_normal.js': {'type': 'module', 'entry': 'js/quiz/quiz_normal/main.js'},
+    'quiz_educational.css': {'type': 'css', 'files': [
+        'css/components/quiz-preloader.css',
+        'css/quiz/quiz_educational/quiz_educational.css',
+    ]},
+    'quiz_educational.js': {'type': 'module', 'entry': 'js/quiz/quiz_educational/main.js'},
+}
+
+# =============================================================================
+# 5.0. KÜÇÜLTME
+# =============================================================================
+# Ayrıştırıcı değil, dizgi/şablon/regex literal'lerini tanıyan bir tarayıcı:
+# literal içerikleri olduğu gibi kopyalanır, yalnızca kod kısmındaki yorumlar
+# ve gereksiz boşluklar atılır.
+
+_WHITESPACE = ' \t\r\n\f\v\u00a0\ufeff'
+_WORD = re.compile(r'[\w$\\\u0080-\uffff]+')
+_REGEX_PRECEDERS = frozenset('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = frozenset({'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                             'void', 'throw', 'instanceof', 'yield', 'await'})
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch in '_$\\' or ord(ch) > 127
+
+
+def _needs_space(prev: str, nxt: str) -> bool:
+    """İki token arasındaki boşluk atılırsa anlam değişir mi."""
+    if _is_word_char(prev) and _is_word_char(nxt):
+        return True
+    if prev.isdigit() and nxt == '.':
+        return True
+    return (prev + nxt) in ('++', '--', '+-', '-+', '//', '/*', '->', '<!')
+
+
+def _scan_quoted(source: str, i: int, quote: str) -> int:
+    """Tırnaklı dizginin bittiği indeksi (kapanış tırnağından sonrası) döner."""
+    n = len(source)
+    i += 1
+    while i < n:
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+            continue
+        i += 1
+        if ch == quote:
+            break
+    return i
+
+
+def _scan_template(source: str, i: int) -> Tuple[int, bool]:
+    """
+    Şablon literal'inin metin kısmını tarar.
+
+    Returns:
+        (indeks, ifade_mi): ifade_mi True ise `${` sonrasında durulmuştur.
+    """
+    n = len(source)
+    while i < n:
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+        elif ch == '`':
+            return i + 1, False
+        elif ch == '$' and source.startswith('${', i):
+            return i + 2, True
+        else:
+            i += 1
+    return n, False
+
+
+def _scan_regex(source: str, i: int) -> Optional[int]:
+    """i'deki '/' bir regex literal'i başlatıyorsa bitiş indeksini döner."""
+    n = len(source)
+    j = i + 1
+    in_class = False
+    while j < n:
+        ch = source[j]
+        if ch == '\\':
+            j += 2
+            continue
+        if ch == '\n':
+            return None
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            j += 1
+            while j < n and (source[j].isalpha()):
+                j += 1
+            return j
+        j += 1
+    return None
+
+
+def minify_js(source: str) -> str:
+    """
+    5.1. JS kaynağından yorumları ve gereksiz boşlukları atar.
+
+    Satır sonları korunur (otomatik noktalı virgül kuralları değişmez);
+    dizgi, şablon ve regex literal'leri aynen kalır.
+    """
+    out: List[str] = []
+    last = ''          # son yazılan anlamlı karakter
+    last_word = ''     # son yazılan tanımlayıcı/anahtar kelime
+    templates: List[int] = []  # açık `${` ifadelerinin süslü parantez derinlikleri
+    i, n = 0, len(source)
+
+    while i < n:
+        ch = source[i]
+
+        # Boşluk ve yorumlar: tek bir ayraca indirgenir
+        if ch in _WHITESPACE or source.startswith('//', i) or source.startswith('/*', i):
+            newline = False
+            while i < n:
+                ch = source[i]
+                if ch in _WHITESPACE:
+                    newline = newline or ch == '\n'
+                    i += 1
+                elif source.startswith('//', i):
+                    end = source.find('\n', i)
+                    i = n if end < 0 else end
+                elif source.startswith('/*', i):
+                    end = source.find('*/', i + 2)
+                    end = n if end < 0 else end + 2
+                    newline = newline or '\n' in source[i:end]
+                    i = end
+                else:
+                    break
+            if out and i < n:
+                if newline:
+                    out.append('\n')
+                    last = '\n'
+                elif _needs_space(last, source[i]):
+                    out.append(' ')
+            continue
+
+        if ch in '\'"':
+            end = _scan_quoted(source, i, ch)
+            out.append(source[i:end])
+            last, last_word, i = ch, '', end
+            continue
+
+        if ch == '`' or (ch == '}' and templates and templates[-1] == 0):
+            if ch == '}':
+                templates.pop()
+            end, in_expression = _scan_template(source, i + 1)
+            out.append(source[i:end])
+            if in_expression:
+                templates.append(0)
+                last = '{'
+            else:
+                last = '`'
+            last_word, i = '', end
+            continue
+
+        if ch == '/':
+            regex_allowed = (last in _REGEX_PRECEDERS or last in ('', '\n', '}')
+                             or last_word in _REGEX_KEYWORDS)
+            end = _scan_regex(source, i) if regex_allowed else None
+            if end is not None:
+                out.append(source[i:end])
+                last, last_word, i = '/', '', end
+                continue
+
+        match = _WORD.match(source, i)
+        if match:
+            word = match.group()
+            out.append(word)
+            last, last_word, i = word[-1], word, match.end()
+            continue
+
+        if templates:
+            if ch == '{':
+                templates[-1] += 1
+            elif ch == '}':
+                templates[-1] -= 1
+        out.append(ch)
+        last, last_word, i = ch, '', i + 1
+
+    return ''.join(out).strip() + '\n'
+
+
+def minify_css(source: str) -> str:
+    """5.2. CSS kaynağından yorumları ve gereksiz boşlukları atar."""
+    out: List[str] = []
+    pending_space = False
+    i, n = 0, len(source)
+    while i < n:
+        ch = source[i]
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            pending_space = True
+            continue
+        if ch in _WHITESPACE:
+            pending_space = True
+            i += 1
+            continue
+        if pending_space and out and out[-1][-1] not in '{};,>(:' and ch not in '{};,>)!':
+            out.append(' ')
+        pending_space = False
+        if ch in '\'"':
+            end = _scan_quoted(source, i, ch)
+            out.append(source[i:end])
+            i = end
+            continue
+        if ch == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(ch)
+        i += 1
+    return ''.join(out).strip() + '\n'
+
+# =============================================================================
+# 6.0. BUNDLE ÜRETİMİ
+# =============================================================================
+
+_IMPORT_RE = re.compile(
+    r'^import\s*(?:(?P<clause>[\w$\s{},*]+?)\s*from\s*)?(?P<q>[\'"])(?P<spec>[^\'"]+)(?P=q)[ \t]*;?[ \t]*$',
+    re.M)
+_EXPORT_DEFAULT_DECL_RE = re.compile(r'^export default (?P<kind>class|function\*?|async function\*?) ?(?P<name>[\w$]+)', re.M)
+_EXPORT_DEFAULT_NAME_RE = re.compile(r'^export default (?P<name>[\w$]+)[ \t]*;?[ \t]*$', re.M)
+_EXPORT_DEFAULT_EXPR_RE = re.compile(r'^export default ', re.M)
+_EXPORT_DECL_RE = re.compile(r'^export (?P<kind>const|let|var|class|function\*?|async function\*?) ?(?P<name>[\w$]+)', re.M)
+_EXPORT_LIST_RE = re.compile(r'^export\s*\{(?P<names>[^}]*)\}[ \t]*;?[ \t]*$', re.M)
+_UNSUPPORTED_RE = re.compile(r'^(?:import|export)\b.*$', re.M)
+
+MODULE_TABLE = '__btk_modules'
+
+
+def _static_path(static_dir: str, relative: str) -> Path:
+    root = Path(static_dir).resolve()
+    path = (root / relative).resolve()
+    if root not in path.parents or not path.is_file():
+        raise FileOperationError(f"Asset not found: {relative}", file_path=relative, operation='bundle')
+    return path
+
+
+def _resolve_import(importer: str, spec: str) -> str:
+    if not spec.startswith(('./', '../')):
+        raise FileOperationError(f"Only relative imports can be bundled: '{spec}' in {importer}",
+                                 file_path=importer, operation='bundle')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+
+
+def _parse_import_clause(clause: str) -> Tuple[Optional[str], Optional[str], List[Tuple[str, str]]]:
+    """'A, { b as c }' -> (default, namespace, [(export, local), ...])"""
+    clause = clause.strip()
+    default = namespace = None
+    named: List[Tuple[str, str]] = []
+    brace = re.search(r'\{(.*)\}', clause, re.S)
+    if brace:
+        for part in brace.group(1).split(','):
+            part = part.strip()
+            if part:
+                pieces = part.split()
+                named.append((pieces[0], pieces[2] if len(pieces) == 3 and pieces[1] == 'as' else pieces[0]))
+        clause = (clause[:brace.start()] + clause[brace.end():]).strip()
+    star = re.search(r'\*\s*as\s+([\w$]+)', clause)
+    if star:
+        namespace = star.group(1)
+        clause = (clause[:star.start()] + clause[star.end():]).strip()
+    clause = clause.strip(', \n')
+    if clause:
+        default = clause
+    return default, namespace, named
+
+
+def _transform_module(path: str, source: str, module_ids: Dict[str, int]) -> Tuple[str, List[Tuple[str, str]]]:
+    """Küçültülmüş modül kaynağının import/export satırlarını yeniden yazar."""
+    exports: List[Tuple[str, str]] = []  # (dışa aktarılan ad, yerel ad)
+
+    def replace_import(match: 're.Match') -> str:
+        target = module_ids[_resolve_import(path, match.group('spec'))]
+        ref = f"{MODULE_TABLE}[{target}]"
+        if not match.group('clause'):
+            return ''
+        default, namespace, named = _parse_import_clause(match.group('clause'))
+        lines = []
+        if default:
+            lines.append(f"const {default}={ref}.default;")
+        if namespace:
+            lines.append(f"const {namespace}={ref};")
+        if named:
+            bindings = ','.join(name if name == local else f"{name}:{local}" for name, local in named)
+            lines.append(f"const{{{bindings}}}={ref};")
+        return '\n'.join(lines)
+
+    def replace_default_decl(match: 're.Match') -> str:
+        exports.append(('default', match.group('name')))
+        return f"{match.group('kind')} {match.group('name')}"
+
+    def replace_default_name(match: 're.Match') -> str:
+        exports.append(('default', match.group('name')))
+        return ''
+
+    def replace_default_expr(match: 're.Match') -> str:
+        exports.append(('default', '__default__'))
+        return 'const __default__='
+
+    def replace_decl(match: 're.Match') -> str:
+        exports.append((match.group('name'), match.group('name')))
+        return f"{match.group('kind')} {match.group('name')}"
+
+    def replace_list(match: 're.Match') -> str:
+        for part in match.group('names').split(','):
+            pieces = part.split()
+            if pieces:
+                local = pieces[0]
+                exports.append((pieces[2] if len(pieces) == 3 and pieces[1] == 'as' else local, local))
+        return ''
+
+    source = _IMPORT_RE.sub(replace_import, source)
+    source = _EXPORT_DEFAULT_DECL_RE.sub(replace_default_decl, source)
+    source = _EXPORT_DEFAULT_NAME_RE.sub(replace_default_name, source)
+    source = _EXPORT_DEFAULT_EXPR_RE.sub(replace_default_expr, source)
+    source = _EXPORT_DECL_RE.sub(replace_decl, source)
+    source = _EXPORT_LIST_RE.sub(replace_list, source)
+    leftover = _UNSUPPORTED_RE.search(source)
+    if leftover:
+        raise FileOperationError(f"Unsupported module syntax in {path}: {leftover.group()[:80]}",
+                                 file_path=path, operation='bundle')
+    return source, exports
+
+
+def bundle_modules(static_dir: str, entry: str) -> Tuple[str, List[str]]:
+    """
+    6.1. Giriş modülünden erişilen ES modüllerini tek dosyada birleştirir.
+
+    Returns:
+        (küçültülmüş bundle, kaynak dosyalar bağımlılık sırasıyla)
+    """
+    order: List[str] = []
+    sources: Dict[str, str] = {}
+    visiting: List[str] = []
+
+    def visit(path: str) -> None:
+        if path in sources:
+            return
+        if path in visiting:
+            cycle = ' -> '.join(visiting[visiting.index(path):] + [path])
+            raise FileOperationError(f"Circular import cannot be bundled: {cycle}",
+                                     file_path=path, operation='bundle')
+        visiting.append(path)
+        source = minify_js(_static_path(static_dir, path).read_text(encoding='utf-8'))
+        for match in _IMPORT_RE.finditer(source):
+            visit(_resolve_import(path, match.group('spec')))
+        visiting.pop()
+        sources[path] = source
+        order.append(path)
+
+    visit(posixpath.normpath(entry))
+    module_ids = {path: index for index, path in enumerate(order)}
+
+    parts = [f"const {MODULE_TABLE}=[];"]
+    for path in order:
+        body, exports = _transform_module(path, sources[path], module_ids)
+        exported = ','.join(name if name == local else f"{name}:{local}" for name, local in exports)
+        parts.append(f"// {path}\n{MODULE_TABLE}[{module_ids[path]}]=(()=>{{\n{body.strip()}\n"
+                     f"return{{{exported}}};\n}})();")
+    return '\n'.join(parts) + '\n', order
+
+
+def bundle_scripts(static_dir: str, files: Iterable[str]) -> Tuple[str, List[str]]:
+    """6.2. Klasik scriptleri sırayla birleştirir (aralarına `;` konur)."""
+    files = list(files)
+    parts = [minify_js(_static_path(static_dir, name).read_text(encoding='utf-8')) for name in files]
+    return ';\n'.join(part.strip() for part in parts) + '\n', files
+
+
+_CSS_IMPORT_RE = re.compile(r'@import\s*(?:url\(\s*)?([\'"]?)(?P<path>[^\'")\s;]+)\1\s*\)?\s*;')
+_CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)(?P<path>[^\'")]+)\1\s*\)')
+
+
+def bundle_css(static_dir: str, files: Iterable[str], output_dir: str = DIST_DIR) -> Tuple[str, List[str]]:
+    """
+    6.3. CSS dosyalarını göreli @import'larıyla birlikte tek dosyada toplar;
+    url() yolları `output_dir` klasörüne göre yeniden yazılır.
+    """
+    included: List[str] = []
+
+    def rewrite_url(current: str, match: 're.Match') -> str:
+        target = match.group('path')
+        if target.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        resolved = posixpath.normpath(posixpath.join(posixpath.dirname(current), target))
+        return f"url({posixpath.relpath(resolved, output_dir)})"
+
+    def inline(path: str) -> str:
+        if path in included:
+            return ''
+        included.append(path)
+        css = minify_css(_static_path(static_dir, path).read_text(encoding='utf-8'))
+
+        def replace_import(match: 're.Match') -> str:
+            target = match.group('path')
+            if target.startswith(('http:', 'https:', '//', '/')):
+                return match.group(0)
+            return inline(posixpath.normpath(posixpath.join(posixpath.dirname(path), target))).strip()
+
+        pieces = []
+        position = 0
+        for match in _CSS_IMPORT_RE.finditer(css):
+            pieces.append(_CSS_URL_RE.sub(lambda m: rewrite_url(path, m), css[position:match.start()]))
+            pieces.append(replace_import(match))
+            position = match.end()
+        pieces.append(_CSS_URL_RE.sub(lambda m: rewrite_url(path, m), css[position:]))
+        return ''.join(pieces)
+
+    parts = [inline(posixpath.normpath(name)).strip() for name in files]
+    return '\n'.join(part for part in parts if part) + '\n', included
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def build_bundles(static_dir: Any, names: Optional[Iterable[str]] = None, prune: bool = True) -> Dict[str, Any]:
+    """
+    6.4. Bundle'ları derler, dist/ altına yazar ve manifest'i günceller.
+
+    Args:
+        static_dir: Static klasörü
+        names: Derlenecek bundle adları (varsayılan: hepsi; diğerleri
+               manifest'te önceki halleriyle kalır)
+        prune: Manifest'te artık yer almayan eski bundle dosyalarını sil
+
+    Returns:
+        Yazılan manifest ({'built_at', 'bundles': {ad: {...}}})
+    """
+    static_dir = str(static_dir)
+    names = list(names) if names is not None else list(ASSET_BUNDLES)
+    dist = Path(static_dir) / DIST_DIR
+    manifest_path = dist / MANIFEST_NAME
+    manifest: Dict[str, Any] = {'bundles': {}}
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            manifest = {'bundles': {}}
+
+    for name in names:
+        spec = ASSET_BUNDLES.get(name)
+        if spec is None:
+            raise FileOperationError(f"Unknown asset bundle: {name}", file_path=name, operation='bundle')
+        if spec['type'] == 'module':
+            content, sources = bundle_modules(static_dir, spec['entry'])
+        elif spec['type'] == 'script':
+            content, sources = bundle_scripts(static_dir, spec['files'])
+        else:
+            content, sources = bundle_css(static_dir, spec['files'])
+        data = content.encode('utf-8')
+        stem, ext = os.path.splitext(name)
+        filename = f"{DIST_DIR}/{stem}.{content_hash(data)}{ext}"
+        _write_atomic(Path(static_dir) / filename, data)
+        manifest['bundles'][name] = {
+            'file': filename,
+            'type': spec['type'],
+            'sources': sources,
+            'bytes': len(data),
+            'source_bytes': sum(_static_path(static_dir, source).stat().st_size for source in sources),
+        }
+        logger.info("Built asset bundle %s -> %s (%d files)", name, filename, len(sources))
+
+    manifest['bundles'] = {name: entry for name, entry in manifest['bundles'].items() if name in ASSET_BUNDLES}
+    manifest['built_at'] = time.time()
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+    if prune:
+        current = {Path(entry['file']).name for entry in manifest['bundles'].values()}
+        bundle_file = re.compile(r'^(?P<base>.+\.[0-9a-f]{%d}\.[A-Za-z0-9]+)(?:\.gz|\.br)?$' % HASH_LENGTH)
+        for path in dist.iterdir():
+            match = bundle_file.match(path.name)
+            if match and match.group('base') not in current:
+                path.unlink()
+    return manifest
+
+# =============================================================================
+# 7.0. MANIFEST VE ŞABLON YARDIMCISI
+# =============================================================================
+
+class AssetManifest:
+    """
+    dist/manifest.json okuyucusu ve asset_bundle() şablon yardımcısı.
+
+    Manifest dosyası değiştiğinde (mtime) yeniden okunur; yeni bir build
+    worker'ları yeniden başlatmadan devreye girer.
+    """
+
+    def __init__(self, static_dir: Any, enabled: bool = True, check_sources: bool = False) -> None:
+        self.static_dir = str(static_dir)
+        self.enabled = enabled
+        self.check_sources = check_sources
+        self._path = Path(self.static_dir) / DIST_DIR / MANIFEST_NAME
+        self._manifest: Dict[str, Any] = {}
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Any]:
+        """Güncel manifest (dosya yoksa/bozuksa boş sözlük)."""
+        try:
+            mtime = self._path.stat().st_mtime
+        except OSError:
+            return {}
+        if mtime != self._mtime:
+            with self._lock:
+                try:
+                    self._manifest = json.loads(self._path.read_text(encoding='utf-8'))
+                except (OSError, ValueError) as e:
+                    logger.warning("Asset manifest could not be read: %s", e)
+                    self._manifest = {}
+                self._mtime = mtime
+        return self._manifest
+
+    def bundle_file(self, name: str) -> Optional[str]:
+        """Kullanılacak bundle dosyası (static'e göreli) veya kaynaklara düşülecekse None."""
+        if not self.enabled:
+            return None
+        entry = self.load().get('bundles', {}).get(name)
+        if not entry or not (Path(self.static_dir) / entry['file']).is_file():
+            return None
+        if self.check_sources:
+            # Geliştirmede kaynak düzenlendiyse eski bundle yerine kaynakları kullan
+            built = self._mtime or 0
+            for source in entry.get('sources', []):
+                try:
+                    if (Path(self.static_dir) / source).stat().st_mtime > built:
+                        return None
+                except OSError:
+                    return None
+        return entry['file']
+
+    def tags(self, name: str) -> Markup:
+        """
+        7.1. Şablon yardımcısı: bundle'ın (veya kaynaklarının) <script>/<link>
+        etiketleri.
+        """
+        from flask import url_for
+
+        spec = ASSET_BUNDLES.get(name)
+        if spec is None:
+            raise KeyError(f"Unknown asset bundle: {name}")
+        bundled = self.bundle_file(name)
+        if bundled:
+            files = [bundled]
+        elif spec['type'] == 'module':
+            files = [spec['entry']]
+        else:
+            files = list(spec['files'])
+
+        tags = []
+        for filename in files:
+            url = escape(url_for('static', filename=filename))
+            if spec['type'] == 'css':
+                tags.append(f'<link rel="stylesheet" href="{url}">')
+            elif spec['type'] == 'module':
+                tags.append(f'<script type="module" src="{url}"></script>')
+            else:
+                tags.append(f'<script src="{url}"></script>')
+        return Markup('\n    '.join(tags))
+
+    def stats(self) -> Dict[str, Any]:
+        """Admin sistem durumu için manifest özeti."""
+        manifest = self.load()
+        return {
+            'enabled': self.enabled,
+            'built_at': manifest.get('built_at'),
+            'bundles': {name: {'file': entry['file'], 'bytes': entry['bytes'], 'sources': len(entry['sources'])}
+                        for name, entry in manifest.get('bundles', {}).items()},
+        }
+
+
+def init_asset_pipeline(app, config_class=None) -> Optional[AssetManifest]:
+    """7.2. asset_bundle() şablon yardımcısını kaydeder."""
+    if not app.has_static_folder:
+        return None
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    manifest = AssetManifest(
+        app.static_folder,
+        enabled=getattr(config_class.APP, 'ASSET_BUNDLES', True),
+        check_sources=app.debug,
+    )
+    app.add_template_global(manifest.tags, 'asset_bundle')
+    app.extensions['asset_manifest'] = manifest
+    return manifest
@@ -6,11 +6,15 @@
 # ve güvenlik işlemleri burada yer alır.
 # =============================================================================
 
+import logging
 from functools import wraps
 from flask import session, redirect, url_for, jsonify, request
 from typing import Optional, Dict, Any, Callable
 from werkzeug.security import check_password_hash
 from app.database.repositories.user_repository import UserRepository
+from app.services.user_cache import get_user_cache
+
+logger = logging.getLogger(__name__)
 
 class AuthenticationService:
     """
@@ -20,6 +24,7 @@ class AuthenticationService:
     def __init__(self):
         """Authentication servisini başlatır."""
         self.user_repo = UserRepository()
+        self.user_cache = get_user_cache()
     
     def login_required(self, f: Callable) -> Callable:
         """
@@ -34,15 +39,7 @@ class AuthenticationService:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Debug: Log session state
-            from flask import current_app
-            if current_app.debug:
-                print("=== AUTH DEBUG (login_required) ===")
-                print(f"Request path: {request.path}")
-                print(f"Session data: {dict(session)}")
-                print(f"is_logged_in: {self.is_logged_in()}")
-                print(f"User ID in session: {session.get('user_id')}")
-                print("=================================")
+            logger.debug("login_required %s user_id=%s", request.path, session.get('user_id'))
             
             if not self.is_logged_in():
                 # AJAX istekleri için JSON yanıt
@@ -74,16 +71,7 @@ class AuthenticationService:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Debug: Log session state
-            from flask import current_app
-            if current_app.debug:
-                print("=== AUTH DEBUG ===")
-                print(f"Request path: {request.path}")
-                print(f"Session data: {dict(session)}")
-                print(f"is_logged_in: {self.is_logged_in()}")
-                print(f"User ID in session: {session.get('user_id')}")
-                print(f"is_admin in session: {session.get('is_admin')}")
-                print("==================")
+            logger.debug("admin_required %s user_id=%s", request.path, session.get('user_id'))
             
             if not self.is_logged_in():
                 # AJAX istekleri için JSON yanıt (API kullanımı için uygun)
@@ -122,11 +110,11 @@ class AuthenticationService:
         if self.is_logged_in():
             user_id = session.get('user_id')
             if user_id:
-                # Veritabanından güncel kullanıcı bilgilerini al
-                user = self.user_repo.get_user_by_id(user_id)
+                # Güncel kullanıcı bilgileri (kısa TTL'li süreç içi önbellekten)
+                user = self.user_cache.get(user_id)
                 if user:
                     return {
-                        'id': user.get('id'),
+                        'id': user.get('user_id'),
                         'username': user.get('username'),
                         'email': user.get('email'),
                         'is_admin': user.get('is_admin', False),
@@ -155,30 +143,26 @@ class AuthenticationService:
         """
         Kullanıcıyı sisteme giriş yapar (session'a kaydeder).
         
+        Sunucu tarafı oturum deposunda oturum kimliği yenilenir; girişten
+        önce bilinen (ör. saldırganın yerleştirdiği) kimlik kimliği
+        doğrulanmış oturuma dönüşmez.
+        
         Args:
             user_data: Kullanıcı bilgileri
             
         Returns:
             True if successful, False otherwise
         """
-        print('=== LOGIN DEBUG (AUTH SERVICE) ===')
-        print(f'Received user_data: {user_data}')
-        
         try:
-            print('Setting session variables...')
             session['logged_in'] = True
             session['user_id'] = user_data.get('id')
             session['username'] = user_data.get('username')
             session['email'] = user_data.get('email')
             session['is_admin'] = user_data.get('is_admin', False)
-            
-            print(f'Session after setting: {dict(session)}')
-            print('Session set successfully')
+            regenerate_session()
             return True
         except Exception as e:
-            print(f'ERROR: Failed to set session: {e}')
-            import traceback
-            print(f'Traceback: {traceback.format_exc()}')
+            logger.exception("Failed to set session: %s", e)
             return False
     
     def logout_user(self) -> bool:
@@ -208,8 +192,8 @@ class AuthenticationService:
         if not user_id:
             return False
         
-        # Veritabanından kullanıcının hala var olup olmadığını kontrol et
-        user = self.user_repo.get_user_by_id(user_id)
+        # Kullanıcının hala var olup olmadığını kontrol et
+        user = self.user_cache.get(user_id)
         if not user:
             self.logout_user()
             return False
@@ -231,15 +215,19 @@ class AuthenticationService:
             return False
         
         # Veritabanından güncel kullanıcı bilgilerini al
-        user = self.user_repo.get_user_by_id(user_id)
+        self.user_cache.invalidate(user_id)
+        user = self.user_cache.get(user_id)
         if not user:
             self.logout_user()
             return False
         
-        # Session'ı güncelle
+        # Session'ı güncelle; yetki değiştiyse oturum kimliği de yenilenir
+        privilege_changed = bool(session.get('is_admin')) != bool(user.get('is_admin'))
         session['username'] = user.get('username')
         session['email'] = user.get('email')
         session['is_admin'] = user.get('is_admin', False)
+        if privilege_changed:
+            regenerate_session()
         
         return True
 
@@ -265,4 +253,10 @@ def is_logged_in() -> bool:
 
 def logout_user() -> bool:
     """Kullanıcıyı çıkış yapar (session'ı temizler)."""
-    return auth_service.logout_user() 
\ No newline at end of file
+    return auth_service.logout_user()
+
+def regenerate_session() -> None:
+    """Giriş/yetki değişiminde sunucu tarafı oturumun kimliğini yeniler (imzalı cookie oturumunda kimlik yoktur)."""
+    regenerate = getattr(session, 'regenerate', None)
+    if callable(regenerate):
+        regenerate() 
\ No newline at end of file
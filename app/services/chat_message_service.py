@@ -11,6 +11,10 @@ import re
 import html
 import os
 import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 class ChatMessageService:
     """
@@ -71,16 +75,9 @@ class ChatMessageService:
             )
         }
         
-        # JSON'dan yüklenen senaryo metinleri
-        self.scenario_texts: Dict[str, Any] = {}
-        
-        # Scenario metinlerini yükle
-        try:
-            self.scenario_texts = self._load_scenarios()
-            print(f"[DEBUG] Loaded scenarios: {list(self.scenario_texts.keys())}")
-        except Exception as e:
-            print(f"[WARNING] Failed to load scenarios: {e}")
-            self.scenario_texts = {}
+        # JSON'dan yüklenen senaryo metinleri (ilk prompt oluşturulurken yüklenir)
+        self._scenario_texts: Optional[Dict[str, Any]] = None
+        self._scenario_lock = threading.Lock()
     
     # =============================================================================
     # MESSAGE STORAGE
@@ -112,7 +109,7 @@ class ChatMessageService:
                     ai_model, prompt_used, response_time_ms, metadata
                 )
             except Exception as e:
-                print(f"[ERROR] Failed to add message: {e}")
+                logger.error("Failed to add message: %s", e)
                 return None
         return None
     
@@ -120,6 +117,24 @@ class ChatMessageService:
     # SCENARIO LOADING
     # =============================================================================
     
+    @property
+    def scenario_texts(self) -> Dict[str, Any]:
+        """Senaryo metinleri; dosyalar ilk erişimde bir kez okunur."""
+        if self._scenario_texts is None:
+            with self._scenario_lock:
+                if self._scenario_texts is None:
+                    try:
+                        self._scenario_texts = self._load_scenarios()
+                        logger.debug("Loaded scenarios: %s", list(self._scenario_texts))
+                    except Exception as e:
+                        logger.warning("Failed to load scenarios: %s", e)
+                        self._scenario_texts = {}
+        return self._scenario_texts
+    
+    @scenario_texts.setter
+    def scenario_texts(self, value: Dict[str, Any]) -> None:
+        self._scenario_texts = value
+    
     def _load_scenarios(self) -> Dict[str, Any]:
         """AI scenario metinlerini JSON dosyalarından yükler."""
         scenarios = {}
@@ -142,7 +157,7 @@ class ChatMessageService:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         scenarios[scenario_name] = json.load(f)
         except Exception as e:
-            print(f"[ERROR] Scenario loading failed: {e}")
+            logger.error("Scenario loading failed: %s", e)
         
         return scenarios
     
@@ -169,19 +184,7 @@ class ChatMessageService:
                     'error': 'Chat session service not available'
                 }
             
-            # Debug: Question context'i logla
-            print(f"[DEBUG] Question context: {message_info.get('question_context')}")
-            print(f"[DEBUG] Is first message: {message_info['is_first_message']}")
-            print(f"[DEBUG] Scenario type: {message_info['scenario_type']}")
-            
             # Kendi prompt building metodumuzu kullan
-            print(f"[DEBUG] Calling build_gemini_contents_for_scenario with:")
-            print(f"  - chat_session_id: {message_info['chat_session_id']}")
-            print(f"  - user_message: {message_info['user_message']}")
-            print(f"  - scenario_type: {message_info['scenario_type']}")
-            print(f"  - is_first_message: {message_info['is_first_message']}")
-            print(f"  - question_context: {message_info.get('question_context')}")
-            
             built = self.build_gemini_contents_for_scenario(
                 chat_session_id=message_info['chat_session_id'],
                 user_message=message_info['user_message'],
@@ -191,13 +194,13 @@ class ChatMessageService:
                 action=message_info.get('action'),
                 files_only=True,
             )
-            print(f"[DEBUG] build_gemini_contents_for_scenario returned: {built}")
             
             contents = built.get('contents', [])
             final_user_text = built.get('final_user_text', '')
             
             if not contents or not str(final_user_text).strip():
-                print(f"[DEBUG] Template empty - contents: {len(contents) if contents else 0}, final_user_text: '{final_user_text}'")
+                logger.debug("Scenario template empty: scenario=%s contents=%d",
+                             message_info['scenario_type'], len(contents) if contents else 0)
                 return {
                     'success': False,
                     'error': 'Scenario template not found or empty'
@@ -246,9 +249,7 @@ class ChatMessageService:
             }
             
         except Exception as e:
-            import traceback
-            print(f"[ERROR] Message processing failed: {str(e)}")
-            print(f"[ERROR] Traceback: {traceback.format_exc()}")
+            logger.exception("Message processing failed: %s", e)
             return {
                 'success': False,
                 'error': f'Message processing failed: {str(e)}'
@@ -311,7 +312,7 @@ class ChatMessageService:
             return False
             
         except Exception as e:
-            print(f"Error saving message with full prompt: {e}")
+            logger.error("Error saving message with full prompt: %s", e)
             return False
     
     def validate_message(self, message: str) -> Tuple[bool, Optional[str]]:
@@ -774,15 +775,14 @@ class ChatMessageService:
         Returns:
             Senaryoya göre hazırlanmış prompt metni
         """
-        print(f"[DEBUG] build_prompt_for_scenario called with scenario_type={scenario_type}, is_first_message={is_first_message}, action={action}")
+        logger.debug("build_prompt_for_scenario scenario=%s first=%s action=%s",
+                     scenario_type, is_first_message, action)
         
         try:
             # Session bilgilerini al
             session_info = self.chat_session_service.get_session(chat_session_id) if self.chat_session_service else {}
-            print(f"[DEBUG] build_prompt_for_scenario - session_info from service: {session_info}")
             if session_info is None:
                 session_info = {}
-                print(f"[DEBUG] build_prompt_for_scenario - session_info was None, using empty dict")
             
             # Ortak değişkenleri hazırla
             shared_conf: Dict[str, Any] = self.scenario_texts.get('shared') or {}
@@ -866,9 +866,7 @@ class ChatMessageService:
             return "\n\n".join(prompt_parts)
         
         except Exception as e:
-            print(f"[ERROR] build_prompt_for_scenario failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("build_prompt_for_scenario failed: %s", e)
             return ''
     
     def _get_recent_dialog(
@@ -926,13 +924,8 @@ class ChatMessageService:
               'final_user_text': str
             }
         """
-        print(f"[DEBUG] build_gemini_contents_for_scenario METHOD ENTRY")
-        print(f"[DEBUG] Calling build_gemini_contents_for_scenario with:")
-        print(f"  - chat_session_id: {chat_session_id}")
-        print(f"  - user_message: {user_message}")
-        print(f"  - scenario_type: {scenario_type}")
-        print(f"  - is_first_message: {is_first_message}")
-        print(f"  - question_context: {question_context}")
+        logger.debug("build_gemini_contents_for_scenario session=%s scenario=%s first=%s",
+                     chat_session_id, scenario_type, is_first_message)
         
         contents = []
         
@@ -950,10 +943,9 @@ class ChatMessageService:
                             'parts': [{'text': msg.get('content', '')}]
                         })
             except Exception as e:
-                print(f"[DEBUG] Error loading history: {e}")
+                logger.warning("Error loading chat history: %s", e)
         
         if is_first_message:
-            print(f"[DEBUG] About to call build_prompt_for_scenario...")
             prompt_text = self.build_prompt_for_scenario(
                 chat_session_id=chat_session_id,
                 user_message=user_message,
@@ -963,13 +955,12 @@ class ChatMessageService:
                 action=action,
                 files_only=files_only
             )
-            print(f"[DEBUG] build_prompt_for_scenario returned: '{prompt_text}'")
         else:
             # Devam mesajları için sadece kullanıcı mesajını ekle (history zaten yukarıda eklendi)
             prompt_text = user_message
         
         if not prompt_text.strip():
-            print(f"[DEBUG] build_prompt_for_scenario returned empty prompt_text")
+            logger.debug("Empty prompt for scenario=%s", scenario_type)
             return {'contents': [], 'final_user_text': ''}
         
         # Son kullanıcı mesajını ekle
@@ -6,7 +6,7 @@
 # =============================================================================
 
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
 class ChatSessionService:
     """
@@ -95,7 +95,6 @@ class ChatSessionService:
             return 0
         
         try:
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-            return self.chat_repo.cleanup_old_sessions(cutoff_time)
+            return self.chat_repo.cleanup_old_sessions(max_age_hours)
         except Exception:
             return 0
\ No newline at end of file
@@ -0,0 +1,168 @@
+# =============================================================================
+# RESPONSE COMPRESSION & CONDITIONAL GET
+# =============================================================================
+# Dinamik yanıtlar için after_request katmanı:
+#   - ETag/304: /api altındaki başarılı GET yanıtlarına gövdeden üretilen
+#     zayıf bir ETag eklenir; If-None-Match eşleşirse gövdesiz 304 döner.
+#     Yanıtlar kullanıcıya özel olabildiğinden `Cache-Control: private,
+#     no-cache` kullanılır (tarayıcı saklar ama her seferinde doğrular).
+#   - Sıkıştırma: JSON/HTML/metin yanıtları AppConfig.COMPRESSION_MIN_SIZE
+#     baytı aşarsa istemcinin Accept-Encoding tercihine göre brotli (paket
+#     kuruluysa: pip install brotli) veya gzip ile sıkıştırılır.
+# Dosya yanıtları (send_file, direct_passthrough) ve akışlar bu katmana
+# girmez; statik dosyaların önceden sıkıştırılmış kopyaları
+# app/services/static_assets.py tarafından sunulur.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. RESPONSE COMPRESSOR SINIFI
+#   4.1. negotiate(self, accept_encodings)
+#   4.2. compress(self, data, encoding)
+#   4.3. add_etag(self, response)
+#   4.4. process(self, request, response)
+#   4.5. stats(self)
+# 5.0. FLASK ENTEGRASYONU
+#   5.1. init_compression(app, config_class)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import gzip
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'text/xml', 'text/csv',
+})
+
+# =============================================================================
+# 4.0. RESPONSE COMPRESSOR SINIFI
+# =============================================================================
+
+class ResponseCompressor:
+    """Dinamik yanıtlara ETag/304 ve gzip/brotli uygular."""
+
+    def __init__(self, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5,
+                 etags: bool = True) -> None:
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.etags = etags
+        self.encodings = ('br', 'gzip') if brotli is not None else ('gzip',)
+        self._lock = threading.Lock()
+        self._counters = {'compressed': 0, 'bytes_in': 0, 'bytes_out': 0, 'not_modified': 0}
+
+    def negotiate(self, accept_encodings) -> Optional[str]:
+        """4.1. İstemcinin kabul ettiği en yüksek kaliteli kodlama (yoksa None)."""
+        best, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = accept_encodings[encoding]
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        """4.2. Gövdeyi verilen kodlamayla sıkıştırır."""
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
+
+    def add_etag(self, response) -> None:
+        """4.3. Gövdenin hash'inden zayıf ETag (sıkıştırmadan bağımsız)."""
+        digest = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        response.set_etag(digest, weak=True)
+        if not response.cache_control:
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+
+    def process(self, request, response):
+        """4.4. after_request gövdesi: önce 304 kontrolü, sonra sıkıştırma."""
+        if response.direct_passthrough or response.is_streamed:
+            return response
+        if not (200 <= response.status_code < 300) or response.status_code in (204, 206):
+            return response
+
+        if (self.etags and request.method in ('GET', 'HEAD') and request.path.startswith('/api/')
+                and response.mimetype == 'application/json' and 'ETag' not in response.headers):
+            self.add_etag(response)
+            response.make_conditional(request)
+            if response.status_code == 304:
+                with self._lock:
+                    self._counters['not_modified'] += 1
+                return response
+
+        if (not self.encodings or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'Content-Encoding' in response.headers):
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = self.negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        compressed = self.compress(data, encoding)
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        with self._lock:
+            self._counters['compressed'] += 1
+            self._counters['bytes_in'] += len(data)
+            self._counters['bytes_out'] += len(compressed)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        4.5. Sıkıştırma metrikleri.
+
+        Returns:
+            {'compressed', 'bytes_in', 'bytes_out', 'ratio', 'not_modified', 'encodings', 'min_size'}
+        """
+        with self._lock:
+            data = dict(self._counters)
+        data['ratio'] = round(data['bytes_out'] / data['bytes_in'], 3) if data['bytes_in'] else None
+        data['encodings'] = list(self.encodings)
+        data['min_size'] = self.min_size
+        return data
+
+# =============================================================================
+# 5.0. FLASK ENTEGRASYONU
+# =============================================================================
+
+def init_compression(app, config_class=None) -> Optional[ResponseCompressor]:
+    """5.1. ETag/304 ve sıkıştırma after_request hook'unu kaydeder."""
+    from flask import request
+
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    app_config = config_class.APP
+    if not getattr(app_config, 'COMPRESSION_ENABLED', True) and not getattr(app_config, 'API_ETAGS', True):
+        return None
+
+    compressor = ResponseCompressor(
+        min_size=getattr(app_config, 'COMPRESSION_MIN_SIZE', 1024),
+        gzip_level=getattr(app_config, 'COMPRESSION_GZIP_LEVEL', 6),
+        brotli_quality=getattr(app_config, 'COMPRESSION_BROTLI_QUALITY', 5),
+        etags=getattr(app_config, 'API_ETAGS', True),
+    )
+    if not getattr(app_config, 'COMPRESSION_ENABLED', True):
+        compressor.encodings = ()
+
+    @app.after_request
+    def compress_response(response):
+        return compressor.process(request, response)
+
+    app.extensions['compression'] = compressor
+    return compressor
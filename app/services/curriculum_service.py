@@ -9,12 +9,15 @@ import json
 import os
 from typing import List, Dict, Optional, Any
 from app.database.repositories.base_repository import BaseRepository
+from app.database.repositories.curriculum_import_repository import CurriculumImportRepository
 
 class CurriculumService:
     """Müfredat yönetimi için servis sınıfı"""
     
     def __init__(self):
         self.base_repo = BaseRepository()
+        self.import_repo = CurriculumImportRepository()
+        self.last_import_report: Optional[Dict[str, Any]] = None
         self.curriculum_data_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)), 
             'data', 'curriculum_structure'
@@ -363,204 +366,19 @@ class CurriculumService:
             return {}
     
     def import_curriculum_data(self, data: Dict[str, Any]) -> bool:
-        """Müfredat verilerini import eder"""
-        try:
-            # Counters for optional debugging
-            imported = {"grades": 0, "subjects": 0, "units": 0, "topics": 0}
-
-            # Helper upsert-like ensure functions using name-based lookups
-            def ensure_grade(grade_name: str, description: Optional[str] = None, is_active: bool = True):
-                row = self.base_repo.fetch_one(
-                    "SELECT grade_id FROM grades WHERE grade_name = %s", (grade_name,)
-                )
-                if row:
-                    return row["grade_id"], False
-                gid = self.create_grade(grade_name, description, is_active)
-                return gid, True
-
-            def ensure_subject(grade_id: int, subject_name: str, description: Optional[str] = None, is_active: bool = True):
-                row = self.base_repo.fetch_one(
-                    "SELECT subject_id FROM subjects WHERE grade_id = %s AND subject_name = %s",
-                    (grade_id, subject_name),
-                )
-                if row:
-                    return row["subject_id"], False
-                sid = self.create_subject(subject_name, grade_id, description, is_active)
-                return sid, True
-
-            def ensure_unit(subject_id: int, unit_name: str, description: Optional[str] = None, is_active: bool = True):
-                row = self.base_repo.fetch_one(
-                    "SELECT unit_id FROM units WHERE subject_id = %s AND unit_name = %s",
-                    (subject_id, unit_name),
-                )
-                if row:
-                    return row["unit_id"], False
-                uid = self.create_unit(unit_name, subject_id, description, is_active)
-                return uid, True
-
-            def ensure_topic(unit_id: int, topic_name: str, description: Optional[str] = None, is_active: bool = True):
-                row = self.base_repo.fetch_one(
-                    "SELECT topic_id FROM topics WHERE unit_id = %s AND topic_name = %s",
-                    (unit_id, topic_name),
-                )
-                if row:
-                    return row["topic_id"], False
-                tid = self.create_topic(topic_name, unit_id, description, is_active)
-                return tid, True
-
-            # Resolver helpers for flat data
-            def resolve_subject_id(subject_name: str, grade_name: Optional[str] = None) -> Optional[int]:
-                if grade_name:
-                    row = self.base_repo.fetch_one(
-                        """
-                        SELECT s.subject_id
-                        FROM subjects s
-                        LEFT JOIN grades g ON s.grade_id = g.grade_id
-                        WHERE s.subject_name = %s AND g.grade_name = %s
-                        """,
-                        (subject_name, grade_name),
-                    )
-                    if row:
-                        return row["subject_id"]
-                row = self.base_repo.fetch_one(
-                    "SELECT subject_id FROM subjects WHERE subject_name = %s ORDER BY subject_id LIMIT 1",
-                    (subject_name,),
-                )
-                return row["subject_id"] if row else None
-
-            def resolve_unit_id(unit_name: str, subject_name: Optional[str] = None, grade_name: Optional[str] = None) -> Optional[int]:
-                if subject_name and grade_name:
-                    row = self.base_repo.fetch_one(
-                        """
-                        SELECT u.unit_id
-                        FROM units u
-                        LEFT JOIN subjects s ON u.subject_id = s.subject_id
-                        LEFT JOIN grades g ON s.grade_id = g.grade_id
-                        WHERE u.unit_name = %s AND s.subject_name = %s AND g.grade_name = %s
-                        """,
-                        (unit_name, subject_name, grade_name),
-                    )
-                    if row:
-                        return row["unit_id"]
-                row = self.base_repo.fetch_one(
-                    "SELECT unit_id FROM units WHERE unit_name = %s ORDER BY unit_id LIMIT 1",
-                    (unit_name,),
-                )
-                return row["unit_id"] if row else None
-
-            processed_any = False
-
-            # Case 1: Flat export format like {'grades': [...], 'subjects': [...], 'units': [...], 'topics': [...]}.
-            if isinstance(data, dict) and any(k in data for k in ("grades", "subjects", "units", "topics")):
-                grade_name_to_id: Dict[str, int] = {}
-
-                # Grades
-                for g in data.get("grades", []) or []:
-                    gname = g.get("grade_name") or g.get("gradeName") or g.get("name")
-                    if not gname:
-                        continue
-                    gid, created = ensure_grade(gname, g.get("description"), g.get("is_active", True))
-                    grade_name_to_id[gname] = gid
-                    if created:
-                        imported["grades"] += 1
+        """
+        Müfredat verilerini import eder.
 
-                # Subjects
-                for s in data.get("subjects", []) or []:
-                    sname = s.get("subject_name") or s.get("subjectName")
-                    if not sname:
-                        continue
-                    gname = s.get("grade_name") or s.get("gradeName")
-                    gid = None
-                    if gname:
-                        # Ensure referenced grade exists
-                        gid = grade_name_to_id.get(gname)
-                        if not gid:
-                            gid, gcreated = ensure_grade(gname)
-                            if gcreated:
-                                imported["grades"] += 1
-                            grade_name_to_id[gname] = gid
-                    else:
-                        gid = s.get("grade_id")
-                    if not gid:
-                        continue
-                    _, screated = ensure_subject(gid, sname, s.get("description"), s.get("is_active", True))
-                    if screated:
-                        imported["subjects"] += 1
-
-                # Units
-                for u in data.get("units", []) or []:
-                    uname = u.get("unit_name") or u.get("unitName")
-                    if not uname:
-                        continue
-                    sname = u.get("subject_name") or u.get("subjectName")
-                    gname = u.get("grade_name") or u.get("gradeName")
-                    sid = resolve_subject_id(sname, gname) if sname else (u.get("subject_id") or None)
-                    if not sid:
-                        continue
-                    _, ucreated = ensure_unit(sid, uname, u.get("description"), u.get("is_active", True))
-                    if ucreated:
-                        imported["units"] += 1
-
-                # Topics
-                for t in data.get("topics", []) or []:
-                    tname = t.get("topic_name") or t.get("topicName")
-                    if not tname:
-                        continue
-                    uname = t.get("unit_name") or t.get("unitName")
-                    sname = t.get("subject_name") or t.get("subjectName")
-                    gname = t.get("grade_name") or t.get("gradeName")
-                    uid = resolve_unit_id(uname, sname, gname) if uname else (t.get("unit_id") or None)
-                    if not uid:
-                        continue
-                    _, tcreated = ensure_topic(uid, tname, t.get("description"), t.get("is_active", True))
-                    if tcreated:
-                        imported["topics"] += 1
-
-                processed_any = True
-
-            # Case 2: Hierarchical format like [{'gradeLevel':..., 'gradeName':..., 'subjects':[...]}] or dict
-            if not processed_any:
-                items = data if isinstance(data, list) else [data]
-                for curriculum_data in items:
-                    grade_name = (
-                        curriculum_data.get("gradeName")
-                        or curriculum_data.get("grade_name")
-                        or curriculum_data.get("grade")
-                        or f"Grade {curriculum_data.get('gradeLevel', 'Unknown')}"
-                    )
-                    gid, gcreated = ensure_grade(grade_name)
-                    if gcreated:
-                        imported["grades"] += 1
-
-                    for subject_data in curriculum_data.get("subjects", []) or []:
-                        sname = subject_data.get("subjectName") or subject_data.get("subject_name")
-                        if not sname:
-                            continue
-                        sid, screated = ensure_subject(gid, sname)
-                        if screated:
-                            imported["subjects"] += 1
-
-                        for unit_data in subject_data.get("units", []) or []:
-                            uname = unit_data.get("unitName") or unit_data.get("unit_name")
-                            if not uname:
-                                continue
-                            uid, ucreated = ensure_unit(sid, uname)
-                            if ucreated:
-                                imported["units"] += 1
-
-                            for topic_data in unit_data.get("topics", []) or []:
-                                tname = topic_data.get("topicName") or topic_data.get("topic_name")
-                                if not tname:
-                                    continue
-                                _, tcreated = ensure_topic(uid, tname)
-                                if tcreated:
-                                    imported["topics"] += 1
-
-            # Successful import
-            return True
-        except Exception as e:
-            print(f"Import error: {e}")
-            return False
+        Düz ({'grades', 'subjects', 'units', 'topics'}) ve hiyerarşik
+        ([{'gradeName', 'subjects': [...]}]) formatları desteklenir. Aktarım
+        küme tabanlıdır: mevcut kayıtlar seviye başına bir kez okunur, eksikler
+        seviye seviye toplu eklenir. Ayrıntılı created/updated/unchanged/skipped
+        raporu `self.last_import_report` içinde tutulur.
+        """
+        self.last_import_report = self.import_repo.import_data(data)
+        if not self.last_import_report['success']:
+            print(f"Import error: {self.last_import_report['errors'][-1:]}")
+        return self.last_import_report['success']
     
     # =============================================================================
     # JSON DOSYA İŞLEMLERİ (ESKİ KOD - KORUNUYOR)
@@ -609,87 +427,17 @@ class CurriculumService:
         if not data:
             return {"success": False, "message": "JSON dosyası yüklenemedi"}
         
-        try:
-            imported_count = {"grades": 0, "subjects": 0, "units": 0, "topics": 0}
-            
-            # JSON verisi liste formatında olabilir
-            curriculum_data = data[0] if isinstance(data, list) else data
-            
-            # Sınıf oluştur veya bul
-            grade_name = curriculum_data.get("gradeName", f"Grade {curriculum_data.get('gradeLevel', 'Unknown')}")
-            
-            # Mevcut sınıfı kontrol et
-            existing_grade = self.base_repo.fetch_one(
-                "SELECT grade_id FROM grades WHERE grade_name = %s", 
-                (grade_name,)
-            )
-            
-            if existing_grade:
-                grade_id = existing_grade['grade_id']
-            else:
-                grade_id = self.create_grade(grade_name)
-                imported_count["grades"] += 1
-            
-            # Dersleri işle
-            for subject_data in curriculum_data.get("subjects", []):
-                subject_name = subject_data.get("subjectName")
-                if not subject_name:
-                    continue
-                
-                # Mevcut dersi kontrol et
-                existing_subject = self.base_repo.fetch_one(
-                    "SELECT subject_id FROM subjects WHERE grade_id = %s AND subject_name = %s",
-                    (grade_id, subject_name)
-                )
-                
-                if existing_subject:
-                    subject_id = existing_subject['subject_id']
-                else:
-                    subject_id = self.create_subject(subject_name, grade_id)
-                    imported_count["subjects"] += 1
-                
-                # Üniteleri işle
-                for unit_data in subject_data.get("units", []):
-                    unit_name = unit_data.get("unitName")
-                    if not unit_name:
-                        continue
-                    
-                    # Mevcut üniteyi kontrol et
-                    existing_unit = self.base_repo.fetch_one(
-                        "SELECT unit_id FROM units WHERE subject_id = %s AND unit_name = %s",
-                        (subject_id, unit_name)
-                    )
-                    
-                    if existing_unit:
-                        unit_id = existing_unit['unit_id']
-                    else:
-                        unit_id = self.create_unit(unit_name, subject_id)
-                        imported_count["units"] += 1
-                    
-                    # Konuları işle
-                    for topic_data in unit_data.get("topics", []):
-                        topic_name = topic_data.get("topicName")
-                        if not topic_name:
-                            continue
-                        
-                        # Mevcut konuyu kontrol et
-                        existing_topic = self.base_repo.fetch_one(
-                            "SELECT topic_id FROM topics WHERE unit_id = %s AND topic_name = %s",
-                            (unit_id, topic_name)
-                        )
-                        
-                        if not existing_topic:
-                            self.create_topic(topic_name, unit_id)
-                            imported_count["topics"] += 1
-            
-            return {
-                "success": True, 
-                "message": "JSON verisi başarıyla aktarıldı",
-                "imported": imported_count
-            }
-            
-        except Exception as e:
-            return {"success": False, "message": f"Aktarım sırasında hata: {str(e)}"}
+        report = self.import_repo.import_data(data)
+        self.last_import_report = report
+        if not report['success']:
+            return {"success": False, "message": f"Aktarım sırasında hata: {report['errors'][-1:]}"}
+        
+        return {
+            "success": True, 
+            "message": "JSON verisi başarıyla aktarıldı",
+            "imported": {level: report[level]['created'] for level in ("grades", "subjects", "units", "topics")},
+            "report": report
+        }
     
     def export_database_to_json(self, grade_id: int) -> Optional[Dict[str, Any]]:
         """Veritabanından belirli sınıfın müfredat verilerini JSON formatında çıkarır"""
@@ -7,10 +7,23 @@
 
 import os
 import json
+import logging
+import threading
 import requests
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Süreç genelinde yanıtı beklenen Gemini isteği sayısı (metrik örnekleyici okur)
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+def in_flight_requests() -> int:
+    """Şu anda yanıtı beklenen Gemini API isteği sayısı."""
+    return _in_flight
+
 class GeminiAPIService:
     """
     Gemini AI API ile doğrudan iletişim kuran servis.
@@ -83,18 +96,23 @@ class GeminiAPIService:
                 "x-goog-api-key": self.api_key
             }
             
-            # Debug: Print full request payload
-            import json
-            debug_msg = f"\n{'='*80}\nGEMINI API REQUEST DEBUG\n{'='*80}\nURL: {self.base_url}\nHeaders: {headers}\nRequest Body:\n{json.dumps(request_body, indent=2, ensure_ascii=False)}\n{'='*80}\n"
-            print(debug_msg, flush=True)
+            # İstek gövdesi yalnızca DEBUG seviyesinde ve API anahtarı olmadan loglanır
+            logger.debug("Gemini API request to %s: %s", self.base_url, request_body)
             
             # API call yap
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=request_body,
-                timeout=30
-            )
+            global _in_flight
+            with _in_flight_lock:
+                _in_flight += 1
+            try:
+                response = requests.post(
+                    self.base_url,
+                    headers=headers,
+                    json=request_body,
+                    timeout=30
+                )
+            finally:
+                with _in_flight_lock:
+                    _in_flight -= 1
             
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,415 @@
+# =============================================================================
+# JOB RUNNER
+# =============================================================================
+# Uzun süren admin işlemleri (müfredat import/export, eski kayıt temizliği,
+# index oluşturma) için süreç içi arka plan iş sistemi. Harici bir broker
+# gerektirmez: işler `background_jobs` tablosuna kaydedilir, bir thread
+# pool'da çalıştırılır; ilerleme, iptal isteği ve sonuç tabloda tutulur.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. JOB CONTEXT SINIFI
+#   4.1. progress(self, current, total, message)
+#   4.2. is_cancelled(self) / check_cancelled(self)
+# 5.0. JOB RUNNER SINIFI
+#   5.1. Constructor ve Başlatma
+#   5.2. İş Tanımları
+#     5.2.1. register(self, job_type, handler)
+#   5.3. İş Yönetimi
+#     5.3.1. submit(self, job_type, params, user_id)
+#     5.3.2. get(self, job_id)
+#     5.3.3. list_jobs(self, limit, status)
+#     5.3.4. cancel(self, job_id)
+#   5.4. Çalıştırma
+#     5.4.1. _run(self, job_id)
+#   5.5. Tablo Yardımcıları
+# 6.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.database.db_connection import DatabaseConnection
+from app.database.schemas.background_jobs_schema import (
+    BACKGROUND_JOBS_TABLE_SQL, BACKGROUND_JOBS_INDEX_SQL
+)
+from app.utils.exceptions import BusinessLogicError, NotFoundError
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ('queued', 'running', 'completed', 'failed', 'cancelled')
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+# İlerleme yazımları en fazla bu aralıkla tabloya yansıtılır (saniye)
+PROGRESS_WRITE_INTERVAL = 0.5
+# Başka bir süreçten gelen iptal isteği en fazla bu aralıkla kontrol edilir
+CANCEL_CHECK_INTERVAL = 1.0
+
+
+class JobCancelled(Exception):
+    """İş, iptal isteği üzerine kendi kontrol noktasında durdu."""
+
+# =============================================================================
+# 4.0. JOB CONTEXT SINIFI
+# =============================================================================
+
+class JobContext:
+    """
+    Çalışan bir işin handler'a verilen tutamacı.
+
+    Handler uzun döngülerinde `progress()` ile ilerleme bildirir ve
+    `check_cancelled()` ile iptal isteğini kontrol eder; iptal edilmişse
+    JobCancelled fırlatılır ve iş 'cancelled' olarak kapanır.
+    """
+
+    def __init__(self, runner: "JobRunner", job_id: str, params: Dict[str, Any],
+                 user_id: Optional[int] = None):
+        self.runner = runner
+        self.job_id = job_id
+        self.params = params
+        self.user_id = user_id
+        self._last_write = 0.0
+        self._last_cancel_check = 0.0
+        self._cancelled = False
+
+    def progress(self, current: int, total: Optional[int] = None, message: Optional[str] = None,
+                 force: bool = False) -> None:
+        """4.1. İlerlemeyi kaydeder (PROGRESS_WRITE_INTERVAL ile seyreltilir)."""
+        now = time.time()
+        if not force and now - self._last_write < PROGRESS_WRITE_INTERVAL:
+            return
+        self._last_write = now
+        fields: Dict[str, Any] = {'progress_current': int(current)}
+        if total is not None:
+            fields['progress_total'] = int(total)
+        if message is not None:
+            fields['message'] = message[:255]
+        self.runner._update(self.job_id, fields)
+
+    def is_cancelled(self) -> bool:
+        """4.2. İptal istenmiş mi? (aynı süreçte anında, tablodan seyreltilerek)"""
+        if self._cancelled or self.runner._cancel_flag(self.job_id):
+            self._cancelled = True
+            return True
+        now = time.time()
+        if now - self._last_cancel_check >= CANCEL_CHECK_INTERVAL:
+            self._last_cancel_check = now
+            job = self.runner._fetch(self.job_id)
+            self._cancelled = bool(job and job.get('cancel_requested'))
+        return self._cancelled
+
+    def check_cancelled(self) -> None:
+        """4.2. İptal istenmişse JobCancelled fırlatır."""
+        if self.is_cancelled():
+            raise JobCancelled()
+
+# =============================================================================
+# 5.0. JOB RUNNER SINIFI
+# =============================================================================
+
+class JobRunner:
+    """
+    Thread pool tabanlı, tabloya kalıcı iş yürütücüsü.
+
+    İşler veritabanı ve dosya G/Ç ağırlıklı olduğundan thread pool yeterlidir;
+    handler'lar DatabaseConnection'ı thread başına ayrı bağlantıyla kullanır.
+    Süreç yeniden başlarsa aynı makinedeki ölü süreçlere ait 'queued' /
+    'running' kayıtlar ilk kullanımda 'failed' olarak kapatılır.
+    """
+
+    # -------------------------------------------------------------------------
+    # 5.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None, max_workers: int = 2):
+        """Runner'ı başlatır; thread pool ilk iş gönderiminde oluşturulur."""
+        self.db = db_connection or DatabaseConnection()
+        self.max_workers = max(1, int(max_workers))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._cancel_flags: set = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._table_ready = False
+
+    # -------------------------------------------------------------------------
+    # 5.2. İş Tanımları
+    # -------------------------------------------------------------------------
+
+    def register(self, job_type: str, handler: Callable[..., Any]) -> None:
+        """
+        5.2.1. Bir iş tipini kaydeder.
+
+        Handler `handler(job: JobContext, **params)` imzasıyla çağrılır ve
+        JSON'a çevrilebilir bir sonuç döner.
+        """
+        self._handlers[job_type] = handler
+
+    # -------------------------------------------------------------------------
+    # 5.3. İş Yönetimi
+    # -------------------------------------------------------------------------
+
+    def submit(self, job_type: str, params: Optional[Dict[str, Any]] = None,
+               user_id: Optional[int] = None) -> Dict[str, Any]:
+        """5.3.1. İşi kuyruğa alır ve kaydını döner."""
+        if job_type not in self._handlers:
+            raise BusinessLogicError(f'Bilinmeyen iş tipi: {job_type}')
+        self._ensure_table()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self.db as conn:
+            conn.cursor.execute("""
+                INSERT INTO background_jobs
+                    (job_id, job_type, status, params, created_by, owner, created_at, updated_at)
+                VALUES (%s, %s, 'queued', %s, %s, %s, %s, %s)
+            """, (job_id, job_type, json.dumps(params or {}, ensure_ascii=False, default=str),
+                  user_id, self.owner, now, now))
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='admin-job')
+            future = self._executor.submit(self._run, job_id)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _f, jid=job_id: self._forget(jid))
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        """5.3.2. İş kaydını API biçiminde döner."""
+        job = self._fetch(job_id)
+        if not job:
+            raise NotFoundError('İş bulunamadı')
+        return self._format(job)
+
+    def list_jobs(self, limit: int = 50, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """5.3.3. Son işleri (yeniden eskiye) listeler."""
+        self._ensure_table()
+        query = "SELECT * FROM background_jobs"
+        params: tuple = ()
+        if status in JOB_STATUSES:
+            query += " WHERE status = %s"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT %s"
+        with self.db.read_only() as conn:
+            conn.cursor.execute(query, params + (max(1, min(int(limit), 500)),))
+            return [self._format(row) for row in conn.cursor.fetchall()]
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """
+        5.3.4. İşi iptal eder.
+
+        Kuyruktaki iş hiç başlamadan 'cancelled' olur; çalışan işe iptal
+        isteği işaretlenir ve iş bir sonraki kontrol noktasında durur.
+        """
+        job = self._fetch(job_id)
+        if not job:
+            raise NotFoundError('İş bulunamadı')
+        if job['status'] in FINISHED_STATUSES:
+            return self._format(job)
+        with self._lock:
+            self._cancel_flags.add(job_id)
+            future = self._futures.get(job_id)
+        if job['status'] == 'queued' and future is not None and future.cancel():
+            self._finish(job_id, 'cancelled', message='Başlamadan iptal edildi')
+        else:
+            self._update(job_id, {'cancel_requested': 1})
+        return self.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """5.3.5. Bu süreçteki kuyruk derinliği (veritabanına gitmez)."""
+        with self._lock:
+            futures = list(self._futures.values())
+        running = sum(1 for future in futures if future.running())
+        return {'workers': self.max_workers, 'running': running, 'queued': len(futures) - running}
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Thread pool'u kapatır (testler ve süreç sonu için)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # -------------------------------------------------------------------------
+    # 5.4. Çalıştırma
+    # -------------------------------------------------------------------------
+
+    def _run(self, job_id: str) -> None:
+        """5.4.1. İşi pool thread'inde çalıştırır ve sonucunu kaydeder."""
+        job = self._fetch(job_id)
+        if not job or job['status'] != 'queued':
+            return
+        if job.get('cancel_requested') or self._cancel_flag(job_id):
+            self._finish(job_id, 'cancelled', message='Başlamadan iptal edildi')
+            return
+        now = time.time()
+        self._update(job_id, {'status': 'running', 'started_at': now})
+        params = json.loads(job.get('params') or '{}')
+        context = JobContext(self, job_id, params, user_id=job.get('created_by'))
+        try:
+            result = self._handlers[job['job_type']](context, **params)
+            if context.is_cancelled():
+                self._finish(job_id, 'cancelled', result=result, message='İptal edildi')
+            else:
+                self._finish(job_id, 'completed', result=result)
+        except JobCancelled:
+            self._finish(job_id, 'cancelled', message='İptal edildi')
+        except Exception as e:
+            logger.error(f"Background job {job_id} ({job['job_type']}) failed: {str(e)}")
+            self._finish(job_id, 'failed', error=str(e))
+
+    def _finish(self, job_id: str, status: str, result: Any = None,
+                error: Optional[str] = None, message: Optional[str] = None) -> None:
+        fields: Dict[str, Any] = {'status': status, 'finished_at': time.time()}
+        if result is not None:
+            fields['result'] = json.dumps(result, ensure_ascii=False, default=str)
+        if error is not None:
+            fields['error'] = error
+        if message is not None:
+            fields['message'] = message[:255]
+        self._update(job_id, fields)
+
+    def _forget(self, job_id: str) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+            self._cancel_flags.discard(job_id)
+
+    def _cancel_flag(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._cancel_flags
+
+    # -------------------------------------------------------------------------
+    # 5.5. Tablo Yardımcıları
+    # -------------------------------------------------------------------------
+
+    def _ensure_table(self) -> None:
+        """Tabloyu ilk kullanımda oluşturur ve ölü süreçlerden kalan işleri kapatır."""
+        if self._table_ready:
+            return
+        with self.db as conn:
+            conn.cursor.execute(BACKGROUND_JOBS_TABLE_SQL)
+            try:
+                conn.cursor.execute(BACKGROUND_JOBS_INDEX_SQL)
+            except Exception:
+                pass  # index zaten var
+        self._table_ready = True
+        self._recover_orphans()
+
+    def _recover_orphans(self) -> None:
+        """Bu makinede artık yaşamayan süreçlerin bıraktığı açık işleri 'failed' yapar."""
+        host = socket.gethostname()
+        try:
+            with self.db as conn:
+                conn.cursor.execute(
+                    "SELECT job_id, owner FROM background_jobs WHERE status IN ('queued', 'running')"
+                )
+                orphans = []
+                for row in conn.cursor.fetchall():
+                    owner_host, _, pid = (row.get('owner') or '').rpartition(':')
+                    if owner_host == host and pid.isdigit() and row['owner'] != self.owner \
+                            and not _pid_alive(int(pid)):
+                        orphans.append(row['job_id'])
+                for job_id in orphans:
+                    conn.cursor.execute("""
+                        UPDATE background_jobs
+                        SET status = 'failed', error = %s, finished_at = %s, updated_at = %s
+                        WHERE job_id = %s
+                    """, ('Süreç yeniden başladığı için iş yarıda kaldı', time.time(), time.time(), job_id))
+        except Exception as e:
+            logger.error(f"Background job recovery failed: {str(e)}")
+
+    def _fetch(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self._ensure_table()
+        # İlerleme sorguları replica gecikmesine takılmasın diye primary'den okunur
+        with self.db as conn:
+            conn.cursor.execute("SELECT * FROM background_jobs WHERE job_id = %s", (job_id,))
+            return conn.cursor.fetchone()
+
+    def _update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        fields = dict(fields, updated_at=time.time())
+        assignments = ', '.join(f"{column} = %s" for column in fields)
+        try:
+            with self.db as conn:
+                conn.cursor.execute(
+                    f"UPDATE background_jobs SET {assignments} WHERE job_id = %s",
+                    tuple(fields.values()) + (job_id,)
+                )
+        except Exception as e:
+            logger.error(f"Background job {job_id} update failed: {str(e)}")
+
+    def _format(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Tablo satırını API yanıtına çevirir (zamanlar ISO, JSON alanları çözülmüş)."""
+        total = job.get('progress_total')
+        current = job.get('progress_current') or 0
+        return {
+            'job_id': job['job_id'],
+            'job_type': job['job_type'],
+            'status': job['status'],
+            'message': job.get('message'),
+            'progress': {
+                'current': current,
+                'total': total,
+                'percent': round(100.0 * current / total, 1) if total else None
+            },
+            'cancel_requested': bool(job.get('cancel_requested')),
+            'params': _loads(job.get('params')),
+            'result': _loads(job.get('result')),
+            'error': job.get('error'),
+            'created_by': job.get('created_by'),
+            'created_at': _iso(job.get('created_at')),
+            'started_at': _iso(job.get('started_at')),
+            'finished_at': _iso(job.get('finished_at')),
+            'updated_at': _iso(job.get('updated_at'))
+        }
+
+
+def _loads(value: Optional[str]) -> Any:
+    try:
+        return json.loads(value) if value else None
+    except (TypeError, ValueError):
+        return value
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(float(timestamp)).isoformat() if timestamp else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+# =============================================================================
+# 6.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Süreç genelindeki JobRunner örneğini döner (ilk çağrıda oluşturulur)."""
+    global _job_runner
+    if _job_runner is None:
+        with _job_runner_lock:
+            if _job_runner is None:
+                from config import get_config
+                workers = getattr(get_config().APP, 'BACKGROUND_JOB_WORKERS', 2)
+                _job_runner = JobRunner(max_workers=workers)
+    return _job_runner
@@ -0,0 +1,370 @@
+# =============================================================================
+# SYSTEM METRICS SAMPLER
+# =============================================================================
+# Sistem ve uygulama metriklerini arka plan thread'inde sabit aralıkla
+# (AppConfig.METRICS_SAMPLE_INTERVAL) toplayıp sabit boyutlu bir halka
+# tamponda (AppConfig.METRICS_HISTORY örnek) tutar. /api/status ve admin
+# metrik uç noktaları ölçüm yapmaz, son örneği ve kısa geçmişi anında okur;
+# böylece istek thread'i `cpu_percent(interval=1)` gibi bekleyen çağrılarla
+# bloklanmaz.
+#
+# Örnek içeriği:
+#   cpu_percent / memory / disk / network   psutil kuruluysa (pip install
+#                                           psutil); değilse load average ve
+#                                           disk kullanımı stdlib'den okunur
+#   network.*_per_sec                       iki örnek arasındaki farktan
+#   gauges                                  register_gauge ile eklenen
+#                                           uygulama ölçümleri (DB pool
+#                                           kullanımı, süren Gemini çağrıları,
+#                                           kuyruk derinlikleri)
+#
+# Thread ilk get_metrics_sampler().start() çağrısında (warm-up 'metrics'
+# adımı veya ilk metrik isteği) başlar; fork edilen worker'da süreç kimliği
+# değiştiği için yeniden başlatılır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. ÖLÇÜM FONKSİYONLARI
+# 5.0. METRICS SAMPLER SINIFI
+#   5.1. register_gauge(self, name, fn)
+#   5.2. start(self) / stop(self)
+#   5.3. sample(self)
+#   5.4. latest(self) / history(self, limit)
+#   5.5. stats(self)
+# 6.0. UYGULAMA GÖSTERGELERİ
+# 7.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 4.0. ÖLÇÜM FONKSİYONLARI
+# =============================================================================
+
+def _cpu() -> Dict[str, Any]:
+    # interval=None: son çağrıdan bu yana geçen süredeki kullanım, beklemez
+    data: Dict[str, Any] = {'cpu_percent': psutil.cpu_percent(interval=None) if psutil else None}
+    try:
+        data['load_average'] = [round(value, 2) for value in os.getloadavg()]
+    except (AttributeError, OSError):
+        data['load_average'] = None
+    return data
+
+
+def _memory() -> Optional[Dict[str, Any]]:
+    if psutil is None:
+        return None
+    memory = psutil.virtual_memory()
+    return {
+        'total': memory.total,
+        'available': memory.available,
+        'used': memory.used,
+        'percent': memory.percent,
+    }
+
+
+def _disk(path: str) -> Dict[str, Any]:
+    disk = psutil.disk_usage(path) if psutil else shutil.disk_usage(path)
+    return {
+        'total': disk.total,
+        'used': disk.used,
+        'free': disk.free,
+        'percent': round((disk.used / disk.total) * 100, 2) if disk.total else None,
+    }
+
+
+def _network() -> Optional[Dict[str, Any]]:
+    if psutil is None:
+        return None
+    network = psutil.net_io_counters()
+    return {
+        'bytes_sent': network.bytes_sent,
+        'bytes_recv': network.bytes_recv,
+        'packets_sent': network.packets_sent,
+        'packets_recv': network.packets_recv,
+    }
+
+# =============================================================================
+# 5.0. METRICS SAMPLER SINIFI
+# =============================================================================
+
+class MetricsSampler:
+    """
+    Metrikleri arka planda toplayan, son N örneği tutan örnekleyici.
+
+    Okuyucular (istek thread'leri) yalnızca tampondaki hazır sözlükleri
+    kopyalar; ölçüm maliyeti tamamen örnekleyici thread'indedir.
+    """
+
+    def __init__(self, interval: float = 5.0, history: int = 120, disk_path: str = '/') -> None:
+        self.interval = max(0.5, float(interval))
+        self.disk_path = disk_path
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=max(1, int(history)))
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._previous_network: Optional[Dict[str, Any]] = None
+        self._previous_time: Optional[float] = None
+        self._counters = {'samples': 0, 'errors': 0, 'last_duration_ms': None}
+
+    # -------------------------------------------------------------------------
+    # 5.1. Uygulama göstergeleri
+    # -------------------------------------------------------------------------
+
+    def register_gauge(self, name: str, fn: Callable[[], Any]) -> None:
+        """5.1. Her örnekte çağrılacak göstergeyi ekler (hata verirse değeri None olur)."""
+        with self._lock:
+            self._gauges[name] = fn
+
+    # -------------------------------------------------------------------------
+    # 5.2. Thread yönetimi
+    # -------------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._pid == os.getpid()
+
+    def start(self) -> bool:
+        """
+        5.2.1. İlk örneği hemen alır ve örnekleyici thread'ini başlatır
+        (çalışıyorsa bir şey yapmaz).
+
+        Fork sonrası devralınan thread çalışmadığından süreç kimliği
+        değiştiyse tampon temizlenip thread yeniden başlatılır.
+
+        Returns:
+            Bu çağrıda thread başlatıldıysa True
+        """
+        if self.running:
+            return False
+        with self._start_lock:
+            if self.running:
+                return False
+            if self._pid != os.getpid():
+                with self._lock:
+                    self._samples.clear()
+                self._previous_network = self._previous_time = None
+            self._pid = os.getpid()
+            self._stop = threading.Event()
+            # İlk istek boş yanıt almasın; psutil CPU yüzdesi için de referans noktası
+            self.sample()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                            name='metrics-sampler', daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """5.2.2. Thread'i durdurur (tampondaki örnekler korunur)."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval + 1)
+
+    def _run(self, stop: threading.Event) -> None:
+        next_run = time.monotonic() + self.interval
+        while not stop.wait(max(0.0, next_run - time.monotonic())):
+            self.sample()
+            next_run = max(next_run + self.interval, time.monotonic())
+
+    # -------------------------------------------------------------------------
+    # 5.3. Örnekleme
+    # -------------------------------------------------------------------------
+
+    def sample(self) -> Dict[str, Any]:
+        """5.3. Tek bir örnek toplar ve tampona ekler."""
+        started = time.perf_counter()
+        now = time.time()
+        sample: Dict[str, Any] = {'timestamp': datetime.fromtimestamp(now).isoformat(), 'time': now}
+        errors = 0
+        for key, collect in (('cpu', _cpu), ('memory', _memory),
+                             ('disk', lambda: _disk(self.disk_path)), ('network', _network)):
+            try:
+                value = collect()
+            except Exception as e:
+                errors += 1
+                logger.debug("Metric %s could not be collected: %s", key, e)
+                value = None
+            if key == 'cpu':
+                sample.update(value or {'cpu_percent': None, 'load_average': None})
+            else:
+                sample[key] = value
+        self._add_network_rates(sample['network'], now)
+
+        gauges: Dict[str, Any] = {}
+        with self._lock:
+            registered = list(self._gauges.items())
+        for name, fn in registered:
+            try:
+                gauges[name] = fn()
+            except Exception as e:
+                errors += 1
+                logger.debug("Gauge %s could not be collected: %s", name, e)
+                gauges[name] = None
+        sample['gauges'] = gauges
+
+        duration = round((time.perf_counter() - started) * 1000, 2)
+        with self._lock:
+            self._samples.append(sample)
+            self._counters['samples'] += 1
+            self._counters['errors'] += errors
+            self._counters['last_duration_ms'] = duration
+        return sample
+
+    def _add_network_rates(self, network: Optional[Dict[str, Any]], now: float) -> None:
+        previous, previous_time = self._previous_network, self._previous_time
+        self._previous_network, self._previous_time = network, now
+        if network is None or previous is None or not previous_time or now <= previous_time:
+            return
+        elapsed = now - previous_time
+        for key in ('bytes_sent', 'bytes_recv'):
+            network[f'{key}_per_sec'] = round(max(0, network[key] - previous[key]) / elapsed, 1)
+
+    # -------------------------------------------------------------------------
+    # 5.4. Okuma
+    # -------------------------------------------------------------------------
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """5.4.1. Son örnek (yaşı 'age_seconds' alanında); henüz örnek yoksa None."""
+        with self._lock:
+            if not self._samples:
+                return None
+            sample = dict(self._samples[-1])
+        sample['age_seconds'] = round(time.time() - sample['time'], 2)
+        return sample
+
+    def history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """5.4.2. Son `limit` örnek (eskiden yeniye)."""
+        with self._lock:
+            samples = list(self._samples)
+        if limit is not None:
+            samples = samples[-max(0, int(limit)):] if limit > 0 else []
+        return samples
+
+    # -------------------------------------------------------------------------
+    # 5.5. Durum
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        5.5. Örnekleyici durumu.
+
+        Returns:
+            {'running', 'interval', 'history', 'buffered', 'samples', 'errors',
+             'last_duration_ms', 'psutil', 'gauges'}
+        """
+        with self._lock:
+            data = dict(self._counters)
+            data.update({
+                'interval': self.interval,
+                'history': self._samples.maxlen,
+                'buffered': len(self._samples),
+                'gauges': sorted(self._gauges),
+            })
+        data['running'] = self.running
+        data['psutil'] = psutil is not None
+        return data
+
+# =============================================================================
+# 6.0. UYGULAMA GÖSTERGELERİ
+# =============================================================================
+# Göstergeler yalnızca zaten oluşturulmuş nesneleri okur; örnekleyici
+# bir servisi, pool'u veya süreç havuzunu kendisi başlatmaz.
+
+def _db_pools() -> Any:
+    from app.database.db_connection import pool_stats
+    return pool_stats()
+
+
+def _gemini_in_flight() -> Any:
+    from app.services.gemini_api_service import in_flight_requests
+    return in_flight_requests()
+
+
+def _password_hasher_queue() -> Any:
+    from app.services import password_hasher
+    hasher = password_hasher._password_hasher
+    if hasher is None:
+        return None
+    data = hasher.stats()
+    return {'in_flight': data['in_flight'], 'queued': data['queued']}
+
+
+def _job_queue() -> Any:
+    from app.services import job_runner
+    runner = job_runner._job_runner
+    return runner.stats() if runner is not None else None
+
+
+def _log_queue() -> Any:
+    from app.utils.logging_utils import log_queue_size
+    return log_queue_size()
+
+
+DEFAULT_GAUGES: Dict[str, Callable[[], Any]] = {
+    'db_pools': _db_pools,
+    'gemini_in_flight': _gemini_in_flight,
+    'password_hasher': _password_hasher_queue,
+    'background_jobs': _job_queue,
+    'log_queue': _log_queue,
+}
+
+# =============================================================================
+# 7.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+_metrics_sampler: Optional[MetricsSampler] = None
+_metrics_sampler_lock = threading.Lock()
+
+
+def get_metrics_sampler() -> MetricsSampler:
+    """Süreç genelindeki MetricsSampler örneğini döner (ilk çağrıda oluşturulur, başlatılmaz)."""
+    global _metrics_sampler
+    if _metrics_sampler is None:
+        with _metrics_sampler_lock:
+            if _metrics_sampler is None:
+                from config import get_config
+                app_config = get_config().APP
+                sampler = MetricsSampler(
+                    interval=getattr(app_config, 'METRICS_SAMPLE_INTERVAL', 5),
+                    history=getattr(app_config, 'METRICS_HISTORY', 120),
+                )
+                for name, fn in DEFAULT_GAUGES.items():
+                    sampler.register_gauge(name, fn)
+                _metrics_sampler = sampler
+    return _metrics_sampler
+
+
+def ensure_metrics_sampler() -> Optional[MetricsSampler]:
+    """
+    Örnekleyiciyi gerekirse başlatıp döner; AppConfig.METRICS_SAMPLER_ENABLED
+    kapalıysa None döner (uç noktalar bu durumda anlık ölçüme düşer).
+    """
+    from config import get_config
+    if not getattr(get_config().APP, 'METRICS_SAMPLER_ENABLED', True):
+        return None
+    sampler = get_metrics_sampler()
+    sampler.start()
+    return sampler
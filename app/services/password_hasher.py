@@ -0,0 +1,299 @@
+# =============================================================================
+# PASSWORD HASHER
+# =============================================================================
+# Şifre hash'leme ve doğrulama (scrypt) CPU-yoğun işlemlerdir; istek
+# thread'inde çalıştırıldıklarında yoğun giriş anlarında (ör. ders başı
+# toplu giriş) aynı worker'daki tüm diğer endpoint'leri aç bırakırlar.
+# Bu modül hash işlemlerini çekirdek sayısı kadar süreçten oluşan ayrı bir
+# havuzda çalıştırır. Havuzun önünde sınırlı bir kuyruk vardır; kuyruk
+# doluysa istek beklemeden ServiceUnavailableError (503) ile reddedilir.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. SÜREÇ İÇİNDE ÇALIŞAN FONKSİYONLAR
+# 5.0. PASSWORD HASHER SINIFI
+#   5.1. Constructor ve Başlatma
+#   5.2. Genel API
+#     5.2.1. hash_password(self, password)
+#     5.2.2. verify_password(self, stored_hash, password)
+#     5.2.3. needs_rehash(self, stored_hash) / note_rehash(self)
+#     5.2.4. stats(self)
+#     5.2.5. shutdown(self)
+#     5.2.6. warm_up(self)
+#   5.3. Çalıştırma
+#     5.3.1. _submit(self, fn, *args)
+#     5.3.2. _release(self)
+#     5.3.3. _executor(self)
+# 6.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.utils.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Gecikme yüzdelikleri için saklanan son ölçüm sayısı
+LATENCY_SAMPLES = 2048
+# Kuyruk doluyken istemciye önerilen bekleme (saniye, Retry-After)
+OVERLOAD_RETRY_AFTER = 2
+
+# =============================================================================
+# 4.0. SÜREÇ İÇİNDE ÇALIŞAN FONKSİYONLAR
+# =============================================================================
+# ProcessPoolExecutor'a gönderilebilmeleri için modül seviyesinde tanımlıdır.
+
+def _hash(password: str, method: str) -> str:
+    return generate_password_hash(password, method=method)
+
+
+def _verify(stored_hash: str, password: str) -> bool:
+    return check_password_hash(stored_hash, password)
+
+
+def hash_method(rounds: int) -> str:
+    """İş faktörüne (log2) karşılık gelen werkzeug hash yöntemi: scrypt:N:8:1"""
+    return f"scrypt:{2 ** max(10, int(rounds))}:8:1"
+
+# =============================================================================
+# 5.0. PASSWORD HASHER SINIFI
+# =============================================================================
+
+class PasswordHasher:
+    """
+    Sınırlı kuyruklu şifre hash'leme havuzu.
+
+    Aynı anda en fazla `workers + queue_size` işlem kabul edilir; fazlası
+    `queue_wait_ms` kadar bekledikten sonra ServiceUnavailableError ile
+    reddedilir. `executor` 'process' (varsayılan), 'thread' veya 'inline'
+    olabilir; süreç havuzu oluşturulamazsa thread havuzuna düşülür.
+    """
+
+    # -------------------------------------------------------------------------
+    # 5.1. Constructor ve Başlatma
+    # -------------------------------------------------------------------------
+
+    def __init__(self, rounds: int = 15, executor: str = 'process', workers: int = 0,
+                 queue_size: int = 32, queue_wait_ms: int = 0, timeout: float = 10) -> None:
+        self.method = hash_method(rounds)
+        self.mode = executor if executor in ('process', 'thread', 'inline') else 'process'
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + max(0, queue_size)
+        self.queue_wait = max(0, queue_wait_ms) / 1000.0
+        self.timeout = timeout
+
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._counters = {'submitted': 0, 'completed': 0, 'rejected': 0, 'timeouts': 0, 'rehashed': 0}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    # -------------------------------------------------------------------------
+    # 5.2. Genel API
+    # -------------------------------------------------------------------------
+
+    def hash_password(self, password: str) -> str:
+        """5.2.1. Şifreyi geçerli iş faktörüyle hash'ler."""
+        return self._submit(_hash, password, self.method)
+
+    def verify_password(self, stored_hash: Optional[str], password: str) -> bool:
+        """5.2.2. Şifreyi saklanan hash ile karşılaştırır (hash yoksa False)."""
+        if not stored_hash:
+            return False
+        return bool(self._submit(_verify, stored_hash, password))
+
+    def needs_rehash(self, stored_hash: Optional[str]) -> bool:
+        """5.2.3. Hash farklı bir yöntem/iş faktörüyle üretilmişse True."""
+        if not stored_hash or '$' not in stored_hash:
+            return False
+        return stored_hash.split('$', 1)[0] != self.method
+
+    def note_rehash(self) -> None:
+        """Girişte yapılan yeniden hash'lemeyi metriklere işler."""
+        with self._lock:
+            self._counters['rehashed'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        5.2.4. Kuyruk derinliği ve gecikme metrikleri.
+
+        Returns:
+            {'method', 'executor', 'workers', 'capacity', 'in_flight', 'queued',
+             'peak_in_flight', 'submitted', 'completed', 'rejected', 'timeouts',
+             'rehashed', 'p50_ms', 'p99_ms'}
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+            in_flight = self._in_flight
+            data = dict(self._counters)
+            data.update({
+                'method': self.method,
+                'executor': self.mode,
+                'workers': self.workers,
+                'capacity': self.capacity,
+                'in_flight': in_flight,
+                'queued': max(0, in_flight - self.workers),
+                'peak_in_flight': self._peak_in_flight,
+            })
+        data['p50_ms'] = _percentile(samples, 0.50)
+        data['p99_ms'] = _percentile(samples, 0.99)
+        return data
+
+    def shutdown(self, wait: bool = False) -> None:
+        """5.2.5. Havuzu kapatır (sonraki çağrıda yeniden oluşturulur)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def warm_up(self) -> int:
+        """
+        5.2.6. Havuzu oluşturur ve çalışanları başlatır (ilk girişte süreç
+        başlatma maliyeti ödenmesin diye). Başlatılan çalışan sayısını döner.
+        """
+        pool = self._executor()
+        if pool is None:
+            return 0
+        futures = [pool.submit(os.getpid) for _ in range(self.workers)]
+        for future in futures:
+            future.result(timeout=self.timeout)
+        return len(futures)
+
+    # -------------------------------------------------------------------------
+    # 5.3. Çalıştırma
+    # -------------------------------------------------------------------------
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        5.3.1. İşi havuzda çalıştırır ve sonucunu bekler.
+
+        Kuyruk yeri iş bitince bırakılır: zaman aşımında iş iptal
+        edilemiyorsa (havuzda çalışmaya devam ediyorsa) yer, future'ın
+        done-callback'inde bırakılır; böylece zaman aşımına uğrayan işler
+        `capacity` sınırını aşacak şekilde birikmez.
+
+        Raises:
+            ServiceUnavailableError: Kuyruk dolu ya da işlem zaman aşımına uğradı.
+        """
+        if self.queue_wait:
+            acquired = self._slots.acquire(timeout=self.queue_wait)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        if not acquired:
+            with self._lock:
+                self._counters['rejected'] += 1
+            raise ServiceUnavailableError('Sunucu şu anda yoğun, lütfen tekrar deneyin',
+                                          retry_after=OVERLOAD_RETRY_AFTER, resource='password_hasher')
+        started = time.perf_counter()
+        with self._lock:
+            self._counters['submitted'] += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        release_on_done = False
+        try:
+            pool = self._executor()
+            if pool is None:
+                return fn(*args)
+            try:
+                future = pool.submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError):
+                # Ölen bir süreç havuzu bozar; bir kez yeniden oluşturup dene
+                self.shutdown()
+                future = self._executor().submit(fn, *args)
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                if not future.cancel():
+                    # İş hâlâ çalışıyor; kuyruk yeri o bitince bırakılır
+                    release_on_done = True
+                    future.add_done_callback(lambda _future: self._release())
+                with self._lock:
+                    self._counters['timeouts'] += 1
+                raise ServiceUnavailableError('Şifre doğrulama zaman aşımına uğradı',
+                                              retry_after=OVERLOAD_RETRY_AFTER, resource='password_hasher')
+            except BrokenProcessPool:
+                self.shutdown()
+                raise ServiceUnavailableError('Şifre doğrulama havuzu yeniden başlatılıyor',
+                                              retry_after=OVERLOAD_RETRY_AFTER, resource='password_hasher')
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._latencies.append(elapsed_ms)
+            if not release_on_done:
+                self._release()
+
+    def _release(self) -> None:
+        """5.3.2. İş bittiğinde kuyruk yerini ve in_flight sayacını bırakır."""
+        with self._lock:
+            self._in_flight -= 1
+            self._counters['completed'] += 1
+        self._slots.release()
+
+    def _executor(self) -> Optional[Executor]:
+        """5.3.3. Havuzu ilk kullanımda oluşturur ('inline' modda None)."""
+        if self.mode == 'inline':
+            return None
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.mode == 'process':
+                        try:
+                            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                        except (OSError, NotImplementedError, ValueError) as e:
+                            logger.warning(f"Password hasher process pool unavailable, using threads: {e}")
+                            self.mode = 'thread'
+                    if self._pool is None:
+                        self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                                        thread_name_prefix='password-hasher')
+        return self._pool
+
+
+def _percentile(samples, fraction: float) -> Optional[float]:
+    if not samples:
+        return None
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return round(samples[index], 2)
+
+# =============================================================================
+# 6.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Süreç genelindeki PasswordHasher örneğini döner (ilk çağrıda oluşturulur)."""
+    global _password_hasher
+    if _password_hasher is None:
+        with _password_hasher_lock:
+            if _password_hasher is None:
+                from config import get_config
+                security = get_config().SECURITY
+                _password_hasher = PasswordHasher(
+                    rounds=getattr(security, 'PASSWORD_SALT_ROUNDS', 15),
+                    executor=getattr(security, 'PASSWORD_HASH_EXECUTOR', 'process'),
+                    workers=getattr(security, 'PASSWORD_HASH_WORKERS', 0),
+                    queue_size=getattr(security, 'PASSWORD_HASH_QUEUE_SIZE', 32),
+                    queue_wait_ms=getattr(security, 'PASSWORD_HASH_QUEUE_WAIT_MS', 0),
+                    timeout=getattr(security, 'PASSWORD_HASH_TIMEOUT', 10),
+                )
+    return _password_hasher
@@ -0,0 +1,496 @@
+# =============================================================================
+# RATE LIMITER
+# =============================================================================
+# APIConfig.API_RATE_LIMIT / API_RATE_LIMIT_WINDOW ayarlarını uygular.
+# Her /api isteği bir uç nokta sınıfına (politika) aittir: 'default',
+# 'ai' (Gemini kotasını tüketen sohbet uçları), 'poll' (quiz durum/timer
+# yoklaması) ve 'auth' (giriş/kayıt). Anahtar, giriş yapmış kullanıcı için
+# user_id, diğerleri için istemci IP'sidir. 'auth' bütçesi IP + gönderilen
+# hesap (email) başınadır; aynı NAT/proxy arkasındaki bir okulun tamamı
+# yalnızca IP başına geniş 'auth_ip' tavanını paylaşır. İstemci IP'si
+# SecurityConfig.TRUSTED_PROXY_HOPS kadar güvenilen proxy atlanarak
+# (werkzeug ProxyFix, bkz. main.py) alınır.
+#   - Token bucket: kısa vadeli patlamaları `burst` ile sınırlar, ortalama
+#     hızı limit/window'a oturtur.
+#   - Kayan pencere (iki pencereli sayaç yaklaşımı, anahtar başına O(1)
+#     bellek): politikada `quota` varsa uzun vadeli bütçeyi (ör. günlük AI
+#     isteği) sınırlar.
+#   - Retry-After her iki algoritmada da durumdan kapalı formülle
+#     hesaplanır; ek sorgu veya tarama gerekmez.
+# Depo takılabilir: 'memory' (süreç içi, LRU sınırlı) veya 'sqlite'
+# (aynı makinedeki worker'ların paylaştığı yerel stand-in; Redis gibi bir
+# paylaşılan depo aynı metotları uygulayarak eklenebilir). SQLite
+# deposundaki süresi dolmuş anahtarlar SWEEP_INTERVAL'da bir silinir;
+# bağlantısı fork'tan sonra reopen_after_fork() ile yeniden açılır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. ALGORİTMALAR
+#   4.1. _bucket_step(state, rate, capacity, now)
+#   4.2. _window_step(state, limit, window, now)
+# 5.0. DEPOLAR
+#   5.1. MemoryRateLimitBackend
+#   5.2. SQLiteRateLimitBackend
+# 6.0. RATE LIMITER SINIFI
+#   6.1. check(self, policy, identity)
+#   6.2. stats(self)
+#   6.3. _maybe_sweep(self, now)
+# 7.0. FLASK ENTEGRASYONU
+#   7.1. rate_limit(policy) dekoratörü
+#   7.2. _auth_account()
+#   7.3. init_rate_limiter(app, config_class)
+# 8.0. SINGLETON ERİŞİMİ
+#   8.1. reopen_after_fork()
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.utils.exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# (izin verildi mi, kalan, Retry-After saniye)
+Decision = Tuple[bool, int, float]
+
+# Süresi dolmuş anahtar taraması aralığı (saniye)
+SWEEP_INTERVAL = 300
+# Anahtar, son kullanımından bu kadar pencere sonra silinebilir
+STATE_TTL_WINDOWS = 2
+
+# =============================================================================
+# 4.0. ALGORİTMALAR
+# =============================================================================
+# Her iki depo da aynı adım fonksiyonlarını kullanır; depo yalnızca durumu
+# (bucket: tokens, updated / pencere: start, current, previous) saklar.
+
+def _bucket_step(state: Optional[Tuple[float, float]], rate: float, capacity: float,
+                 now: float) -> Tuple[Tuple[float, float], Decision]:
+    """4.1. Token bucket: birikmiş jetonları ekler, bir jeton harcamayı dener."""
+    tokens, updated = state if state else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    if tokens >= 1:
+        tokens -= 1
+        return (tokens, now), (True, int(tokens), 0.0)
+    return (tokens, now), (False, 0, (1 - tokens) / rate)
+
+
+def _window_step(state: Optional[Tuple[float, int, int]], limit: int, window: float,
+                 now: float) -> Tuple[Tuple[float, int, int], Decision]:
+    """
+    4.2. Kayan pencere sayacı: tahmini sayı = önceki pencere * kalan oran
+    + mevcut pencere. Reddedilirse tahminin limitin altına ineceği an
+    doğrudan hesaplanır.
+    """
+    start = math.floor(now / window) * window
+    current = previous = 0
+    if state:
+        if state[0] == start:
+            _, current, previous = state
+        elif state[0] == start - window:
+            previous = state[1]
+    elapsed = now - start
+    estimate = previous * (1 - elapsed / window) + current
+    if estimate + 1 <= limit:
+        current += 1
+        return (start, current, previous), (True, int(limit - estimate - 1), 0.0)
+    if current + 1 > limit:
+        # Bu pencere tek başına dolu: sonraki pencerede bu sayı "önceki" olur
+        retry = (window - elapsed) + window * (1 - (limit - 1) / current)
+    else:
+        retry = window * (1 - (limit - 1 - current) / previous) - elapsed
+    return (start, current, previous), (False, 0, max(retry, 0.0))
+
+# =============================================================================
+# 5.0. DEPOLAR
+# =============================================================================
+# Ortak arayüz: consume(key, rate, capacity, now) ve
+# hit(key, limit, window, now) Decision döner; sweep(now) süresi dolmuş
+# anahtarları siler ve silinen sayıyı döner.
+
+class MemoryRateLimitBackend:
+    """5.1. Süreç içi depo; en uzun süredir kullanılmayan anahtarlar atılır."""
+
+    name = 'memory'
+
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max(1, max_keys)
+        self._state: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rate: float, capacity: float, now: float) -> Decision:
+        return self._step(key, lambda state: _bucket_step(state, rate, capacity, now))
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> Decision:
+        return self._step(key, lambda state: _window_step(state, limit, window, now))
+
+    def _step(self, key: str, step: Callable[[Any], Tuple[tuple, Decision]]) -> Decision:
+        with self._lock:
+            state, decision = step(self._state.get(key))
+            self._state[key] = state
+            self._state.move_to_end(key)
+            while len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        return decision
+
+    def sweep(self, now: float) -> int:
+        # LRU ile sınırlı; süre dolumu taraması gerekmez
+        return 0
+
+    def count(self) -> int:
+        return len(self._state)
+
+
+class SQLiteRateLimitBackend:
+    """
+    5.2. Paylaşılan depo için yerel stand-in: durum WAL modlu bir SQLite
+    dosyasındadır, oku-güncelle adımı BEGIN IMMEDIATE ile süreçler arası
+    atomiktir. Her satır expires_at taşır; sweep() eski satırları siler.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._inherited: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_state ("
+            "key TEXT PRIMARY KEY, a REAL NOT NULL, b REAL NOT NULL, c REAL NOT NULL DEFAULT 0, "
+            "expires_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(rate_limit_state)")}
+        if 'expires_at' not in columns:
+            # Eski şema: mevcut satırlar ilk taramada silinir
+            self._conn.execute(
+                "ALTER TABLE rate_limit_state ADD COLUMN expires_at REAL NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limit_expires ON rate_limit_state (expires_at)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def reopen(self) -> None:
+        """
+        Fork edilen worker'da yeni bağlantı açar; devralınan bağlantı
+        kapatılmadan bırakılır (bkz. session_store.SQLiteSessionBackend).
+        """
+        self._inherited.append(self._conn)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def consume(self, key: str, rate: float, capacity: float, now: float) -> Decision:
+        expires_at = now + STATE_TTL_WINDOWS * capacity / rate
+        return self._step(key, 2, expires_at, lambda state: _bucket_step(state, rate, capacity, now))
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> Decision:
+        def step(state):
+            if state:
+                state = (state[0], int(state[1]), int(state[2]))
+            return _window_step(state, limit, window, now)
+        return self._step(key, 3, now + STATE_TTL_WINDOWS * window, step)
+
+    def _step(self, key: str, width: int, expires_at: float,
+              step: Callable[[Any], Tuple[tuple, Decision]]) -> Decision:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT a, b, c FROM rate_limit_state WHERE key = ?", (key,)
+                ).fetchone()
+                state, decision = step(tuple(row[:width]) if row else None)
+                values = tuple(state) + (0,) * (3 - width)
+                self._conn.execute(
+                    "INSERT INTO rate_limit_state (key, a, b, c, expires_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET a = excluded.a, b = excluded.b, c = excluded.c, "
+                    "expires_at = excluded.expires_at",
+                    (key,) + values + (expires_at,)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return decision
+
+    def sweep(self, now: float) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM rate_limit_state WHERE expires_at < ?", (now,)
+            ).rowcount
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rate_limit_state").fetchone()[0]
+
+# =============================================================================
+# 6.0. RATE LIMITER SINIFI
+# =============================================================================
+
+def build_policies(api_config) -> Dict[str, Dict[str, Any]]:
+    """
+    APIConfig'ten politika tablosunu oluşturur.
+
+    Politika: {'limit', 'window' (saniye), 'burst' (bucket kapasitesi),
+    'quota': (istek, saniye) veya None}
+    """
+    limit = getattr(api_config, 'API_RATE_LIMIT', 100)
+    window = getattr(api_config, 'API_RATE_LIMIT_WINDOW', 60)
+    ai_daily = getattr(api_config, 'AI_DAILY_LIMIT', 200)
+    return {
+        'default': {'limit': limit, 'window': window, 'burst': limit, 'quota': None},
+        'ai': {
+            'limit': getattr(api_config, 'AI_RATE_LIMIT', 10),
+            'window': getattr(api_config, 'AI_RATE_LIMIT_WINDOW', 60),
+            'burst': getattr(api_config, 'AI_RATE_LIMIT_BURST', 3),
+            'quota': (ai_daily, 86400) if ai_daily else None,
+        },
+        'poll': {
+            'limit': getattr(api_config, 'POLL_RATE_LIMIT', 60),
+            'window': getattr(api_config, 'POLL_RATE_LIMIT_WINDOW', 60),
+            'burst': getattr(api_config, 'POLL_RATE_LIMIT', 60),
+            'quota': None,
+        },
+        'auth': {
+            'limit': getattr(api_config, 'AUTH_RATE_LIMIT', 10),
+            'window': getattr(api_config, 'AUTH_RATE_LIMIT_WINDOW', 300),
+            'burst': getattr(api_config, 'AUTH_RATE_LIMIT', 10),
+            'quota': None,
+        },
+        'auth_ip': {
+            'limit': getattr(api_config, 'AUTH_IP_RATE_LIMIT', 300),
+            'window': getattr(api_config, 'AUTH_RATE_LIMIT_WINDOW', 300),
+            'burst': getattr(api_config, 'AUTH_IP_RATE_LIMIT', 300),
+            'quota': None,
+        },
+    }
+
+
+class RateLimiter:
+    """
+    Politika + kimlik başına token bucket ve isteğe bağlı kayan pencere
+    kotası. Depo hatasında istek reddedilmez (fail-open).
+    """
+
+    def __init__(self, backend, policies: Dict[str, Dict[str, Any]]) -> None:
+        self.backend = backend
+        self.policies = policies
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {
+            name: {'allowed': 0, 'limited': 0} for name in policies
+        }
+        self._errors = 0
+        self._swept = 0
+        self._last_sweep = time.time()
+
+    def check(self, policy: str, identity: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        6.1. İsteği politikanın bütçesinden düşer.
+
+        Returns:
+            {'policy', 'limit', 'remaining'} (yanıt başlıkları için)
+
+        Raises:
+            RateLimitError: Bütçe aşıldı; retry_after saniye cinsindendir.
+        """
+        rule = self.policies.get(policy) or self.policies['default']
+        policy = policy if policy in self.policies else 'default'
+        now = time.time() if now is None else now
+        self._maybe_sweep(now)
+        key = f"{policy}:{identity}"
+        try:
+            allowed, remaining, retry = self.backend.consume(
+                key, rule['limit'] / rule['window'], rule['burst'], now
+            )
+            window_label = f"{rule['limit']}/{rule['window']}s"
+            if allowed and rule['quota']:
+                quota_limit, quota_window = rule['quota']
+                allowed, quota_remaining, retry = self.backend.hit(
+                    f"{key}:quota", quota_limit, quota_window, now
+                )
+                remaining = min(remaining, quota_remaining)
+                if not allowed:
+                    window_label = f"{quota_limit}/{quota_window}s"
+        except Exception as e:
+            logger.error("Rate limit backend failed, allowing request: %s", e)
+            with self._lock:
+                self._errors += 1
+            return {'policy': policy, 'limit': rule['limit'], 'remaining': None}
+
+        with self._lock:
+            self._counters[policy]['allowed' if allowed else 'limited'] += 1
+        if not allowed:
+            raise RateLimitError('Çok fazla istek gönderildi, lütfen biraz bekleyin',
+                                 limit=rule['limit'], window=window_label,
+                                 retry_after=max(1, math.ceil(retry)))
+        return {'policy': policy, 'limit': rule['limit'], 'remaining': remaining}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        6.2. Politika bazında izin verilen/reddedilen istek sayıları.
+
+        Returns:
+            {'backend', 'keys', 'errors', 'swept',
+             'policies': {ad: {'allowed', 'limited'}}}
+        """
+        with self._lock:
+            data = {'policies': {name: dict(c) for name, c in self._counters.items()},
+                    'errors': self._errors, 'swept': self._swept}
+        data['backend'] = self.backend.name
+        try:
+            data['keys'] = self.backend.count()
+        except Exception:
+            data['keys'] = None
+        return data
+
+    def _maybe_sweep(self, now: float) -> None:
+        """6.3. SWEEP_INTERVAL geçtiyse süresi dolmuş anahtarları siler (tek çağıran)."""
+        with self._lock:
+            if now - self._last_sweep < SWEEP_INTERVAL:
+                return
+            self._last_sweep = now
+        try:
+            removed = self.backend.sweep(now)
+        except Exception as e:
+            logger.error("Rate limit sweep failed: %s", e)
+            return
+        with self._lock:
+            self._swept += removed
+
+# =============================================================================
+# 7.0. FLASK ENTEGRASYONU
+# =============================================================================
+
+def rate_limit(policy: Optional[str]) -> Callable:
+    """
+    7.1. Route'un politika sınıfını belirler (None = muaf). Kontrolün kendisi
+    before_request'te tek sefer yapılır; dekoratör yalnızca işaret koyar ve
+    @route'un hemen altına yazılmalıdır.
+    """
+    def decorator(f: Callable) -> Callable:
+        f.rate_limit_policy = policy
+        return f
+    return decorator
+
+
+def _auth_account() -> str:
+    """7.2. Giriş/kayıt gövdesindeki hesap adı (email, yoksa username); küçük harf."""
+    from flask import request
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return ''
+    account = data.get('email') or data.get('username') or ''
+    return str(account).strip().lower()[:254]
+
+
+def init_rate_limiter(app, config_class=None) -> Optional[RateLimiter]:
+    """
+    7.3. /api istekleri için before_request kontrolünü, X-RateLimit-*
+    başlıklarını ve 429 + Retry-After hata yanıtını kaydeder.
+    """
+    from flask import g, jsonify, request, session
+
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    if not getattr(config_class.API, 'RATE_LIMIT_ENABLED', True):
+        return None
+    limiter = get_rate_limiter(config_class)
+
+    @app.before_request
+    def enforce_rate_limit():
+        if not request.path.startswith('/api/'):
+            return None
+        view = app.view_functions.get(request.endpoint)
+        policy = getattr(view, 'rate_limit_policy', 'default')
+        if policy is None:
+            return None
+        if policy == 'auth':
+            # Geniş IP tavanı + IP ve hesap başına dar bütçe
+            ip = request.remote_addr
+            limiter.check('auth_ip', f"ip:{ip}")
+            g.rate_limit = limiter.check('auth', f"ip:{ip}:account:{_auth_account()}")
+            return None
+        user_id = session.get('user_id')
+        identity = f"user:{user_id}" if user_id else f"ip:{request.remote_addr}"
+        g.rate_limit = limiter.check(policy, identity)
+        return None
+
+    @app.after_request
+    def add_rate_limit_headers(response):
+        info = g.get('rate_limit')
+        if info and info['remaining'] is not None:
+            response.headers['X-RateLimit-Limit'] = str(info['limit'])
+            response.headers['X-RateLimit-Remaining'] = str(info['remaining'])
+        return response
+
+    @app.errorhandler(RateLimitError)
+    def handle_rate_limit(error):
+        response = jsonify({
+            'status': 'error',
+            'message': error.message,
+            'details': error.details
+        })
+        response.status_code = 429
+        if error.retry_after:
+            response.headers['Retry-After'] = str(error.retry_after)
+        return response
+
+    return limiter
+
+# =============================================================================
+# 8.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(config_class=None) -> RateLimiter:
+    """Süreç genelindeki RateLimiter örneğini döner (ilk çağrıda oluşturulur)."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                if config_class is None:
+                    from config import get_config
+                    config_class = get_config()
+                api = config_class.API
+                backend_name = getattr(api, 'RATE_LIMIT_BACKEND', 'memory')
+                backend = MemoryRateLimitBackend()
+                if backend_name == 'sqlite':
+                    path = getattr(api, 'RATE_LIMIT_STORE_PATH', '') or str(
+                        Path(__file__).resolve().parents[2] / 'instance' / 'rate_limits.db'
+                    )
+                    try:
+                        backend = SQLiteRateLimitBackend(path)
+                    except (OSError, sqlite3.Error) as e:
+                        logger.error("Shared rate limit store unavailable, using memory: %s", e)
+                _rate_limiter = RateLimiter(backend, build_policies(api))
+    return _rate_limiter
+
+
+def reopen_after_fork() -> None:
+    """8.1. Fork edilen worker'da paylaşılan deponun bağlantısını yeniden açar."""
+    backend = getattr(_rate_limiter, 'backend', None)
+    if hasattr(backend, 'reopen'):
+        backend.reopen()
@@ -0,0 +1,172 @@
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+# Büyük liste yanıtlarının değişmeyen parçalarını süreç içinde tutar.
+# `/quiz/session/<id>/questions` yanıtında her soru için iki sorgu (seçenekler,
+# detaylar) çalıştırılıp aynı seçenek satırları her istekte yeniden JSON'a
+# çevriliyordu. Soru içeriği oturumlar arasında aynıdır; burada soru başına
+# detay sözlüğü ve önceden serileştirilmiş seçenek blob'ları (JSONBlob)
+# saklanır. Seçenek sırası yine her istekte karıştırılır, yalnızca blob
+# listesinin sırası değişir.
+#
+# Soruyu değiştiren işlemler invalidate_question() çağırır; diğer süreçlerdeki
+# kopyalar en geç TTL (APIConfig.RESPONSE_CACHE_TTL) sonunda yenilenir.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. RESPONSE CACHE SINIFI
+#   4.1. get_or_load(self, key, loader)
+#   4.2. invalidate(self, key) / clear(self)
+#   4.3. stats(self)
+# 5.0. SINGLETON ERİŞİMİ VE SORU İÇERİĞİ
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.utils.json_provider import JSONBlob, to_blob
+
+# =============================================================================
+# 4.0. RESPONSE CACHE SINIFI
+# =============================================================================
+
+class ResponseCache:
+    """
+    TTL ve sürüm sayaçlı, LRU sınırlı anahtar/değer önbelleği.
+
+    Değerler paylaşılır (kopyalanmaz); bu yüzden yalnızca değiştirilmeyen
+    nesneler (JSONBlob, tuple, okunup kopyalanan sözlükler) saklanmalıdır.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 5000) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (expires, version, value)
+        self._versions: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'invalidations': 0, 'evictions': 0}
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """
+        4.1. Değeri önbellekten döner; yoksa loader() ile üretip saklar.
+        loader None dönerse sonuç önbelleğe yazılmaz.
+        """
+        now = time.monotonic()
+        with self._lock:
+            version = self._versions.get(key, 0)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] == version:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return entry[2]
+            self._counters['misses'] += 1
+
+        value = loader()
+        if value is None:
+            return None
+
+        with self._lock:
+            # Yükleme sırasında invalidate edildiyse sonucu önbelleğe yazma
+            if self._versions.get(key, 0) == version:
+                self._entries[key] = (now + self.ttl, version, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._counters['evictions'] += 1
+        return value
+
+    def invalidate(self, key: Any) -> None:
+        """4.2. Kaydı düşürür ve sürümünü artırır."""
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.pop(key, None)
+            self._counters['invalidations'] += 1
+
+    def clear(self) -> None:
+        """Tüm kayıtları düşürür (sürüm sayaçları korunur)."""
+        with self._lock:
+            for key in list(self._entries):
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        4.3. Önbellek metrikleri.
+
+        Returns:
+            {'hits', 'misses', 'hit_rate', 'invalidations', 'evictions', 'entries', 'bytes', 'ttl'}
+        """
+        with self._lock:
+            data = dict(self._counters)
+            data['entries'] = len(self._entries)
+            data['bytes'] = sum(_blob_size(entry[2]) for entry in self._entries.values())
+        lookups = data['hits'] + data['misses']
+        data['hit_rate'] = round(data['hits'] / lookups, 4) if lookups else None
+        data['ttl'] = self.ttl
+        return data
+
+
+def _blob_size(value: Any) -> int:
+    if isinstance(value, JSONBlob):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(_blob_size(item) for item in value)
+    return 0
+
+# =============================================================================
+# 5.0. SINGLETON ERİŞİMİ VE SORU İÇERİĞİ
+# =============================================================================
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Süreç genelindeki ResponseCache örneğini döner (ilk çağrıda oluşturulur)."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from config import get_config
+                api = get_config().API
+                _response_cache = ResponseCache(
+                    ttl=getattr(api, 'RESPONSE_CACHE_TTL', 300),
+                    max_entries=getattr(api, 'RESPONSE_CACHE_SIZE', 5000),
+                )
+    return _response_cache
+
+
+def get_question_content(session_service, question_id: int) -> Tuple[Optional[Dict[str, Any]], List[JSONBlob]]:
+    """
+    Sorunun detay sözlüğünü ve serileştirilmiş seçeneklerini döner.
+
+    Returns:
+        (details veya None, [seçenek JSONBlob'ları]) — liste çağırana aittir
+        (karıştırılabilir), detay sözlüğü değiştirilmemelidir.
+    """
+    def _load() -> Optional[Tuple[Dict[str, Any], Tuple[JSONBlob, ...]]]:
+        details = session_service.get_question_details(question_id)
+        if details is None:
+            # Bulunamayan soru veya okuma hatası önbelleğe yazılmaz
+            return None
+        options = session_service.get_question_options(question_id)
+        return details, tuple(to_blob(option) for option in options)
+
+    content = get_response_cache().get_or_load(('question', int(question_id)), _load)
+    if content is None:
+        return None, [to_blob(option) for option in session_service.get_question_options(question_id)]
+    details, option_blobs = content
+    return details, list(option_blobs)
+
+
+def invalidate_question(question_id: Any) -> None:
+    """Soruyu veya seçeneklerini değiştiren işlemlerden sonra çağrılır."""
+    get_response_cache().invalidate(('question', int(question_id)))
@@ -16,8 +16,12 @@
 # =============================================================================
 # 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
 # =============================================================================
+import logging
+import threading
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # 4.0. SERVİS SINIFLARI İMPORT
 # =============================================================================
@@ -48,31 +52,25 @@ class ServiceFactory:
     """
     Servis sınıflarını yöneten fabrika sınıfı.
     Tüm servislerin merkezi erişim noktasıdır.
+
+    Servisler import sırasında değil, ilk get_service() çağrısında
+    oluşturulur (lazy singleton); böylece worker açılışı veritabanına
+    veya servis kurucularının maliyetine bağlı kalmaz.
     """
     
     def __init__(self):
         """Servis fabrikasını başlatır."""
         self._services = {}
-        self._initialize_services()
-    
-    def _initialize_services(self):
-        """Tüm servisleri başlatır."""
-        try:
-            if UserService:
-                self._services['user'] = UserService()
-            
-            if QuizService:
-                self._services['quiz'] = QuizService()
-            
-            if SystemService:
-                self._services['system'] = SystemService()
-                
-        except Exception as e:
-            pass
+        self._factories = {
+            name: cls for name, cls in (
+                ('user', UserService), ('quiz', QuizService), ('system', SystemService)
+            ) if cls
+        }
+        self._lock = threading.Lock()
     
     def get_service(self, service_name: str) -> Optional[Any]:
         """
-        Belirtilen servisi döndürür.
+        Belirtilen servisi döndürür (ilk çağrıda oluşturur).
         
         Args:
             service_name (str): Servis adı ('user', 'quiz', 'system')
@@ -80,7 +78,18 @@ class ServiceFactory:
         Returns:
             Service instance or None if not found
         """
-        return self._services.get(service_name)
+        service = self._services.get(service_name)
+        if service is not None or service_name not in self._factories:
+            return service
+        with self._lock:
+            service = self._services.get(service_name)
+            if service is None:
+                try:
+                    service = self._factories[service_name]()
+                    self._services[service_name] = service
+                except Exception as e:
+                    logger.error("Service %s could not be created: %s", service_name, e)
+            return service
     
     def get_user_service(self) -> Optional[UserService]:
         """UserService'i döndürür."""
@@ -95,12 +104,14 @@ class ServiceFactory:
         return self.get_service('system')
     
     def get_all_services(self) -> Dict[str, Any]:
-        """Tüm servisleri döndürür."""
+        """Tüm servisleri döndürür (henüz oluşturulmamış olanlar da oluşturulur)."""
+        for name in self._factories:
+            self.get_service(name)
         return self._services.copy()
     
     def is_service_available(self, service_name: str) -> bool:
         """Belirtilen servisin mevcut olup olmadığını kontrol eder."""
-        return service_name in self._services
+        return service_name in self._factories
 
 # Global service factory instance
 service_factory = ServiceFactory()
@@ -0,0 +1,560 @@
+# =============================================================================
+# SESSION STORE
+# =============================================================================
+# Flask'ın varsayılan oturumu tüm içeriği (user_id, username, email,
+# is_admin, logged_in) imzalı cookie'de taşır: her istekte cookie'nin imzası
+# doğrulanır ve içeriği çözülür, büyüyen oturum her isteği şişirir.
+# Bu modül isteğe bağlı (SESSION_BACKEND) bir sunucu tarafı oturum deposu
+# sağlar:
+#   - Cookie yalnızca rastgele, opak bir oturum kimliği taşır.
+#   - Oturum verisi ilk erişimde yüklenir (oturuma dokunmayan istekler
+#     depoya hiç gitmez).
+#   - Son aktivite zamanı her istekte yazılmaz; kimlikler biriktirilir ve
+#     SESSION_TOUCH_INTERVAL saniyede bir toplu olarak güncellenir.
+#   - Giriş ve yetki değişiminde session.regenerate() kimliği yeniler: veri
+#     yeni kimlikle yazılır, eski kayıt silinir ve cookie yeniden verilir
+#     (session fixation'a karşı).
+# Depolar: 'memory' (süreç içi LRU, tek worker), 'file' ve 'sqlite'
+# (aynı makinedeki birden çok worker için paylaşılan depo). SQLite
+# bağlantıları fork'tan sonra kullanılamaz; preload_app ile çalışırken
+# worker'da reopen_after_fork() yeni bağlantı açar.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. DEPOLAR
+#   4.1. MemorySessionBackend
+#   4.2. FileSessionBackend
+#   4.3. SQLiteSessionBackend
+# 5.0. OTURUM NESNESİ
+#   5.1. ServerSideSession
+#     5.1.1. regenerate(self)
+# 6.0. SESSION INTERFACE
+#   6.1. open_session(self, app, request)
+#   6.2. save_session(self, app, session, response)
+#   6.3. flush_touches(self, force) / stats(self)
+# 7.0. KURULUM
+#   7.1. create_backend(name, path, lifetime, max_entries)
+#   7.2. init_session_store(app, config_class)
+#   7.3. reopen_after_fork()
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import atexit
+import logging
+import os
+import re
+import secrets
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from flask.sessions import SessionInterface, SessionMixin, session_json_serializer
+from werkzeug.datastructures import CallbackDict
+
+logger = logging.getLogger(__name__)
+
+# secrets.token_urlsafe(32) çıktısı; başka biçimdeki cookie değerleri yok sayılır
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{43}$')
+# Süresi dolan kayıtların depodan temizlenme aralığı (saniye)
+PURGE_INTERVAL = 3600
+
+# Fork sonrası yeniden açılacak SQLite depoları (bkz. reopen_after_fork)
+_sqlite_backends: "weakref.WeakSet[SQLiteSessionBackend]" = weakref.WeakSet()
+
+# =============================================================================
+# 4.0. DEPOLAR
+# =============================================================================
+# Ortak arayüz: load(sid, now), save(sid, data, now), delete(sid),
+# touch_many({sid: zaman}), purge(now), count(). Kayıt, son aktivitesi
+# `lifetime` saniyeden eskiyse süresi dolmuş sayılır.
+
+class MemorySessionBackend:
+    """4.1. Süreç içi, LRU sınırlı depo (tek worker veya geliştirme için)."""
+
+    name = 'memory'
+
+    def __init__(self, lifetime: float, max_entries: int = 10000) -> None:
+        self.lifetime = lifetime
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # sid -> (last_activity, data)
+        self._lock = threading.Lock()
+
+    def load(self, sid: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if entry[0] + self.lifetime < now:
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return dict(entry[1])
+
+    def save(self, sid: str, data: Dict[str, Any], now: float) -> None:
+        with self._lock:
+            self._entries[sid] = (now, dict(data))
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def touch_many(self, touches: Dict[str, float]) -> None:
+        with self._lock:
+            for sid, at in touches.items():
+                entry = self._entries.get(sid)
+                if entry is not None and at > entry[0]:
+                    self._entries[sid] = (at, entry[1])
+
+    def purge(self, now: float) -> int:
+        with self._lock:
+            expired = [sid for sid, entry in self._entries.items() if entry[0] + self.lifetime < now]
+            for sid in expired:
+                del self._entries[sid]
+        return len(expired)
+
+    def count(self) -> int:
+        return len(self._entries)
+
+
+class FileSessionBackend:
+    """
+    4.2. Oturum başına bir dosya; son aktivite dosyanın mtime'ıdır, böylece
+    toplu touch yalnızca os.utime çağrısıdır. Yazma geçici dosya + os.replace
+    ile atomiktir.
+    """
+
+    name = 'file'
+
+    def __init__(self, directory: str, lifetime: float) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.lifetime = lifetime
+
+    def load(self, sid: str, now: float) -> Optional[Dict[str, Any]]:
+        path = self.directory / sid
+        try:
+            if path.stat().st_mtime + self.lifetime < now:
+                path.unlink(missing_ok=True)
+                return None
+            return session_json_serializer.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, sid: str, data: Dict[str, Any], now: float) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(session_json_serializer.dumps(dict(data)))
+            os.utime(tmp, (now, now))
+            os.replace(tmp, self.directory / sid)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def delete(self, sid: str) -> None:
+        (self.directory / sid).unlink(missing_ok=True)
+
+    def touch_many(self, touches: Dict[str, float]) -> None:
+        for sid, at in touches.items():
+            try:
+                os.utime(self.directory / sid, (at, at))
+            except FileNotFoundError:
+                pass
+
+    def purge(self, now: float) -> int:
+        removed = 0
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime + self.lifetime < now:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def count(self) -> int:
+        return sum(1 for path in self.directory.iterdir() if not path.name.startswith('.'))
+
+
+class SQLiteSessionBackend:
+    """
+    4.3. Tek tablolu SQLite deposu (WAL modunda; aynı makinedeki worker'lar
+    dosyayı paylaşır). Toplu touch tek bir executemany UPDATE'tir.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str, lifetime: float) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.lifetime = lifetime
+        self._inherited: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "sid TEXT PRIMARY KEY, data TEXT NOT NULL, last_activity REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_last_activity ON sessions (last_activity)")
+        _sqlite_backends.add(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def reopen(self) -> None:
+        """
+        Fork edilen worker'da yeni bağlantı açar. Ebeveynden devralınan
+        bağlantı kapatılmaz (kapatmak ebeveynin kilit/WAL durumuna dokunur);
+        referansı tutulup bırakılır.
+        """
+        self._inherited.append(self._conn)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def load(self, sid: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE sid = ? AND last_activity >= ?",
+                (sid, now - self.lifetime)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return session_json_serializer.loads(row[0])
+        except ValueError:
+            return None
+
+    def save(self, sid: str, data: Dict[str, Any], now: float) -> None:
+        payload = session_json_serializer.dumps(dict(data))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sessions (sid, data, last_activity) VALUES (?, ?, ?) "
+                "ON CONFLICT(sid) DO UPDATE SET data = excluded.data, last_activity = excluded.last_activity",
+                (sid, payload, now)
+            )
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def touch_many(self, touches: Dict[str, float]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE sessions SET last_activity = ? WHERE sid = ? AND last_activity < ?",
+                [(at, sid, at) for sid, at in touches.items()]
+            )
+
+    def purge(self, now: float) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM sessions WHERE last_activity < ?", (now - self.lifetime,)
+            ).rowcount
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+# =============================================================================
+# 5.0. OTURUM NESNESİ
+# =============================================================================
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """
+    5.1. Verisi ilk erişimde yüklenen oturum.
+
+    Okuma ve yazma metotlarının tümü önce `_load()` çağırır; böylece oturuma
+    hiç dokunmayan istekler depoya gitmez, değiştirilen oturum ise eski
+    içerikle birleştirilerek yazılır.
+    """
+
+    def __init__(self, sid: Optional[str] = None,
+                 loader: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None) -> None:
+        def on_update(self) -> None:
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(None, on_update)
+        self.sid = sid
+        self.new = sid is None or loader is None
+        self.modified = False
+        self.accessed = False
+        self.rotate = False
+        self._loader = loader
+        self._loaded = loader is None
+
+    def regenerate(self) -> None:
+        """
+        5.1.1. Oturum kimliğini yeniler; veri korunur, yanıt kaydedilirken
+        yeni kimlikle yazılır ve eski kimliğin kaydı silinir.
+        """
+        self._load()
+        self.rotate = True
+        self.modified = True
+        self.accessed = True
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        self.accessed = True
+        data = self._loader(self.sid)
+        if data is None:
+            # Bilinmeyen/süresi dolmuş kimlik: yeni kimlikle yeni oturum açılır
+            self.sid = None
+            self.new = True
+        else:
+            dict.update(self, data)
+
+
+def _loading(name: str) -> Callable[..., Any]:
+    method = getattr(CallbackDict, name)
+
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        self._load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('__getitem__', '__contains__', '__iter__', '__len__', '__repr__', '__eq__',
+              'get', 'keys', 'values', 'items', 'copy',
+              '__setitem__', '__delitem__', 'setdefault', 'pop', 'popitem', 'update', 'clear'):
+    setattr(ServerSideSession, _name, _loading(_name))
+
+# =============================================================================
+# 6.0. SESSION INTERFACE
+# =============================================================================
+
+class ServerSideSessionInterface(SessionInterface):
+    """
+    Cookie'de yalnızca oturum kimliği taşıyan SessionInterface.
+
+    `lifetime` boşta kalma süresidir (saniye); her istek oturumu uzatır
+    ancak bu uzatma depoya `touch_interval` saniyede bir toplu yazılır.
+    """
+
+    session_class = ServerSideSession
+
+    def __init__(self, backend, touch_interval: float = 60) -> None:
+        self.backend = backend
+        self.touch_interval = max(0, touch_interval)
+        self._pending: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.time()
+        self._last_purge = time.time()
+        self._counters = {'loads': 0, 'misses': 0, 'saves': 0, 'deletes': 0,
+                          'rotations': 0, 'touches': 0, 'flushes': 0, 'errors': 0}
+
+    # -------------------------------------------------------------------------
+    # 6.1. open_session
+    # -------------------------------------------------------------------------
+
+    def open_session(self, app, request) -> ServerSideSession:
+        """Cookie'deki kimliği okur; veriyi yüklemez (bkz. ServerSideSession)."""
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid or not SESSION_ID_PATTERN.match(sid):
+            return self.session_class()
+        return self.session_class(sid, self._load)
+
+    def _load(self, sid: str) -> Optional[Dict[str, Any]]:
+        try:
+            data = self.backend.load(sid, time.time())
+        except Exception as e:
+            logger.error("Session load failed: %s", e)
+            with self._lock:
+                self._counters['errors'] += 1
+            return None
+        with self._lock:
+            self._counters['loads'] += 1
+            if data is None:
+                self._counters['misses'] += 1
+        return data
+
+    # -------------------------------------------------------------------------
+    # 6.2. save_session
+    # -------------------------------------------------------------------------
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        """
+        Değişen oturumu yazar (boşaldıysa siler ve cookie'yi kaldırır);
+        değişmeyen oturumun yalnızca son aktivitesini toplu touch'a ekler.
+        regenerate() çağrıldıysa veri yeni kimlikle yazılır, eski kayıt
+        silinir ve cookie yeni kimlikle yeniden verilir.
+        """
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        now = time.time()
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        if session.modified:
+            if not session:
+                if session.sid:
+                    self._delete(session.sid)
+                    response.delete_cookie(name, domain=domain, path=path,
+                                           secure=self.get_cookie_secure(app),
+                                           samesite=self.get_cookie_samesite(app),
+                                           httponly=self.get_cookie_httponly(app))
+                return
+            previous = session.sid if session.rotate else None
+            is_new = session.sid is None or previous is not None
+            if is_new:
+                session.sid = secrets.token_urlsafe(32)
+            try:
+                self.backend.save(session.sid, dict(session), now)
+                with self._lock:
+                    self._counters['saves'] += 1
+                    self._pending.pop(session.sid, None)
+            except Exception as e:
+                logger.error("Session save failed: %s", e)
+                with self._lock:
+                    self._counters['errors'] += 1
+                return
+            if previous is not None:
+                self._delete(previous)
+                with self._lock:
+                    self._counters['rotations'] += 1
+            if is_new or session.permanent:
+                response.set_cookie(
+                    name, session.sid,
+                    expires=self.get_expiration_time(app, session),
+                    httponly=self.get_cookie_httponly(app),
+                    domain=domain, path=path,
+                    secure=self.get_cookie_secure(app),
+                    samesite=self.get_cookie_samesite(app),
+                )
+        elif session.sid:
+            with self._lock:
+                self._pending[session.sid] = now
+                self._counters['touches'] += 1
+        self.flush_touches()
+
+    def _delete(self, sid: str) -> None:
+        try:
+            self.backend.delete(sid)
+            with self._lock:
+                self._counters['deletes'] += 1
+                self._pending.pop(sid, None)
+        except Exception as e:
+            logger.error("Session delete failed: %s", e)
+
+    # -------------------------------------------------------------------------
+    # 6.3. Toplu touch ve metrikler
+    # -------------------------------------------------------------------------
+
+    def flush_touches(self, force: bool = False) -> int:
+        """
+        Biriken son aktivite zamanlarını depoya tek seferde yazar
+        (touch_interval dolmadıysa force=True olmadan bir şey yapmaz).
+        Saatte bir süresi dolan kayıtlar da temizlenir.
+        """
+        now = time.time()
+        with self._lock:
+            if not force and now - self._last_flush < self.touch_interval:
+                return 0
+            pending, self._pending = self._pending, {}
+            self._last_flush = now
+            purge = now - self._last_purge >= PURGE_INTERVAL
+            if purge:
+                self._last_purge = now
+        try:
+            if pending:
+                self.backend.touch_many(pending)
+                with self._lock:
+                    self._counters['flushes'] += 1
+            if purge:
+                self.backend.purge(now)
+        except Exception as e:
+            logger.error("Session touch flush failed: %s", e)
+            with self._lock:
+                self._counters['errors'] += 1
+        return len(pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {'backend', 'loads', 'misses', 'saves', 'deletes', 'rotations',
+             'touches', 'flushes', 'errors', 'pending_touches', 'entries'}
+        """
+        with self._lock:
+            data = dict(self._counters)
+            data['pending_touches'] = len(self._pending)
+        data['backend'] = self.backend.name
+        try:
+            data['entries'] = self.backend.count()
+        except Exception:
+            data['entries'] = None
+        return data
+
+# =============================================================================
+# 7.0. KURULUM
+# =============================================================================
+
+def create_backend(name: str, path: Optional[str], lifetime: float, max_entries: int = 10000):
+    """7.1. SESSION_BACKEND adına göre depo oluşturur."""
+    instance_dir = Path(__file__).resolve().parents[2] / 'instance'
+    if name == 'memory':
+        return MemorySessionBackend(lifetime, max_entries)
+    if name == 'file':
+        return FileSessionBackend(path or str(instance_dir / 'sessions'), lifetime)
+    if name == 'sqlite':
+        return SQLiteSessionBackend(path or str(instance_dir / 'sessions.db'), lifetime)
+    raise ValueError(f"Unknown session backend: {name}")
+
+
+def init_session_store(app, config_class=None) -> Optional[ServerSideSessionInterface]:
+    """
+    7.2. SESSION_BACKEND ayarlıysa (memory | file | sqlite) uygulamanın
+    session_interface'ini sunucu tarafı depoya çevirir; boş veya 'cookie'
+    ise Flask'ın imzalı cookie oturumu kullanılmaya devam eder.
+    """
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    security = config_class.SECURITY
+    name = (getattr(security, 'SESSION_BACKEND', '') or 'cookie').strip().lower()
+    if name == 'cookie':
+        return None
+    try:
+        backend = create_backend(
+            name,
+            getattr(security, 'SESSION_STORE_PATH', '') or None,
+            lifetime=getattr(security, 'SESSION_LIFETIME', 86400),
+            max_entries=getattr(security, 'SESSION_MAX_ENTRIES', 10000),
+        )
+    except (ValueError, OSError, sqlite3.Error) as e:
+        logger.error("Server-side session store unavailable, using cookie sessions: %s", e)
+        return None
+    interface = ServerSideSessionInterface(backend, getattr(security, 'SESSION_TOUCH_INTERVAL', 60))
+    app.session_interface = interface
+    atexit.register(interface.flush_touches, True)
+    logger.info("Server-side sessions enabled (backend=%s)", backend.name)
+    return interface
+
+
+def reopen_after_fork() -> None:
+    """
+    7.3. Fork edilen worker'da (gunicorn preload_app) ebeveynde açılmış
+    SQLite oturum depolarının bağlantılarını yeniden açar.
+    """
+    for backend in list(_sqlite_backends):
+        backend.reopen()
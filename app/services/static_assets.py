@@ -0,0 +1,285 @@
+# =============================================================================
+# STATIC ASSETS
+# =============================================================================
+# app/static altındaki JS/CSS dosyalarının sunumu:
+#   - İçerik hash'li URL: url_for('static', filename='css/base.css')
+#     -> /static/css/base.<hash>.css. Hash dosya içeriğinden üretilir;
+#     içerik değişince URL de değişir, bu yüzden hash'li URL'ler
+#     `Cache-Control: public, max-age=..., immutable` ile sunulur. Dosya
+#     aynı klasörde kaldığı için göreli import/@import yolları bozulmaz.
+#   - Hash'siz veya eski hash'li istekler güncel dosyayı `no-cache` + ETag
+#     ile döner (tarayıcı 304 ile yeniden doğrular).
+#   - Önceden sıkıştırılmış kopyalar (.gz, brotli kuruluysa .br) build
+#     sırasında (scripts/static_assets.py precompress) veya açılışta
+#     (warm-up 'static' adımı) kaynak dosyanın yanına yazılır; istemci
+#     Accept-Encoding ile kabul ediyorsa istek anında sıkıştırma yapmadan
+#     bu kopya gönderilir.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. STATIC ASSETS SINIFI
+#   4.1. file_hash / is_fingerprinted / hashed_filename
+#   4.2. resolve(self, filename)
+#   4.3. precompress(self, force)
+#   4.4. serve(self, filename)
+#   4.5. url_defaults(self, endpoint, values)
+# 5.0. FLASK ENTEGRASYONU
+#   5.1. init_static_assets(app, config_class)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Önceden sıkıştırılan uzantılar (görseller/fontlar zaten sıkıştırılmış)
+COMPRESSIBLE_EXTENSIONS = frozenset({'.js', '.css', '.svg', '.html', '.json', '.txt', '.map', '.xml', '.ico'})
+
+# Desteklenen ön sıkıştırma kodlamaları: (Content-Encoding, dosya son eki)
+PRECOMPRESSED_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+HASH_LENGTH = 10
+_HASHED_NAME = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<ext>\.[A-Za-z0-9]+)$' % HASH_LENGTH)
+
+
+def content_hash(data: bytes) -> str:
+    """URL'lerde kullanılan kısa içerik hash'i (bundle adları da bununla üretilir)."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+# =============================================================================
+# 4.0. STATIC ASSETS SINIFI
+# =============================================================================
+
+class StaticAssets:
+    """
+    Statik dosyalar için hash'li URL üretimi, ön sıkıştırma ve sunum.
+
+    Hash'ler (mtime, boyut) anahtarıyla bellekte tutulur; dosya değişince
+    bir sonraki çağrıda yeniden hesaplanır.
+    """
+
+    def __init__(self, static_dir: Any, hashed_urls: bool = True, max_age: int = 31536000,
+                 min_size: int = 1024) -> None:
+        self.static_dir = str(static_dir)
+        self.hashed_urls = hashed_urls
+        self.max_age = max_age
+        self.min_size = min_size
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}  # filename -> (mtime_ns, size, hash)
+        self._lock = threading.Lock()
+        self._counters = {'hashed_hits': 0, 'unhashed_hits': 0, 'stale_hits': 0, 'precompressed_hits': 0}
+
+    # -------------------------------------------------------------------------
+    # 4.1. İçerik hash'i
+    # -------------------------------------------------------------------------
+
+    def _path(self, filename: str) -> Optional[str]:
+        path = safe_join(self.static_dir, filename)
+        if path is None or not os.path.isfile(path):
+            return None
+        return path
+
+    def file_hash(self, filename: str) -> Optional[str]:
+        """4.1.1. Dosya içeriğinin kısa hash'i; dosya yoksa None."""
+        path = self._path(filename)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        cached = self._hashes.get(filename)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        value = digest.hexdigest()[:HASH_LENGTH]
+        with self._lock:
+            self._hashes[filename] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
+
+    def is_fingerprinted(self, filename: str) -> bool:
+        """4.1.2. Dosya adı zaten kendi içerik hash'ini taşıyor mu (ör. dist/ bundle'ları)."""
+        match = _HASHED_NAME.match(filename)
+        return match is not None and self.file_hash(filename) == match.group('hash')
+
+    def hashed_filename(self, filename: str) -> str:
+        """4.1.3. 'css/base.css' -> 'css/base.<hash>.css' (dosya yoksa aynen)."""
+        value = self.file_hash(filename)
+        if value is None or self.is_fingerprinted(filename):
+            return filename
+        stem, ext = os.path.splitext(filename)
+        return f"{stem}.{value}{ext}" if ext else f"{filename}.{value}"
+
+    # -------------------------------------------------------------------------
+    # 4.2. İstek yolunu çözme
+    # -------------------------------------------------------------------------
+
+    def resolve(self, filename: str) -> Tuple[str, Optional[bool]]:
+        """
+        4.2. İstenen yolu gerçek dosya adına çevirir.
+
+        Returns:
+            (gerçek dosya adı, hash durumu): True = hash güncel (immutable),
+            False = eski hash (güncel içerik, no-cache), None = hash'siz istek
+        """
+        if self._path(filename) is not None:
+            return filename, True if self.is_fingerprinted(filename) else None
+        match = _HASHED_NAME.match(filename)
+        if match is None:
+            return filename, None
+        original = match.group('stem') + match.group('ext')
+        current = self.file_hash(original)
+        if current is None:
+            return filename, None
+        return original, current == match.group('hash')
+
+    # -------------------------------------------------------------------------
+    # 4.3. Ön sıkıştırma
+    # -------------------------------------------------------------------------
+
+    def precompress(self, force: bool = False) -> Dict[str, Any]:
+        """
+        4.3. Sıkıştırılabilir dosyaların .gz (ve brotli varsa .br) kopyalarını
+        yazar. Kaynaktan yeni olan kopyalar atlanır; yazma atomiktir, aynı
+        anda başlayan worker'lar birbirini bozmaz.
+
+        Returns:
+            {'files', 'written', 'skipped', 'bytes', 'gzip_bytes', 'brotli_bytes', 'brotli'}
+        """
+        report = {'files': 0, 'written': 0, 'skipped': 0, 'bytes': 0, 'gzip_bytes': 0,
+                  'brotli_bytes': 0, 'brotli': brotli is not None}
+        root = Path(self.static_dir)
+        if not root.is_dir():
+            return report
+        for path in sorted(root.rglob('*')):
+            if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            source_stat = path.stat()
+            if source_stat.st_size < self.min_size:
+                continue
+            report['files'] += 1
+            report['bytes'] += source_stat.st_size
+            data = None
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+                if encoding == 'br' and brotli is None:
+                    continue
+                target = path.with_name(path.name + suffix)
+                if not force and target.exists() and target.stat().st_mtime >= source_stat.st_mtime:
+                    report['skipped'] += 1
+                else:
+                    if data is None:
+                        data = path.read_bytes()
+                    if encoding == 'br':
+                        compressed = brotli.compress(data, quality=11)
+                    else:
+                        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+                    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                    tmp.write_bytes(compressed)
+                    os.replace(tmp, target)
+                    report['written'] += 1
+                report['brotli_bytes' if encoding == 'br' else 'gzip_bytes'] += target.stat().st_size
+        return report
+
+    # -------------------------------------------------------------------------
+    # 4.4. Sunum
+    # -------------------------------------------------------------------------
+
+    def serve(self, filename: str):
+        """4.4. Flask 'static' uç noktasının yerine geçen view."""
+        from flask import request, send_from_directory
+
+        real, fresh = self.resolve(filename)
+        mimetype = mimetypes.guess_type(real)[0] or 'application/octet-stream'
+        path = self._path(real)
+
+        encoding = None
+        served = real
+        if path is not None:
+            source_mtime = os.stat(path).st_mtime
+            for candidate, suffix in PRECOMPRESSED_ENCODINGS:
+                if not request.accept_encodings[candidate]:
+                    continue
+                compressed = path + suffix
+                if os.path.isfile(compressed) and os.stat(compressed).st_mtime >= source_mtime:
+                    encoding, served = candidate, real + suffix
+                    break
+
+        response = send_from_directory(self.static_dir, served, mimetype=mimetype,
+                                       max_age=self.max_age if fresh else None)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+            self._counters['precompressed_hits'] += 1
+        if path is not None and os.path.splitext(real)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+            response.vary.add('Accept-Encoding')
+
+        if fresh:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+            self._counters['hashed_hits'] += 1
+        else:
+            # Hash'siz/eski URL: her kullanımda ETag ile yeniden doğrulanır
+            response.cache_control.no_cache = True
+            self._counters['stale_hits' if fresh is False else 'unhashed_hits'] += 1
+        return response
+
+    # -------------------------------------------------------------------------
+    # 4.5. URL üretimi
+    # -------------------------------------------------------------------------
+
+    def url_defaults(self, endpoint: str, values: Dict[str, Any]) -> None:
+        """4.5. url_for('static', filename=...) çağrılarına içerik hash'i ekler."""
+        if endpoint != 'static' or not self.hashed_urls:
+            return
+        filename = values.get('filename')
+        if filename:
+            values['filename'] = self.hashed_filename(filename)
+
+    def stats(self) -> Dict[str, Any]:
+        """Admin sistem durumu için sayaçlar."""
+        return dict(self._counters, hashed_files=len(self._hashes), brotli=brotli is not None,
+                    hashed_urls=self.hashed_urls)
+
+# =============================================================================
+# 5.0. FLASK ENTEGRASYONU
+# =============================================================================
+
+def init_static_assets(app, config_class=None) -> Optional[StaticAssets]:
+    """
+    5.1. Flask'ın 'static' view'ını StaticAssets.serve ile değiştirir ve
+    url_for için hash'li dosya adı üretimini kaydeder.
+    """
+    if not app.has_static_folder or 'static' not in app.view_functions:
+        return None
+    if config_class is None:
+        from config import get_config
+        config_class = get_config()
+    app_config = config_class.APP
+    assets = StaticAssets(
+        app.static_folder,
+        hashed_urls=getattr(app_config, 'STATIC_HASHED_URLS', True),
+        max_age=getattr(app_config, 'STATIC_MAX_AGE', 31536000),
+        min_size=getattr(app_config, 'COMPRESSION_MIN_SIZE', 1024),
+    )
+    app.view_functions['static'] = assets.serve
+    app.url_defaults(assets.url_defaults)
+    app.extensions['static_assets'] = assets
+    return assets
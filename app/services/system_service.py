@@ -19,6 +19,7 @@
 #   4.3. Sistem Yönetimi
 #     4.3.1. check_database_connection(self)
 #     4.3.2. get_system_metrics(self)
+#     4.3.3. get_metrics_history(self, limit)
 # =============================================================================
 
 # =============================================================================
@@ -28,8 +29,8 @@ from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 import platform
 import sys
-import psutil
-import os
+
+from app.services.metrics_sampler import ensure_metrics_sampler, get_metrics_sampler
 
 # Import database connection for health checks
 try:
@@ -157,50 +158,53 @@ class SystemService:
             return False, {'message': 'Database connection failed', 'error': str(e)}
 
     def get_system_metrics(self) -> Dict[str, Any]:
-        """4.3.2. Sistem metriklerini döndürür."""
+        """
+        4.3.2. Sistem metriklerini döndürür.
+
+        Ölçüm arka plandaki örnekleyicide yapılır; burada son örnek okunur
+        (beklemez). Örnekleyici kapalıysa anlık, beklemesiz bir ölçüm alınır.
+        """
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_info = {
-                'total': memory.total,
-                'available': memory.available,
-                'used': memory.used,
-                'percent': memory.percent
-            }
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_info = {
-                'total': disk.total,
-                'used': disk.used,
-                'free': disk.free,
-                'percent': (disk.used / disk.total) * 100
-            }
-            
-            # Network info
-            network = psutil.net_io_counters()
-            network_info = {
-                'bytes_sent': network.bytes_sent,
-                'bytes_recv': network.bytes_recv,
-                'packets_sent': network.packets_sent,
-                'packets_recv': network.packets_recv
-            }
-            
-            metrics = {
-                'cpu_percent': cpu_percent,
-                'memory': memory_info,
-                'disk': disk_info,
-                'network': network_info,
+            sampler = ensure_metrics_sampler()
+            sample = sampler.latest() if sampler is not None else None
+            if sample is None:
+                sample = get_metrics_sampler().sample()
+            return self._format_metrics(sample)
+        except Exception as e:
+            return {
+                'error': 'Failed to retrieve system metrics',
+                'message': str(e),
                 'timestamp': datetime.now().isoformat()
             }
-            
-            return metrics
+
+    def get_metrics_history(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """4.3.3. Örnekleyici tamponundaki son örnekleri (eskiden yeniye) döndürür."""
+        try:
+            sampler = ensure_metrics_sampler()
+            if sampler is None:
+                return {'enabled': False, 'samples': []}
+            return {
+                'enabled': True,
+                'sampler': sampler.stats(),
+                'samples': [self._format_metrics(sample) for sample in sampler.history(limit)]
+            }
         except Exception as e:
             return {
-                'error': 'Failed to retrieve system metrics',
+                'error': 'Failed to retrieve metrics history',
                 'message': str(e),
                 'timestamp': datetime.now().isoformat()
-            } 
\ No newline at end of file
+            }
+
+    @staticmethod
+    def _format_metrics(sample: Dict[str, Any]) -> Dict[str, Any]:
+        """Örneği eski get_system_metrics yanıt biçimine (ek alanlarla) çevirir."""
+        return {
+            'cpu_percent': sample.get('cpu_percent'),
+            'load_average': sample.get('load_average'),
+            'memory': sample.get('memory'),
+            'disk': sample.get('disk'),
+            'network': sample.get('network'),
+            'app': sample.get('gauges', {}),
+            'timestamp': sample.get('timestamp'),
+            'age_seconds': sample.get('age_seconds', 0.0)
+        }
@@ -0,0 +1,171 @@
+# =============================================================================
+# USER CACHE
+# =============================================================================
+# Yetki kontrolleri (admin_required, get_current_user) her istekte kullanıcı
+# kaydını okur; admin paneli tek sayfa açılışında onlarca XHR isteği
+# gönderdiğinden bu okumalar veritabanına gereksiz yük bindirir. Bu modül
+# user_id anahtarlı, kısa ömürlü (TTL) ve süreç içi bir kullanıcı önbelleği
+# sağlar. Kullanıcıyı değiştiren işlemler invalidate() çağırır; kullanıcı
+# başına tutulan sürüm sayacı, yükleme sırasında gelen bir invalidate'in
+# eski veriyi önbelleğe yazmasını engeller. Diğer süreçlerdeki kopyalar en
+# geç TTL sonunda yenilenir. Yalnızca bulunan kullanıcılar önbelleğe alınır:
+# repository okuma hatasında da None döndüğünden, None'ı saklamak geçici bir
+# DB hatasını TTL boyunca oturum kaybına veya yetki reddine çevirirdi.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. USER CACHE SINIFI
+#   4.1. get(self, user_id)
+#   4.2. invalidate(self, user_id) / clear(self)
+#   4.3. stats(self)
+# 5.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Önbellekte asla tutulmayan alanlar
+SENSITIVE_FIELDS = ('password_hash',)
+
+# =============================================================================
+# 4.0. USER CACHE SINIFI
+# =============================================================================
+
+class UserCache:
+    """
+    TTL ve sürüm sayaçlı, LRU sınırlı kullanıcı önbelleği.
+
+    `loader(user_id)` kullanıcı sözlüğünü (veya bulunamazsa None) döner;
+    None sonuçları önbelleğe alınmaz, sonraki çağrı yeniden yükler. Sürüm
+    sayaçları yalnızca önbellekteki veya o an yüklenen kullanıcılar için
+    tutulur.
+    """
+
+    def __init__(self, loader: Callable[[int], Optional[Dict[str, Any]]],
+                 ttl: float = 30, max_entries: int = 10000) -> None:
+        self.loader = loader
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()  # user_id -> (expires, version, user)
+        self._versions: Dict[Any, int] = {}
+        self._loading: Dict[Any, int] = {}  # user_id -> süren loader çağrısı sayısı
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'invalidations': 0, 'evictions': 0}
+
+    def get(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        4.1. Kullanıcıyı önbellekten döner; yoksa, süresi dolmuşsa veya
+        sürümü eskimişse loader ile yükler.
+        """
+        if user_id is None:
+            return None
+        key = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            version = self._versions.get(key, 0)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] == version:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return dict(entry[2])
+            self._counters['misses'] += 1
+            self._loading[key] = self._loading.get(key, 0) + 1
+
+        try:
+            user = self.loader(user_id)
+        finally:
+            with self._lock:
+                remaining = self._loading.pop(key) - 1
+                if remaining:
+                    self._loading[key] = remaining
+        if user is not None:
+            user = {k: v for k, v in dict(user).items() if k not in SENSITIVE_FIELDS}
+
+        with self._lock:
+            # Yükleme sırasında invalidate edildiyse sonucu önbelleğe yazma
+            if user is not None and self._versions.get(key, 0) == version:
+                self._entries[key] = (now + self.ttl, version, user)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._forget_version(evicted)
+                    self._counters['evictions'] += 1
+            self._forget_version(key)
+        return dict(user) if user is not None else None
+
+    def _forget_version(self, key: Any) -> None:
+        """Önbellekte olmayan ve yüklenmeyen kullanıcının sürüm sayacını bırakır (kilit altında)."""
+        if key not in self._entries and key not in self._loading:
+            self._versions.pop(key, None)
+
+    def invalidate(self, user_id: Any) -> None:
+        """4.2. Kullanıcının önbellek kaydını düşürür ve sürümünü artırır."""
+        if user_id is None:
+            return
+        key = str(user_id)
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.pop(key, None)
+            self._forget_version(key)
+            self._counters['invalidations'] += 1
+
+    def clear(self) -> None:
+        """Tüm kayıtları düşürür (süren yüklemelerin sonucu önbelleğe yazılmaz)."""
+        with self._lock:
+            for key in self._loading:
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.clear()
+            for key in list(self._versions):
+                self._forget_version(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        4.3. Önbellek metrikleri.
+
+        Returns:
+            {'hits', 'misses', 'hit_rate', 'invalidations', 'evictions', 'entries', 'ttl'}
+        """
+        with self._lock:
+            data = dict(self._counters)
+            data['entries'] = len(self._entries)
+        lookups = data['hits'] + data['misses']
+        data['hit_rate'] = round(data['hits'] / lookups, 4) if lookups else None
+        data['ttl'] = self.ttl
+        return data
+
+# =============================================================================
+# 5.0. SINGLETON ERİŞİMİ
+# =============================================================================
+
+_user_cache: Optional[UserCache] = None
+_user_cache_lock = threading.Lock()
+
+
+def get_user_cache() -> UserCache:
+    """Süreç genelindeki UserCache örneğini döner (ilk çağrıda oluşturulur)."""
+    global _user_cache
+    if _user_cache is None:
+        with _user_cache_lock:
+            if _user_cache is None:
+                from config import get_config
+                from app.database.repositories.user_repository import UserRepository
+                security = get_config().SECURITY
+                _user_cache = UserCache(
+                    UserRepository().get_by_id,
+                    ttl=getattr(security, 'AUTH_USER_CACHE_TTL', 30),
+                    max_entries=getattr(security, 'AUTH_USER_CACHE_SIZE', 10000),
+                )
+    return _user_cache
+
+
+def invalidate_user(user_id: Any) -> None:
+    """Kullanıcıyı değiştiren işlemlerden sonra çağrılır."""
+    get_user_cache().invalidate(user_id)
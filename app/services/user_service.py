@@ -18,17 +18,25 @@
 #     4.2.1. get_all_users(self)
 #     4.2.2. create_new_user(self, user_data)
 #     4.2.3. register_user(self, register_data)
+#     4.2.4. login_user(self, login_data)
+#   4.3. Yardımcı Metotlar
+#     4.3.1. _rehash_if_needed(self, user, password)
 # =============================================================================
 
 # =============================================================================
 # 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
 # =============================================================================
 from app.database.repositories.user_repository import UserRepository
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.services.password_hasher import get_password_hasher
+from app.services.user_cache import invalidate_user
+from app.utils.exceptions import ServiceUnavailableError
 from typing import Dict, Any, List, Tuple, Optional
+import logging
 import re
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # 4.0. USERSERVICE SINIFI
 # =============================================================================
@@ -43,6 +51,7 @@ class UserService:
     def __init__(self):
         """4.1.1. Servisin kurucu metodu. Gerekli repository'leri başlatır."""
         self.user_repo = UserRepository()
+        self.hasher = get_password_hasher()
 
     # -------------------------------------------------------------------------
     # 4.2. Kullanıcı İş Mantığı Metotları
@@ -87,7 +96,7 @@ class UserService:
                 return False, {'message': 'Bu e-posta adresi zaten kullanılıyor'}
 
             # 3. Şifreyi hash'le
-            password_hash = generate_password_hash(password)
+            password_hash = self.hasher.hash_password(password)
 
             # 4. Yeni kullanıcıyı oluştur
             new_user_id = self.user_repo.create_user(username, email, password_hash)
@@ -103,6 +112,8 @@ class UserService:
                 'email': created_user.get('email')
             }
 
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             return False, {'message': 'Beklenmeyen bir hata oluştu'}
 
@@ -160,7 +171,7 @@ class UserService:
 
         try:
             # 8. Şifreyi hash'le
-            password_hash = generate_password_hash(password)
+            password_hash = self.hasher.hash_password(password)
 
             # 9. Yeni kullanıcıyı oluştur
             new_user_id = self.user_repo.create_user(username, email, password_hash)
@@ -179,6 +190,8 @@ class UserService:
                 'email': created_user.get('email')
             }
 
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             return False, {'message': 'Beklenmeyen bir hata oluştu'}
 
@@ -187,56 +200,45 @@ class UserService:
         4.2.4. Login form verilerini işler ve kullanıcı girişini gerçekleştirir.
         Login form'da email ve password alanları bulunur.
         """
-        print('=== LOGIN DEBUG (USER SERVICE) ===', flush=True)
-        print(f'Received login_data: {login_data}', flush=True)
-        
         from app.services.auth_service import auth_service
         
         # 1. Form verilerini kontrol et
         email = login_data.get('email', '').strip()
         password = login_data.get('password', '')
-        
-        print(f'Extracted - Email: {email}, Password length: {len(password) if password else 0}', flush=True)
 
         # 2. Gerekli alanların kontrolü
         if not email:
-            print('ERROR: Email field is empty', flush=True)
+            logger.debug("Login rejected: empty email")
             return False, {'message': 'E-posta alanı gereklidir'}
         if not password:
-            print('ERROR: Password field is empty', flush=True)
+            logger.debug("Login rejected: empty password")
             return False, {'message': 'Şifre alanı gereklidir'}
 
         # 3. Email format kontrolü
         email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         if not re.match(email_pattern, email):
-            print(f'ERROR: Invalid email format: {email}', flush=True)
+            logger.debug("Login rejected: invalid email format")
             return False, {'message': 'Geçerli bir e-posta adresi giriniz'}
 
-        print('Email format is valid, proceeding...', flush=True)
-
         try:
             # 4. Kullanıcıyı e-posta ile bul
-            print(f'Looking up user by email: {email}', flush=True)
             user = self.user_repo.get_by_email(email)
             
-            print(f'User lookup result: {user}', flush=True)
-            
             if not user:
-                print('ERROR: User not found', flush=True)
+                logger.debug("Login rejected: unknown email")
                 return False, {'message': 'E-posta veya şifre hatalı'}
 
             # 5. Şifre kontrolü
             stored_hash = user.get('password_hash')
-            print(f'Stored password hash exists: {bool(stored_hash)}', flush=True)
-            print(f'Stored hash length: {len(stored_hash) if stored_hash else 0}', flush=True)
-            
-            password_match = check_password_hash(stored_hash, password)
-            print(f'Password match result: {password_match}', flush=True)
+            password_match = self.hasher.verify_password(stored_hash, password)
             
             if not password_match:
-                print('ERROR: Password does not match', flush=True)
+                logger.debug("Login rejected: password mismatch", extra={'user_id': user.get('user_id')})
                 return False, {'message': 'E-posta veya şifre hatalı'}
 
+            # 5.b. İş faktörü değiştiyse hash'i şeffaf şekilde yenile
+            self._rehash_if_needed(user, password)
+
             # 6. Session'a kullanıcıyı kaydet
             user_data = {
                 'id': user.get('user_id'),
@@ -245,13 +247,10 @@ class UserService:
                 'is_admin': user.get('is_admin', False)
             }
             
-            print(f'Attempting to set session with user_data: {user_data}', flush=True)
-            
             auth_result = auth_service.login_user(user_data)
-            print(f'Auth service login result: {auth_result}', flush=True)
             
             if not auth_result:
-                print('ERROR: Failed to set session', flush=True)
+                logger.warning("Login failed: session could not be set", extra={'user_id': user_data['id']})
                 return False, {'message': 'Oturum açılırken bir hata oluştu'}
 
             # 7. Başarılı giriş - kullanıcı bilgilerini döndür (şifre hariç)
@@ -262,14 +261,12 @@ class UserService:
                 'is_admin': user.get('is_admin', False),
                 'created_at': user.get('created_at').isoformat() if user.get('created_at') else None
             }
-            
-            print(f'Login successful! Returning: {success_data}', flush=True)
             return True, success_data
 
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
-            print(f'ERROR: Exception occurred: {e}', flush=True)
-            import traceback
-            print(f'Traceback: {traceback.format_exc()}', flush=True)
+            logger.exception("Login failed with unexpected error: %s", e)
             return False, {'message': 'Beklenmeyen bir hata oluştu'}
 
     def get_user_profile(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -346,6 +343,7 @@ class UserService:
             # Veritabanını güncelle
             try:
                 success = self.user_repo.update_user(user_id, **update_data)
+                invalidate_user(user_id)
                 
                 if success:
                     # Güncellenmiş kullanıcı bilgilerini al
@@ -383,6 +381,7 @@ class UserService:
             # Update user's avatar path in database
             avatar_path = f"/static/uploads/avatars/{unique_filename}"
             success = self.user_repo.update_user(user_id, avatar_path=avatar_path)
+            invalidate_user(user_id)
             
             if success:
                 return True, {'avatar_path': avatar_path}
@@ -395,3 +394,21 @@ class UserService:
         except Exception as e:
             return False, {'message': 'Beklenmeyen bir hata oluştu'}
 
+    # -------------------------------------------------------------------------
+    # 4.3. Yardımcı Metotlar
+    # -------------------------------------------------------------------------
+    def _rehash_if_needed(self, user: Dict[str, Any], password: str) -> None:
+        """
+        4.3.1. Saklanan hash eski bir yöntem/iş faktörüyle (PASSWORD_SALT_ROUNDS)
+        üretildiyse, doğrulanmış şifreyi yeni ayarla hash'leyip kaydeder.
+        Kuyruk doluysa veya kayıt başarısızsa giriş etkilenmez; yenileme bir
+        sonraki girişe kalır.
+        """
+        if not self.hasher.needs_rehash(user.get('password_hash')):
+            return
+        try:
+            new_hash = self.hasher.hash_password(password)
+            if self.user_repo.update_password_hash(user.get('user_id'), new_hash):
+                self.hasher.note_rehash()
+        except Exception:
+            pass
@@ -0,0 +1,200 @@
+# =============================================================================
+# WORKER WARM-UP
+# =============================================================================
+# Worker trafik almadan önce soğuk önbellekleri doldurur; böylece her
+# worker'ın ilk istekleri şablon derleme, senaryo dosyası okuma, bağlantı
+# açma ve süreç havuzu başlatma maliyetini ödemez.
+#
+# Adımlar (AppConfig.WARMUP_STEPS, virgülle ayrılmış, sırayla çalışır):
+#   db_pool          canlı DB manager'larının pool'larına bağlantı açar
+#   templates        tüm Jinja şablonlarını derleyip önbelleğe alır
+#   scenarios        AI senaryo / prompt JSON'larını yükler
+#   curriculum       sınıf/ders/ünite/konu listelerini bir kez okur
+#   password_hasher  şifre hash süreç havuzunu başlatır
+#   static           statik dosyaların .gz/.br kopyalarını üretir, hash'leri hesaplar
+#   metrics          sistem metrikleri örnekleyici thread'ini başlatır
+#   indexes          (isteğe bağlı) kritik index'leri doğrular/oluşturur
+#
+# gunicorn ile (gunicorn.conf.py):
+#     from app.services.warmup import post_fork
+# Hook, preload_app açıkken ebeveynden devralınan DB pool'larını, SQLite
+# oturum/rate limit bağlantılarını ve log dinleyicisini yeniler, uygulamayı
+# yükler ve warm-up'ı çalıştırır.
+# Bir adımın hatası worker açılışını durdurmaz; loglanır ve raporlanır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. WARM-UP ADIMLARI
+# 5.0. ÇALIŞTIRMA
+#   5.1. warm_up(app, steps)
+#   5.2. post_fork(server, worker)
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from flask import Flask
+
+from app.utils.startup_profiler import StartupProfiler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STEPS = 'db_pool,templates,scenarios,curriculum,password_hasher,static,metrics'
+
+# =============================================================================
+# 4.0. WARM-UP ADIMLARI
+# =============================================================================
+# Her adım app'i alır ve rapora eklenecek kısa bir özet döner.
+
+def _warm_db_pool(app: Flask) -> Any:
+    from app.database.db_connection import warm_up_pools
+    return warm_up_pools(getattr(app.config.get('APP'), 'WARMUP_POOL_CONNECTIONS', 1))
+
+
+def _warm_templates(app: Flask) -> Any:
+    env = app.jinja_env
+    names = [name for name in env.list_templates() if name.endswith('.html')]
+    for name in names:
+        env.get_template(name)
+    return {'templates': len(names)}
+
+
+def _warm_scenarios(app: Flask) -> Any:
+    from app.routes.api import ai_chat_v2_routes
+    service = ai_chat_v2_routes.chat_message_service
+    if not service:
+        return {'scenarios': 0, 'available': False}
+    return {'scenarios': len(service.scenario_texts)}
+
+
+def _warm_curriculum(app: Flask) -> Any:
+    # Admin servisinin modül seviyesindeki repository'leri üzerinden okunur;
+    # bağlantılar ve DB tarafı önbellekler bu istek yolu için ısınır
+    from app.routes.api.admin_routes import admin_service
+    return {
+        'grades': len(admin_service.grade_repo.get_all()),
+        'subjects': len(admin_service.subject_repo.get_all()),
+        'units': len(admin_service.unit_repo.get_all()),
+        'topics': len(admin_service.topic_repo.get_all()),
+    }
+
+
+def _warm_password_hasher(app: Flask) -> Any:
+    from app.services.password_hasher import get_password_hasher
+    hasher = get_password_hasher()
+    return {'executor': hasher.mode, 'workers': hasher.warm_up()}
+
+
+def _warm_static(app: Flask) -> Any:
+    assets = app.extensions.get('static_assets')
+    if assets is None:
+        return {'available': False}
+    report = assets.precompress()
+    # url_for hash'lerini ilk sayfa isteğinden önce hesapla
+    report['hashed'] = sum(1 for name in _static_files(assets.static_dir) if assets.file_hash(name))
+    return report
+
+
+def _static_files(static_dir: str) -> Iterable[str]:
+    root = Path(static_dir)
+    for path in root.rglob('*'):
+        if path.is_file() and path.suffix not in ('.gz', '.br'):
+            yield path.relative_to(root).as_posix()
+
+
+def _warm_metrics(app: Flask) -> Any:
+    from app.services.metrics_sampler import ensure_metrics_sampler
+    sampler = ensure_metrics_sampler()
+    return sampler.stats() if sampler is not None else {'enabled': False}
+
+
+def _warm_indexes(app: Flask) -> Any:
+    from app.database.migrations.index_manager import IndexManager
+    return {'ok': IndexManager().ensure_indexes()}
+
+
+WARMUP_STEPS: Dict[str, Callable[[Flask], Any]] = {
+    'db_pool': _warm_db_pool,
+    'templates': _warm_templates,
+    'scenarios': _warm_scenarios,
+    'curriculum': _warm_curriculum,
+    'password_hasher': _warm_password_hasher,
+    'static': _warm_static,
+    'metrics': _warm_metrics,
+    'indexes': _warm_indexes,
+}
+
+# =============================================================================
+# 5.0. ÇALIŞTIRMA
+# =============================================================================
+
+def warm_up(app: Flask, steps: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    5.1. Seçili adımları sırayla çalıştırır ve süre raporunu döner.
+
+    Args:
+        app: Flask uygulaması
+        steps: Adım adları; verilmezse AppConfig.WARMUP_STEPS kullanılır
+
+    Returns:
+        {'total_ms', 'phases': [...], 'results': {adım: özet}, 'errors': {adım: mesaj}}
+    """
+    if steps is None:
+        app_config = app.config.get('APP')
+        spec = getattr(app_config, 'WARMUP_STEPS', DEFAULT_STEPS)
+        steps = [step.strip() for step in spec.split(',') if step.strip()]
+
+    profiler = StartupProfiler()
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    with app.app_context():
+        for step in steps:
+            handler = WARMUP_STEPS.get(step)
+            if handler is None:
+                logger.warning("Unknown warm-up step: %s", step)
+                continue
+            with profiler.phase(step):
+                try:
+                    results[step] = handler(app)
+                except Exception as e:
+                    errors[step] = str(e)
+                    logger.warning("Warm-up step %s failed: %s", step, e)
+
+    report = profiler.report()
+    report.update({'results': results, 'errors': errors})
+    app.extensions['warmup'] = report
+    if report['phases']:
+        profiler.log(logger, 'Warm-up')
+    return report
+
+
+def post_fork(server, worker) -> None:
+    """
+    5.2. gunicorn `post_fork` hook'u: worker süreci başına bir kez çalışır.
+
+    preload_app açıksa uygulama ebeveynde yüklenmiştir; devralınan DB pool
+    bağlantıları bırakılır, SQLite oturum ve rate limit depoları yeni
+    bağlantı açar ve log dinleyici thread'i (fork'tan sağ çıkmaz) yeniden
+    başlatılır. Değilse uygulama burada yüklenir; gunicorn aynı
+    nesneyi worker başlatılırken yeniden kullanır.
+    """
+    from app.database.db_connection import reset_after_fork
+    from app.services import rate_limiter, session_store
+    from app.utils.logging_utils import configure_logging
+
+    configure_logging(force=True)
+    reset_after_fork()
+    session_store.reopen_after_fork()
+    rate_limiter.reopen_after_fork()
+    app = worker.app.wsgi()
+    if not isinstance(app, Flask):
+        logger.warning("Warm-up skipped: WSGI callable is not a Flask app (%r)", app)
+        return
+    warm_up(app)
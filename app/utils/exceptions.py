@@ -151,15 +151,18 @@ class ImportExportError(BTKAppException):
 class RateLimitError(BTKAppException):
     """Rate limit hatası"""
     
-    def __init__(self, message: str, limit: int = None, window: str = None):
+    def __init__(self, message: str, limit: int = None, window: str = None, retry_after: int = None):
         super().__init__(message, 'RATE_LIMIT_ERROR')
         self.limit = limit
         self.window = window
+        self.retry_after = retry_after
         
         if limit:
             self.details['limit'] = limit
         if window:
             self.details['window'] = window
+        if retry_after:
+            self.details['retry_after'] = retry_after
 
 class MaintenanceError(BTKAppException):
     """Bakım modu hatası"""
@@ -174,6 +177,19 @@ class MaintenanceError(BTKAppException):
         if maintenance_type:
             self.details['maintenance_type'] = maintenance_type
 
+class ServiceUnavailableError(BTKAppException):
+    """Geçici kapasite aşımı (yük atma) hatası"""
+    
+    def __init__(self, message: str, retry_after: int = None, resource: str = None):
+        super().__init__(message, 'SERVICE_UNAVAILABLE')
+        self.retry_after = retry_after
+        self.resource = resource
+        
+        if retry_after:
+            self.details['retry_after'] = retry_after
+        if resource:
+            self.details['resource'] = resource
+
 # Exception mapping for HTTP status codes
 EXCEPTION_STATUS_MAP = {
     ValidationError: 422,
@@ -187,7 +203,8 @@ EXCEPTION_STATUS_MAP = {
     FileOperationError: 500,
     ImportExportError: 400,
     RateLimitError: 429,
-    MaintenanceError: 503
+    MaintenanceError: 503,
+    ServiceUnavailableError: 503
 }
 
 def get_http_status_code(exception: Exception) -> int:
@@ -0,0 +1,233 @@
+# =============================================================================
+# JSON PROVIDER
+# =============================================================================
+# Flask uygulamasının JSON katmanı (app.json). jsonify / success_response /
+# error_response çağrılarının tamamı buradan geçer.
+#   - orjson kuruluysa (pip install orjson) serileştirme orjson ile, değilse
+#     standart json modülüyle yapılır (APIConfig.JSON_BACKEND).
+#   - Cursor satırlarındaki datetime/date/time/timedelta/Decimal/UUID
+#     değerleri ön dönüşüm gerekmeden serileştirilir. datetime varsayılan
+#     olarak Flask ile aynı HTTP tarih biçiminde yazılır; 'iso' seçilirse
+#     ISO 8601 kullanılır (APIConfig.JSON_DATETIME_FORMAT).
+#   - JSONBlob: önceden serileştirilmiş bir değer; yanıta yeniden
+#     kodlanmadan olduğu gibi gömülür (büyük, önbellekteki listeler için).
+#   - Yanıt gövdesi doğrudan UTF-8 bytes olarak üretilir (str -> encode
+#     kopyası yok). Anahtar sıralaması Flask varsayılanı gibi açıktır.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. JSONBlob
+# 5.0. FastJSONProvider
+#   5.1. default(self, o)
+#   5.2. dumps_bytes(self, obj, indent)
+#   5.3. dumps / loads / response
+#   5.4. blob(self, obj)
+# 6.0. YARDIMCI FONKSİYONLAR
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import dataclasses
+import decimal
+import json
+import re
+import secrets
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List
+
+from flask import current_app, has_app_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Standart json yolunda blob'ların yerini tutan işaret (\x00 ile kullanıcı
+# verisiyle çakışmaz; çıktıda "\u0000<nonce>:<n>\u0000" olarak görünür)
+_BLOB_NONCE = secrets.token_hex(8)
+_BLOB_PATTERN = re.compile(rb'"\\u0000' + _BLOB_NONCE.encode('ascii') + rb':(\d+)\\u0000"')
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# =============================================================================
+# 4.0. JSONBlob
+# =============================================================================
+
+class JSONBlob(bytes):
+    """
+    Önceden serileştirilmiş (UTF-8) JSON değeri.
+
+    Sözlük/liste içine konduğunda FastJSONProvider tarafından yanıta olduğu
+    gibi eklenir. Oluşturmak için provider.blob(obj) / to_blob(obj) kullanın.
+    """
+
+    __slots__ = ()
+
+# =============================================================================
+# 5.0. FastJSONProvider
+# =============================================================================
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson (varsa) veya json ile çalışan, blob destekli JSON provider."""
+
+    ensure_ascii = False
+    sort_keys = True
+
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        api_config = app.config.get('API')
+        backend = getattr(api_config, 'JSON_BACKEND', 'auto')
+        self.backend = 'orjson' if orjson is not None and backend in ('auto', 'orjson') else 'json'
+        self.datetime_format = getattr(api_config, 'JSON_DATETIME_FORMAT', 'http')
+        self._fragment = getattr(orjson, 'Fragment', None) if self.backend == 'orjson' else None
+
+    # -------------------------------------------------------------------------
+    # 5.1. Tip dönüşümleri
+    # -------------------------------------------------------------------------
+
+    def default(self, o: Any) -> Any:
+        """5.1. Serileştirilemeyen değerleri JSON tiplerine çevirir."""
+        if isinstance(o, date):
+            if self.datetime_format == 'iso':
+                return o.isoformat()
+            return _http_date(o)
+        if isinstance(o, time):
+            return o.isoformat()
+        if isinstance(o, timedelta):
+            # MySQL TIME kolonları timedelta olarak gelir
+            return o.total_seconds()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            return dataclasses.asdict(o)
+        if hasattr(o, '__html__'):
+            return str(o.__html__())
+        if isinstance(o, (set, frozenset)):
+            return list(o)
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    # -------------------------------------------------------------------------
+    # 5.2. Serileştirme
+    # -------------------------------------------------------------------------
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """5.2. Nesneyi UTF-8 JSON bytes'a çevirir; JSONBlob'ları yerine koyar."""
+        if self.backend == 'orjson':
+            option = orjson.OPT_NON_STR_KEYS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            if self.datetime_format != 'iso':
+                option |= orjson.OPT_PASSTHROUGH_DATETIME
+            if self._fragment is not None:
+                fragment = self._fragment
+
+                def _default(o: Any) -> Any:
+                    if isinstance(o, JSONBlob):
+                        return fragment(bytes(o))
+                    return self.default(o)
+
+                return orjson.dumps(obj, default=_default, option=option)
+
+        blobs: List[bytes] = []
+
+        def _default_with_blobs(o: Any) -> Any:
+            if isinstance(o, JSONBlob):
+                blobs.append(bytes(o))
+                return f"\x00{_BLOB_NONCE}:{len(blobs) - 1}\x00"
+            return self.default(o)
+
+        if self.backend == 'orjson':
+            data = orjson.dumps(obj, default=_default_with_blobs, option=option)
+        else:
+            kwargs: Dict[str, Any] = {'indent': 2} if indent else {'separators': (',', ':')}
+            data = json.dumps(obj, default=_default_with_blobs, ensure_ascii=self.ensure_ascii,
+                              sort_keys=self.sort_keys, **kwargs).encode('utf-8')
+        if blobs:
+            # Tek geçişte tüm işaretleri blob'larla değiştir
+            data = _BLOB_PATTERN.sub(lambda match: blobs[int(match.group(1))], data)
+        return data
+
+    # -------------------------------------------------------------------------
+    # 5.3. Flask JSONProvider arayüzü
+    # -------------------------------------------------------------------------
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """5.3.1. str çıktı (json.dumps uyumlu argümanlar standart yola düşer)."""
+        if set(kwargs) - {'indent', 'separators'}:
+            kwargs.setdefault('default', self.default)
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """5.3.2. JSON çözer (orjson varsa ve ek argüman yoksa orjson ile)."""
+        if self.backend == 'orjson' and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """5.3.3. jsonify: gövde doğrudan bytes olarak üretilir."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent) + b'\n',
+                                        mimetype=self.mimetype)
+
+    # -------------------------------------------------------------------------
+    # 5.4. Blob üretimi
+    # -------------------------------------------------------------------------
+
+    def blob(self, obj: Any) -> JSONBlob:
+        """5.4. Nesneyi bir kez serileştirip gömülebilir JSONBlob döner."""
+        return JSONBlob(self.dumps_bytes(obj))
+
+    def info(self) -> Dict[str, Any]:
+        """Admin sistem durumu için provider ayarları."""
+        return {
+            'backend': self.backend,
+            'datetime_format': self.datetime_format,
+            'fragments': self._fragment is not None,
+            'sort_keys': self.sort_keys,
+        }
+
+# =============================================================================
+# 6.0. YARDIMCI FONKSİYONLAR
+# =============================================================================
+
+def _http_date(value: date) -> str:
+    """
+    werkzeug.http.http_date ile aynı çıktı ("Wed, 01 May 2024 12:30:00 GMT");
+    naive değerler UTC kabul edilir. Satır başına birkaç datetime içeren
+    listelerde werkzeug sürümünden belirgin şekilde hızlıdır.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None and value.utcoffset() is not None:
+            value = value.astimezone(timezone.utc)
+        hour, minute, second = value.hour, value.minute, value.second
+    else:
+        hour = minute = second = 0
+    return (f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} "
+            f"{value.year:04d} {hour:02d}:{minute:02d}:{second:02d} GMT")
+
+
+def to_blob(obj: Any) -> JSONBlob:
+    """
+    Nesneyi geçerli uygulamanın provider'ıyla JSONBlob'a çevirir.
+
+    Uygulama bağlamı yoksa veya provider FastJSONProvider değilse standart
+    json (Flask ile aynı varsayılanlar) kullanılır.
+    """
+    provider = current_app.json if has_app_context() else None
+    if isinstance(provider, FastJSONProvider):
+        return provider.blob(obj)
+    return JSONBlob(json.dumps(obj, default=DefaultJSONProvider.default, ensure_ascii=False,
+                               sort_keys=True, separators=(',', ':')).encode('utf-8'))
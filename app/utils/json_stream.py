@@ -0,0 +1,128 @@
+"""
+JSON Stream - Incremental JSON Array Reader
+Büyük JSON dosyalarında üst seviye bir dizinin elemanlarını tek tek okur.
+
+Dosyanın tamamı belleğe alınmaz: okuma tamponu yalnızca o an çözülen elemanı
+ve bir okuma parçasını (chunk) tutar. Eleman dışındaki üst seviye anahtarlar
+(ör. `metadata`) küçük oldukları varsayımıyla `header` sözlüğüne yazılır.
+
+Example:
+    header = {}
+    with open('bank.json', 'rb') as f:
+        for question in iter_array_items(f, 'questions', header):
+            ...
+    header['metadata']  # dizi başlamadan önce okunmuş olur
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\r\n'
+_decoder = json.JSONDecoder()
+
+
+class _BufferedReader:
+    """UTF-8 akışını parça parça okuyup json.raw_decode ile değer çözen tampon."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Tampona bir parça daha ekler; okunmuş kısmı atar."""
+        if self.eof:
+            return False
+        data = self.stream.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            text = self.decoder.decode(b'', final=True)
+        else:
+            text = self.decoder.decode(data)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Boşlukları atlayıp sıradaki karakteri döner (dosya sonunda '')."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at stream offset, found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Sıradaki tam JSON değerini çözer; eksikse tamponu büyütüp yeniden dener."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Tampon sonunda biten sayı/literal kesilmiş olabilir
+            if end == len(self.buffer) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_array_items(stream: BinaryIO, key: str, header: Optional[Dict[str, Any]] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Üst seviye nesnedeki `key` dizisinin elemanlarını sırayla üretir.
+
+    Args:
+        stream: İkili (binary) modda açılmış dosya.
+        key: Elemanları okunacak dizinin anahtarı (ör. 'questions').
+        header: Verilirse diğer üst seviye anahtarlar buraya yazılır.
+        chunk_size: Her okumada alınacak bayt sayısı.
+
+    Raises:
+        ValueError / json.JSONDecodeError: Geçersiz JSON.
+    """
+    header = header if header is not None else {}
+    reader = _BufferedReader(stream, chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    separator = reader.peek()
+                    reader.pos += 1
+                    if separator == ']':
+                        break
+                    if separator != ',':
+                        raise ValueError(f"Expected ',' or ']' in '{key}' array, found '{separator or 'EOF'}'")
+        else:
+            header[name] = reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"Expected ',' or '}}' in object, found '{separator or 'EOF'}'")
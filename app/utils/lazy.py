@@ -0,0 +1,69 @@
+# =============================================================================
+# LAZY SERVICE
+# =============================================================================
+# Route modüllerindeki modül seviyesi servis nesneleri için tembel (lazy)
+# singleton vekili. Nesne import sırasında değil, ilk attribute erişiminde
+# bir kez oluşturulur; böylece blueprint import'u servis kurucularının
+# (repository, dosya okuma, dış servis ayarı) maliyetini taşımaz.
+#
+#     admin_service = LazyService(AdminService)
+#     admin_service.get_dashboard_stats()   # ilk çağrıda AdminService() kurulur
+#
+# Kurucu hata verirse vekil False döner (`if not service: ... 503`) ve bir
+# sonraki erişimde yeniden denenir.
+# =============================================================================
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LazyService:
+    """İlk kullanımda factory() ile oluşturulan thread-safe vekil."""
+
+    def __init__(self, factory: Optional[Callable[[], Any]], name: Optional[str] = None):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_name', name or getattr(factory, '__name__', 'service'))
+        object.__setattr__(self, '_instance', _MISSING)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def get(self) -> Optional[Any]:
+        """Gerçek nesneyi döner; factory yoksa veya kurulamazsa None."""
+        instance = self._instance
+        if instance is not _MISSING:
+            return instance
+        if self._factory is None:
+            return None
+        with self._lock:
+            if self._instance is _MISSING:
+                try:
+                    object.__setattr__(self, '_instance', self._factory())
+                except Exception as e:
+                    logger.error("Service %s could not be created: %s", self._name, e)
+                    return None
+            return self._instance
+
+    @property
+    def is_created(self) -> bool:
+        """Nesne oluşturuldu mu? (oluşturmayı tetiklemez)"""
+        return self._instance is not _MISSING
+
+    def __getattr__(self, name: str) -> Any:
+        instance = self.get()
+        if instance is None:
+            raise AttributeError(f"{self._name} is not available")
+        return getattr(instance, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.get(), name, value)
+
+    def __bool__(self) -> bool:
+        return self.get() is not None
+
+    def __repr__(self) -> str:
+        state = 'created' if self.is_created else 'pending'
+        return f"<LazyService {self._name} ({state})>"
@@ -0,0 +1,204 @@
+# =============================================================================
+# LOGGING UTILS
+# =============================================================================
+# Uygulama genelinde tek bir log hattı kurar:
+#   - İstek thread'leri kayıtları yalnızca bir kuyruğa bırakır (QueueHandler);
+#     biçimlendirme ve yazma (stderr / dosya) ayrı bir dinleyici thread'inde
+#     (QueueListener) yapılır, böylece yavaş bir terminal veya disk isteği
+#     bekletmez.
+#   - Mesajlar %-argümanlarıyla tembel (lazy) biçimlendirilir; seviyesi
+#     kapalı bir logger.debug(...) çağrısı hiçbir string üretmez.
+#   - Seviyeler AppConfig.LOG_LEVEL'dan modül bazında okunur:
+#         LOG_LEVEL="INFO,app.services.chat_message_service=DEBUG,werkzeug=WARNING"
+#   - LOG_JSON=1 ile kayıtlar JSON satırları olarak yazılır; `extra={...}`
+#     ile verilen alanlar kayda yapısal alan olarak eklenir.
+# =============================================================================
+
+# =============================================================================
+# 2.0. İÇİNDEKİLER
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# 4.0. BİÇİMLENDİRİCİLER VE HANDLER'LAR
+#   4.1. StructuredFormatter
+#   4.2. DeferredQueueHandler
+# 5.0. KURULUM
+#   5.1. parse_levels(spec)
+#   5.2. configure_logging(config_class)
+#   5.3. shutdown_logging()
+#   5.4. log_queue_size()
+# =============================================================================
+
+# =============================================================================
+# 3.0. GEREKLİ KÜTÜPHANELER VE MODÜLLER
+# =============================================================================
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# LogRecord'un standart alanları; bunların dışındakiler `extra` ile gelmiştir
+_RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# =============================================================================
+# 4.0. BİÇİMLENDİRİCİLER VE HANDLER'LAR
+# =============================================================================
+
+class StructuredFormatter(logging.Formatter):
+    """
+    4.1. Kaydı tek satırlık JSON'a çevirir:
+    {"ts", "level", "logger", "message", ...extra alanlar, "exc"}.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith('_'):
+                data[key] = value
+        if record.exc_text or record.exc_info:
+            data['exc'] = record.exc_text or self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class ExtraFieldsFormatter(logging.Formatter):
+    """Metin formatına `extra` alanlarını `key=value` olarak ekler."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        extras = [f"{key}={value!r}" for key, value in record.__dict__.items()
+                  if key not in _RESERVED and not key.startswith('_')]
+        return f"{text} | {' '.join(extras)}" if extras else text
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    4.2. Kaydı biçimlendirmeden kuyruğa bırakır.
+
+    Standart QueueHandler.prepare() mesajı çağıran thread'de biçimlendirir;
+    burada yalnızca istisna metni (traceback nesneleri thread'e bağlı olduğu
+    için) üretilir, `msg % args` biçimlendirmesi dinleyici thread'ine kalır.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+# =============================================================================
+# 5.0. KURULUM
+# =============================================================================
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_lock = threading.Lock()
+
+
+def parse_levels(spec: str, default: str = 'INFO') -> Tuple[int, Dict[str, int]]:
+    """
+    5.1. "INFO,app.x=DEBUG,werkzeug=WARNING" biçimindeki ayarı
+    (kök seviye, {logger adı: seviye}) çiftine çevirir. Bilinmeyen seviye
+    adları yok sayılır.
+    """
+    root_level = logging.getLevelName(default.upper())
+    levels: Dict[str, int] = {}
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, level = part.rpartition('=')
+        value = logging.getLevelName(level.strip().upper())
+        if not isinstance(value, int):
+            continue
+        if name:
+            levels[name.strip()] = value
+        else:
+            root_level = value
+    return root_level if isinstance(root_level, int) else logging.INFO, levels
+
+
+def configure_logging(config_class=None, force: bool = False) -> logging.handlers.QueueListener:
+    """
+    5.2. Kök logger'a kuyruk handler'ını bağlar ve dinleyiciyi başlatır
+    (süreç başına bir kez; force=True yeniden kurar).
+
+    Hedefler: stderr (her zaman) ve LOG_TO_FILE açıksa LOG_DIR/app.log
+    (dönen dosya). Mevcut kök handler'lar (ör. basicConfig) kaldırılır.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None and not force:
+            return _listener
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+        if config_class is None:
+            from config import get_config
+            config_class = get_config()
+        app_config = getattr(config_class, 'APP', config_class)
+        root_level, levels = parse_levels(getattr(app_config, 'LOG_LEVEL', 'INFO'))
+        use_json = getattr(app_config, 'LOG_JSON', False)
+
+        if use_json:
+            formatter: logging.Formatter = StructuredFormatter()
+        else:
+            formatter = ExtraFieldsFormatter(
+                getattr(app_config, 'LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            )
+        targets = [logging.StreamHandler()]
+        if getattr(app_config, 'LOG_TO_FILE', False):
+            log_dir = Path(getattr(app_config, 'LOG_DIR', 'logs'))
+            try:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                targets.append(logging.handlers.RotatingFileHandler(
+                    log_dir / 'app.log', maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8'
+                ))
+            except OSError as e:
+                logging.getLogger(__name__).warning("Log file could not be opened: %s", e)
+        for handler in targets:
+            handler.setFormatter(formatter)
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(DeferredQueueHandler(log_queue))
+        root.setLevel(root_level)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, *targets, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """5.3. Kuyruktaki kayıtları yazar ve dinleyiciyi durdurur."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def log_queue_size() -> Optional[int]:
+    """5.4. Dinleyicinin henüz yazmadığı kayıt sayısı (dinleyici yoksa None)."""
+    listener = _listener
+    if listener is None:
+        return None
+    return listener.queue.qsize()
+
+
+atexit.register(shutdown_logging)
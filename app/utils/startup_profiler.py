@@ -0,0 +1,54 @@
+# =============================================================================
+# STARTUP PROFILER
+# =============================================================================
+# create_app ve worker warm-up aşamalarının sürelerini ölçer. Ölçüm her
+# zaman yapılır (birkaç perf_counter çağrısı); STARTUP_PROFILE=1 ise
+# aşama dökümü açılışta loglanır. Sonuç app.extensions['startup_profile']
+# altında saklanır ve admin sistem durumunda gösterilir.
+#
+#     profiler = StartupProfiler()
+#     with profiler.phase('blueprint_import'):
+#         from app.routes import api_bp, pages_bp
+#     profiler.log(logger)
+# =============================================================================
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class StartupProfiler:
+    """Ardışık açılış aşamalarının süresini (ms) kaydeder."""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self._origin = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Blok süresini `name` aşaması olarak kaydeder (hata olsa da)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - started) * 1000))
+
+    def report(self) -> Dict[str, Any]:
+        """{'total_ms', 'phases': [{'name', 'ms', 'percent'}]} biçiminde özet."""
+        total = sum(ms for _, ms in self.phases)
+        return {
+            'started_at': self.started_at,
+            'total_ms': round(total, 1),
+            'phases': [
+                {'name': name, 'ms': round(ms, 1), 'percent': round(ms * 100 / total, 1) if total else 0.0}
+                for name, ms in self.phases
+            ],
+        }
+
+    def log(self, logger: logging.Logger, title: str = 'Startup') -> None:
+        """Aşama dökümünü tek bir INFO kaydı olarak yazar."""
+        report = self.report()
+        details = ', '.join(f"{p['name']}={p['ms']}ms" for p in report['phases'])
+        logger.info("%s took %.1f ms: %s", title, report['total_ms'], details)
@@ -43,6 +43,32 @@ class DatabaseConfig:
     PASSWORD = os.environ.get('DB_PASSWORD', '')  # Must be set in production
     DATABASE = os.environ.get('DB_NAME', 'btk_app')
     
+    # Read/write splitting (optional)
+    # DB_PRIMARY_URL: full SQLAlchemy URL overriding HOST/PORT/... (e.g. sqlite stand-in)
+    # DB_REPLICA_URLS: comma-separated SQLAlchemy URLs of read replicas
+    PRIMARY_URL = os.environ.get('DB_PRIMARY_URL') or None
+    REPLICA_URLS = [u.strip() for u in os.environ.get('DB_REPLICA_URLS', '').split(',') if u.strip()]
+    REPLICA_MAX_LAG_SECONDS = _env_int('DB_REPLICA_MAX_LAG_SECONDS', 5)
+    REPLICA_LAG_CHECK_INTERVAL = _env_int('DB_REPLICA_LAG_CHECK_INTERVAL', 2)
+    
+    # Query instrumentation (per-request SQL stats, slow-query log, N+1 detection)
+    QUERY_STATS_ENABLED = _env_bool('DB_QUERY_STATS', True)
+    SLOW_QUERY_MS = _env_int('DB_SLOW_QUERY_MS', 200)
+    N_PLUS_ONE_THRESHOLD = _env_int('DB_N_PLUS_ONE_THRESHOLD', 10)
+    SLOW_QUERY_LOG_SIZE = _env_int('DB_SLOW_QUERY_LOG_SIZE', 200)
+    
+    # Data retention (chunked purge; see RetentionManager)
+    RETENTION_CHAT_MESSAGE_DAYS = _env_int('RETENTION_CHAT_MESSAGE_DAYS', 180)
+    RETENTION_CHAT_SESSION_DAYS = _env_int('RETENTION_CHAT_SESSION_DAYS', 30)  # also the minimum age for /api/ai/session/cleanup
+    RETENTION_ACTIVITY_DAYS = _env_int('RETENTION_ACTIVITY_DAYS', 90)
+    RETENTION_QUIZ_SESSION_DAYS = _env_int('RETENTION_QUIZ_SESSION_DAYS', 30)
+    RETENTION_CHUNK_SIZE = _env_int('RETENTION_CHUNK_SIZE', 1000)
+    RETENTION_SLEEP_MS = _env_int('RETENTION_SLEEP_MS', 50)
+    RETENTION_MAX_ROWS_PER_SEC = _env_int('RETENTION_MAX_ROWS_PER_SEC', 0)  # 0 = unlimited
+    # Monthly RANGE partitions (chat_messages, user_activities; MySQL only)
+    PARTITIONING_ENABLED = _env_bool('DB_PARTITIONING_ENABLED', False)
+    PARTITION_MONTHS_AHEAD = _env_int('DB_PARTITION_MONTHS_AHEAD', 3)
+    
     # Connection pool settings
     POOL_SIZE = _env_int('DB_POOL_SIZE', 10)
     MAX_OVERFLOW = _env_int('DB_MAX_OVERFLOW', 20)
@@ -69,7 +95,11 @@ class DatabaseConfig:
             'max_overflow': cls.MAX_OVERFLOW,
             'pool_timeout': cls.POOL_TIMEOUT,
             'pool_recycle': cls.POOL_RECYCLE,
-            'pool_pre_ping': cls.POOL_PRE_PING
+            'pool_pre_ping': cls.POOL_PRE_PING,
+            'primary_url': cls.PRIMARY_URL,
+            'replica_urls': list(cls.REPLICA_URLS),
+            'replica_max_lag_seconds': cls.REPLICA_MAX_LAG_SECONDS,
+            'replica_lag_check_interval': cls.REPLICA_LAG_CHECK_INTERVAL
         }
 
 class APIConfig:
@@ -86,6 +116,25 @@ class APIConfig:
     # Rate limiting
     API_RATE_LIMIT = _env_int('API_RATE_LIMIT', 100)  # requests per minute
     API_RATE_LIMIT_WINDOW = _env_int('API_RATE_LIMIT_WINDOW', 60)  # seconds
+    RATE_LIMIT_ENABLED = _env_bool('RATE_LIMIT_ENABLED', True)
+    RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')  # memory | sqlite (shared by workers)
+    RATE_LIMIT_STORE_PATH = os.environ.get('RATE_LIMIT_STORE_PATH', '')
+    # Stricter per-route budgets (see app/services/rate_limiter.py)
+    AI_RATE_LIMIT = _env_int('AI_RATE_LIMIT', 10)  # AI chat requests per window
+    AI_RATE_LIMIT_WINDOW = _env_int('AI_RATE_LIMIT_WINDOW', 60)
+    AI_RATE_LIMIT_BURST = _env_int('AI_RATE_LIMIT_BURST', 3)
+    AI_DAILY_LIMIT = _env_int('AI_DAILY_LIMIT', 200)  # sliding 24h quota, 0 = off
+    POLL_RATE_LIMIT = _env_int('POLL_RATE_LIMIT', 60)  # quiz status/timer polling
+    POLL_RATE_LIMIT_WINDOW = _env_int('POLL_RATE_LIMIT_WINDOW', 60)
+    AUTH_RATE_LIMIT = _env_int('AUTH_RATE_LIMIT', 10)  # login/register attempts per IP + account
+    AUTH_IP_RATE_LIMIT = _env_int('AUTH_IP_RATE_LIMIT', 300)  # login/register ceiling per IP (shared NAT)
+    AUTH_RATE_LIMIT_WINDOW = _env_int('AUTH_RATE_LIMIT_WINDOW', 300)
+
+    # JSON responses (app/utils/json_provider.py)
+    JSON_BACKEND = os.environ.get('JSON_BACKEND', 'auto')  # auto (orjson if installed) | orjson | json
+    JSON_DATETIME_FORMAT = os.environ.get('JSON_DATETIME_FORMAT', 'http')  # http (Flask default) | iso
+    RESPONSE_CACHE_TTL = _env_int('RESPONSE_CACHE_TTL', 300)  # seconds; cached question content/blobs
+    RESPONSE_CACHE_SIZE = _env_int('RESPONSE_CACHE_SIZE', 5000)
 
 class SecurityConfig:
     """Security configuration settings."""
@@ -97,9 +146,29 @@ class SecurityConfig:
     SESSION_COOKIE_SECURE = _env_bool('SESSION_COOKIE_SECURE', False)
     SESSION_COOKIE_HTTPONLY = _env_bool('SESSION_COOKIE_HTTPONLY', True)
     SESSION_COOKIE_SAMESITE = os.environ.get('SESSION_COOKIE_SAMESITE', 'Lax')
+    # Reverse proxies in front of the app whose X-Forwarded-For/-Proto are trusted (0 = none)
+    TRUSTED_PROXY_HOPS = _env_int('TRUSTED_PROXY_HOPS', 0)
     
-    # Password hashing
-    PASSWORD_SALT_ROUNDS = _env_int('PASSWORD_SALT_ROUNDS', 12)
+    # Server-side session store (see app/services/session_store.py)
+    # '' / cookie = Flask signed cookie; memory | file | sqlite = only the session id in the cookie
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', '')
+    SESSION_STORE_PATH = os.environ.get('SESSION_STORE_PATH', '')  # file: directory, sqlite: .db file
+    SESSION_LIFETIME = _env_int('SESSION_LIFETIME', 86400)  # idle timeout (seconds)
+    SESSION_MAX_ENTRIES = _env_int('SESSION_MAX_ENTRIES', 10000)  # LRU bound for the memory store
+    SESSION_TOUCH_INTERVAL = _env_int('SESSION_TOUCH_INTERVAL', 60)  # last-activity write-back interval (seconds)
+    
+    # Password hashing (scrypt, N = 2 ** PASSWORD_SALT_ROUNDS; 15 = werkzeug default)
+    # When this changes, old hashes are rehashed on the next successful login.
+    PASSWORD_SALT_ROUNDS = _env_int('PASSWORD_SALT_ROUNDS', 15)
+    PASSWORD_HASH_EXECUTOR = os.environ.get('PASSWORD_HASH_EXECUTOR', 'process')  # process | thread | inline
+    PASSWORD_HASH_WORKERS = _env_int('PASSWORD_HASH_WORKERS', 0)  # 0 = CPU count
+    PASSWORD_HASH_QUEUE_SIZE = _env_int('PASSWORD_HASH_QUEUE_SIZE', 32)  # pending jobs beyond the workers
+    PASSWORD_HASH_QUEUE_WAIT_MS = _env_int('PASSWORD_HASH_QUEUE_WAIT_MS', 0)  # wait when the queue is full
+    PASSWORD_HASH_TIMEOUT = _env_int('PASSWORD_HASH_TIMEOUT', 10)  # seconds
+    
+    # In-process user cache for authorization checks (see app/services/user_cache.py)
+    AUTH_USER_CACHE_TTL = _env_int('AUTH_USER_CACHE_TTL', 30)  # seconds
+    AUTH_USER_CACHE_SIZE = _env_int('AUTH_USER_CACHE_SIZE', 10000)
     
     # CORS settings
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
@@ -132,10 +201,39 @@ class AppConfig:
     MAX_QUESTIONS_PER_QUIZ = _env_int('MAX_QUESTIONS_PER_QUIZ', 50)
     QUESTIONS_DIR = os.environ.get('QUESTIONS_DIR', 'app/data/quiz_banks')
     
-    # Logging
+    # Curriculum CSV import (rows per validated/upserted batch)
+    CURRICULUM_IMPORT_BATCH_SIZE = _env_int('CURRICULUM_IMPORT_BATCH_SIZE', 2000)
+    
+    # Background jobs (admin import/export, cleanup, index creation)
+    BACKGROUND_JOB_WORKERS = _env_int('BACKGROUND_JOB_WORKERS', 2)
+    
+    # Logging (LOG_LEVEL may be per module: "INFO,app.services=DEBUG,werkzeug=WARNING")
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
+    LOG_JSON = _env_bool('LOG_JSON', False)
+    LOG_TO_FILE = _env_bool('LOG_TO_FILE', False)
+
+    # Startup profiling and worker warm-up (app/services/warmup.py, gunicorn post_fork)
+    STARTUP_PROFILE = _env_bool('STARTUP_PROFILE', False)  # log per-phase create_app/warm-up timings
+    WARMUP_STEPS = os.environ.get('WARMUP_STEPS', 'db_pool,templates,scenarios,curriculum,password_hasher,static,metrics')  # '' = off, 'indexes' is opt-in
+    WARMUP_POOL_CONNECTIONS = _env_int('WARMUP_POOL_CONNECTIONS', 1)  # connections opened per live DB manager
+
+    # Background system metrics sampler (app/services/metrics_sampler.py)
+    METRICS_SAMPLER_ENABLED = _env_bool('METRICS_SAMPLER_ENABLED', True)  # off = /api/status samples on request (non-blocking)
+    METRICS_SAMPLE_INTERVAL = _env_int('METRICS_SAMPLE_INTERVAL', 5)  # seconds between samples
+    METRICS_HISTORY = _env_int('METRICS_HISTORY', 120)  # samples kept in the ring buffer (10 min at 5 s)
+
+    # Response compression, API ETags and static asset caching
+    # (app/services/compression.py, app/services/static_assets.py)
+    COMPRESSION_ENABLED = _env_bool('COMPRESSION_ENABLED', True)
+    COMPRESSION_MIN_SIZE = _env_int('COMPRESSION_MIN_SIZE', 1024)  # bytes; smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL = _env_int('COMPRESSION_GZIP_LEVEL', 6)
+    COMPRESSION_BROTLI_QUALITY = _env_int('COMPRESSION_BROTLI_QUALITY', 5)  # used when `brotli` is installed
+    API_ETAGS = _env_bool('API_ETAGS', True)  # weak ETag + 304 on GET /api/* JSON
+    STATIC_HASHED_URLS = _env_bool('STATIC_HASHED_URLS', True)  # url_for('static') -> name.<hash>.ext
+    STATIC_MAX_AGE = _env_int('STATIC_MAX_AGE', 31536000)  # seconds, hashed URLs only (immutable)
+    ASSET_BUNDLES = _env_bool('ASSET_BUNDLES', True)  # serve built bundles from static/dist/manifest.json when present
+
     @classmethod
     def ensure_directories(cls) -> None:
         """Ensure required directories exist."""
@@ -194,7 +292,15 @@ class TestingConfig(Config):
         'POOL_RECYCLE': 1800,
         'POOL_PRE_PING': True,
         'CHARSET': 'utf8mb4',
-        'COLLATION': 'utf8mb4_unicode_ci'
+        'COLLATION': 'utf8mb4_unicode_ci',
+        'PRIMARY_URL': os.environ.get('DB_PRIMARY_URL') or None,
+        'REPLICA_URLS': [u.strip() for u in os.environ.get('DB_REPLICA_URLS', '').split(',') if u.strip()],
+        'REPLICA_MAX_LAG_SECONDS': 5,
+        'REPLICA_LAG_CHECK_INTERVAL': 2,
+        'QUERY_STATS_ENABLED': True,
+        'SLOW_QUERY_MS': 200,
+        'N_PLUS_ONE_THRESHOLD': 10,
+        'SLOW_QUERY_LOG_SIZE': 200
     })()
 
 class ProductionConfig(Config):
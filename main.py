@@ -1,44 +1,101 @@
 from flask import Flask, session
 from config import get_config
+from app.utils.startup_profiler import StartupProfiler
+from app.utils.json_provider import FastJSONProvider
+import logging
 import os
 
 def create_app(config_class=None):
     """Create and configure the Flask application."""
+    # Per-phase startup timing (logged when STARTUP_PROFILE=1)
+    profiler = StartupProfiler()
+
     # Get configuration
-    config = config_class or get_config()
-    
+    with profiler.phase('config'):
+        config = config_class or get_config()
+
+    # Non-blocking, level-gated logging (see app/utils/logging_utils.py)
+    with profiler.phase('logging'):
+        from app.utils.logging_utils import configure_logging
+        configure_logging(config)
+
     # Create Flask app instance
-    app = Flask(__name__, 
-               template_folder=str(config.APP.TEMPLATE_DIR),
-               static_folder=str(config.APP.STATIC_DIR),
-               static_url_path='/static')
-    
-    # Load configuration
-    app.config.from_object(config)
-    
-    # Set secret key from config
-    app.secret_key = config.SECURITY.SECRET_KEY
-    
+    with profiler.phase('flask_app'):
+        app = Flask(__name__,
+                   template_folder=str(config.APP.TEMPLATE_DIR),
+                   static_folder=str(config.APP.STATIC_DIR),
+                   static_url_path='/static')
+
+        # Load configuration
+        app.config.from_object(config)
+
+        # Set secret key from config
+        app.secret_key = config.SECURITY.SECRET_KEY
+
+        # Faster JSON encoding (orjson when installed) with pre-serialized blob support
+        app.json = FastJSONProvider(app)
+
+        # Client IP/scheme from trusted reverse proxies (rate limiting keys on remote_addr)
+        if config.SECURITY.TRUSTED_PROXY_HOPS:
+            from werkzeug.middleware.proxy_fix import ProxyFix
+            hops = config.SECURITY.TRUSTED_PROXY_HOPS
+            app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
+
+    # Optional server-side session store (cookie carries only the session id)
+    with profiler.phase('session_store'):
+        from app.services.session_store import init_session_store
+        init_session_store(app, config)
+
     # Ensure required directories exist
-    config.APP.ensure_directories()
-    
+    with profiler.phase('directories'):
+        config.APP.ensure_directories()
+
+    # Per-request SQL instrumentation (query count, DB time, slow-query log)
+    with profiler.phase('db_instrumentation'):
+        from app.database import query_instrumentation
+        query_instrumentation.init_app(app)
+
+    # API rate limiting (APIConfig.API_RATE_LIMIT, stricter AI/poll/auth budgets)
+    with profiler.phase('rate_limiter'):
+        from app.services.rate_limiter import init_rate_limiter
+        init_rate_limiter(app, config)
+
+    # gzip/brotli + ETag/304 for dynamic responses; hashed, precompressed static files and bundles
+    with profiler.phase('http_delivery'):
+        from app.services.compression import init_compression
+        from app.services.static_assets import init_static_assets
+        from app.services.asset_pipeline import init_asset_pipeline
+        init_compression(app, config)
+        init_static_assets(app, config)
+        init_asset_pipeline(app, config)
+
     # Import and register blueprints
-    from app.routes import api_bp, pages_bp
-    from app.routes.api.admin_routes import admin_bp
-    
-    app.register_blueprint(api_bp, url_prefix='/api')
-    app.register_blueprint(pages_bp)
-    app.register_blueprint(admin_bp)
-    
+    with profiler.phase('blueprint_import'):
+        from app.routes import api_bp, pages_bp
+        from app.routes.api.admin_routes import admin_bp
+
+    with profiler.phase('blueprint_register'):
+        app.register_blueprint(api_bp, url_prefix='/api')
+        app.register_blueprint(pages_bp)
+        app.register_blueprint(admin_bp)
+
     # Context processor for session injection into templates
     @app.context_processor
     def inject_session():
         return {'session': session}
-    
+
+    app.extensions['startup_profile'] = profiler
+    if config.APP.STARTUP_PROFILE:
+        profiler.log(logging.getLogger(__name__), 'create_app')
+
     return app
 
 # Create the application instance
 app = create_app()
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=app.debug)
\ No newline at end of file
+    # Development server: warm caches in-process before serving
+    # (under gunicorn use app.services.warmup.post_fork instead)
+    from app.services.warmup import warm_up
+    warm_up(app)
+    app.run(host='0.0.0.0', port=5000, debug=app.debug)
@@ -0,0 +1,128 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from app.utils.json_provider import FastJSONProvider, orjson
+
+
+class _APIConfig:
+    JSON_BACKEND = 'json'
+    JSON_DATETIME_FORMAT = 'http'
+
+
+def build_payload(questions, options_per_question):
+    """Same shape as GET /api/quiz/session/<id>/questions, with raw cursor values."""
+    created = datetime(2024, 5, 1, 12, 30)
+    rows = []
+    for qid in range(1, questions + 1):
+        options = [{
+            'id': qid * 10 + n,
+            'question_id': qid,
+            'name': f"Seçenek {n} — örnek cevap metni {qid}",
+            'is_correct': n == 0,
+            'score': Decimal('1.50'),
+            'created_at': created + timedelta(minutes=n),
+        } for n in range(options_per_question)]
+        rows.append({
+            'question_id': qid,
+            'question_text': f"Soru {qid}: Aşağıdakilerden hangisi doğrudur? " * 3,
+            'question_order': qid,
+            'user_answer_option_id': None,
+            'is_answered': False,
+            'options': options,
+            'difficulty_level': 'medium',
+            'points': 1,
+            'topic_id': 1,
+            'created_at': created,
+        })
+    return {'success': True, 'message': 'Sorular başarıyla getirildi',
+            'data': {'questions': rows, 'total_questions': len(rows)}}
+
+
+def make_app(backend):
+    app = Flask(__name__)
+    config = _APIConfig()
+    config.JSON_BACKEND = backend
+    app.config['API'] = config
+    app.json = FastJSONProvider(app)
+    return app
+
+
+def measure(fn, repeat):
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = fn()
+    return (time.perf_counter() - started) * 1e6 / repeat, len(body)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare JSON encoding cost of the quiz questions response per provider"
+    )
+    parser.add_argument("--questions", type=int, default=50, help="Questions per response")
+    parser.add_argument("--options", type=int, default=4, help="Options per question")
+    parser.add_argument("--repeat", type=int, default=200, help="Responses per measurement")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    payload = build_payload(args.questions, args.options)
+    results = {}
+
+    default_app = Flask(__name__)
+    default_app.json = DefaultJSONProvider(default_app)
+    with default_app.app_context():
+        results['flask_default'] = measure(lambda: default_app.json.response(payload).get_data(), args.repeat)
+
+    backends = ['json'] + (['orjson'] if orjson is not None else [])
+    for backend in backends:
+        app = make_app(backend)
+        with app.app_context():
+            results[f'fast_{backend}'] = measure(lambda: app.json.response(payload).get_data(), args.repeat)
+
+            # Cached path: option rows pre-serialized once, only the list order changes per response
+            blobs = {q['question_id']: [app.json.blob(o) for o in q['options']]
+                     for q in payload['data']['questions']}
+
+            def spliced():
+                questions = []
+                for q in payload['data']['questions']:
+                    options = list(blobs[q['question_id']])
+                    random.shuffle(options)
+                    questions.append(dict(q, options=options))
+                data = {'questions': questions, 'total_questions': len(questions)}
+                return app.json.response(dict(payload, data=data)).get_data()
+
+            results[f'fast_{backend}_blobs'] = measure(spliced, args.repeat)
+
+    baseline = results['flask_default'][0]
+    rows = {name: {'us_per_response': round(us, 1), 'bytes': size,
+                   'speedup': round(baseline / us, 2) if us else None}
+            for name, (us, size) in results.items()}
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"{args.questions} questions x {args.options} options, {args.repeat} responses each"
+          f"  (orjson {'available' if orjson is not None else 'not installed'})")
+    print(f"{'provider':<20}{'us/resp':>10}{'bytes':>9}{'speedup':>9}")
+    for name, row in rows.items():
+        print(f"{name:<20}{row['us_per_response']:>10}{row['bytes']:>9}{row['speedup']:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import threading
+import time
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.password_hasher import PasswordHasher, hash_method
+from app.utils.exceptions import ServiceUnavailableError
+from werkzeug.security import generate_password_hash
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return None
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))]
+
+
+def run(hasher, stored_hash, clients, duration):
+    """`clients` concurrent login loops for `duration` seconds plus a light 'other endpoint' probe."""
+    stop = time.perf_counter() + duration
+    login_latencies, probe_latencies = [], []
+    counts = {"ok": 0, "rejected": 0}
+    lock = threading.Lock()
+
+    def client():
+        while time.perf_counter() < stop:
+            started = time.perf_counter()
+            try:
+                hasher.verify_password(stored_hash, "correct horse")
+                elapsed = (time.perf_counter() - started) * 1000
+                with lock:
+                    counts["ok"] += 1
+                    login_latencies.append(elapsed)
+            except ServiceUnavailableError:
+                with lock:
+                    counts["rejected"] += 1
+                time.sleep(0.005)
+
+    def probe():
+        # Simulates a cheap endpoint on the same worker: its latency shows GIL/CPU starvation
+        payload = {"items": list(range(200))}
+        while time.perf_counter() < stop:
+            started = time.perf_counter()
+            json.dumps(payload)
+            probe_latencies.append((time.perf_counter() - started) * 1000)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)] + [threading.Thread(target=probe)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {
+        "clients": clients,
+        "logins_per_sec": round(counts["ok"] / duration, 1),
+        "rejected_per_sec": round(counts["rejected"] / duration, 1),
+        "login_p50_ms": round(percentile(login_latencies, 0.50) or 0, 1),
+        "login_p99_ms": round(percentile(login_latencies, 0.99) or 0, 1),
+        "probe_p99_ms": round(percentile(probe_latencies, 0.99) or 0, 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure login (password verify) throughput at a fixed p99 for each hashing executor"
+    )
+    parser.add_argument("--rounds", type=int, default=15, help="Work factor (scrypt N = 2**rounds)")
+    parser.add_argument("--executors", default="inline,thread,process",
+                        help="Comma separated executors to compare")
+    parser.add_argument("--clients", default="1,2,4,8,16,32", help="Concurrency levels to sweep")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per measurement")
+    parser.add_argument("--p99-ms", type=float, default=500.0, help="Latency budget for the summary")
+    parser.add_argument("--workers", type=int, default=0, help="Pool size (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=32, help="Bounded queue size in front of the pool")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    stored_hash = generate_password_hash("correct horse", method=hash_method(args.rounds))
+    levels = [int(c) for c in args.clients.split(",") if c]
+    results = {}
+    for mode in [m.strip() for m in args.executors.split(",") if m.strip()]:
+        hasher = PasswordHasher(rounds=args.rounds, executor=mode, workers=args.workers,
+                                queue_size=args.queue_size)
+        hasher.verify_password(stored_hash, "warm-up")  # pool start-up is not measured
+        results[mode] = [run(hasher, stored_hash, clients, args.duration) for clients in levels]
+        hasher.shutdown(wait=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"method={hash_method(args.rounds)}  p99 budget={args.p99_ms} ms")
+    print(f"{'executor':<9}{'clients':>8}{'login/s':>10}{'shed/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'probe p99':>11}")
+    for mode, rows in results.items():
+        for row in rows:
+            print(f"{mode:<9}{row['clients']:>8}{row['logins_per_sec']:>10}{row['rejected_per_sec']:>9}"
+                  f"{row['login_p50_ms']:>9}{row['login_p99_ms']:>9}{row['probe_p99_ms']:>11}")
+    print()
+    for mode, rows in results.items():
+        within = [row for row in rows if row["login_p99_ms"] <= args.p99_ms]
+        best = max(within, key=lambda row: row["logins_per_sec"]) if within else None
+        if best:
+            print(f"{mode}: {best['logins_per_sec']} logins/s at p99 {best['login_p99_ms']} ms "
+                  f"({best['clients']} clients)")
+        else:
+            print(f"{mode}: no level met the p99 budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
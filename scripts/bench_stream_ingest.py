@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.database.seeders.questions_seeder import stream_question_file, parse_question_file
+
+
+def generate_bank(path: Path, size_mb: int) -> int:
+    """Writes a synthetic quiz bank of roughly size_mb megabytes; returns question count."""
+    target = size_mb * 1024 * 1024
+    metadata = {"grade": 8, "subject": "Türkçe", "unit": "Fiilimsiler", "topic": "Sıfat-fiil"}
+    filler = "Bu cümlede fiilimsi kullanılmıştır ve açıklama metni uzatılmıştır. " * 4
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"metadata": ' + json.dumps(metadata, ensure_ascii=False) + ', "questions": [')
+        while f.tell() < target:
+            question = {
+                "id": f"bench_{count:08d}",
+                "questionText": f"Soru {count}: {filler}",
+                "questionType": "multiple_choice",
+                "difficulty": ("easy", "medium", "hard")[count % 3],
+                "explanation": filler,
+                "options": [
+                    {"id": letter, "text": f"{letter} seçeneği {count}", "isCorrect": letter == "C",
+                     "explanation": filler}
+                    for letter in "ABCD"
+                ],
+            }
+            f.write(("," if count else "") + json.dumps(question, ensure_ascii=False))
+            count += 1
+        f.write("]}")
+    return count
+
+
+def measure(label: str, func) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} questions={result:<9} time={elapsed:7.2f}s "
+          f"python_peak={peak / 1024 / 1024:8.1f} MiB "
+          f"max_rss={resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:8.1f} MiB")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs full-load quiz bank parsing")
+    parser.add_argument("--size-mb", type=int, default=500, help="Generated bank size (default: 500)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Writer batch size to simulate")
+    parser.add_argument("--path", default=None, help="Bank file path (default: temp file)")
+    parser.add_argument("--full-load", action="store_true",
+                        help="Also measure json.load of the whole file (needs several GiB for 500MB)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated file")
+    args = parser.parse_args(argv)
+
+    path = Path(args.path) if args.path else Path(tempfile.gettempdir()) / f"bench_bank_{args.size_mb}mb.json"
+    if not path.exists():
+        started = time.perf_counter()
+        count = generate_bank(path, args.size_mb)
+        print(f"generated {path} ({path.stat().st_size / 1024 / 1024:.0f} MiB, {count} questions) "
+              f"in {time.perf_counter() - started:.1f}s")
+
+    def streaming() -> int:
+        parsed = stream_question_file(str(path))
+        batch, total = [], 0
+        for entry in parsed["entries"]:
+            batch.append(entry)
+            if len(batch) >= args.batch_size:
+                total += len(batch)
+                batch = []  # the DB writer would flush here
+        return total + len(batch)
+
+    try:
+        measure("streaming", streaming)
+        if args.full_load:
+            measure("full-load", lambda: len(parse_question_file(str(path))["questions"]))
+    finally:
+        if not args.keep and not args.path:
+            os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
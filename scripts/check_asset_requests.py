@@ -0,0 +1,123 @@
+import sys
+from pathlib import Path
+import argparse
+import gzip
+import json
+import posixpath
+import re
+import shutil
+import tempfile
+from urllib.parse import urlsplit
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SCRIPT_RE = re.compile(r'<script\b[^>]*\bsrc="(?P<url>[^"]+)"[^>]*>', re.I)
+STYLESHEET_RE = re.compile(r'<link\b[^>]*\brel="stylesheet"[^>]*\bhref="(?P<url>[^"]+)"[^>]*>', re.I)
+JS_IMPORT_RE = re.compile(r'^\s*(?:import|export)\b[^\'";]*?[\'"](?P<spec>\.{1,2}/[^\'"]+)[\'"]', re.M)
+CSS_IMPORT_RE = re.compile(r'@import\s*(?:url\(\s*)?[\'"]?(?P<spec>[^\'")\s;]+)')
+
+
+def crawl(client, html):
+    """Follow the page like a browser: <script>/<link> tags, then ES module and CSS @import chains."""
+    queue = [(m.group('url'), 1) for m in SCRIPT_RE.finditer(html)]
+    queue += [(m.group('url'), 1) for m in STYLESHEET_RE.finditer(html)]
+    seen, requests = set(), []
+    while queue:
+        url, depth = queue.pop(0)
+        path = urlsplit(url).path
+        if not path.startswith('/static/') or path in seen:
+            continue
+        seen.add(path)
+        response = client.get(path, headers={'Accept-Encoding': 'gzip'})
+        wire = response.get_data()
+        body = gzip.decompress(wire) if response.headers.get('Content-Encoding') == 'gzip' else wire
+        requests.append({'url': path, 'status': response.status_code, 'bytes': len(body),
+                         'wire_bytes': len(wire), 'depth': depth})
+        text = body.decode('utf-8', errors='replace')
+        pattern = CSS_IMPORT_RE if path.endswith('.css') else JS_IMPORT_RE
+        for match in pattern.finditer(text):
+            spec = match.group('spec')
+            if spec.startswith(('http:', 'https:', '//')):
+                continue
+            queue.append((posixpath.normpath(posixpath.join(posixpath.dirname(path), spec)), depth + 1))
+    return {
+        'requests': len(requests),
+        'bytes': sum(r['bytes'] for r in requests),
+        'wire_bytes': sum(r['wire_bytes'] for r in requests),
+        'max_depth': max((r['depth'] for r in requests), default=0),
+        'errors': [r['url'] for r in requests if r['status'] != 200],
+        'files': requests,
+    }
+
+
+def measure(config, page, bundles):
+    from main import create_app
+
+    config.APP.ASSET_BUNDLES = bundles
+    app = create_app(config)
+    app.debug = False
+    client = app.test_client()
+    with app.test_request_context('/'):
+        from flask import render_template
+        html = render_template(page, title='Quiz', session_id='asset-check')
+    return crawl(client, html)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Count static requests, bytes and request waterfall depth of a page, "
+                    "with source files vs built bundles"
+    )
+    parser.add_argument("--page", default="quiz_educational.html", help="Template to render")
+    parser.add_argument("--max-requests", type=int, default=4,
+                        help="Fail if the bundled page needs more local static requests than this")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every request")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    from config import get_config
+    from app.services.asset_pipeline import build_bundles
+    from app.services.static_assets import StaticAssets
+
+    # Bundles are built into a scratch copy so the working tree is left untouched
+    scratch = Path(tempfile.mkdtemp(prefix='asset-check-'))
+    try:
+        static_dir = scratch / 'static'
+        shutil.copytree(ROOT / 'app' / 'static', static_dir,
+                        ignore=shutil.ignore_patterns('dist', '*.gz', '*.br'))
+        build_bundles(static_dir)
+        StaticAssets(static_dir).precompress()
+
+        config = get_config()
+        config.APP.TEMPLATE_DIR = ROOT / 'app' / 'templates'
+        config.APP.STATIC_DIR = static_dir
+        results = {mode: measure(config, args.page, mode == 'bundles') for mode in ('sources', 'bundles')}
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    sources, bundles = results['sources'], results['bundles']
+    ok = (not sources['errors'] and not bundles['errors']
+          and bundles['requests'] <= args.max_requests and bundles['requests'] < sources['requests'])
+
+    if args.json:
+        print(json.dumps({'page': args.page, 'ok': ok, **results}, indent=2))
+        return 0 if ok else 1
+
+    print(f"{args.page}: local static requests (gzip transfer)")
+    print(f"{'mode':<9}{'requests':>9}{'depth':>7}{'bytes':>10}{'wire':>9}")
+    for mode, result in results.items():
+        print(f"{mode:<9}{result['requests']:>9}{result['max_depth']:>7}{result['bytes']:>10}{result['wire_bytes']:>9}")
+        if args.verbose:
+            for item in result['files']:
+                print(f"    {item['status']} d{item['depth']} {item['wire_bytes']:>7}  {item['url']}")
+        if result['errors']:
+            print(f"    failed: {', '.join(result['errors'])}")
+    print("OK" if ok else f"FAIL: bundled page needs {bundles['requests']} requests (budget {args.max_requests})")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import os
+import subprocess
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Runs in a fresh interpreter: counts engine initialisations during `import main`
+# (create_app runs at import) and reports the wall time of the whole boot.
+BOOT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+from app.database.db_connection import DatabaseConnectionManager
+calls = []
+original = DatabaseConnectionManager._initialize_connections
+def counting(self):
+    calls.append(self.config.host)
+    return original(self)
+DatabaseConnectionManager._initialize_connections = counting
+import main
+print(json.dumps({"boot_ms": (time.perf_counter() - started) * 1000,
+                  "engine_inits": len(calls),
+                  "routes": len(list(main.app.url_map.iter_rules()))}))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            parts = line[len("import time:"):].split("|")
+            self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2].rstrip()
+        except (ValueError, IndexError):
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+
+def measure(python, db_host):
+    """Boot the app once in a child interpreter with the database unreachable."""
+    env = dict(os.environ)
+    for key in ("DB_PRIMARY_URL", "DB_REPLICA_URLS", "DB_PASSWORD"):
+        env.pop(key, None)
+    env.update({"DB_HOST": db_host, "FLASK_DEBUG": "0", "LOG_LEVEL": env.get("LOG_LEVEL", "WARNING")})
+    proc = subprocess.run([python, "-X", "importtime", "-c", BOOT_SNIPPET],
+                          cwd=str(ROOT), env=env, capture_output=True, text=True, timeout=120)
+    if proc.returncode != 0:
+        raise RuntimeError(f"boot failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    rows = parse_importtime(proc.stderr)
+    result["import_ms"] = sum(cum for _, _, cum, depth in rows if depth == 0) / 1000
+    result["modules"] = rows
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fail if app import/boot exceeds a time budget or touches the database"
+    )
+    parser.add_argument("--budget-ms", type=float, default=1500.0,
+                        help="Maximum boot time (import main + create_app) in ms")
+    parser.add_argument("--runs", type=int, default=3, help="Boots to measure; the fastest is compared")
+    parser.add_argument("--top", type=int, default=15, help="Slowest first-party modules to list")
+    parser.add_argument("--db-host", default="192.0.2.1",
+                        help="Database host used during the check (default: unroutable TEST-NET address)")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure(args.python, args.db_host) for _ in range(max(1, args.runs))]
+    best = min(results, key=lambda r: r["boot_ms"])
+    first_party = sorted((row for row in best["modules"]
+                          if row[0].split(".")[0] in ("app", "main", "config")),
+                         key=lambda row: row[1], reverse=True)[:args.top]
+    failures = []
+    if best["boot_ms"] > args.budget_ms:
+        failures.append(f"boot took {best['boot_ms']:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if best["engine_inits"]:
+        failures.append(f"{best['engine_inits']} database engine(s) initialised during boot")
+
+    if args.json:
+        print(json.dumps({
+            "boot_ms": round(best["boot_ms"], 1),
+            "import_ms": round(best["import_ms"], 1),
+            "engine_inits": best["engine_inits"],
+            "routes": best["routes"],
+            "slowest": [{"module": name, "self_ms": self_us / 1000, "cumulative_ms": cum / 1000}
+                        for name, self_us, cum, _ in first_party],
+            "failures": failures,
+        }, indent=2))
+    else:
+        print(f"boot={best['boot_ms']:.0f} ms  imports={best['import_ms']:.0f} ms  "
+              f"engine_inits={best['engine_inits']}  routes={best['routes']}  budget={args.budget_ms:.0f} ms")
+        print(f"{'module':<55}{'self ms':>10}{'cum ms':>10}")
+        for name, self_us, cum, _ in first_party:
+            print(f"{name:<55}{self_us / 1000:>10.1f}{cum / 1000:>10.1f}")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if not failures:
+            print("OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
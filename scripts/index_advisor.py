@@ -0,0 +1,79 @@
+import sys
+import json
+from pathlib import Path
+import argparse
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.database.migrations.index_advisor import IndexAdvisor, format_report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Suggest missing/redundant/unused indexes from the application's query log"
+    )
+    parser.add_argument(
+        "--fingerprints",
+        help="Path to query_fingerprints.json (default: LOG_DIR/query_fingerprints.json)",
+    )
+    parser.add_argument(
+        "--slow-log",
+        help="Path to slow_queries.log (default: LOG_DIR/slow_queries.log)",
+    )
+    parser.add_argument(
+        "--scan-source",
+        action="store_true",
+        help="Also add SQL literals found in app/ (useful before any traffic was recorded)",
+    )
+    parser.add_argument(
+        "--no-db",
+        action="store_true",
+        help="Do not connect; read indexes from app/database/schemas and skip EXPLAIN",
+    )
+    parser.add_argument(
+        "--no-explain",
+        action="store_true",
+        help="Skip EXPLAIN of sampled statements",
+    )
+    parser.add_argument(
+        "--include-drops",
+        action="store_true",
+        help="Write DROP INDEX for redundant indexes as runnable statements (default: commented out)",
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Write the migration plan (SQL) to this file",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the full report as JSON instead of text",
+    )
+    args = parser.parse_args(argv)
+
+    advisor = IndexAdvisor(use_database=not args.no_db)
+    loaded = advisor.load_fingerprints(args.fingerprints)
+    loaded += advisor.load_slow_log(args.slow_log)
+    if args.scan_source:
+        loaded += advisor.scan_source()
+    if not loaded:
+        print("No statements found. Run the app with DB_QUERY_STATS enabled or use --scan-source.")
+        return 1
+
+    report = advisor.analyze(explain=not args.no_explain, include_drops=args.include_drops)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    else:
+        print(format_report(report))
+
+    if args.output:
+        Path(args.output).write_text("\n".join(report["plan"]) + "\n", encoding="utf-8")
+        print(f"plan_written: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
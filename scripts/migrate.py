@@ -23,6 +23,26 @@ def main(argv=None) -> int:
         action="store_true",
         help="Create missing performance indexes after ensuring tables exist",
     )
+    parser.add_argument(
+        "--repair-answerable",
+        action="store_true",
+        help="Recompute questions.option_count / is_answerable from question_options",
+    )
+    parser.add_argument(
+        "--partition",
+        action="store_true",
+        help="Convert chat_messages / user_activities to monthly RANGE partitions (MySQL, rewrites the tables)",
+    )
+    parser.add_argument(
+        "--maintain-partitions",
+        action="store_true",
+        help="Create upcoming monthly partitions and drop partitions past their retention period",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --repair-answerable / --partition / --maintain-partitions: only report, do not write",
+    )
     parser.add_argument(
         "--yes", "-y",
         action="store_true",
@@ -55,7 +75,26 @@ def main(argv=None) -> int:
         ok_idx = migrations.create_missing_indexes()
         print(f"indexes_ok: {ok_idx}")
 
-    return 0 if (ok_tables and ok_idx) else 1
+    ok_repair = True
+    if args.repair_answerable:
+        report = migrations.repair_answerable_flags(dry_run=args.dry_run)
+        print(f"answerable_repair: {report}")
+        ok_repair = 'error' not in report
+
+    ok_partitions = True
+    if args.partition:
+        for table, report in migrations.partition_tables(dry_run=args.dry_run).items():
+            for sql in report['statements'] if args.dry_run else []:
+                print(sql + ";")
+            print(f"partition[{table}]: partitioned={report['partitioned']} supported={report['supported']}"
+                  + (f" error={report['error']}" if 'error' in report else ""))
+            ok_partitions = ok_partitions and 'error' not in report
+    if args.maintain_partitions:
+        for table, report in migrations.maintain_partitions(dry_run=args.dry_run, drop_expired=True).items():
+            print(f"partitions[{table}]: {report}")
+            ok_partitions = ok_partitions and 'error' not in report
+
+    return 0 if (ok_tables and ok_idx and ok_repair and ok_partitions) else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import sys
+import json
+from pathlib import Path
+import argparse
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.database.migrations.retention_manager import (
+    RETENTION_POLICIES,
+    RetentionManager,
+    format_report,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Delete expired chat, activity and quiz session rows in small primary-key ordered chunks"
+    )
+    parser.add_argument(
+        "--policy", "-p",
+        action="append",
+        choices=sorted(RETENTION_POLICIES),
+        help="Policy to apply (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--days",
+        type=float,
+        help="Override the retention period (days) of the selected policies",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the rows that would be deleted",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Rows per DELETE statement (default: RETENTION_CHUNK_SIZE)",
+    )
+    parser.add_argument(
+        "--sleep-ms",
+        type=int,
+        help="Pause after every DELETE in milliseconds (default: RETENTION_SLEEP_MS)",
+    )
+    parser.add_argument(
+        "--max-rows-per-sec",
+        type=int,
+        help="Cap the delete rate, 0 = unlimited (default: RETENTION_MAX_ROWS_PER_SEC)",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Stop each policy after this many seconds; the rest is picked up by the next run",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the available policies and exit",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON instead of text",
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, spec in RETENTION_POLICIES.items():
+            print(f"{name:<16} {spec['table']:<16} {spec['description']} ({spec['days_setting']})")
+        return 0
+
+    manager = RetentionManager(
+        chunk_size=args.chunk_size,
+        sleep_ms=args.sleep_ms,
+        max_rows_per_sec=args.max_rows_per_sec,
+    )
+    reports = manager.purge_all(
+        args.policy,
+        dry_run=args.dry_run,
+        days=args.days,
+        max_seconds=args.max_seconds,
+    )
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2, default=str))
+    else:
+        print(format_report(reports))
+    return 1 if any("error" in report for report in reports.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
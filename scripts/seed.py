@@ -1,4 +1,5 @@
 import sys
+import time
 from pathlib import Path
 import argparse
 
@@ -9,10 +10,38 @@ if str(ROOT) not in sys.path:
 
 from app.database.db_connection import DatabaseConnection
 from app.database.db_migrations_v2 import DatabaseMigrations
+from app.database.seeders.questions_seeder import iter_bank_files
 
 DEFAULT_QUESTIONS_DIR = 'app/data/quiz_banks'
 
 
+class ProgressLine:
+    """Single-line live progress/throughput output on stderr (QuestionsSeeder.progress callback)."""
+
+    def __init__(self, total_files: int = 0, interval: float = 0.5) -> None:
+        self.total_files = total_files
+        self.interval = interval
+        self.last = 0.0
+        self.width = 0
+
+    def __call__(self, info: dict) -> None:
+        now = time.monotonic()
+        if now - self.last < self.interval:
+            return
+        self.last = now
+        files = f"{info['files']}/{self.total_files}" if self.total_files else str(info['files'])
+        line = (f"files {files}  questions {info['questions']}  rows {info['rows']}  "
+                f"{info['rows_per_sec']:.0f} rows/s  {info['seconds']:.1f}s  {info.get('current') or ''}")
+        self.width = max(self.width, len(line))
+        sys.stderr.write("\r" + line.ljust(self.width))
+        sys.stderr.flush()
+
+    def finish(self) -> None:
+        if self.width:
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+
 def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Database seeding utilities")
     parser.add_argument(
@@ -31,6 +60,29 @@ def main(argv=None) -> int:
         default=None,
         help="Path to a single question JSON file to seed",
     )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Incrementally sync questions: skip unchanged files (mtime+hash), "
+             "insert/update/deactivate questions of changed files",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parse/validate question files in N worker processes (a single writer commits batches)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Questions written per transaction (default: 1000)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print the live progress line and per-file summary",
+    )
     parser.add_argument(
         "--users",
         action="store_true",
@@ -69,17 +121,62 @@ def main(argv=None) -> int:
         overall_ok = overall_ok and ok_curr_all
         print(f"seed initial curriculum (grades+subjects+units+topics): {ok_curr_all}")
 
-    if do_questions:
+    seeder = migrations.seed_manager.questions
+    seeder.workers = max(1, args.workers)
+    if args.batch_size:
+        seeder.batch_size = max(1, args.batch_size)
+    progress = None
+    if do_questions and not args.quiet:
+        directory = args.directory or DEFAULT_QUESTIONS_DIR
+        total_files = 1 if args.file else sum(1 for _ in iter_bank_files(Path(directory)))
+        progress = seeder.progress = ProgressLine(total_files)
+
+    if do_questions and args.sync:
+        directory = args.directory or DEFAULT_QUESTIONS_DIR
+        results = migrations.sync_questions_from_dir(directory)
+        if progress:
+            progress.finish()
+        stats = seeder.stats
+        for name, result in results.items():
+            if result['status'] != 'unchanged':
+                print(f"  {result['status']:<8} {name} {result.get('error') or ''}".rstrip())
+        print(
+            f"sync questions from '{directory}': {stats.get('files', 0)} files, "
+            f"{stats.get('unchanged', 0)} unchanged, {stats.get('synced', 0)} synced, "
+            f"{stats.get('removed', 0)} removed; +{stats.get('inserted', 0)} "
+            f"~{stats.get('updated', 0)} -{stats.get('deactivated', 0)} questions "
+            f"in {stats.get('seconds', 0)}s"
+        )
+        overall_ok = overall_ok and not stats.get('errors')
+    elif do_questions:
         if args.file:
             success, total = migrations.seed_questions_file(args.file)
+            if progress:
+                progress.finish()
             print(f"seed questions file '{args.file}': {success}/{total} inserted")
             overall_ok = overall_ok and (success >= 0)
         else:
             directory = args.directory or DEFAULT_QUESTIONS_DIR
             results = migrations.seed_questions_from_dir(directory)
+            if progress:
+                progress.finish()
             total_success = sum((s for (s, t) in results.values()), 0)
             total_questions = sum((t for (s, t) in results.values()), 0)
+            if not args.quiet:
+                # Per-file summary in processing order; errors appear where they occurred
+                for report in seeder.file_reports:
+                    notes = []
+                    if report['skipped']:
+                        notes.append(f"{report['skipped']} invalid skipped")
+                    if report['error']:
+                        notes.append(f"ERROR: {report['error']}")
+                    print(f"  {report['inserted']:>6}/{report['total']:<6} {report['file']}"
+                          f"{'  ' + '; '.join(notes) if notes else ''}")
             print(f"seed questions from '{directory}': {total_success}/{total_questions} inserted")
+            stats = seeder.stats
+            if stats:
+                print(f"throughput: {stats['rows']} rows in {stats['seconds']}s ({stats['rows_per_sec']} rows/s)"
+                      f", {len(stats['errors'])} file(s) with errors")
             overall_ok = overall_ok and (total_success >= 0)  # not strictly failure-driven
 
     if do_users:
@@ -0,0 +1,88 @@
+import sys
+import json
+from pathlib import Path
+import argparse
+
+# Ensure project root is on sys.path so 'app' package resolves when running from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import get_config
+from app.services.static_assets import StaticAssets
+from app.services.asset_pipeline import ASSET_BUNDLES, build_bundles
+
+
+def cmd_build(assets, args) -> dict:
+    manifest = build_bundles(assets.static_dir, names=args.bundle or None, prune=not args.no_prune)
+    manifest['precompress'] = assets.precompress(force=args.force)
+    return manifest
+
+
+def cmd_precompress(assets, args) -> dict:
+    return assets.precompress(force=args.force)
+
+
+def cmd_hashes(assets, args) -> dict:
+    root = Path(assets.static_dir)
+    names = sorted(p.relative_to(root).as_posix() for p in root.rglob('*')
+                   if p.is_file() and p.suffix not in ('.gz', '.br'))
+    return {name: assets.hashed_filename(name) for name in names}
+
+
+COMMANDS = {
+    'build': cmd_build,
+    'precompress': cmd_precompress,
+    'hashes': cmd_hashes,
+}
+
+
+def main(argv=None) -> int:
+    config = get_config()
+    parser = argparse.ArgumentParser(
+        description="Build-time static asset tasks: per-page bundles (dist/manifest.json), "
+                    "precompressed .gz/.br copies, content-hashed names"
+    )
+    parser.add_argument("command", choices=sorted(COMMANDS), help="Task to run")
+    parser.add_argument("--static-dir", default=str(ROOT / 'app' / 'static'),
+                        help="Static folder (default: app/static in this checkout)")
+    parser.add_argument("--min-size", type=int, default=config.APP.COMPRESSION_MIN_SIZE,
+                        help="Skip files smaller than this many bytes")
+    parser.add_argument("--bundle", "-b", action="append", choices=sorted(ASSET_BUNDLES),
+                        help="build: bundle to build (repeatable, default: all)")
+    parser.add_argument("--no-prune", action="store_true", help="build: keep outdated bundle files in dist/")
+    parser.add_argument("--force", action="store_true", help="Rewrite up-to-date compressed copies")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    if not Path(args.static_dir).is_dir():
+        print(f"Static folder not found: {args.static_dir}", file=sys.stderr)
+        return 1
+
+    assets = StaticAssets(args.static_dir, min_size=args.min_size)
+    result = COMMANDS[args.command](assets, args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    if args.command == 'build':
+        print(f"{'bundle':<24}{'files':>6}{'source B':>10}{'bundle B':>10}  output")
+        for name, entry in sorted(result['bundles'].items()):
+            print(f"{name:<24}{len(entry['sources']):>6}{entry['source_bytes']:>10}{entry['bytes']:>10}  {entry['file']}")
+        result = result['precompress']
+        print(f"precompressed: {result['written']} written, {result['skipped']} up to date")
+    elif args.command == 'precompress':
+        print(f"{result['files']} files ({result['bytes']} bytes): {result['written']} written, "
+              f"{result['skipped']} up to date")
+        print(f"gzip: {result['gzip_bytes']} bytes"
+              + (f", brotli: {result['brotli_bytes']} bytes" if result['brotli'] else
+                 " (brotli not installed, .br copies skipped)"))
+    else:
+        for name, hashed in result.items():
+            print(f"{name} -> {hashed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())